@@ -6,6 +6,7 @@ C.7 Mathematical Formulas (p187)
 from plasTeX.Base.LaTeX.Arrays import Array
 from plasTeX import Command, Environment, sourceChildren, NoCharSubEnvironment
 from plasTeX import DimenCommand, GlueCommand, TeXFragment
+from plasTeX.MathML import toMathML
 from typing import Optional
 
 #
@@ -34,6 +35,18 @@ class ThinSpace_(Command):
     macroName = '/'
     str = '\u2009'
 
+def mathml(node) -> Optional[str]:
+    """
+    MathML version of a simple formula
+
+    Returns None unless the images:simple-math config option is set and
+    the formula only uses the subset supported by plasTeX.MathML.
+
+    """
+    if not node.ownerDocument.config['images']['simple-math']:
+        return None
+    return toMathML(node, display=bool(node.blockType))
+
 class MathEnvironment(NoCharSubEnvironment):
     mathMode = True
 
@@ -41,6 +54,10 @@ class MathEnvironment(NoCharSubEnvironment):
     def mathjax_source(self):
         return mathjax_lt_gt(self.source)
 
+    @property
+    def mathml(self):
+        return mathml(self)
+
 class MathEnvironmentPre(MathEnvironment):
     """
     A math environment whose source property keeps the begin and end markup.
@@ -137,6 +154,10 @@ class ensuremath(Command):
             return mathjax_lt_gt(sourceChildren(self))
         return ""
 
+    @property
+    def mathml(self):
+        return mathml(self)
+
 class equation(MathEnvironment):
     blockType = True
     counter = 'equation'
@@ -273,6 +273,7 @@ class SectionUtils(object):
 
     def digest(self, tokens):
         # Absorb the tokens that belong to us
+        profiler = getattr(self.ownerDocument, 'profiler', None)
 #       text = []
         for item in tokens:
 #           if item.nodeType == Command.TEXT_NODE:
@@ -283,7 +284,14 @@ class SectionUtils(object):
                 break
             if item.nodeType == Command.ELEMENT_NODE:
                 item.parentNode = self
-                item.digest(tokens)
+                if profiler is None or item.macroMode == Command.MODE_END:
+                    item.digest(tokens)
+                else:
+                    profiler.start('digest', item.nodeName)
+                    try:
+                        item.digest(tokens)
+                    finally:
+                        profiler.stop()
 #           self.appendText(text, self.ownerDocument.charsubs)
             self.appendChild(item)
 #       self.appendText(text, self.ownerDocument.charsubs)
@@ -1,34 +1,7 @@
 #from Entities import *
 
-from plasTeX.Base.LaTeX.Accents import *
-from plasTeX.Base.LaTeX.Alignment import *
-from plasTeX.Base.LaTeX.Arrays import *
-from plasTeX.Base.LaTeX.Bibliography import *
-from plasTeX.Base.LaTeX.Boxes import *
-from plasTeX.Base.LaTeX.Breaking import *
-from plasTeX.Base.LaTeX.Characters import *
-from plasTeX.Base.LaTeX.Crossref import *
-from plasTeX.Base.LaTeX.Definitions import *
-from plasTeX.Base.LaTeX.Document import *
-from plasTeX.Base.LaTeX.Environments import *
-from plasTeX.Base.LaTeX.FontSelection import *
-from plasTeX.Base.LaTeX.Footnotes import *
-from plasTeX.Base.LaTeX.Files import *
-from plasTeX.Base.LaTeX.Floats import *
-from plasTeX.Base.LaTeX.Index import *
-from plasTeX.Base.LaTeX.Lengths import *
-from plasTeX.Base.LaTeX.Lists import *
-from plasTeX.Base.LaTeX.Math import *
-from plasTeX.Base.LaTeX.Numbering import *
-from plasTeX.Base.LaTeX.Packages import *
-from plasTeX.Base.LaTeX.Pictures import *
-from plasTeX.Base.LaTeX.Paragraphs import *
-from plasTeX.Base.LaTeX.Quotations import *
-from plasTeX.Base.LaTeX.Sectioning import *
-from plasTeX.Base.LaTeX.Sentences import *
-from plasTeX.Base.LaTeX.Space import *
-from plasTeX.Base.LaTeX.Tabbing import *
-from plasTeX.Base.LaTeX.Verbatim import *
+from plasTeX.Base import lazyNames
+from plasTeX.Base.registry import LATEX
 
 from plasTeX import Command
 from plasTeX.Tokenizer import Token
@@ -61,3 +34,9 @@ class makeatother(Command):
 class makeatletter(Command):
     def invoke(self, tex):
         self.ownerDocument.context.catcode('@', Token.CC_LETTER)
+
+# The modules defining the other names are imported on first use
+__getattr__, __dir__ = lazyNames(globals(), LATEX)
+
+__all__ = sorted(set(LATEX) | {name for name, value in list(globals().items())
+                               if getattr(value, '__module__', None) == __name__})
@@ -42,6 +42,7 @@ class bgroup(Command):
 
     def digest(self, tokens):
         # Absorb the tokens that belong to us
+        profiler = getattr(self.ownerDocument, 'profiler', None)
         for item in tokens:
             if item.nodeType == Command.ELEMENT_NODE:
                 if item.level < self.ENDSECTIONS_LEVEL:
@@ -54,7 +55,14 @@ class bgroup(Command):
                     tokens.push(item)
                     break
                 item.parentNode = self
-                item.digest(tokens)
+                if profiler is None or item.macroMode == Command.MODE_END:
+                    item.digest(tokens)
+                else:
+                    profiler.start('digest', item.nodeName)
+                    try:
+                        item.digest(tokens)
+                    finally:
+                        profiler.stop()
             self.appendChild(item)
         self.paragraphs(force=False)
 
@@ -1,6 +1,7 @@
-from plasTeX.Base.TeX.Fonts import *
-from plasTeX.Base.TeX.Parameters import *
-from plasTeX.Base.TeX.Primitives import *
-from plasTeX.Base.TeX.Registers import *
-from plasTeX.Base.TeX.Text import *
-from plasTeX.Base.TeX.Numbers import *
+from plasTeX.Base import lazyNames
+from plasTeX.Base.registry import TEX
+
+# The modules defining these names are imported on first use
+__getattr__, __dir__ = lazyNames(globals(), TEX)
+
+__all__ = sorted(TEX)
@@ -1,2 +1,50 @@
-from plasTeX.Base.LaTeX import *
-from plasTeX.Base.TeX import *
+"""
+Built-in macros
+
+The modules of plasTeX.Base are only imported when one of their names
+is first used.  plasTeX.Base.registry records the module defining each
+name, and is generated by plasTeX.Base.makeregistry.
+
+"""
+
+import sys
+from importlib import import_module
+from typing import Callable, Dict, Tuple
+
+from plasTeX.Base.registry import BASE
+
+def lazyNames(namespace: Dict, names: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """
+    Create the module __getattr__ and __dir__ functions of a package
+    whose names are defined by modules imported on first use
+
+    Required Arguments:
+    namespace -- the globals of the package
+    names -- dictionary mapping names to the module defining them
+
+    Returns:
+    tuple containing the __getattr__ and __dir__ functions
+
+    """
+    def __getattr__(name):
+        try:
+            module = names[name]
+        except KeyError:
+            raise AttributeError('module %r has no attribute %r' %
+                                 (namespace['__name__'], name)) from None
+        value = namespace[name] = getattr(import_module(module), name)
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(names))
+
+    # Module __getattr__ is only supported by Python 3.7 and later
+    if sys.version_info < (3, 7):
+        for name in names:
+            __getattr__(name)
+
+    return __getattr__, __dir__
+
+__getattr__, __dir__ = lazyNames(globals(), BASE)
+
+__all__ = sorted(BASE)
@@ -0,0 +1,109 @@
+"""
+Generate plasTeX/Base/registry.py
+
+The packages of plasTeX.Base only import the module defining a name when
+that name is first used.  The registry records which module defines
+each name and each macro.  Run this module again after adding, removing
+or renaming macros in plasTeX.Base::
+
+    python -m plasTeX.Base.makeregistry
+
+"""
+
+import inspect, os
+from importlib import import_module
+from typing import Any, Dict, List, Tuple
+
+from plasTeX import ismacro, macroName
+
+# Modules whose names are exported by each package.  When several
+# modules export the same name, the last one wins.
+LATEX_MODULES = ['Accents', 'Alignment', 'Arrays', 'Bibliography', 'Boxes',
+                 'Breaking', 'Characters', 'Crossref', 'Definitions',
+                 'Document', 'Environments', 'FontSelection', 'Footnotes',
+                 'Files', 'Floats', 'Index', 'Lengths', 'Lists', 'Math',
+                 'Numbering', 'Packages', 'Pictures', 'Paragraphs',
+                 'Quotations', 'Sectioning', 'Sentences', 'Space',
+                 'Tabbing', 'Verbatim']
+
+TEX_MODULES = ['Fonts', 'Parameters', 'Primitives', 'Registers', 'Text',
+               'Numbers']
+
+def exports(package: str, modules: List[str]) -> Dict[str, Tuple[str, Any]]:
+    """
+    Get the names that `from <module> import *` imports from each module
+
+    Required Arguments:
+    package -- name of the package containing the modules
+    modules -- names of the modules, in order
+
+    Returns:
+    dictionary mapping names to the module exporting them and their value
+
+    """
+    names = {} # type: Dict[str, Tuple[str, Any]]
+    for name in modules:
+        module = import_module('%s.%s' % (package, name))
+        public = getattr(module, '__all__', None)
+        if public is None:
+            public = [x for x in vars(module) if not x.startswith('_')]
+        for attr in public:
+            value = getattr(module, attr)
+            if not inspect.ismodule(value):
+                names[attr] = (module.__name__, value)
+    return names
+
+def registry() -> Dict[str, Dict]:
+    """ Compute the content of the registry """
+    latex = exports('plasTeX.Base.LaTeX', LATEX_MODULES)
+    tex = exports('plasTeX.Base.TeX', TEX_MODULES)
+
+    # Names defined in plasTeX/Base/LaTeX/__init__.py itself
+    package = import_module('plasTeX.Base.LaTeX')
+    own = {name: (package.__name__, value) for name, value in vars(package).items()
+           if not name.startswith('_') and
+              getattr(value, '__module__', None) == package.__name__}
+
+    base = dict(latex)
+    base.update(own)
+    base.update(tex)
+
+    macros = {} # type: Dict[str, Tuple[str, str]]
+    for name, (module, value) in base.items():
+        # Token classes like EscapeSequence have a macroName property
+        if ismacro(value) and isinstance(macroName(value), str):
+            macros[macroName(value)] = (module, name)
+
+    return {
+        'BASE': {name: module for name, (module, _) in base.items()},
+        'LATEX': {name: module for name, (module, _) in latex.items()
+                  if name not in own},
+        'TEX': {name: module for name, (module, _) in tex.items()},
+        'MACROS': macros,
+    }
+
+def formatDict(name: str, comment: str, data: Dict) -> str:
+    """ Format a dictionary as Python source, one item per line """
+    lines = ['# %s' % comment, '%s = {' % name]
+    for key in sorted(data):
+        lines.append('    %r: %r,' % (key, data[key]))
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+def main():
+    data = registry()
+    source = [
+        '"""\nNames defined by the modules of plasTeX.Base\n\n'
+        'This file is generated by ``python -m plasTeX.Base.makeregistry``.\n'
+        'Do not edit it by hand.\n\n"""\n',
+        formatDict('BASE', 'Modules defining the names of plasTeX.Base', data['BASE']),
+        formatDict('LATEX', 'Modules defining the names of plasTeX.Base.LaTeX', data['LATEX']),
+        formatDict('TEX', 'Modules defining the names of plasTeX.Base.TeX', data['TEX']),
+        formatDict('MACROS', 'Module and attribute defining each macro', data['MACROS']),
+    ]
+    filename = os.path.join(os.path.dirname(__file__), 'registry.py')
+    with open(filename, 'w') as fh:
+        fh.write('\n'.join(source))
+
+if __name__ == '__main__':
+    main()
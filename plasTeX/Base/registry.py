@@ -0,0 +1,3057 @@
+"""
+Names defined by the modules of plasTeX.Base
+
+This file is generated by ``python -m plasTeX.Base.makeregistry``.
+Do not edit it by hand.
+
+"""
+
+# Modules defining the names of plasTeX.Base
+BASE = {
+    'AE': 'plasTeX.Base.LaTeX.Characters',
+    'Accent': 'plasTeX.Base.LaTeX.Accents',
+    'Acute': 'plasTeX.Base.LaTeX.Accents',
+    'AlignmentChar': 'plasTeX.Base.TeX.Primitives',
+    'AllowHyphen': 'plasTeX.Base.LaTeX.Breaking',
+    'Alph': 'plasTeX.Base.LaTeX.Numbering',
+    'Ampersand': 'plasTeX.Base.LaTeX.Sentences',
+    'AngleReplacingDelimiter': 'plasTeX.Base.LaTeX.Math',
+    'Array': 'plasTeX.Base.LaTeX.Math',
+    'Arrowvert': 'plasTeX.Base.LaTeX.Math',
+    'AtBeginDocument': 'plasTeX.Base.LaTeX.Document',
+    'AtEndDocument': 'plasTeX.Base.LaTeX.Document',
+    'BeginDisplayMath': 'plasTeX.Base.LaTeX.Math',
+    'BeginMath': 'plasTeX.Base.LaTeX.Math',
+    'Big': 'plasTeX.Base.LaTeX.Math',
+    'Bigg': 'plasTeX.Base.LaTeX.Math',
+    'Biggl': 'plasTeX.Base.LaTeX.Math',
+    'Biggm': 'plasTeX.Base.LaTeX.Math',
+    'Biggr': 'plasTeX.Base.LaTeX.Math',
+    'Bigl': 'plasTeX.Base.LaTeX.Math',
+    'Bigm': 'plasTeX.Base.LaTeX.Math',
+    'Bigr': 'plasTeX.Base.LaTeX.Math',
+    'Box': 'plasTeX.Base.LaTeX.Math',
+    'BoxCommand': 'plasTeX.Base.TeX.Primitives',
+    'Caption': 'plasTeX.Base.LaTeX.Floats',
+    'Circumflex': 'plasTeX.Base.LaTeX.Accents',
+    'ColumnType': 'plasTeX.Base.LaTeX.Arrays',
+    'Command': 'plasTeX.Base.TeX.Numbers',
+    'ConfigurableList': 'plasTeX.Base.LaTeX.Lists',
+    'ControlSpace': 'plasTeX.Base.TeX.Text',
+    'CountCommand': 'plasTeX.Base.TeX.Primitives',
+    'DH': 'plasTeX.Base.LaTeX.Characters',
+    'DJ': 'plasTeX.Base.LaTeX.Characters',
+    'DeclareOption': 'plasTeX.Base.LaTeX.Packages',
+    'DeclareRobustCommand': 'plasTeX.Base.LaTeX.Definitions',
+    'DeclareTextCommandDefault': 'plasTeX.Base.LaTeX.Definitions',
+    'DefCommand': 'plasTeX.Base.TeX.Primitives',
+    'Delimiter': 'plasTeX.Base.LaTeX.Math',
+    'Delta': 'plasTeX.Base.LaTeX.Math',
+    'Diamond': 'plasTeX.Base.LaTeX.Math',
+    'DimenCommand': 'plasTeX.Base.TeX.Registers',
+    'Dollar': 'plasTeX.Base.LaTeX.Sentences',
+    'Dot': 'plasTeX.Base.LaTeX.Accents',
+    'Downarrow': 'plasTeX.Base.LaTeX.Math',
+    'EndDisplayMath': 'plasTeX.Base.LaTeX.Math',
+    'EndMath': 'plasTeX.Base.LaTeX.Math',
+    'EndOfSentence': 'plasTeX.Base.LaTeX.Sentences',
+    'EndVerbatimStar': 'plasTeX.Base.LaTeX.Verbatim',
+    'Environment': 'plasTeX.Base.TeX.Fonts',
+    'EqnarrayStar': 'plasTeX.Base.LaTeX.Math',
+    'EscapeSequence': 'plasTeX.Base.TeX.Primitives',
+    'FigureStar': 'plasTeX.Base.LaTeX.Floats',
+    'FileContentsStar': 'plasTeX.Base.LaTeX.Files',
+    'Float': 'plasTeX.Base.LaTeX.Floats',
+    'Font': 'plasTeX.Base.TeX.Fonts',
+    'Gamma': 'plasTeX.Base.LaTeX.Math',
+    'GlueCommand': 'plasTeX.Base.TeX.Registers',
+    'Grave': 'plasTeX.Base.LaTeX.Accents',
+    'GreekLamda': 'plasTeX.Base.LaTeX.Math',
+    'H': 'plasTeX.Base.LaTeX.Accents',
+    'HashMark': 'plasTeX.Base.LaTeX.Sentences',
+    'Huge': 'plasTeX.Base.LaTeX.FontSelection',
+    'IfCommand': 'plasTeX.Base.TeX.Primitives',
+    'IfFileExists': 'plasTeX.Base.LaTeX.Packages',
+    'IgnoreCommand': 'plasTeX.Base.LaTeX.Index',
+    'Im': 'plasTeX.Base.LaTeX.Math',
+    'In': 'plasTeX.Base.LaTeX.Math',
+    'IndexDestination': 'plasTeX.Base.LaTeX.Index',
+    'IndexEntry': 'plasTeX.Base.LaTeX.Index',
+    'IndexPageNumber': 'plasTeX.Base.LaTeX.Index',
+    'IndexUtils': 'plasTeX.Base.LaTeX.Index',
+    'InputIfFileExists': 'plasTeX.Base.LaTeX.Packages',
+    'InterWordSpace': 'plasTeX.Base.LaTeX.Sentences',
+    'Join': 'plasTeX.Base.LaTeX.Math',
+    'L': 'plasTeX.Base.LaTeX.Characters',
+    'LARGE': 'plasTeX.Base.LaTeX.FontSelection',
+    'LaTeX': 'plasTeX.Base.LaTeX.Sentences',
+    'Lambda': 'plasTeX.Base.LaTeX.Math',
+    'Large': 'plasTeX.Base.LaTeX.FontSelection',
+    'LeftBrace': 'plasTeX.Base.LaTeX.Sentences',
+    'Leftarrow': 'plasTeX.Base.LaTeX.Math',
+    'Leftrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'List': 'plasTeX.Base.LaTeX.Lists',
+    'LoadClass': 'plasTeX.Base.LaTeX.Packages',
+    'Logarithm': 'plasTeX.Base.LaTeX.Math',
+    'Longleftarrow': 'plasTeX.Base.LaTeX.Math',
+    'Longleftrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'Longrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'Macro': 'plasTeX.Base.TeX.Primitives',
+    'Macron': 'plasTeX.Base.LaTeX.Accents',
+    'MathAccent': 'plasTeX.Base.LaTeX.Math',
+    'MathEnvironment': 'plasTeX.Base.LaTeX.Math',
+    'MathEnvironmentPre': 'plasTeX.Base.LaTeX.Math',
+    'MathShift': 'plasTeX.Base.TeX.Primitives',
+    'MathSymbol': 'plasTeX.Base.LaTeX.Math',
+    'MediumSpace': 'plasTeX.Base.LaTeX.Math',
+    'MuGlueCommand': 'plasTeX.Base.TeX.Parameters',
+    'NG': 'plasTeX.Base.LaTeX.Characters',
+    'NameDef': 'plasTeX.Base.TeX.Primitives',
+    'NeedsTeXFormat': 'plasTeX.Base.LaTeX.Packages',
+    'NegativeThinSpace': 'plasTeX.Base.LaTeX.Math',
+    'NewLine': 'plasTeX.Base.LaTeX.Breaking',
+    'NoCharSubEnvironment': 'plasTeX.Base.LaTeX.Math',
+    'NoLineBreak': 'plasTeX.Base.LaTeX.Sentences',
+    'Node': 'plasTeX.Base.LaTeX.Characters',
+    'Not': 'plasTeX.Base.LaTeX.Math',
+    'O': 'plasTeX.Base.LaTeX.Characters',
+    'OE': 'plasTeX.Base.LaTeX.Characters',
+    'Omega': 'plasTeX.Base.LaTeX.Math',
+    'Optional': 'plasTeX.Base.LaTeX.Math',
+    'Other': 'plasTeX.Base.TeX.Primitives',
+    'P': 'plasTeX.Base.LaTeX.Accents',
+    'PackageLoader': 'plasTeX.Base.LaTeX.Packages',
+    'PackageWarning': 'plasTeX.Base.LaTeX.Packages',
+    'ParameterCommand': 'plasTeX.Base.TeX.Parameters',
+    'Percent': 'plasTeX.Base.LaTeX.Sentences',
+    'Phi': 'plasTeX.Base.LaTeX.Math',
+    'Pi': 'plasTeX.Base.LaTeX.Math',
+    'Pr': 'plasTeX.Base.LaTeX.Math',
+    'ProcessOptions': 'plasTeX.Base.LaTeX.Packages',
+    'ProvidesClass': 'plasTeX.Base.LaTeX.Packages',
+    'ProvidesPackage': 'plasTeX.Base.LaTeX.Packages',
+    'Psi': 'plasTeX.Base.LaTeX.Math',
+    'Re': 'plasTeX.Base.LaTeX.Math',
+    'RequirePackage': 'plasTeX.Base.LaTeX.Packages',
+    'RightBrace': 'plasTeX.Base.LaTeX.Sentences',
+    'Rightarrow': 'plasTeX.Base.LaTeX.Math',
+    'Roman': 'plasTeX.Base.LaTeX.Numbering',
+    'S': 'plasTeX.Base.LaTeX.Accents',
+    'SS': 'plasTeX.Base.LaTeX.Characters',
+    'SectionUtils': 'plasTeX.Base.LaTeX.Sectioning',
+    'Sigma': 'plasTeX.Base.LaTeX.Math',
+    'SmallSpace': 'plasTeX.Base.LaTeX.Sentences',
+    'StartSection': 'plasTeX.Base.LaTeX.Sectioning',
+    'SubScript': 'plasTeX.Base.TeX.Primitives',
+    'SuperScript': 'plasTeX.Base.TeX.Primitives',
+    'Symbol': 'plasTeX.Base.LaTeX.Accents',
+    'TH': 'plasTeX.Base.LaTeX.Characters',
+    'TableOfContents': 'plasTeX.Base.LaTeX.Sectioning',
+    'TableStar': 'plasTeX.Base.LaTeX.Floats',
+    'TabularStar': 'plasTeX.Base.LaTeX.Arrays',
+    'TeX': 'plasTeX.Base.LaTeX.Sentences',
+    'TeXBreak': 'plasTeX.Base.TeX.Text',
+    'TeXCount': 'plasTeX.Base.TeX.Registers',
+    'TeXFragment': 'plasTeX.Base.LaTeX.Math',
+    'Text': 'plasTeX.Base.LaTeX.Accents',
+    'TextBoxCommand': 'plasTeX.Base.LaTeX.Boxes',
+    'TextCommand': 'plasTeX.Base.LaTeX.FontSelection',
+    'TextDeclaration': 'plasTeX.Base.LaTeX.FontSelection',
+    'TextSizeDeclaration': 'plasTeX.Base.LaTeX.FontSelection',
+    'Theta': 'plasTeX.Base.LaTeX.Math',
+    'ThickSpace': 'plasTeX.Base.LaTeX.Math',
+    'ThinSpace': 'plasTeX.Base.LaTeX.Math',
+    'ThinSpace_': 'plasTeX.Base.LaTeX.Math',
+    'Tilde': 'plasTeX.Base.LaTeX.Accents',
+    'Token': 'plasTeX.Base.TeX.Primitives',
+    'Umlaut': 'plasTeX.Base.LaTeX.Accents',
+    'Underscore': 'plasTeX.Base.LaTeX.Sentences',
+    'Uparrow': 'plasTeX.Base.LaTeX.Math',
+    'Updownarrow': 'plasTeX.Base.LaTeX.Math',
+    'Upsilon': 'plasTeX.Base.LaTeX.Math',
+    'VerbatimEnvironment': 'plasTeX.Base.LaTeX.Verbatim',
+    'VerbatimStar': 'plasTeX.Base.LaTeX.Verbatim',
+    'Vert': 'plasTeX.Base.LaTeX.Math',
+    'VerticalBar': 'plasTeX.Base.LaTeX.Math',
+    'Xi': 'plasTeX.Base.LaTeX.Math',
+    'abovedisplayshortskip': 'plasTeX.Base.TeX.Parameters',
+    'abovedisplayskip': 'plasTeX.Base.TeX.Parameters',
+    'abstract': 'plasTeX.Base.LaTeX.Packages',
+    'active': 'plasTeX.Base.TeX.Primitives',
+    'acute': 'plasTeX.Base.LaTeX.Math',
+    'addcontentsline': 'plasTeX.Base.LaTeX.Sectioning',
+    'addtocontents': 'plasTeX.Base.LaTeX.Sectioning',
+    'addtocounter': 'plasTeX.Base.LaTeX.Numbering',
+    'addtolength': 'plasTeX.Base.LaTeX.Lengths',
+    'addvspace': 'plasTeX.Base.LaTeX.Space',
+    'adjdemerits': 'plasTeX.Base.TeX.Parameters',
+    'advance': 'plasTeX.Base.TeX.Primitives',
+    'ae': 'plasTeX.Base.LaTeX.Characters',
+    'aleph': 'plasTeX.Base.LaTeX.Math',
+    'allowbreak': 'plasTeX.Base.TeX.Text',
+    'alph': 'plasTeX.Base.LaTeX.Numbering',
+    'alpha': 'plasTeX.Base.LaTeX.Math',
+    'amalg': 'plasTeX.Base.LaTeX.Math',
+    'appendix': 'plasTeX.Base.LaTeX.Sectioning',
+    'approx': 'plasTeX.Base.LaTeX.Math',
+    'arabic': 'plasTeX.Base.LaTeX.Numbering',
+    'arccos': 'plasTeX.Base.LaTeX.Math',
+    'arcsin': 'plasTeX.Base.LaTeX.Math',
+    'arctan': 'plasTeX.Base.LaTeX.Math',
+    'arg': 'plasTeX.Base.LaTeX.Math',
+    'array': 'plasTeX.Base.LaTeX.Arrays',
+    'arraycolsep': 'plasTeX.Base.LaTeX.Arrays',
+    'arrayrulewidth': 'plasTeX.Base.LaTeX.Arrays',
+    'arraystretch': 'plasTeX.Base.LaTeX.Arrays',
+    'arrowvert': 'plasTeX.Base.LaTeX.Math',
+    'ast': 'plasTeX.Base.LaTeX.Math',
+    'asymp': 'plasTeX.Base.LaTeX.Math',
+    'author': 'plasTeX.Base.LaTeX.Packages',
+    'b': 'plasTeX.Base.LaTeX.Accents',
+    'backslash': 'plasTeX.Base.LaTeX.Math',
+    'bar': 'plasTeX.Base.LaTeX.Math',
+    'baselineskip': 'plasTeX.Base.TeX.Parameters',
+    'baselinestretch': 'plasTeX.Base.LaTeX.Paragraphs',
+    'begin': 'plasTeX.Base.LaTeX.Environments',
+    'begingroup': 'plasTeX.Base.TeX.Text',
+    'belowdisplayshortskip': 'plasTeX.Base.TeX.Parameters',
+    'belowdisplayskip': 'plasTeX.Base.TeX.Parameters',
+    'beta': 'plasTeX.Base.LaTeX.Math',
+    'bf': 'plasTeX.Base.TeX.Fonts',
+    'bfseries': 'plasTeX.Base.LaTeX.FontSelection',
+    'bgroup': 'plasTeX.Base.TeX.Text',
+    'bibcite': 'plasTeX.Base.LaTeX.Bibliography',
+    'bibdata': 'plasTeX.Base.LaTeX.Bibliography',
+    'bibindent': 'plasTeX.Base.LaTeX.Packages',
+    'bibliography': 'plasTeX.Base.LaTeX.Bibliography',
+    'bibliographyref': 'plasTeX.Base.LaTeX.Bibliography',
+    'bibliographystyle': 'plasTeX.Base.LaTeX.Bibliography',
+    'bibstyle': 'plasTeX.Base.LaTeX.Bibliography',
+    'big': 'plasTeX.Base.LaTeX.Math',
+    'bigbreak': 'plasTeX.Base.TeX.Text',
+    'bigcap': 'plasTeX.Base.LaTeX.Math',
+    'bigcirc': 'plasTeX.Base.LaTeX.Math',
+    'bigcup': 'plasTeX.Base.LaTeX.Math',
+    'bigg': 'plasTeX.Base.LaTeX.Math',
+    'biggl': 'plasTeX.Base.LaTeX.Math',
+    'biggm': 'plasTeX.Base.LaTeX.Math',
+    'biggr': 'plasTeX.Base.LaTeX.Math',
+    'bigl': 'plasTeX.Base.LaTeX.Math',
+    'bigm': 'plasTeX.Base.LaTeX.Math',
+    'bigodot': 'plasTeX.Base.LaTeX.Math',
+    'bigoplus': 'plasTeX.Base.LaTeX.Math',
+    'bigotimes': 'plasTeX.Base.LaTeX.Math',
+    'bigr': 'plasTeX.Base.LaTeX.Math',
+    'bigskip': 'plasTeX.Base.LaTeX.Space',
+    'bigskipamount': 'plasTeX.Base.LaTeX.Space',
+    'bigsqcup': 'plasTeX.Base.LaTeX.Math',
+    'bigtriangledown': 'plasTeX.Base.LaTeX.Math',
+    'bigtriangleup': 'plasTeX.Base.LaTeX.Math',
+    'biguplus': 'plasTeX.Base.LaTeX.Math',
+    'bigvee': 'plasTeX.Base.LaTeX.Math',
+    'bigwedge': 'plasTeX.Base.LaTeX.Math',
+    'binoppenalty': 'plasTeX.Base.TeX.Parameters',
+    'bmod': 'plasTeX.Base.LaTeX.Math',
+    'boldmath': 'plasTeX.Base.LaTeX.Math',
+    'bot': 'plasTeX.Base.LaTeX.Math',
+    'bottomfraction': 'plasTeX.Base.LaTeX.Floats',
+    'bowtie': 'plasTeX.Base.LaTeX.Math',
+    'box': 'plasTeX.Base.TeX.Registers',
+    'boxmaxdepth': 'plasTeX.Base.TeX.Parameters',
+    'brace': 'plasTeX.Base.LaTeX.Math',
+    'bracevert': 'plasTeX.Base.LaTeX.Math',
+    'brack': 'plasTeX.Base.LaTeX.Math',
+    'breve': 'plasTeX.Base.LaTeX.Math',
+    'brokenpenalty': 'plasTeX.Base.TeX.Parameters',
+    'bullet': 'plasTeX.Base.LaTeX.Math',
+    'c': 'plasTeX.Base.LaTeX.Accents',
+    'cachedproperty': 'plasTeX.Base.LaTeX.Sectioning',
+    'cal': 'plasTeX.Base.TeX.Fonts',
+    'cap': 'plasTeX.Base.LaTeX.Math',
+    'catcode': 'plasTeX.Base.TeX.Primitives',
+    'cdot': 'plasTeX.Base.LaTeX.Math',
+    'cdots': 'plasTeX.Base.LaTeX.Math',
+    'center': 'plasTeX.Base.LaTeX.Alignment',
+    'centering': 'plasTeX.Base.LaTeX.Alignment',
+    'centerline': 'plasTeX.Base.TeX.Text',
+    'chapter': 'plasTeX.Base.LaTeX.Sectioning',
+    'char': 'plasTeX.Base.TeX.Primitives',
+    'chardef': 'plasTeX.Base.TeX.Primitives',
+    'check': 'plasTeX.Base.LaTeX.Math',
+    'chi': 'plasTeX.Base.LaTeX.Math',
+    'choose': 'plasTeX.Base.LaTeX.Math',
+    'circ': 'plasTeX.Base.LaTeX.Math',
+    'citation': 'plasTeX.Base.LaTeX.Bibliography',
+    'cite': 'plasTeX.Base.LaTeX.Bibliography',
+    'cleardoublepage': 'plasTeX.Base.LaTeX.Breaking',
+    'clearpage': 'plasTeX.Base.LaTeX.Breaking',
+    'closeout': 'plasTeX.Base.TeX.Primitives',
+    'clubpenalty': 'plasTeX.Base.TeX.Parameters',
+    'clubsuit': 'plasTeX.Base.LaTeX.Math',
+    'collator': 'plasTeX.Base.LaTeX.Index',
+    'columnsep': 'plasTeX.Base.LaTeX.Packages',
+    'columnseprule': 'plasTeX.Base.LaTeX.Packages',
+    'columnwidth': 'plasTeX.Base.LaTeX.Paragraphs',
+    'cong': 'plasTeX.Base.LaTeX.Math',
+    'coprod': 'plasTeX.Base.LaTeX.Math',
+    'copyright': 'plasTeX.Base.LaTeX.Accents',
+    'cos': 'plasTeX.Base.LaTeX.Math',
+    'cosh': 'plasTeX.Base.LaTeX.Math',
+    'cot': 'plasTeX.Base.LaTeX.Math',
+    'coth': 'plasTeX.Base.LaTeX.Math',
+    'csc': 'plasTeX.Base.LaTeX.Math',
+    'csname': 'plasTeX.Base.TeX.Primitives',
+    'cup': 'plasTeX.Base.LaTeX.Math',
+    'd': 'plasTeX.Base.LaTeX.Accents',
+    'dag': 'plasTeX.Base.LaTeX.Accents',
+    'dagger': 'plasTeX.Base.LaTeX.Math',
+    'dashv': 'plasTeX.Base.LaTeX.Math',
+    'date': 'plasTeX.Base.LaTeX.Packages',
+    'datetime': 'plasTeX.Base.TeX.Primitives',
+    'day': 'plasTeX.Base.TeX.Parameters',
+    'dblfloatpagefraction': 'plasTeX.Base.LaTeX.Floats',
+    'dblfloatsep': 'plasTeX.Base.LaTeX.Floats',
+    'dbltextfloatsep': 'plasTeX.Base.LaTeX.Floats',
+    'dbltopfraction': 'plasTeX.Base.LaTeX.Floats',
+    'ddag': 'plasTeX.Base.LaTeX.Accents',
+    'ddagger': 'plasTeX.Base.LaTeX.Math',
+    'ddot': 'plasTeX.Base.LaTeX.Math',
+    'ddots': 'plasTeX.Base.LaTeX.Math',
+    'def_': 'plasTeX.Base.TeX.Primitives',
+    'defaulthyphenchar': 'plasTeX.Base.TeX.Parameters',
+    'defaultskewchar': 'plasTeX.Base.TeX.Parameters',
+    'deflog': 'plasTeX.Base.TeX.Primitives',
+    'deg': 'plasTeX.Base.LaTeX.Math',
+    'delimiterfactor': 'plasTeX.Base.TeX.Parameters',
+    'delimitershortfall': 'plasTeX.Base.TeX.Parameters',
+    'delta': 'plasTeX.Base.LaTeX.Math',
+    'description': 'plasTeX.Base.LaTeX.Lists',
+    'det': 'plasTeX.Base.LaTeX.Math',
+    'dh': 'plasTeX.Base.LaTeX.Characters',
+    'diamond': 'plasTeX.Base.LaTeX.Math',
+    'diamondsuit': 'plasTeX.Base.LaTeX.Math',
+    'dim': 'plasTeX.Base.LaTeX.Math',
+    'dimen_': 'plasTeX.Base.TeX.Registers',
+    'ding': 'plasTeX.Base.LaTeX.Characters',
+    'displayindent': 'plasTeX.Base.TeX.Parameters',
+    'displaymath': 'plasTeX.Base.LaTeX.Math',
+    'displaystyle': 'plasTeX.Base.LaTeX.Math',
+    'displaywidowpenalty': 'plasTeX.Base.TeX.Parameters',
+    'displaywidth': 'plasTeX.Base.TeX.Parameters',
+    'div': 'plasTeX.Base.LaTeX.Math',
+    'dj': 'plasTeX.Base.LaTeX.Characters',
+    'document': 'plasTeX.Base.LaTeX.Document',
+    'documentclass': 'plasTeX.Base.LaTeX.Packages',
+    'documentstyle': 'plasTeX.Base.LaTeX.Packages',
+    'dot': 'plasTeX.Base.LaTeX.Math',
+    'doteq': 'plasTeX.Base.LaTeX.Math',
+    'dots': 'plasTeX.Base.TeX.Text',
+    'doublehyphendemerits': 'plasTeX.Base.TeX.Parameters',
+    'doublerulesep': 'plasTeX.Base.LaTeX.Arrays',
+    'downarrow': 'plasTeX.Base.LaTeX.Math',
+    'edef': 'plasTeX.Base.TeX.Primitives',
+    'egroup': 'plasTeX.Base.TeX.Text',
+    'eject': 'plasTeX.Base.TeX.Text',
+    'ell': 'plasTeX.Base.LaTeX.Math',
+    'else_': 'plasTeX.Base.TeX.Primitives',
+    'em': 'plasTeX.Base.LaTeX.Sentences',
+    'emergencystretch': 'plasTeX.Base.TeX.Parameters',
+    'emph': 'plasTeX.Base.LaTeX.Sentences',
+    'empty': 'plasTeX.Base.TeX.Text',
+    'emptyset': 'plasTeX.Base.LaTeX.Math',
+    'end': 'plasTeX.Base.LaTeX.Environments',
+    'endcsname': 'plasTeX.Base.TeX.Primitives',
+    'endgroup': 'plasTeX.Base.TeX.Text',
+    'endinput': 'plasTeX.Base.TeX.Primitives',
+    'endlinechar': 'plasTeX.Base.TeX.Parameters',
+    'endverbatim': 'plasTeX.Base.LaTeX.Verbatim',
+    'enlargethispage': 'plasTeX.Base.LaTeX.Breaking',
+    'enskip': 'plasTeX.Base.TeX.Text',
+    'enspace': 'plasTeX.Base.TeX.Text',
+    'ensuremath': 'plasTeX.Base.LaTeX.Math',
+    'enumerate_': 'plasTeX.Base.LaTeX.Lists',
+    'enumiiiname': 'plasTeX.Base.LaTeX.Lists',
+    'enumiiname': 'plasTeX.Base.LaTeX.Lists',
+    'enuminame': 'plasTeX.Base.LaTeX.Lists',
+    'enumivname': 'plasTeX.Base.LaTeX.Lists',
+    'envlog': 'plasTeX.Base.LaTeX.Environments',
+    'epsilon': 'plasTeX.Base.LaTeX.Math',
+    'eqnarray': 'plasTeX.Base.LaTeX.Math',
+    'equation': 'plasTeX.Base.LaTeX.Math',
+    'equiv': 'plasTeX.Base.LaTeX.Math',
+    'errorcontextlines': 'plasTeX.Base.TeX.Parameters',
+    'escapechar': 'plasTeX.Base.TeX.Parameters',
+    'eta': 'plasTeX.Base.LaTeX.Math',
+    'evensidemargin': 'plasTeX.Base.LaTeX.Packages',
+    'everypar': 'plasTeX.Base.TeX.Primitives',
+    'exhyphenpenalty': 'plasTeX.Base.TeX.Parameters',
+    'exists': 'plasTeX.Base.LaTeX.Math',
+    'exp': 'plasTeX.Base.LaTeX.Math',
+    'expandafter': 'plasTeX.Base.TeX.Primitives',
+    'fam': 'plasTeX.Base.TeX.Parameters',
+    'fbox': 'plasTeX.Base.LaTeX.Boxes',
+    'fboxrule': 'plasTeX.Base.LaTeX.Boxes',
+    'fboxsep': 'plasTeX.Base.LaTeX.Boxes',
+    'fi': 'plasTeX.Base.TeX.Primitives',
+    'figure': 'plasTeX.Base.LaTeX.Floats',
+    'filbreak': 'plasTeX.Base.TeX.Text',
+    'filecontents': 'plasTeX.Base.LaTeX.Files',
+    'fill': 'plasTeX.Base.LaTeX.Lengths',
+    'finalhyphendemerits': 'plasTeX.Base.TeX.Parameters',
+    'flat': 'plasTeX.Base.LaTeX.Math',
+    'floatingpenalty': 'plasTeX.Base.TeX.Parameters',
+    'floatpagefraction': 'plasTeX.Base.LaTeX.Floats',
+    'floatsep': 'plasTeX.Base.LaTeX.Floats',
+    'flushleft': 'plasTeX.Base.LaTeX.Alignment',
+    'flushright': 'plasTeX.Base.LaTeX.Alignment',
+    'fnsymbol': 'plasTeX.Base.LaTeX.Numbering',
+    'footnote': 'plasTeX.Base.LaTeX.Footnotes',
+    'footnotemark': 'plasTeX.Base.LaTeX.Footnotes',
+    'footnoterule': 'plasTeX.Base.LaTeX.Footnotes',
+    'footnotesep': 'plasTeX.Base.LaTeX.Footnotes',
+    'footnotesize': 'plasTeX.Base.LaTeX.FontSelection',
+    'footnotetext': 'plasTeX.Base.LaTeX.Footnotes',
+    'footskip': 'plasTeX.Base.LaTeX.Packages',
+    'forall': 'plasTeX.Base.LaTeX.Math',
+    'frac': 'plasTeX.Base.LaTeX.Math',
+    'framebox': 'plasTeX.Base.LaTeX.Boxes',
+    'frenchspacing': 'plasTeX.Base.TeX.Text',
+    'frown': 'plasTeX.Base.LaTeX.Math',
+    'fussy': 'plasTeX.Base.LaTeX.Breaking',
+    'gamma': 'plasTeX.Base.LaTeX.Math',
+    'gcd': 'plasTeX.Base.LaTeX.Math',
+    'gdef': 'plasTeX.Base.TeX.Primitives',
+    'ge': 'plasTeX.Base.LaTeX.Math',
+    'geq': 'plasTeX.Base.LaTeX.Math',
+    'getLogger': 'plasTeX.Base.TeX.Primitives',
+    'gg': 'plasTeX.Base.LaTeX.Math',
+    'global_': 'plasTeX.Base.TeX.Primitives',
+    'globaldefs': 'plasTeX.Base.TeX.Parameters',
+    'glossary': 'plasTeX.Base.LaTeX.Index',
+    'goodbreak': 'plasTeX.Base.TeX.Text',
+    'grave': 'plasTeX.Base.LaTeX.Math',
+    'guillemotright': 'plasTeX.Base.LaTeX.Characters',
+    'guillmotleft': 'plasTeX.Base.LaTeX.Characters',
+    'guilsinglleft': 'plasTeX.Base.LaTeX.Characters',
+    'guilsinglright': 'plasTeX.Base.LaTeX.Characters',
+    'hang': 'plasTeX.Base.TeX.Text',
+    'hangafter': 'plasTeX.Base.TeX.Parameters',
+    'hangindent': 'plasTeX.Base.TeX.Parameters',
+    'hat': 'plasTeX.Base.LaTeX.Math',
+    'hbadness': 'plasTeX.Base.TeX.Parameters',
+    'hbar': 'plasTeX.Base.LaTeX.Math',
+    'hbox': 'plasTeX.Base.TeX.Primitives',
+    'headheight': 'plasTeX.Base.LaTeX.Packages',
+    'headsep': 'plasTeX.Base.LaTeX.Packages',
+    'heartsuit': 'plasTeX.Base.LaTeX.Math',
+    'hfil': 'plasTeX.Base.TeX.Primitives',
+    'hfill': 'plasTeX.Base.LaTeX.Space',
+    'hfuzz': 'plasTeX.Base.TeX.Parameters',
+    'hglue': 'plasTeX.Base.TeX.Text',
+    'hideskip': 'plasTeX.Base.TeX.Registers',
+    'hoffset': 'plasTeX.Base.TeX.Parameters',
+    'holdinginserts': 'plasTeX.Base.TeX.Parameters',
+    'hom': 'plasTeX.Base.LaTeX.Math',
+    'hookleftarrow': 'plasTeX.Base.LaTeX.Math',
+    'hookrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'hrule': 'plasTeX.Base.TeX.Primitives',
+    'hsize': 'plasTeX.Base.TeX.Parameters',
+    'hskip': 'plasTeX.Base.TeX.Primitives',
+    'hspace': 'plasTeX.Base.LaTeX.Space',
+    'htmlfalse': 'plasTeX.Base.TeX.Primitives',
+    'htmltrue': 'plasTeX.Base.TeX.Primitives',
+    'huge': 'plasTeX.Base.LaTeX.FontSelection',
+    'hyperindexformat': 'plasTeX.Base.LaTeX.Index',
+    'hyperpage': 'plasTeX.Base.LaTeX.Index',
+    'hyphenation': 'plasTeX.Base.LaTeX.Breaking',
+    'hyphenpenalty': 'plasTeX.Base.TeX.Parameters',
+    'i': 'plasTeX.Base.LaTeX.Characters',
+    'if_': 'plasTeX.Base.TeX.Primitives',
+    'ifcase': 'plasTeX.Base.TeX.Primitives',
+    'ifcat': 'plasTeX.Base.TeX.Primitives',
+    'ifcsname': 'plasTeX.Base.TeX.Primitives',
+    'ifdefined': 'plasTeX.Base.TeX.Primitives',
+    'ifdim': 'plasTeX.Base.TeX.Primitives',
+    'ifeof': 'plasTeX.Base.TeX.Primitives',
+    'iffalse': 'plasTeX.Base.TeX.Primitives',
+    'ifhbox': 'plasTeX.Base.TeX.Primitives',
+    'ifhmode': 'plasTeX.Base.TeX.Primitives',
+    'ifhtml': 'plasTeX.Base.TeX.Primitives',
+    'ifinner': 'plasTeX.Base.TeX.Primitives',
+    'ifmmode': 'plasTeX.Base.TeX.Primitives',
+    'ifnum': 'plasTeX.Base.TeX.Primitives',
+    'ifodd': 'plasTeX.Base.TeX.Primitives',
+    'ifpdf': 'plasTeX.Base.TeX.Primitives',
+    'ifplastex': 'plasTeX.Base.TeX.Primitives',
+    'iftrue': 'plasTeX.Base.TeX.Primitives',
+    'ifundefined_': 'plasTeX.Base.LaTeX',
+    'ifvbox': 'plasTeX.Base.TeX.Primitives',
+    'ifvmode': 'plasTeX.Base.TeX.Primitives',
+    'ifvoid': 'plasTeX.Base.TeX.Primitives',
+    'ifx': 'plasTeX.Base.TeX.Primitives',
+    'imath': 'plasTeX.Base.LaTeX.Math',
+    'include': 'plasTeX.Base.TeX.Primitives',
+    'includeonly': 'plasTeX.Base.LaTeX.Files',
+    'indent': 'plasTeX.Base.LaTeX.Paragraphs',
+    'index': 'plasTeX.Base.LaTeX.Index',
+    'inf': 'plasTeX.Base.LaTeX.Math',
+    'infty': 'plasTeX.Base.LaTeX.Math',
+    'input': 'plasTeX.Base.TeX.Primitives',
+    'int': 'plasTeX.Base.LaTeX.Math',
+    'interlinepenalty': 'plasTeX.Base.TeX.Parameters',
+    'intextsep': 'plasTeX.Base.LaTeX.Floats',
+    'iota': 'plasTeX.Base.LaTeX.Math',
+    'it': 'plasTeX.Base.TeX.Fonts',
+    'itemindent': 'plasTeX.Base.LaTeX.Lists',
+    'itemize': 'plasTeX.Base.LaTeX.Lists',
+    'itemsep': 'plasTeX.Base.LaTeX.Lists',
+    'iterate': 'plasTeX.Base.TeX.Text',
+    'itshape': 'plasTeX.Base.LaTeX.FontSelection',
+    'j': 'plasTeX.Base.LaTeX.Characters',
+    'jmath': 'plasTeX.Base.LaTeX.Math',
+    'jobname': 'plasTeX.Base.TeX.Primitives',
+    'jot': 'plasTeX.Base.LaTeX.Math',
+    'k': 'plasTeX.Base.LaTeX.Accents',
+    'kappa': 'plasTeX.Base.LaTeX.Math',
+    'ker': 'plasTeX.Base.LaTeX.Math',
+    'kern': 'plasTeX.Base.TeX.Primitives',
+    'l': 'plasTeX.Base.LaTeX.Characters',
+    'label': 'plasTeX.Base.LaTeX.Crossref',
+    'labelitemi': 'plasTeX.Base.LaTeX.Lists',
+    'labelitemii': 'plasTeX.Base.LaTeX.Lists',
+    'labelitemiii': 'plasTeX.Base.LaTeX.Lists',
+    'labelitemiv': 'plasTeX.Base.LaTeX.Lists',
+    'labelsep': 'plasTeX.Base.LaTeX.Lists',
+    'labelwidth': 'plasTeX.Base.LaTeX.Lists',
+    'langle': 'plasTeX.Base.LaTeX.Math',
+    'language': 'plasTeX.Base.TeX.Parameters',
+    'large': 'plasTeX.Base.LaTeX.FontSelection',
+    'lbrace': 'plasTeX.Base.LaTeX.Math',
+    'lbrack': 'plasTeX.Base.TeX.Text',
+    'lceil': 'plasTeX.Base.LaTeX.Math',
+    'ldots': 'plasTeX.Base.LaTeX.Math',
+    'le': 'plasTeX.Base.LaTeX.Math',
+    'leadsto': 'plasTeX.Base.LaTeX.Math',
+    'leavevmode': 'plasTeX.Base.TeX.Primitives',
+    'left': 'plasTeX.Base.LaTeX.Math',
+    'leftarrow': 'plasTeX.Base.LaTeX.Math',
+    'lefteqn': 'plasTeX.Base.LaTeX.Math',
+    'leftharpoondown': 'plasTeX.Base.LaTeX.Math',
+    'leftharpoonup': 'plasTeX.Base.LaTeX.Math',
+    'lefthyphenmin': 'plasTeX.Base.TeX.Parameters',
+    'leftline': 'plasTeX.Base.TeX.Text',
+    'leftmargin': 'plasTeX.Base.LaTeX.Lists',
+    'leftrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'leftskip': 'plasTeX.Base.TeX.Parameters',
+    'leq': 'plasTeX.Base.LaTeX.Math',
+    'let': 'plasTeX.Base.TeX.Primitives',
+    'lfloor': 'plasTeX.Base.LaTeX.Math',
+    'lg': 'plasTeX.Base.LaTeX.Math',
+    'lgroup': 'plasTeX.Base.LaTeX.Math',
+    'lhd': 'plasTeX.Base.LaTeX.Math',
+    'lim': 'plasTeX.Base.LaTeX.Math',
+    'liminf': 'plasTeX.Base.LaTeX.Math',
+    'limsup': 'plasTeX.Base.LaTeX.Math',
+    'line': 'plasTeX.Base.TeX.Text',
+    'linebreak': 'plasTeX.Base.LaTeX.Breaking',
+    'linepenalty': 'plasTeX.Base.TeX.Parameters',
+    'lineskip': 'plasTeX.Base.TeX.Parameters',
+    'lineskipamount': 'plasTeX.Base.TeX.Parameters',
+    'linewidth': 'plasTeX.Base.LaTeX.Paragraphs',
+    'listfiles': 'plasTeX.Base.LaTeX.Files',
+    'listoffigures': 'plasTeX.Base.LaTeX.Sectioning',
+    'listoftables': 'plasTeX.Base.LaTeX.Sectioning',
+    'listparindent': 'plasTeX.Base.LaTeX.Lists',
+    'll': 'plasTeX.Base.LaTeX.Math',
+    'llap': 'plasTeX.Base.TeX.Text',
+    'lmoustache': 'plasTeX.Base.LaTeX.Math',
+    'ln': 'plasTeX.Base.LaTeX.Math',
+    'log': 'plasTeX.Base.TeX.Primitives',
+    'long': 'plasTeX.Base.TeX.Primitives',
+    'longleftarrow': 'plasTeX.Base.LaTeX.Math',
+    'longleftrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'longmapsto': 'plasTeX.Base.LaTeX.Math',
+    'longrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'loop': 'plasTeX.Base.TeX.Text',
+    'looseness': 'plasTeX.Base.TeX.Parameters',
+    'lq': 'plasTeX.Base.TeX.Text',
+    'lrbox': 'plasTeX.Base.LaTeX.Boxes',
+    'mag': 'plasTeX.Base.TeX.Parameters',
+    'magstep': 'plasTeX.Base.TeX.Fonts',
+    'magstephalf': 'plasTeX.Base.TeX.Fonts',
+    'makeatletter': 'plasTeX.Base.LaTeX',
+    'makeatother': 'plasTeX.Base.LaTeX',
+    'makebox': 'plasTeX.Base.LaTeX.Boxes',
+    'makeglossary': 'plasTeX.Base.LaTeX.Index',
+    'makeindex': 'plasTeX.Base.LaTeX.Index',
+    'makelabel': 'plasTeX.Base.LaTeX.Lists',
+    'maketitle': 'plasTeX.Base.LaTeX.Packages',
+    'mapsto': 'plasTeX.Base.LaTeX.Math',
+    'marginpar': 'plasTeX.Base.LaTeX.Floats',
+    'marginparpush': 'plasTeX.Base.LaTeX.Floats',
+    'marginparsep': 'plasTeX.Base.LaTeX.Packages',
+    'marginparwidth': 'plasTeX.Base.LaTeX.Packages',
+    'markboth': 'plasTeX.Base.LaTeX.Packages',
+    'markright': 'plasTeX.Base.LaTeX.Packages',
+    'math': 'plasTeX.Base.LaTeX.Math',
+    'mathbf': 'plasTeX.Base.LaTeX.Math',
+    'mathcal': 'plasTeX.Base.LaTeX.Math',
+    'mathchardef': 'plasTeX.Base.TeX.Primitives',
+    'mathindent': 'plasTeX.Base.LaTeX.Math',
+    'mathit': 'plasTeX.Base.LaTeX.Math',
+    'mathjax_lt_gt': 'plasTeX.Base.LaTeX.Math',
+    'mathml': 'plasTeX.Base.LaTeX.Math',
+    'mathop': 'plasTeX.Base.LaTeX.Math',
+    'mathrm': 'plasTeX.Base.LaTeX.Math',
+    'mathsf': 'plasTeX.Base.LaTeX.Math',
+    'mathshiftlog': 'plasTeX.Base.TeX.Primitives',
+    'mathsurround': 'plasTeX.Base.TeX.Parameters',
+    'mathtt': 'plasTeX.Base.LaTeX.Math',
+    'max': 'plasTeX.Base.LaTeX.Math',
+    'maxdeadcycles': 'plasTeX.Base.TeX.Parameters',
+    'maxdepth': 'plasTeX.Base.TeX.Parameters',
+    'maxdimen': 'plasTeX.Base.TeX.Registers',
+    'mbox': 'plasTeX.Base.LaTeX.Boxes',
+    'mdseries': 'plasTeX.Base.LaTeX.FontSelection',
+    'medbreak': 'plasTeX.Base.TeX.Text',
+    'medmuskip': 'plasTeX.Base.TeX.Parameters',
+    'medskip': 'plasTeX.Base.LaTeX.Space',
+    'medskipamount': 'plasTeX.Base.LaTeX.Space',
+    'mho': 'plasTeX.Base.LaTeX.Math',
+    'mid': 'plasTeX.Base.LaTeX.Math',
+    'min': 'plasTeX.Base.LaTeX.Math',
+    'minipage': 'plasTeX.Base.LaTeX.Boxes',
+    'models': 'plasTeX.Base.LaTeX.Math',
+    'month': 'plasTeX.Base.TeX.Parameters',
+    'mp': 'plasTeX.Base.LaTeX.Math',
+    'mu': 'plasTeX.Base.LaTeX.Math',
+    'nabla': 'plasTeX.Base.LaTeX.Math',
+    'narrower': 'plasTeX.Base.TeX.Text',
+    'natural': 'plasTeX.Base.LaTeX.Math',
+    'ne': 'plasTeX.Base.LaTeX.Math',
+    'nearrow': 'plasTeX.Base.LaTeX.Math',
+    'neg': 'plasTeX.Base.LaTeX.Math',
+    'negthinspace': 'plasTeX.Base.TeX.Text',
+    'neq': 'plasTeX.Base.LaTeX.Math',
+    'newblock': 'plasTeX.Base.LaTeX.Bibliography',
+    'newbox': 'plasTeX.Base.TeX.Registers',
+    'newcommand': 'plasTeX.Base.LaTeX.Definitions',
+    'newcount': 'plasTeX.Base.TeX.Registers',
+    'newcounter': 'plasTeX.Base.LaTeX.Numbering',
+    'newdimen': 'plasTeX.Base.TeX.Registers',
+    'newenvironment': 'plasTeX.Base.LaTeX.Definitions',
+    'newfam': 'plasTeX.Base.TeX.Registers',
+    'newhelp': 'plasTeX.Base.TeX.Registers',
+    'newif': 'plasTeX.Base.TeX.Registers',
+    'newlanguage': 'plasTeX.Base.TeX.Registers',
+    'newlength': 'plasTeX.Base.LaTeX.Lengths',
+    'newline': 'plasTeX.Base.LaTeX.Breaking',
+    'newlinechar': 'plasTeX.Base.TeX.Parameters',
+    'newmuskip': 'plasTeX.Base.TeX.Registers',
+    'newpage': 'plasTeX.Base.LaTeX.Breaking',
+    'newread': 'plasTeX.Base.TeX.Registers',
+    'newsavebox': 'plasTeX.Base.LaTeX.Boxes',
+    'newskip': 'plasTeX.Base.TeX.Registers',
+    'newtheorem': 'plasTeX.Base.LaTeX.Definitions',
+    'newtoks': 'plasTeX.Base.TeX.Registers',
+    'newwrite': 'plasTeX.Base.TeX.Registers',
+    'ng': 'plasTeX.Base.LaTeX.Characters',
+    'ni': 'plasTeX.Base.LaTeX.Math',
+    'nocite': 'plasTeX.Base.LaTeX.Bibliography',
+    'nofiles': 'plasTeX.Base.LaTeX.Files',
+    'noindent': 'plasTeX.Base.LaTeX.Paragraphs',
+    'nointerlineskip': 'plasTeX.Base.TeX.Text',
+    'noligs_': 'plasTeX.Base.TeX.Primitives',
+    'nolinebreak': 'plasTeX.Base.LaTeX.Breaking',
+    'nonfrenchspacing': 'plasTeX.Base.TeX.Text',
+    'nonumber': 'plasTeX.Base.LaTeX.Math',
+    'nopagebreak': 'plasTeX.Base.LaTeX.Breaking',
+    'normalbaselines': 'plasTeX.Base.TeX.Text',
+    'normalfont': 'plasTeX.Base.LaTeX.FontSelection',
+    'normalmarginpar': 'plasTeX.Base.LaTeX.Floats',
+    'normalsize': 'plasTeX.Base.LaTeX.FontSelection',
+    'notag': 'plasTeX.Base.LaTeX.Math',
+    'notin': 'plasTeX.Base.LaTeX.Math',
+    'nu': 'plasTeX.Base.LaTeX.Math',
+    'null': 'plasTeX.Base.TeX.Text',
+    'nulldelimiterspace': 'plasTeX.Base.TeX.Parameters',
+    'numToRoman': 'plasTeX.Base.TeX.Numbers',
+    'number': 'plasTeX.Base.TeX.Numbers',
+    'nwarrow': 'plasTeX.Base.LaTeX.Math',
+    'o': 'plasTeX.Base.LaTeX.Characters',
+    'obeyspaces': 'plasTeX.Base.TeX.Text',
+    'oddsidemargin': 'plasTeX.Base.LaTeX.Packages',
+    'odot': 'plasTeX.Base.LaTeX.Math',
+    'oe': 'plasTeX.Base.LaTeX.Characters',
+    'offinterlineskip': 'plasTeX.Base.TeX.Text',
+    'oint': 'plasTeX.Base.LaTeX.Math',
+    'omega': 'plasTeX.Base.LaTeX.Math',
+    'ominus': 'plasTeX.Base.LaTeX.Math',
+    'onecolumn': 'plasTeX.Base.LaTeX.Packages',
+    'openout': 'plasTeX.Base.TeX.Primitives',
+    'oplus': 'plasTeX.Base.LaTeX.Math',
+    'oslash': 'plasTeX.Base.LaTeX.Math',
+    'otimes': 'plasTeX.Base.LaTeX.Math',
+    'outputpenalty': 'plasTeX.Base.TeX.Parameters',
+    'overbrace': 'plasTeX.Base.LaTeX.Math',
+    'overfullrule': 'plasTeX.Base.TeX.Parameters',
+    'overline': 'plasTeX.Base.LaTeX.Math',
+    'pagebreak': 'plasTeX.Base.LaTeX.Breaking',
+    'pagelabel': 'plasTeX.Base.LaTeX',
+    'pagenumbering': 'plasTeX.Base.LaTeX.Packages',
+    'pageref': 'plasTeX.Base.LaTeX.Crossref',
+    'pagestyle': 'plasTeX.Base.LaTeX.Packages',
+    'paperheight': 'plasTeX.Base.LaTeX.Packages',
+    'paperwidth': 'plasTeX.Base.LaTeX.Packages',
+    'par': 'plasTeX.Base.TeX.Primitives',
+    'paragraph': 'plasTeX.Base.LaTeX.Sectioning',
+    'parallel': 'plasTeX.Base.LaTeX.Math',
+    'parbox': 'plasTeX.Base.LaTeX.Boxes',
+    'parfillskip': 'plasTeX.Base.TeX.Parameters',
+    'parindent': 'plasTeX.Base.TeX.Parameters',
+    'parsep': 'plasTeX.Base.LaTeX.Lists',
+    'parskip': 'plasTeX.Base.TeX.Parameters',
+    'part': 'plasTeX.Base.LaTeX.Sectioning',
+    'partial': 'plasTeX.Base.LaTeX.Math',
+    'partopsep': 'plasTeX.Base.LaTeX.Lists',
+    'pausing': 'plasTeX.Base.TeX.Parameters',
+    'pdffalse': 'plasTeX.Base.TeX.Primitives',
+    'pdftrue': 'plasTeX.Base.TeX.Primitives',
+    'perp': 'plasTeX.Base.LaTeX.Math',
+    'phantom': 'plasTeX.Base.LaTeX.Space',
+    'phi': 'plasTeX.Base.LaTeX.Math',
+    'pi': 'plasTeX.Base.LaTeX.Math',
+    'picture': 'plasTeX.Base.LaTeX.Pictures',
+    'plastexfalse': 'plasTeX.Base.TeX.Primitives',
+    'plastextrue': 'plasTeX.Base.TeX.Primitives',
+    'pm': 'plasTeX.Base.LaTeX.Math',
+    'pmod': 'plasTeX.Base.LaTeX.Math',
+    'postdisplaypenalty': 'plasTeX.Base.TeX.Parameters',
+    'pounds': 'plasTeX.Base.LaTeX.Accents',
+    'prec': 'plasTeX.Base.LaTeX.Math',
+    'preceq': 'plasTeX.Base.LaTeX.Math',
+    'predisplaypenalty': 'plasTeX.Base.TeX.Parameters',
+    'predisplaysize': 'plasTeX.Base.TeX.Parameters',
+    'pretolerance': 'plasTeX.Base.TeX.Parameters',
+    'prime': 'plasTeX.Base.LaTeX.Math',
+    'printindex': 'plasTeX.Base.LaTeX.Index',
+    'prod': 'plasTeX.Base.LaTeX.Math',
+    'propto': 'plasTeX.Base.LaTeX.Math',
+    'protect': 'plasTeX.Base.TeX.Primitives',
+    'protected_write': 'plasTeX.Base.TeX.Primitives',
+    'providecommand': 'plasTeX.Base.LaTeX.Definitions',
+    'psi': 'plasTeX.Base.LaTeX.Math',
+    'qbeziermax': 'plasTeX.Base.LaTeX.Pictures',
+    'qquad': 'plasTeX.Base.TeX.Text',
+    'quad': 'plasTeX.Base.TeX.Text',
+    'quotation': 'plasTeX.Base.LaTeX.Quotations',
+    'quote': 'plasTeX.Base.LaTeX.Quotations',
+    'quotedblbase': 'plasTeX.Base.LaTeX.Characters',
+    'quotesinglbase': 'plasTeX.Base.LaTeX.Characters',
+    'r': 'plasTeX.Base.LaTeX.Accents',
+    'raggedbottom': 'plasTeX.Base.LaTeX.Alignment',
+    'raggedleft': 'plasTeX.Base.LaTeX.Alignment',
+    'raggedright': 'plasTeX.Base.LaTeX.Alignment',
+    'raisebox': 'plasTeX.Base.LaTeX.Boxes',
+    'rangle': 'plasTeX.Base.LaTeX.Math',
+    'rbrace': 'plasTeX.Base.LaTeX.Math',
+    'rbrack': 'plasTeX.Base.TeX.Text',
+    'rceil': 'plasTeX.Base.LaTeX.Math',
+    'ref': 'plasTeX.Base.LaTeX.Crossref',
+    'refstepcounter': 'plasTeX.Base.LaTeX.Numbering',
+    'relax': 'plasTeX.Base.TeX.Primitives',
+    'relpenalty': 'plasTeX.Base.TeX.Parameters',
+    'removelastskip': 'plasTeX.Base.TeX.Text',
+    'renewcommand': 'plasTeX.Base.LaTeX.Definitions',
+    'renewenvironment': 'plasTeX.Base.LaTeX.Definitions',
+    'repeat': 'plasTeX.Base.TeX.Text',
+    'reversemarginpar': 'plasTeX.Base.LaTeX.Floats',
+    'rfloor': 'plasTeX.Base.LaTeX.Math',
+    'rgroup': 'plasTeX.Base.LaTeX.Math',
+    'rhd': 'plasTeX.Base.LaTeX.Math',
+    'rho': 'plasTeX.Base.LaTeX.Math',
+    'right': 'plasTeX.Base.LaTeX.Math',
+    'rightarrow': 'plasTeX.Base.LaTeX.Math',
+    'rightharpoondown': 'plasTeX.Base.LaTeX.Math',
+    'rightharpoonup': 'plasTeX.Base.LaTeX.Math',
+    'righthyphenmin': 'plasTeX.Base.TeX.Parameters',
+    'rightleftharpoons': 'plasTeX.Base.LaTeX.Math',
+    'rightline': 'plasTeX.Base.TeX.Text',
+    'rightmargin': 'plasTeX.Base.LaTeX.Lists',
+    'rightskip': 'plasTeX.Base.TeX.Parameters',
+    'rm': 'plasTeX.Base.TeX.Fonts',
+    'rmfamily': 'plasTeX.Base.LaTeX.FontSelection',
+    'rmoustache': 'plasTeX.Base.LaTeX.Math',
+    'roman': 'plasTeX.Base.LaTeX.Numbering',
+    'romannumeral': 'plasTeX.Base.TeX.Numbers',
+    'rq': 'plasTeX.Base.TeX.Text',
+    'rule': 'plasTeX.Base.LaTeX.Boxes',
+    'savebox': 'plasTeX.Base.LaTeX.Boxes',
+    'sbox': 'plasTeX.Base.LaTeX.Boxes',
+    'sc': 'plasTeX.Base.TeX.Fonts',
+    'scriptscriptstyle': 'plasTeX.Base.LaTeX.Math',
+    'scriptsize': 'plasTeX.Base.LaTeX.FontSelection',
+    'scriptspace': 'plasTeX.Base.TeX.Parameters',
+    'scriptstyle': 'plasTeX.Base.LaTeX.Math',
+    'scshape': 'plasTeX.Base.LaTeX.FontSelection',
+    'searrow': 'plasTeX.Base.LaTeX.Math',
+    'sec': 'plasTeX.Base.LaTeX.Math',
+    'section': 'plasTeX.Base.LaTeX.Sectioning',
+    'setcounter': 'plasTeX.Base.LaTeX.Numbering',
+    'setlength': 'plasTeX.Base.LaTeX.Lengths',
+    'setminus': 'plasTeX.Base.LaTeX.Math',
+    'settodepth': 'plasTeX.Base.LaTeX.Lengths',
+    'settoheight': 'plasTeX.Base.LaTeX.Lengths',
+    'settowidth': 'plasTeX.Base.LaTeX.Lengths',
+    'sf': 'plasTeX.Base.TeX.Fonts',
+    'sffamily': 'plasTeX.Base.LaTeX.FontSelection',
+    'sharp': 'plasTeX.Base.LaTeX.Math',
+    'showboxbreadth': 'plasTeX.Base.TeX.Parameters',
+    'showboxdepth': 'plasTeX.Base.TeX.Parameters',
+    'showthe': 'plasTeX.Base.TeX.Primitives',
+    'sigma': 'plasTeX.Base.LaTeX.Math',
+    'sim': 'plasTeX.Base.LaTeX.Math',
+    'simeq': 'plasTeX.Base.LaTeX.Math',
+    'sin': 'plasTeX.Base.LaTeX.Math',
+    'sinh': 'plasTeX.Base.LaTeX.Math',
+    'skip': 'plasTeX.Base.TeX.Registers',
+    'sl': 'plasTeX.Base.TeX.Fonts',
+    'slash': 'plasTeX.Base.TeX.Text',
+    'sloppy': 'plasTeX.Base.LaTeX.Breaking',
+    'sloppypar': 'plasTeX.Base.LaTeX.Breaking',
+    'slshape': 'plasTeX.Base.LaTeX.FontSelection',
+    'small': 'plasTeX.Base.LaTeX.FontSelection',
+    'smallbreak': 'plasTeX.Base.TeX.Text',
+    'smallskip': 'plasTeX.Base.LaTeX.Space',
+    'smallskipamount': 'plasTeX.Base.LaTeX.Space',
+    'smile': 'plasTeX.Base.LaTeX.Math',
+    'sourceArguments': 'plasTeX.Base.LaTeX.Verbatim',
+    'sourceChildren': 'plasTeX.Base.TeX.Text',
+    'space': 'plasTeX.Base.TeX.Text',
+    'spaceskip': 'plasTeX.Base.TeX.Parameters',
+    'spadesuit': 'plasTeX.Base.LaTeX.Math',
+    'splitmaxdepth': 'plasTeX.Base.TeX.Parameters',
+    'splittopskip': 'plasTeX.Base.TeX.Parameters',
+    'sqcap': 'plasTeX.Base.LaTeX.Math',
+    'sqcup': 'plasTeX.Base.LaTeX.Math',
+    'sqrt': 'plasTeX.Base.LaTeX.Math',
+    'sqsubseteq': 'plasTeX.Base.LaTeX.Math',
+    'sqsupset': 'plasTeX.Base.LaTeX.Math',
+    'sqsupseteq': 'plasTeX.Base.LaTeX.Math',
+    'ss': 'plasTeX.Base.LaTeX.Characters',
+    'stackrel': 'plasTeX.Base.LaTeX.Math',
+    'star': 'plasTeX.Base.LaTeX.Math',
+    'status': 'plasTeX.Base.TeX.Primitives',
+    'stepcounter': 'plasTeX.Base.LaTeX.Numbering',
+    'stretch': 'plasTeX.Base.LaTeX.Lengths',
+    'subparagraph': 'plasTeX.Base.LaTeX.Sectioning',
+    'subsection': 'plasTeX.Base.LaTeX.Sectioning',
+    'subset': 'plasTeX.Base.LaTeX.Math',
+    'subseteq': 'plasTeX.Base.LaTeX.Math',
+    'subsubparagraph': 'plasTeX.Base.LaTeX.Sectioning',
+    'subsubsection': 'plasTeX.Base.LaTeX.Sectioning',
+    'succ': 'plasTeX.Base.LaTeX.Math',
+    'succeq': 'plasTeX.Base.LaTeX.Math',
+    'sum': 'plasTeX.Base.LaTeX.Math',
+    'sup': 'plasTeX.Base.LaTeX.Math',
+    'supereject': 'plasTeX.Base.TeX.Text',
+    'suppressfloats': 'plasTeX.Base.LaTeX.Floats',
+    'supset': 'plasTeX.Base.LaTeX.Math',
+    'supseteq': 'plasTeX.Base.LaTeX.Math',
+    'surd': 'plasTeX.Base.LaTeX.Math',
+    'swarrow': 'plasTeX.Base.LaTeX.Math',
+    'symbol': 'plasTeX.Base.LaTeX.FontSelection',
+    't': 'plasTeX.Base.LaTeX.Accents',
+    'tabbing': 'plasTeX.Base.LaTeX.Tabbing',
+    'tabbingsep': 'plasTeX.Base.LaTeX.Tabbing',
+    'tabcolsep': 'plasTeX.Base.LaTeX.Arrays',
+    'table': 'plasTeX.Base.LaTeX.Floats',
+    'tableofcontents': 'plasTeX.Base.LaTeX.Sectioning',
+    'tabskip': 'plasTeX.Base.TeX.Parameters',
+    'tabular': 'plasTeX.Base.LaTeX.Arrays',
+    'tabularx': 'plasTeX.Base.LaTeX.Arrays',
+    'tabulary': 'plasTeX.Base.LaTeX.Arrays',
+    'tan': 'plasTeX.Base.LaTeX.Math',
+    'tanh': 'plasTeX.Base.LaTeX.Math',
+    'tau': 'plasTeX.Base.LaTeX.Math',
+    'text': 'plasTeX.Base.LaTeX.Math',
+    'textasciicircum': 'plasTeX.Base.LaTeX.Characters',
+    'textasciitilde': 'plasTeX.Base.LaTeX.Characters',
+    'textbackslash': 'plasTeX.Base.LaTeX.Characters',
+    'textbar': 'plasTeX.Base.LaTeX.Characters',
+    'textbf': 'plasTeX.Base.LaTeX.FontSelection',
+    'textbraceleft': 'plasTeX.Base.LaTeX.Characters',
+    'textbraceright': 'plasTeX.Base.LaTeX.Characters',
+    'textcompwordmark': 'plasTeX.Base.LaTeX.Characters',
+    'textcopyright': 'plasTeX.Base.LaTeX.Characters',
+    'textdollar': 'plasTeX.Base.LaTeX.Characters',
+    'textemdash': 'plasTeX.Base.LaTeX.Characters',
+    'textendash': 'plasTeX.Base.LaTeX.Characters',
+    'textexclamdown': 'plasTeX.Base.LaTeX.Characters',
+    'textfloatsep': 'plasTeX.Base.LaTeX.Floats',
+    'textfraction': 'plasTeX.Base.LaTeX.Floats',
+    'textgreater': 'plasTeX.Base.LaTeX.Characters',
+    'textheight': 'plasTeX.Base.LaTeX.Packages',
+    'textindent': 'plasTeX.Base.TeX.Text',
+    'textit': 'plasTeX.Base.LaTeX.FontSelection',
+    'textless': 'plasTeX.Base.LaTeX.Characters',
+    'textmd': 'plasTeX.Base.LaTeX.FontSelection',
+    'textnormal': 'plasTeX.Base.LaTeX.FontSelection',
+    'textogonekcentered': 'plasTeX.Base.LaTeX.Characters',
+    'textpertenthousand': 'plasTeX.Base.LaTeX.Characters',
+    'textperthousand': 'plasTeX.Base.LaTeX.Characters',
+    'textquestiondown': 'plasTeX.Base.LaTeX.Characters',
+    'textquotedbl': 'plasTeX.Base.LaTeX.Characters',
+    'textquotedblleft': 'plasTeX.Base.LaTeX.Characters',
+    'textquotedblright': 'plasTeX.Base.LaTeX.Characters',
+    'textquoteleft': 'plasTeX.Base.LaTeX.Characters',
+    'textquoteright': 'plasTeX.Base.LaTeX.Characters',
+    'textregistered': 'plasTeX.Base.LaTeX.Characters',
+    'textrm': 'plasTeX.Base.LaTeX.FontSelection',
+    'textsc': 'plasTeX.Base.LaTeX.FontSelection',
+    'textsection': 'plasTeX.Base.LaTeX.Characters',
+    'textsf': 'plasTeX.Base.LaTeX.FontSelection',
+    'textsl': 'plasTeX.Base.LaTeX.FontSelection',
+    'textsterling': 'plasTeX.Base.LaTeX.Characters',
+    'textstyle': 'plasTeX.Base.LaTeX.Math',
+    'textsubscript': 'plasTeX.Base.LaTeX.Sentences',
+    'textsuperscript': 'plasTeX.Base.LaTeX.Sentences',
+    'texttrademark': 'plasTeX.Base.LaTeX.Characters',
+    'texttt': 'plasTeX.Base.LaTeX.FontSelection',
+    'textunderscore': 'plasTeX.Base.LaTeX.Characters',
+    'textup': 'plasTeX.Base.LaTeX.FontSelection',
+    'textvisiblespace': 'plasTeX.Base.LaTeX.Characters',
+    'textwidth': 'plasTeX.Base.LaTeX.Packages',
+    'th': 'plasTeX.Base.LaTeX.Characters',
+    'thanks': 'plasTeX.Base.LaTeX.Packages',
+    'the': 'plasTeX.Base.TeX.Primitives',
+    'thebibliography': 'plasTeX.Base.LaTeX.Bibliography',
+    'theindex': 'plasTeX.Base.LaTeX.Index',
+    'theta': 'plasTeX.Base.LaTeX.Math',
+    'thickmuskip': 'plasTeX.Base.TeX.Parameters',
+    'thinmuskip': 'plasTeX.Base.TeX.Parameters',
+    'thinspace': 'plasTeX.Base.TeX.Text',
+    'thispagestyle': 'plasTeX.Base.LaTeX.Packages',
+    'tilde': 'plasTeX.Base.LaTeX.Math',
+    'time': 'plasTeX.Base.TeX.Parameters',
+    'times': 'plasTeX.Base.LaTeX.Math',
+    'tiny': 'plasTeX.Base.LaTeX.FontSelection',
+    'title': 'plasTeX.Base.LaTeX.Packages',
+    'titlepage': 'plasTeX.Base.LaTeX.Packages',
+    'toMathML': 'plasTeX.Base.LaTeX.Math',
+    'toks': 'plasTeX.Base.TeX.Registers',
+    'tolerance': 'plasTeX.Base.TeX.Parameters',
+    'top': 'plasTeX.Base.LaTeX.Math',
+    'topfraction': 'plasTeX.Base.LaTeX.Floats',
+    'topglue': 'plasTeX.Base.TeX.Text',
+    'topmargin': 'plasTeX.Base.LaTeX.Packages',
+    'topsep': 'plasTeX.Base.LaTeX.Lists',
+    'topskip': 'plasTeX.Base.TeX.Parameters',
+    'tracingcommands': 'plasTeX.Base.TeX.Parameters',
+    'tracinglostchars': 'plasTeX.Base.TeX.Parameters',
+    'tracingmacros': 'plasTeX.Base.TeX.Parameters',
+    'tracingonline': 'plasTeX.Base.TeX.Parameters',
+    'tracingoutput': 'plasTeX.Base.TeX.Parameters',
+    'tracingpages': 'plasTeX.Base.TeX.Parameters',
+    'tracingparagraphs': 'plasTeX.Base.TeX.Parameters',
+    'tracingrestores': 'plasTeX.Base.TeX.Parameters',
+    'tracingstats': 'plasTeX.Base.TeX.Parameters',
+    'triangle': 'plasTeX.Base.LaTeX.Math',
+    'triangleleft': 'plasTeX.Base.LaTeX.Math',
+    'triangleright': 'plasTeX.Base.LaTeX.Math',
+    'trivlist': 'plasTeX.Base.LaTeX.Lists',
+    'tt': 'plasTeX.Base.TeX.Fonts',
+    'ttfamily': 'plasTeX.Base.LaTeX.FontSelection',
+    'twocolumn': 'plasTeX.Base.LaTeX.Packages',
+    'typein': 'plasTeX.Base.LaTeX.Files',
+    'typeout': 'plasTeX.Base.LaTeX.Files',
+    'u': 'plasTeX.Base.LaTeX.Accents',
+    'uchyph': 'plasTeX.Base.TeX.Parameters',
+    'unboldmath': 'plasTeX.Base.LaTeX.Math',
+    'undefined': 'plasTeX.Base.TeX.Primitives',
+    'undefined_': 'plasTeX.Base.TeX.Primitives',
+    'underbar': 'plasTeX.Base.TeX.Text',
+    'underbrace': 'plasTeX.Base.LaTeX.Math',
+    'underline': 'plasTeX.Base.LaTeX.Math',
+    'unidecode': 'plasTeX.Base.LaTeX.Index',
+    'unitlength': 'plasTeX.Base.LaTeX.Pictures',
+    'unlhd': 'plasTeX.Base.LaTeX.Math',
+    'unrhd': 'plasTeX.Base.LaTeX.Math',
+    'uparrow': 'plasTeX.Base.LaTeX.Math',
+    'updownarrow': 'plasTeX.Base.LaTeX.Math',
+    'uplus': 'plasTeX.Base.LaTeX.Math',
+    'uppercase': 'plasTeX.Base.TeX.Text',
+    'upshape': 'plasTeX.Base.LaTeX.FontSelection',
+    'upsilon': 'plasTeX.Base.LaTeX.Math',
+    'usebox': 'plasTeX.Base.LaTeX.Boxes',
+    'usecounter': 'plasTeX.Base.LaTeX.Lists',
+    'usepackage': 'plasTeX.Base.LaTeX.Packages',
+    'v': 'plasTeX.Base.LaTeX.Accents',
+    'value': 'plasTeX.Base.LaTeX.Numbering',
+    'varepsilon': 'plasTeX.Base.LaTeX.Math',
+    'varphi': 'plasTeX.Base.LaTeX.Math',
+    'varpi': 'plasTeX.Base.LaTeX.Math',
+    'varrho': 'plasTeX.Base.LaTeX.Math',
+    'varsigma': 'plasTeX.Base.LaTeX.Math',
+    'vartheta': 'plasTeX.Base.LaTeX.Math',
+    'vbadness': 'plasTeX.Base.TeX.Parameters',
+    'vbox': 'plasTeX.Base.TeX.Primitives',
+    'vdash': 'plasTeX.Base.LaTeX.Math',
+    'vdots': 'plasTeX.Base.LaTeX.Math',
+    'vec': 'plasTeX.Base.LaTeX.Math',
+    'vee': 'plasTeX.Base.LaTeX.Math',
+    'verb': 'plasTeX.Base.LaTeX.Verbatim',
+    'verbatim': 'plasTeX.Base.LaTeX.Verbatim',
+    'verbatiminput': 'plasTeX.Base.LaTeX',
+    'verse': 'plasTeX.Base.LaTeX.Quotations',
+    'vert': 'plasTeX.Base.LaTeX.Math',
+    'vfill': 'plasTeX.Base.LaTeX.Space',
+    'vfuzz': 'plasTeX.Base.TeX.Parameters',
+    'vglue': 'plasTeX.Base.TeX.Text',
+    'vobeyspaces_': 'plasTeX.Base.TeX.Primitives',
+    'voffset': 'plasTeX.Base.TeX.Parameters',
+    'vsize': 'plasTeX.Base.TeX.Parameters',
+    'vskip': 'plasTeX.Base.TeX.Primitives',
+    'vspace': 'plasTeX.Base.LaTeX.Space',
+    'vwritefile_': 'plasTeX.Base.LaTeX',
+    'wedge': 'plasTeX.Base.LaTeX.Math',
+    'widehat': 'plasTeX.Base.LaTeX.Math',
+    'widetilde': 'plasTeX.Base.LaTeX.Math',
+    'widowpenalty': 'plasTeX.Base.TeX.Parameters',
+    'wp': 'plasTeX.Base.LaTeX.Math',
+    'wr': 'plasTeX.Base.LaTeX.Math',
+    'write': 'plasTeX.Base.TeX.Primitives',
+    'xdef': 'plasTeX.Base.TeX.Primitives',
+    'xi': 'plasTeX.Base.LaTeX.Math',
+    'xspaceskip': 'plasTeX.Base.TeX.Parameters',
+    'year': 'plasTeX.Base.TeX.Parameters',
+    'zeta': 'plasTeX.Base.LaTeX.Math',
+}
+
+# Modules defining the names of plasTeX.Base.LaTeX
+LATEX = {
+    'AE': 'plasTeX.Base.LaTeX.Characters',
+    'Accent': 'plasTeX.Base.LaTeX.Accents',
+    'Acute': 'plasTeX.Base.LaTeX.Accents',
+    'AllowHyphen': 'plasTeX.Base.LaTeX.Breaking',
+    'Alph': 'plasTeX.Base.LaTeX.Numbering',
+    'Ampersand': 'plasTeX.Base.LaTeX.Sentences',
+    'AngleReplacingDelimiter': 'plasTeX.Base.LaTeX.Math',
+    'Array': 'plasTeX.Base.LaTeX.Math',
+    'Arrowvert': 'plasTeX.Base.LaTeX.Math',
+    'AtBeginDocument': 'plasTeX.Base.LaTeX.Document',
+    'AtEndDocument': 'plasTeX.Base.LaTeX.Document',
+    'BeginDisplayMath': 'plasTeX.Base.LaTeX.Math',
+    'BeginMath': 'plasTeX.Base.LaTeX.Math',
+    'Big': 'plasTeX.Base.LaTeX.Math',
+    'Bigg': 'plasTeX.Base.LaTeX.Math',
+    'Biggl': 'plasTeX.Base.LaTeX.Math',
+    'Biggm': 'plasTeX.Base.LaTeX.Math',
+    'Biggr': 'plasTeX.Base.LaTeX.Math',
+    'Bigl': 'plasTeX.Base.LaTeX.Math',
+    'Bigm': 'plasTeX.Base.LaTeX.Math',
+    'Bigr': 'plasTeX.Base.LaTeX.Math',
+    'Box': 'plasTeX.Base.LaTeX.Math',
+    'BoxCommand': 'plasTeX.Base.LaTeX.FontSelection',
+    'Caption': 'plasTeX.Base.LaTeX.Floats',
+    'Circumflex': 'plasTeX.Base.LaTeX.Accents',
+    'ColumnType': 'plasTeX.Base.LaTeX.Arrays',
+    'Command': 'plasTeX.Base.LaTeX.Verbatim',
+    'ConfigurableList': 'plasTeX.Base.LaTeX.Lists',
+    'DH': 'plasTeX.Base.LaTeX.Characters',
+    'DJ': 'plasTeX.Base.LaTeX.Characters',
+    'DeclareOption': 'plasTeX.Base.LaTeX.Packages',
+    'DeclareRobustCommand': 'plasTeX.Base.LaTeX.Definitions',
+    'DeclareTextCommandDefault': 'plasTeX.Base.LaTeX.Definitions',
+    'Delimiter': 'plasTeX.Base.LaTeX.Math',
+    'Delta': 'plasTeX.Base.LaTeX.Math',
+    'Diamond': 'plasTeX.Base.LaTeX.Math',
+    'DimenCommand': 'plasTeX.Base.LaTeX.Tabbing',
+    'Dollar': 'plasTeX.Base.LaTeX.Sentences',
+    'Dot': 'plasTeX.Base.LaTeX.Accents',
+    'Downarrow': 'plasTeX.Base.LaTeX.Math',
+    'EndDisplayMath': 'plasTeX.Base.LaTeX.Math',
+    'EndMath': 'plasTeX.Base.LaTeX.Math',
+    'EndOfSentence': 'plasTeX.Base.LaTeX.Sentences',
+    'EndVerbatimStar': 'plasTeX.Base.LaTeX.Verbatim',
+    'Environment': 'plasTeX.Base.LaTeX.Tabbing',
+    'EqnarrayStar': 'plasTeX.Base.LaTeX.Math',
+    'EscapeSequence': 'plasTeX.Base.LaTeX.Index',
+    'FigureStar': 'plasTeX.Base.LaTeX.Floats',
+    'FileContentsStar': 'plasTeX.Base.LaTeX.Files',
+    'Float': 'plasTeX.Base.LaTeX.Floats',
+    'Gamma': 'plasTeX.Base.LaTeX.Math',
+    'GlueCommand': 'plasTeX.Base.LaTeX.Math',
+    'Grave': 'plasTeX.Base.LaTeX.Accents',
+    'GreekLamda': 'plasTeX.Base.LaTeX.Math',
+    'H': 'plasTeX.Base.LaTeX.Accents',
+    'HashMark': 'plasTeX.Base.LaTeX.Sentences',
+    'Huge': 'plasTeX.Base.LaTeX.FontSelection',
+    'IfFileExists': 'plasTeX.Base.LaTeX.Packages',
+    'IgnoreCommand': 'plasTeX.Base.LaTeX.Index',
+    'Im': 'plasTeX.Base.LaTeX.Math',
+    'In': 'plasTeX.Base.LaTeX.Math',
+    'IndexDestination': 'plasTeX.Base.LaTeX.Index',
+    'IndexEntry': 'plasTeX.Base.LaTeX.Index',
+    'IndexPageNumber': 'plasTeX.Base.LaTeX.Index',
+    'IndexUtils': 'plasTeX.Base.LaTeX.Index',
+    'InputIfFileExists': 'plasTeX.Base.LaTeX.Packages',
+    'InterWordSpace': 'plasTeX.Base.LaTeX.Sentences',
+    'Join': 'plasTeX.Base.LaTeX.Math',
+    'L': 'plasTeX.Base.LaTeX.Characters',
+    'LARGE': 'plasTeX.Base.LaTeX.FontSelection',
+    'LaTeX': 'plasTeX.Base.LaTeX.Sentences',
+    'Lambda': 'plasTeX.Base.LaTeX.Math',
+    'Large': 'plasTeX.Base.LaTeX.FontSelection',
+    'LeftBrace': 'plasTeX.Base.LaTeX.Sentences',
+    'Leftarrow': 'plasTeX.Base.LaTeX.Math',
+    'Leftrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'List': 'plasTeX.Base.LaTeX.Lists',
+    'LoadClass': 'plasTeX.Base.LaTeX.Packages',
+    'Logarithm': 'plasTeX.Base.LaTeX.Math',
+    'Longleftarrow': 'plasTeX.Base.LaTeX.Math',
+    'Longleftrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'Longrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'Macro': 'plasTeX.Base.LaTeX.Arrays',
+    'Macron': 'plasTeX.Base.LaTeX.Accents',
+    'MathAccent': 'plasTeX.Base.LaTeX.Math',
+    'MathEnvironment': 'plasTeX.Base.LaTeX.Math',
+    'MathEnvironmentPre': 'plasTeX.Base.LaTeX.Math',
+    'MathSymbol': 'plasTeX.Base.LaTeX.Math',
+    'MediumSpace': 'plasTeX.Base.LaTeX.Math',
+    'NG': 'plasTeX.Base.LaTeX.Characters',
+    'NeedsTeXFormat': 'plasTeX.Base.LaTeX.Packages',
+    'NegativeThinSpace': 'plasTeX.Base.LaTeX.Math',
+    'NewLine': 'plasTeX.Base.LaTeX.Breaking',
+    'NoCharSubEnvironment': 'plasTeX.Base.LaTeX.Math',
+    'NoLineBreak': 'plasTeX.Base.LaTeX.Sentences',
+    'Node': 'plasTeX.Base.LaTeX.Characters',
+    'Not': 'plasTeX.Base.LaTeX.Math',
+    'O': 'plasTeX.Base.LaTeX.Characters',
+    'OE': 'plasTeX.Base.LaTeX.Characters',
+    'Omega': 'plasTeX.Base.LaTeX.Math',
+    'Optional': 'plasTeX.Base.LaTeX.Math',
+    'Other': 'plasTeX.Base.LaTeX.Verbatim',
+    'P': 'plasTeX.Base.LaTeX.Accents',
+    'PackageLoader': 'plasTeX.Base.LaTeX.Packages',
+    'PackageWarning': 'plasTeX.Base.LaTeX.Packages',
+    'Percent': 'plasTeX.Base.LaTeX.Sentences',
+    'Phi': 'plasTeX.Base.LaTeX.Math',
+    'Pi': 'plasTeX.Base.LaTeX.Math',
+    'Pr': 'plasTeX.Base.LaTeX.Math',
+    'ProcessOptions': 'plasTeX.Base.LaTeX.Packages',
+    'ProvidesClass': 'plasTeX.Base.LaTeX.Packages',
+    'ProvidesPackage': 'plasTeX.Base.LaTeX.Packages',
+    'Psi': 'plasTeX.Base.LaTeX.Math',
+    'Re': 'plasTeX.Base.LaTeX.Math',
+    'RequirePackage': 'plasTeX.Base.LaTeX.Packages',
+    'RightBrace': 'plasTeX.Base.LaTeX.Sentences',
+    'Rightarrow': 'plasTeX.Base.LaTeX.Math',
+    'Roman': 'plasTeX.Base.LaTeX.Numbering',
+    'S': 'plasTeX.Base.LaTeX.Accents',
+    'SS': 'plasTeX.Base.LaTeX.Characters',
+    'SectionUtils': 'plasTeX.Base.LaTeX.Sectioning',
+    'Sigma': 'plasTeX.Base.LaTeX.Math',
+    'SmallSpace': 'plasTeX.Base.LaTeX.Sentences',
+    'StartSection': 'plasTeX.Base.LaTeX.Sectioning',
+    'Symbol': 'plasTeX.Base.LaTeX.Accents',
+    'TH': 'plasTeX.Base.LaTeX.Characters',
+    'TableOfContents': 'plasTeX.Base.LaTeX.Sectioning',
+    'TableStar': 'plasTeX.Base.LaTeX.Floats',
+    'TabularStar': 'plasTeX.Base.LaTeX.Arrays',
+    'TeX': 'plasTeX.Base.LaTeX.Sentences',
+    'TeXFragment': 'plasTeX.Base.LaTeX.Math',
+    'Text': 'plasTeX.Base.LaTeX.Accents',
+    'TextBoxCommand': 'plasTeX.Base.LaTeX.Boxes',
+    'TextCommand': 'plasTeX.Base.LaTeX.FontSelection',
+    'TextDeclaration': 'plasTeX.Base.LaTeX.FontSelection',
+    'TextSizeDeclaration': 'plasTeX.Base.LaTeX.FontSelection',
+    'Theta': 'plasTeX.Base.LaTeX.Math',
+    'ThickSpace': 'plasTeX.Base.LaTeX.Math',
+    'ThinSpace': 'plasTeX.Base.LaTeX.Math',
+    'ThinSpace_': 'plasTeX.Base.LaTeX.Math',
+    'Tilde': 'plasTeX.Base.LaTeX.Accents',
+    'Token': 'plasTeX.Base.LaTeX.Packages',
+    'Umlaut': 'plasTeX.Base.LaTeX.Accents',
+    'Underscore': 'plasTeX.Base.LaTeX.Sentences',
+    'Uparrow': 'plasTeX.Base.LaTeX.Math',
+    'Updownarrow': 'plasTeX.Base.LaTeX.Math',
+    'Upsilon': 'plasTeX.Base.LaTeX.Math',
+    'VerbatimEnvironment': 'plasTeX.Base.LaTeX.Verbatim',
+    'VerbatimStar': 'plasTeX.Base.LaTeX.Verbatim',
+    'Vert': 'plasTeX.Base.LaTeX.Math',
+    'VerticalBar': 'plasTeX.Base.LaTeX.Math',
+    'Xi': 'plasTeX.Base.LaTeX.Math',
+    'abstract': 'plasTeX.Base.LaTeX.Packages',
+    'acute': 'plasTeX.Base.LaTeX.Math',
+    'addcontentsline': 'plasTeX.Base.LaTeX.Sectioning',
+    'addtocontents': 'plasTeX.Base.LaTeX.Sectioning',
+    'addtocounter': 'plasTeX.Base.LaTeX.Numbering',
+    'addtolength': 'plasTeX.Base.LaTeX.Lengths',
+    'addvspace': 'plasTeX.Base.LaTeX.Space',
+    'ae': 'plasTeX.Base.LaTeX.Characters',
+    'aleph': 'plasTeX.Base.LaTeX.Math',
+    'alph': 'plasTeX.Base.LaTeX.Numbering',
+    'alpha': 'plasTeX.Base.LaTeX.Math',
+    'amalg': 'plasTeX.Base.LaTeX.Math',
+    'appendix': 'plasTeX.Base.LaTeX.Sectioning',
+    'approx': 'plasTeX.Base.LaTeX.Math',
+    'arabic': 'plasTeX.Base.LaTeX.Numbering',
+    'arccos': 'plasTeX.Base.LaTeX.Math',
+    'arcsin': 'plasTeX.Base.LaTeX.Math',
+    'arctan': 'plasTeX.Base.LaTeX.Math',
+    'arg': 'plasTeX.Base.LaTeX.Math',
+    'array': 'plasTeX.Base.LaTeX.Arrays',
+    'arraycolsep': 'plasTeX.Base.LaTeX.Arrays',
+    'arrayrulewidth': 'plasTeX.Base.LaTeX.Arrays',
+    'arraystretch': 'plasTeX.Base.LaTeX.Arrays',
+    'arrowvert': 'plasTeX.Base.LaTeX.Math',
+    'ast': 'plasTeX.Base.LaTeX.Math',
+    'asymp': 'plasTeX.Base.LaTeX.Math',
+    'author': 'plasTeX.Base.LaTeX.Packages',
+    'b': 'plasTeX.Base.LaTeX.Accents',
+    'backslash': 'plasTeX.Base.LaTeX.Math',
+    'bar': 'plasTeX.Base.LaTeX.Math',
+    'baselinestretch': 'plasTeX.Base.LaTeX.Paragraphs',
+    'begin': 'plasTeX.Base.LaTeX.Environments',
+    'beta': 'plasTeX.Base.LaTeX.Math',
+    'bfseries': 'plasTeX.Base.LaTeX.FontSelection',
+    'bgroup': 'plasTeX.Base.LaTeX.Verbatim',
+    'bibcite': 'plasTeX.Base.LaTeX.Bibliography',
+    'bibdata': 'plasTeX.Base.LaTeX.Bibliography',
+    'bibindent': 'plasTeX.Base.LaTeX.Packages',
+    'bibliography': 'plasTeX.Base.LaTeX.Bibliography',
+    'bibliographyref': 'plasTeX.Base.LaTeX.Bibliography',
+    'bibliographystyle': 'plasTeX.Base.LaTeX.Bibliography',
+    'bibstyle': 'plasTeX.Base.LaTeX.Bibliography',
+    'big': 'plasTeX.Base.LaTeX.Math',
+    'bigcap': 'plasTeX.Base.LaTeX.Math',
+    'bigcirc': 'plasTeX.Base.LaTeX.Math',
+    'bigcup': 'plasTeX.Base.LaTeX.Math',
+    'bigg': 'plasTeX.Base.LaTeX.Math',
+    'biggl': 'plasTeX.Base.LaTeX.Math',
+    'biggm': 'plasTeX.Base.LaTeX.Math',
+    'biggr': 'plasTeX.Base.LaTeX.Math',
+    'bigl': 'plasTeX.Base.LaTeX.Math',
+    'bigm': 'plasTeX.Base.LaTeX.Math',
+    'bigodot': 'plasTeX.Base.LaTeX.Math',
+    'bigoplus': 'plasTeX.Base.LaTeX.Math',
+    'bigotimes': 'plasTeX.Base.LaTeX.Math',
+    'bigr': 'plasTeX.Base.LaTeX.Math',
+    'bigskip': 'plasTeX.Base.LaTeX.Space',
+    'bigskipamount': 'plasTeX.Base.LaTeX.Space',
+    'bigsqcup': 'plasTeX.Base.LaTeX.Math',
+    'bigtriangledown': 'plasTeX.Base.LaTeX.Math',
+    'bigtriangleup': 'plasTeX.Base.LaTeX.Math',
+    'biguplus': 'plasTeX.Base.LaTeX.Math',
+    'bigvee': 'plasTeX.Base.LaTeX.Math',
+    'bigwedge': 'plasTeX.Base.LaTeX.Math',
+    'bmod': 'plasTeX.Base.LaTeX.Math',
+    'boldmath': 'plasTeX.Base.LaTeX.Math',
+    'bot': 'plasTeX.Base.LaTeX.Math',
+    'bottomfraction': 'plasTeX.Base.LaTeX.Floats',
+    'bowtie': 'plasTeX.Base.LaTeX.Math',
+    'brace': 'plasTeX.Base.LaTeX.Math',
+    'bracevert': 'plasTeX.Base.LaTeX.Math',
+    'brack': 'plasTeX.Base.LaTeX.Math',
+    'breve': 'plasTeX.Base.LaTeX.Math',
+    'bullet': 'plasTeX.Base.LaTeX.Math',
+    'c': 'plasTeX.Base.LaTeX.Accents',
+    'cachedproperty': 'plasTeX.Base.LaTeX.Sectioning',
+    'cap': 'plasTeX.Base.LaTeX.Math',
+    'cdot': 'plasTeX.Base.LaTeX.Math',
+    'cdots': 'plasTeX.Base.LaTeX.Math',
+    'center': 'plasTeX.Base.LaTeX.Alignment',
+    'centering': 'plasTeX.Base.LaTeX.Alignment',
+    'chapter': 'plasTeX.Base.LaTeX.Sectioning',
+    'check': 'plasTeX.Base.LaTeX.Math',
+    'chi': 'plasTeX.Base.LaTeX.Math',
+    'choose': 'plasTeX.Base.LaTeX.Math',
+    'circ': 'plasTeX.Base.LaTeX.Math',
+    'citation': 'plasTeX.Base.LaTeX.Bibliography',
+    'cite': 'plasTeX.Base.LaTeX.Bibliography',
+    'cleardoublepage': 'plasTeX.Base.LaTeX.Breaking',
+    'clearpage': 'plasTeX.Base.LaTeX.Breaking',
+    'clubsuit': 'plasTeX.Base.LaTeX.Math',
+    'collator': 'plasTeX.Base.LaTeX.Index',
+    'columnsep': 'plasTeX.Base.LaTeX.Packages',
+    'columnseprule': 'plasTeX.Base.LaTeX.Packages',
+    'columnwidth': 'plasTeX.Base.LaTeX.Paragraphs',
+    'cong': 'plasTeX.Base.LaTeX.Math',
+    'coprod': 'plasTeX.Base.LaTeX.Math',
+    'copyright': 'plasTeX.Base.LaTeX.Accents',
+    'cos': 'plasTeX.Base.LaTeX.Math',
+    'cosh': 'plasTeX.Base.LaTeX.Math',
+    'cot': 'plasTeX.Base.LaTeX.Math',
+    'coth': 'plasTeX.Base.LaTeX.Math',
+    'csc': 'plasTeX.Base.LaTeX.Math',
+    'cup': 'plasTeX.Base.LaTeX.Math',
+    'd': 'plasTeX.Base.LaTeX.Accents',
+    'dag': 'plasTeX.Base.LaTeX.Accents',
+    'dagger': 'plasTeX.Base.LaTeX.Math',
+    'dashv': 'plasTeX.Base.LaTeX.Math',
+    'date': 'plasTeX.Base.LaTeX.Packages',
+    'dblfloatpagefraction': 'plasTeX.Base.LaTeX.Floats',
+    'dblfloatsep': 'plasTeX.Base.LaTeX.Floats',
+    'dbltextfloatsep': 'plasTeX.Base.LaTeX.Floats',
+    'dbltopfraction': 'plasTeX.Base.LaTeX.Floats',
+    'ddag': 'plasTeX.Base.LaTeX.Accents',
+    'ddagger': 'plasTeX.Base.LaTeX.Math',
+    'ddot': 'plasTeX.Base.LaTeX.Math',
+    'ddots': 'plasTeX.Base.LaTeX.Math',
+    'deflog': 'plasTeX.Base.LaTeX.Definitions',
+    'deg': 'plasTeX.Base.LaTeX.Math',
+    'delta': 'plasTeX.Base.LaTeX.Math',
+    'description': 'plasTeX.Base.LaTeX.Lists',
+    'det': 'plasTeX.Base.LaTeX.Math',
+    'dh': 'plasTeX.Base.LaTeX.Characters',
+    'diamond': 'plasTeX.Base.LaTeX.Math',
+    'diamondsuit': 'plasTeX.Base.LaTeX.Math',
+    'dim': 'plasTeX.Base.LaTeX.Math',
+    'ding': 'plasTeX.Base.LaTeX.Characters',
+    'displaymath': 'plasTeX.Base.LaTeX.Math',
+    'displaystyle': 'plasTeX.Base.LaTeX.Math',
+    'div': 'plasTeX.Base.LaTeX.Math',
+    'dj': 'plasTeX.Base.LaTeX.Characters',
+    'document': 'plasTeX.Base.LaTeX.Document',
+    'documentclass': 'plasTeX.Base.LaTeX.Packages',
+    'documentstyle': 'plasTeX.Base.LaTeX.Packages',
+    'dot': 'plasTeX.Base.LaTeX.Math',
+    'doteq': 'plasTeX.Base.LaTeX.Math',
+    'doublerulesep': 'plasTeX.Base.LaTeX.Arrays',
+    'downarrow': 'plasTeX.Base.LaTeX.Math',
+    'ell': 'plasTeX.Base.LaTeX.Math',
+    'em': 'plasTeX.Base.LaTeX.Sentences',
+    'emph': 'plasTeX.Base.LaTeX.Sentences',
+    'emptyset': 'plasTeX.Base.LaTeX.Math',
+    'end': 'plasTeX.Base.LaTeX.Environments',
+    'endverbatim': 'plasTeX.Base.LaTeX.Verbatim',
+    'enlargethispage': 'plasTeX.Base.LaTeX.Breaking',
+    'ensuremath': 'plasTeX.Base.LaTeX.Math',
+    'enumerate_': 'plasTeX.Base.LaTeX.Lists',
+    'enumiiiname': 'plasTeX.Base.LaTeX.Lists',
+    'enumiiname': 'plasTeX.Base.LaTeX.Lists',
+    'enuminame': 'plasTeX.Base.LaTeX.Lists',
+    'enumivname': 'plasTeX.Base.LaTeX.Lists',
+    'envlog': 'plasTeX.Base.LaTeX.Environments',
+    'epsilon': 'plasTeX.Base.LaTeX.Math',
+    'eqnarray': 'plasTeX.Base.LaTeX.Math',
+    'equation': 'plasTeX.Base.LaTeX.Math',
+    'equiv': 'plasTeX.Base.LaTeX.Math',
+    'eta': 'plasTeX.Base.LaTeX.Math',
+    'evensidemargin': 'plasTeX.Base.LaTeX.Packages',
+    'exists': 'plasTeX.Base.LaTeX.Math',
+    'exp': 'plasTeX.Base.LaTeX.Math',
+    'fbox': 'plasTeX.Base.LaTeX.Boxes',
+    'fboxrule': 'plasTeX.Base.LaTeX.Boxes',
+    'fboxsep': 'plasTeX.Base.LaTeX.Boxes',
+    'figure': 'plasTeX.Base.LaTeX.Floats',
+    'filecontents': 'plasTeX.Base.LaTeX.Files',
+    'fill': 'plasTeX.Base.LaTeX.Lengths',
+    'flat': 'plasTeX.Base.LaTeX.Math',
+    'floatpagefraction': 'plasTeX.Base.LaTeX.Floats',
+    'floatsep': 'plasTeX.Base.LaTeX.Floats',
+    'flushleft': 'plasTeX.Base.LaTeX.Alignment',
+    'flushright': 'plasTeX.Base.LaTeX.Alignment',
+    'fnsymbol': 'plasTeX.Base.LaTeX.Numbering',
+    'footnote': 'plasTeX.Base.LaTeX.Footnotes',
+    'footnotemark': 'plasTeX.Base.LaTeX.Footnotes',
+    'footnoterule': 'plasTeX.Base.LaTeX.Footnotes',
+    'footnotesep': 'plasTeX.Base.LaTeX.Footnotes',
+    'footnotesize': 'plasTeX.Base.LaTeX.FontSelection',
+    'footnotetext': 'plasTeX.Base.LaTeX.Footnotes',
+    'footskip': 'plasTeX.Base.LaTeX.Packages',
+    'forall': 'plasTeX.Base.LaTeX.Math',
+    'frac': 'plasTeX.Base.LaTeX.Math',
+    'framebox': 'plasTeX.Base.LaTeX.Boxes',
+    'frown': 'plasTeX.Base.LaTeX.Math',
+    'fussy': 'plasTeX.Base.LaTeX.Breaking',
+    'gamma': 'plasTeX.Base.LaTeX.Math',
+    'gcd': 'plasTeX.Base.LaTeX.Math',
+    'ge': 'plasTeX.Base.LaTeX.Math',
+    'geq': 'plasTeX.Base.LaTeX.Math',
+    'getLogger': 'plasTeX.Base.LaTeX.Packages',
+    'gg': 'plasTeX.Base.LaTeX.Math',
+    'glossary': 'plasTeX.Base.LaTeX.Index',
+    'grave': 'plasTeX.Base.LaTeX.Math',
+    'guillemotright': 'plasTeX.Base.LaTeX.Characters',
+    'guillmotleft': 'plasTeX.Base.LaTeX.Characters',
+    'guilsinglleft': 'plasTeX.Base.LaTeX.Characters',
+    'guilsinglright': 'plasTeX.Base.LaTeX.Characters',
+    'hat': 'plasTeX.Base.LaTeX.Math',
+    'hbar': 'plasTeX.Base.LaTeX.Math',
+    'headheight': 'plasTeX.Base.LaTeX.Packages',
+    'headsep': 'plasTeX.Base.LaTeX.Packages',
+    'heartsuit': 'plasTeX.Base.LaTeX.Math',
+    'hfill': 'plasTeX.Base.LaTeX.Space',
+    'hom': 'plasTeX.Base.LaTeX.Math',
+    'hookleftarrow': 'plasTeX.Base.LaTeX.Math',
+    'hookrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'hspace': 'plasTeX.Base.LaTeX.Space',
+    'huge': 'plasTeX.Base.LaTeX.FontSelection',
+    'hyperindexformat': 'plasTeX.Base.LaTeX.Index',
+    'hyperpage': 'plasTeX.Base.LaTeX.Index',
+    'hyphenation': 'plasTeX.Base.LaTeX.Breaking',
+    'i': 'plasTeX.Base.LaTeX.Characters',
+    'imath': 'plasTeX.Base.LaTeX.Math',
+    'includeonly': 'plasTeX.Base.LaTeX.Files',
+    'indent': 'plasTeX.Base.LaTeX.Paragraphs',
+    'index': 'plasTeX.Base.LaTeX.Index',
+    'inf': 'plasTeX.Base.LaTeX.Math',
+    'infty': 'plasTeX.Base.LaTeX.Math',
+    'int': 'plasTeX.Base.LaTeX.Math',
+    'intextsep': 'plasTeX.Base.LaTeX.Floats',
+    'iota': 'plasTeX.Base.LaTeX.Math',
+    'itemindent': 'plasTeX.Base.LaTeX.Lists',
+    'itemize': 'plasTeX.Base.LaTeX.Lists',
+    'itemsep': 'plasTeX.Base.LaTeX.Lists',
+    'itshape': 'plasTeX.Base.LaTeX.FontSelection',
+    'j': 'plasTeX.Base.LaTeX.Characters',
+    'jmath': 'plasTeX.Base.LaTeX.Math',
+    'jot': 'plasTeX.Base.LaTeX.Math',
+    'k': 'plasTeX.Base.LaTeX.Accents',
+    'kappa': 'plasTeX.Base.LaTeX.Math',
+    'ker': 'plasTeX.Base.LaTeX.Math',
+    'l': 'plasTeX.Base.LaTeX.Characters',
+    'label': 'plasTeX.Base.LaTeX.Crossref',
+    'labelitemi': 'plasTeX.Base.LaTeX.Lists',
+    'labelitemii': 'plasTeX.Base.LaTeX.Lists',
+    'labelitemiii': 'plasTeX.Base.LaTeX.Lists',
+    'labelitemiv': 'plasTeX.Base.LaTeX.Lists',
+    'labelsep': 'plasTeX.Base.LaTeX.Lists',
+    'labelwidth': 'plasTeX.Base.LaTeX.Lists',
+    'langle': 'plasTeX.Base.LaTeX.Math',
+    'large': 'plasTeX.Base.LaTeX.FontSelection',
+    'lbrace': 'plasTeX.Base.LaTeX.Math',
+    'lceil': 'plasTeX.Base.LaTeX.Math',
+    'ldots': 'plasTeX.Base.LaTeX.Math',
+    'le': 'plasTeX.Base.LaTeX.Math',
+    'leadsto': 'plasTeX.Base.LaTeX.Math',
+    'left': 'plasTeX.Base.LaTeX.Math',
+    'leftarrow': 'plasTeX.Base.LaTeX.Math',
+    'lefteqn': 'plasTeX.Base.LaTeX.Math',
+    'leftharpoondown': 'plasTeX.Base.LaTeX.Math',
+    'leftharpoonup': 'plasTeX.Base.LaTeX.Math',
+    'leftmargin': 'plasTeX.Base.LaTeX.Lists',
+    'leftrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'leq': 'plasTeX.Base.LaTeX.Math',
+    'lfloor': 'plasTeX.Base.LaTeX.Math',
+    'lg': 'plasTeX.Base.LaTeX.Math',
+    'lgroup': 'plasTeX.Base.LaTeX.Math',
+    'lhd': 'plasTeX.Base.LaTeX.Math',
+    'lim': 'plasTeX.Base.LaTeX.Math',
+    'liminf': 'plasTeX.Base.LaTeX.Math',
+    'limsup': 'plasTeX.Base.LaTeX.Math',
+    'linebreak': 'plasTeX.Base.LaTeX.Breaking',
+    'linewidth': 'plasTeX.Base.LaTeX.Paragraphs',
+    'listfiles': 'plasTeX.Base.LaTeX.Files',
+    'listoffigures': 'plasTeX.Base.LaTeX.Sectioning',
+    'listoftables': 'plasTeX.Base.LaTeX.Sectioning',
+    'listparindent': 'plasTeX.Base.LaTeX.Lists',
+    'll': 'plasTeX.Base.LaTeX.Math',
+    'lmoustache': 'plasTeX.Base.LaTeX.Math',
+    'ln': 'plasTeX.Base.LaTeX.Math',
+    'log': 'plasTeX.Base.LaTeX.Packages',
+    'longleftarrow': 'plasTeX.Base.LaTeX.Math',
+    'longleftrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'longmapsto': 'plasTeX.Base.LaTeX.Math',
+    'longrightarrow': 'plasTeX.Base.LaTeX.Math',
+    'lrbox': 'plasTeX.Base.LaTeX.Boxes',
+    'makebox': 'plasTeX.Base.LaTeX.Boxes',
+    'makeglossary': 'plasTeX.Base.LaTeX.Index',
+    'makeindex': 'plasTeX.Base.LaTeX.Index',
+    'makelabel': 'plasTeX.Base.LaTeX.Lists',
+    'maketitle': 'plasTeX.Base.LaTeX.Packages',
+    'mapsto': 'plasTeX.Base.LaTeX.Math',
+    'marginpar': 'plasTeX.Base.LaTeX.Floats',
+    'marginparpush': 'plasTeX.Base.LaTeX.Floats',
+    'marginparsep': 'plasTeX.Base.LaTeX.Packages',
+    'marginparwidth': 'plasTeX.Base.LaTeX.Packages',
+    'markboth': 'plasTeX.Base.LaTeX.Packages',
+    'markright': 'plasTeX.Base.LaTeX.Packages',
+    'math': 'plasTeX.Base.LaTeX.Math',
+    'mathbf': 'plasTeX.Base.LaTeX.Math',
+    'mathcal': 'plasTeX.Base.LaTeX.Math',
+    'mathindent': 'plasTeX.Base.LaTeX.Math',
+    'mathit': 'plasTeX.Base.LaTeX.Math',
+    'mathjax_lt_gt': 'plasTeX.Base.LaTeX.Math',
+    'mathml': 'plasTeX.Base.LaTeX.Math',
+    'mathop': 'plasTeX.Base.LaTeX.Math',
+    'mathrm': 'plasTeX.Base.LaTeX.Math',
+    'mathsf': 'plasTeX.Base.LaTeX.Math',
+    'mathtt': 'plasTeX.Base.LaTeX.Math',
+    'max': 'plasTeX.Base.LaTeX.Math',
+    'mbox': 'plasTeX.Base.LaTeX.Boxes',
+    'mdseries': 'plasTeX.Base.LaTeX.FontSelection',
+    'medskip': 'plasTeX.Base.LaTeX.Space',
+    'medskipamount': 'plasTeX.Base.LaTeX.Space',
+    'mho': 'plasTeX.Base.LaTeX.Math',
+    'mid': 'plasTeX.Base.LaTeX.Math',
+    'min': 'plasTeX.Base.LaTeX.Math',
+    'minipage': 'plasTeX.Base.LaTeX.Boxes',
+    'models': 'plasTeX.Base.LaTeX.Math',
+    'mp': 'plasTeX.Base.LaTeX.Math',
+    'mu': 'plasTeX.Base.LaTeX.Math',
+    'nabla': 'plasTeX.Base.LaTeX.Math',
+    'natural': 'plasTeX.Base.LaTeX.Math',
+    'ne': 'plasTeX.Base.LaTeX.Math',
+    'nearrow': 'plasTeX.Base.LaTeX.Math',
+    'neg': 'plasTeX.Base.LaTeX.Math',
+    'neq': 'plasTeX.Base.LaTeX.Math',
+    'newblock': 'plasTeX.Base.LaTeX.Bibliography',
+    'newcommand': 'plasTeX.Base.LaTeX.Definitions',
+    'newcounter': 'plasTeX.Base.LaTeX.Numbering',
+    'newenvironment': 'plasTeX.Base.LaTeX.Definitions',
+    'newlength': 'plasTeX.Base.LaTeX.Lengths',
+    'newline': 'plasTeX.Base.LaTeX.Breaking',
+    'newpage': 'plasTeX.Base.LaTeX.Breaking',
+    'newsavebox': 'plasTeX.Base.LaTeX.Boxes',
+    'newtheorem': 'plasTeX.Base.LaTeX.Definitions',
+    'ng': 'plasTeX.Base.LaTeX.Characters',
+    'ni': 'plasTeX.Base.LaTeX.Math',
+    'nocite': 'plasTeX.Base.LaTeX.Bibliography',
+    'nofiles': 'plasTeX.Base.LaTeX.Files',
+    'noindent': 'plasTeX.Base.LaTeX.Paragraphs',
+    'nolinebreak': 'plasTeX.Base.LaTeX.Breaking',
+    'nonumber': 'plasTeX.Base.LaTeX.Math',
+    'nopagebreak': 'plasTeX.Base.LaTeX.Breaking',
+    'normalfont': 'plasTeX.Base.LaTeX.FontSelection',
+    'normalmarginpar': 'plasTeX.Base.LaTeX.Floats',
+    'normalsize': 'plasTeX.Base.LaTeX.FontSelection',
+    'notag': 'plasTeX.Base.LaTeX.Math',
+    'notin': 'plasTeX.Base.LaTeX.Math',
+    'nu': 'plasTeX.Base.LaTeX.Math',
+    'nwarrow': 'plasTeX.Base.LaTeX.Math',
+    'o': 'plasTeX.Base.LaTeX.Characters',
+    'oddsidemargin': 'plasTeX.Base.LaTeX.Packages',
+    'odot': 'plasTeX.Base.LaTeX.Math',
+    'oe': 'plasTeX.Base.LaTeX.Characters',
+    'oint': 'plasTeX.Base.LaTeX.Math',
+    'omega': 'plasTeX.Base.LaTeX.Math',
+    'ominus': 'plasTeX.Base.LaTeX.Math',
+    'onecolumn': 'plasTeX.Base.LaTeX.Packages',
+    'oplus': 'plasTeX.Base.LaTeX.Math',
+    'oslash': 'plasTeX.Base.LaTeX.Math',
+    'otimes': 'plasTeX.Base.LaTeX.Math',
+    'overbrace': 'plasTeX.Base.LaTeX.Math',
+    'overline': 'plasTeX.Base.LaTeX.Math',
+    'pagebreak': 'plasTeX.Base.LaTeX.Breaking',
+    'pagenumbering': 'plasTeX.Base.LaTeX.Packages',
+    'pageref': 'plasTeX.Base.LaTeX.Crossref',
+    'pagestyle': 'plasTeX.Base.LaTeX.Packages',
+    'paperheight': 'plasTeX.Base.LaTeX.Packages',
+    'paperwidth': 'plasTeX.Base.LaTeX.Packages',
+    'paragraph': 'plasTeX.Base.LaTeX.Sectioning',
+    'parallel': 'plasTeX.Base.LaTeX.Math',
+    'parbox': 'plasTeX.Base.LaTeX.Boxes',
+    'parsep': 'plasTeX.Base.LaTeX.Lists',
+    'part': 'plasTeX.Base.LaTeX.Sectioning',
+    'partial': 'plasTeX.Base.LaTeX.Math',
+    'partopsep': 'plasTeX.Base.LaTeX.Lists',
+    'perp': 'plasTeX.Base.LaTeX.Math',
+    'phantom': 'plasTeX.Base.LaTeX.Space',
+    'phi': 'plasTeX.Base.LaTeX.Math',
+    'pi': 'plasTeX.Base.LaTeX.Math',
+    'picture': 'plasTeX.Base.LaTeX.Pictures',
+    'pm': 'plasTeX.Base.LaTeX.Math',
+    'pmod': 'plasTeX.Base.LaTeX.Math',
+    'pounds': 'plasTeX.Base.LaTeX.Accents',
+    'prec': 'plasTeX.Base.LaTeX.Math',
+    'preceq': 'plasTeX.Base.LaTeX.Math',
+    'prime': 'plasTeX.Base.LaTeX.Math',
+    'printindex': 'plasTeX.Base.LaTeX.Index',
+    'prod': 'plasTeX.Base.LaTeX.Math',
+    'propto': 'plasTeX.Base.LaTeX.Math',
+    'providecommand': 'plasTeX.Base.LaTeX.Definitions',
+    'psi': 'plasTeX.Base.LaTeX.Math',
+    'qbeziermax': 'plasTeX.Base.LaTeX.Pictures',
+    'quotation': 'plasTeX.Base.LaTeX.Quotations',
+    'quote': 'plasTeX.Base.LaTeX.Quotations',
+    'quotedblbase': 'plasTeX.Base.LaTeX.Characters',
+    'quotesinglbase': 'plasTeX.Base.LaTeX.Characters',
+    'r': 'plasTeX.Base.LaTeX.Accents',
+    'raggedbottom': 'plasTeX.Base.LaTeX.Alignment',
+    'raggedleft': 'plasTeX.Base.LaTeX.Alignment',
+    'raggedright': 'plasTeX.Base.LaTeX.Alignment',
+    'raisebox': 'plasTeX.Base.LaTeX.Boxes',
+    'rangle': 'plasTeX.Base.LaTeX.Math',
+    'rbrace': 'plasTeX.Base.LaTeX.Math',
+    'rceil': 'plasTeX.Base.LaTeX.Math',
+    'ref': 'plasTeX.Base.LaTeX.Crossref',
+    'refstepcounter': 'plasTeX.Base.LaTeX.Numbering',
+    'renewcommand': 'plasTeX.Base.LaTeX.Definitions',
+    'renewenvironment': 'plasTeX.Base.LaTeX.Definitions',
+    'reversemarginpar': 'plasTeX.Base.LaTeX.Floats',
+    'rfloor': 'plasTeX.Base.LaTeX.Math',
+    'rgroup': 'plasTeX.Base.LaTeX.Math',
+    'rhd': 'plasTeX.Base.LaTeX.Math',
+    'rho': 'plasTeX.Base.LaTeX.Math',
+    'right': 'plasTeX.Base.LaTeX.Math',
+    'rightarrow': 'plasTeX.Base.LaTeX.Math',
+    'rightharpoondown': 'plasTeX.Base.LaTeX.Math',
+    'rightharpoonup': 'plasTeX.Base.LaTeX.Math',
+    'rightleftharpoons': 'plasTeX.Base.LaTeX.Math',
+    'rightmargin': 'plasTeX.Base.LaTeX.Lists',
+    'rmfamily': 'plasTeX.Base.LaTeX.FontSelection',
+    'rmoustache': 'plasTeX.Base.LaTeX.Math',
+    'roman': 'plasTeX.Base.LaTeX.Numbering',
+    'rule': 'plasTeX.Base.LaTeX.Boxes',
+    'savebox': 'plasTeX.Base.LaTeX.Boxes',
+    'sbox': 'plasTeX.Base.LaTeX.Boxes',
+    'scriptscriptstyle': 'plasTeX.Base.LaTeX.Math',
+    'scriptsize': 'plasTeX.Base.LaTeX.FontSelection',
+    'scriptstyle': 'plasTeX.Base.LaTeX.Math',
+    'scshape': 'plasTeX.Base.LaTeX.FontSelection',
+    'searrow': 'plasTeX.Base.LaTeX.Math',
+    'sec': 'plasTeX.Base.LaTeX.Math',
+    'section': 'plasTeX.Base.LaTeX.Sectioning',
+    'setcounter': 'plasTeX.Base.LaTeX.Numbering',
+    'setlength': 'plasTeX.Base.LaTeX.Lengths',
+    'setminus': 'plasTeX.Base.LaTeX.Math',
+    'settodepth': 'plasTeX.Base.LaTeX.Lengths',
+    'settoheight': 'plasTeX.Base.LaTeX.Lengths',
+    'settowidth': 'plasTeX.Base.LaTeX.Lengths',
+    'sffamily': 'plasTeX.Base.LaTeX.FontSelection',
+    'sharp': 'plasTeX.Base.LaTeX.Math',
+    'sigma': 'plasTeX.Base.LaTeX.Math',
+    'sim': 'plasTeX.Base.LaTeX.Math',
+    'simeq': 'plasTeX.Base.LaTeX.Math',
+    'sin': 'plasTeX.Base.LaTeX.Math',
+    'sinh': 'plasTeX.Base.LaTeX.Math',
+    'sloppy': 'plasTeX.Base.LaTeX.Breaking',
+    'sloppypar': 'plasTeX.Base.LaTeX.Breaking',
+    'slshape': 'plasTeX.Base.LaTeX.FontSelection',
+    'small': 'plasTeX.Base.LaTeX.FontSelection',
+    'smallskip': 'plasTeX.Base.LaTeX.Space',
+    'smallskipamount': 'plasTeX.Base.LaTeX.Space',
+    'smile': 'plasTeX.Base.LaTeX.Math',
+    'sourceArguments': 'plasTeX.Base.LaTeX.Verbatim',
+    'sourceChildren': 'plasTeX.Base.LaTeX.Verbatim',
+    'spadesuit': 'plasTeX.Base.LaTeX.Math',
+    'sqcap': 'plasTeX.Base.LaTeX.Math',
+    'sqcup': 'plasTeX.Base.LaTeX.Math',
+    'sqrt': 'plasTeX.Base.LaTeX.Math',
+    'sqsubseteq': 'plasTeX.Base.LaTeX.Math',
+    'sqsupset': 'plasTeX.Base.LaTeX.Math',
+    'sqsupseteq': 'plasTeX.Base.LaTeX.Math',
+    'ss': 'plasTeX.Base.LaTeX.Characters',
+    'stackrel': 'plasTeX.Base.LaTeX.Math',
+    'star': 'plasTeX.Base.LaTeX.Math',
+    'stepcounter': 'plasTeX.Base.LaTeX.Numbering',
+    'stretch': 'plasTeX.Base.LaTeX.Lengths',
+    'subparagraph': 'plasTeX.Base.LaTeX.Sectioning',
+    'subsection': 'plasTeX.Base.LaTeX.Sectioning',
+    'subset': 'plasTeX.Base.LaTeX.Math',
+    'subseteq': 'plasTeX.Base.LaTeX.Math',
+    'subsubparagraph': 'plasTeX.Base.LaTeX.Sectioning',
+    'subsubsection': 'plasTeX.Base.LaTeX.Sectioning',
+    'succ': 'plasTeX.Base.LaTeX.Math',
+    'succeq': 'plasTeX.Base.LaTeX.Math',
+    'sum': 'plasTeX.Base.LaTeX.Math',
+    'sup': 'plasTeX.Base.LaTeX.Math',
+    'suppressfloats': 'plasTeX.Base.LaTeX.Floats',
+    'supset': 'plasTeX.Base.LaTeX.Math',
+    'supseteq': 'plasTeX.Base.LaTeX.Math',
+    'surd': 'plasTeX.Base.LaTeX.Math',
+    'swarrow': 'plasTeX.Base.LaTeX.Math',
+    'symbol': 'plasTeX.Base.LaTeX.FontSelection',
+    't': 'plasTeX.Base.LaTeX.Accents',
+    'tabbing': 'plasTeX.Base.LaTeX.Tabbing',
+    'tabbingsep': 'plasTeX.Base.LaTeX.Tabbing',
+    'tabcolsep': 'plasTeX.Base.LaTeX.Arrays',
+    'table': 'plasTeX.Base.LaTeX.Floats',
+    'tableofcontents': 'plasTeX.Base.LaTeX.Sectioning',
+    'tabular': 'plasTeX.Base.LaTeX.Arrays',
+    'tabularx': 'plasTeX.Base.LaTeX.Arrays',
+    'tabulary': 'plasTeX.Base.LaTeX.Arrays',
+    'tan': 'plasTeX.Base.LaTeX.Math',
+    'tanh': 'plasTeX.Base.LaTeX.Math',
+    'tau': 'plasTeX.Base.LaTeX.Math',
+    'text': 'plasTeX.Base.LaTeX.Math',
+    'textasciicircum': 'plasTeX.Base.LaTeX.Characters',
+    'textasciitilde': 'plasTeX.Base.LaTeX.Characters',
+    'textbackslash': 'plasTeX.Base.LaTeX.Characters',
+    'textbar': 'plasTeX.Base.LaTeX.Characters',
+    'textbf': 'plasTeX.Base.LaTeX.FontSelection',
+    'textbraceleft': 'plasTeX.Base.LaTeX.Characters',
+    'textbraceright': 'plasTeX.Base.LaTeX.Characters',
+    'textcompwordmark': 'plasTeX.Base.LaTeX.Characters',
+    'textcopyright': 'plasTeX.Base.LaTeX.Characters',
+    'textdollar': 'plasTeX.Base.LaTeX.Characters',
+    'textemdash': 'plasTeX.Base.LaTeX.Characters',
+    'textendash': 'plasTeX.Base.LaTeX.Characters',
+    'textexclamdown': 'plasTeX.Base.LaTeX.Characters',
+    'textfloatsep': 'plasTeX.Base.LaTeX.Floats',
+    'textfraction': 'plasTeX.Base.LaTeX.Floats',
+    'textgreater': 'plasTeX.Base.LaTeX.Characters',
+    'textheight': 'plasTeX.Base.LaTeX.Packages',
+    'textit': 'plasTeX.Base.LaTeX.FontSelection',
+    'textless': 'plasTeX.Base.LaTeX.Characters',
+    'textmd': 'plasTeX.Base.LaTeX.FontSelection',
+    'textnormal': 'plasTeX.Base.LaTeX.FontSelection',
+    'textogonekcentered': 'plasTeX.Base.LaTeX.Characters',
+    'textpertenthousand': 'plasTeX.Base.LaTeX.Characters',
+    'textperthousand': 'plasTeX.Base.LaTeX.Characters',
+    'textquestiondown': 'plasTeX.Base.LaTeX.Characters',
+    'textquotedbl': 'plasTeX.Base.LaTeX.Characters',
+    'textquotedblleft': 'plasTeX.Base.LaTeX.Characters',
+    'textquotedblright': 'plasTeX.Base.LaTeX.Characters',
+    'textquoteleft': 'plasTeX.Base.LaTeX.Characters',
+    'textquoteright': 'plasTeX.Base.LaTeX.Characters',
+    'textregistered': 'plasTeX.Base.LaTeX.Characters',
+    'textrm': 'plasTeX.Base.LaTeX.FontSelection',
+    'textsc': 'plasTeX.Base.LaTeX.FontSelection',
+    'textsection': 'plasTeX.Base.LaTeX.Characters',
+    'textsf': 'plasTeX.Base.LaTeX.FontSelection',
+    'textsl': 'plasTeX.Base.LaTeX.FontSelection',
+    'textsterling': 'plasTeX.Base.LaTeX.Characters',
+    'textstyle': 'plasTeX.Base.LaTeX.Math',
+    'textsubscript': 'plasTeX.Base.LaTeX.Sentences',
+    'textsuperscript': 'plasTeX.Base.LaTeX.Sentences',
+    'texttrademark': 'plasTeX.Base.LaTeX.Characters',
+    'texttt': 'plasTeX.Base.LaTeX.FontSelection',
+    'textunderscore': 'plasTeX.Base.LaTeX.Characters',
+    'textup': 'plasTeX.Base.LaTeX.FontSelection',
+    'textvisiblespace': 'plasTeX.Base.LaTeX.Characters',
+    'textwidth': 'plasTeX.Base.LaTeX.Packages',
+    'th': 'plasTeX.Base.LaTeX.Characters',
+    'thanks': 'plasTeX.Base.LaTeX.Packages',
+    'thebibliography': 'plasTeX.Base.LaTeX.Bibliography',
+    'theindex': 'plasTeX.Base.LaTeX.Index',
+    'theta': 'plasTeX.Base.LaTeX.Math',
+    'thispagestyle': 'plasTeX.Base.LaTeX.Packages',
+    'tilde': 'plasTeX.Base.LaTeX.Math',
+    'times': 'plasTeX.Base.LaTeX.Math',
+    'tiny': 'plasTeX.Base.LaTeX.FontSelection',
+    'title': 'plasTeX.Base.LaTeX.Packages',
+    'titlepage': 'plasTeX.Base.LaTeX.Packages',
+    'toMathML': 'plasTeX.Base.LaTeX.Math',
+    'top': 'plasTeX.Base.LaTeX.Math',
+    'topfraction': 'plasTeX.Base.LaTeX.Floats',
+    'topmargin': 'plasTeX.Base.LaTeX.Packages',
+    'topsep': 'plasTeX.Base.LaTeX.Lists',
+    'triangle': 'plasTeX.Base.LaTeX.Math',
+    'triangleleft': 'plasTeX.Base.LaTeX.Math',
+    'triangleright': 'plasTeX.Base.LaTeX.Math',
+    'trivlist': 'plasTeX.Base.LaTeX.Lists',
+    'ttfamily': 'plasTeX.Base.LaTeX.FontSelection',
+    'twocolumn': 'plasTeX.Base.LaTeX.Packages',
+    'typein': 'plasTeX.Base.LaTeX.Files',
+    'typeout': 'plasTeX.Base.LaTeX.Files',
+    'u': 'plasTeX.Base.LaTeX.Accents',
+    'unboldmath': 'plasTeX.Base.LaTeX.Math',
+    'underbrace': 'plasTeX.Base.LaTeX.Math',
+    'underline': 'plasTeX.Base.LaTeX.Math',
+    'unidecode': 'plasTeX.Base.LaTeX.Index',
+    'unitlength': 'plasTeX.Base.LaTeX.Pictures',
+    'unlhd': 'plasTeX.Base.LaTeX.Math',
+    'unrhd': 'plasTeX.Base.LaTeX.Math',
+    'uparrow': 'plasTeX.Base.LaTeX.Math',
+    'updownarrow': 'plasTeX.Base.LaTeX.Math',
+    'uplus': 'plasTeX.Base.LaTeX.Math',
+    'upshape': 'plasTeX.Base.LaTeX.FontSelection',
+    'upsilon': 'plasTeX.Base.LaTeX.Math',
+    'usebox': 'plasTeX.Base.LaTeX.Boxes',
+    'usecounter': 'plasTeX.Base.LaTeX.Lists',
+    'usepackage': 'plasTeX.Base.LaTeX.Packages',
+    'v': 'plasTeX.Base.LaTeX.Accents',
+    'value': 'plasTeX.Base.LaTeX.Numbering',
+    'varepsilon': 'plasTeX.Base.LaTeX.Math',
+    'varphi': 'plasTeX.Base.LaTeX.Math',
+    'varpi': 'plasTeX.Base.LaTeX.Math',
+    'varrho': 'plasTeX.Base.LaTeX.Math',
+    'varsigma': 'plasTeX.Base.LaTeX.Math',
+    'vartheta': 'plasTeX.Base.LaTeX.Math',
+    'vdash': 'plasTeX.Base.LaTeX.Math',
+    'vdots': 'plasTeX.Base.LaTeX.Math',
+    'vec': 'plasTeX.Base.LaTeX.Math',
+    'vee': 'plasTeX.Base.LaTeX.Math',
+    'verb': 'plasTeX.Base.LaTeX.Verbatim',
+    'verbatim': 'plasTeX.Base.LaTeX.Verbatim',
+    'verse': 'plasTeX.Base.LaTeX.Quotations',
+    'vert': 'plasTeX.Base.LaTeX.Math',
+    'vfill': 'plasTeX.Base.LaTeX.Space',
+    'vspace': 'plasTeX.Base.LaTeX.Space',
+    'wedge': 'plasTeX.Base.LaTeX.Math',
+    'widehat': 'plasTeX.Base.LaTeX.Math',
+    'widetilde': 'plasTeX.Base.LaTeX.Math',
+    'wp': 'plasTeX.Base.LaTeX.Math',
+    'wr': 'plasTeX.Base.LaTeX.Math',
+    'xi': 'plasTeX.Base.LaTeX.Math',
+    'zeta': 'plasTeX.Base.LaTeX.Math',
+}
+
+# Modules defining the names of plasTeX.Base.TeX
+TEX = {
+    'AlignmentChar': 'plasTeX.Base.TeX.Primitives',
+    'BoxCommand': 'plasTeX.Base.TeX.Primitives',
+    'Command': 'plasTeX.Base.TeX.Numbers',
+    'ControlSpace': 'plasTeX.Base.TeX.Text',
+    'CountCommand': 'plasTeX.Base.TeX.Primitives',
+    'DefCommand': 'plasTeX.Base.TeX.Primitives',
+    'DimenCommand': 'plasTeX.Base.TeX.Registers',
+    'Environment': 'plasTeX.Base.TeX.Fonts',
+    'EscapeSequence': 'plasTeX.Base.TeX.Primitives',
+    'Font': 'plasTeX.Base.TeX.Fonts',
+    'GlueCommand': 'plasTeX.Base.TeX.Registers',
+    'IfCommand': 'plasTeX.Base.TeX.Primitives',
+    'Macro': 'plasTeX.Base.TeX.Primitives',
+    'MathShift': 'plasTeX.Base.TeX.Primitives',
+    'MuGlueCommand': 'plasTeX.Base.TeX.Parameters',
+    'NameDef': 'plasTeX.Base.TeX.Primitives',
+    'Other': 'plasTeX.Base.TeX.Primitives',
+    'ParameterCommand': 'plasTeX.Base.TeX.Parameters',
+    'SubScript': 'plasTeX.Base.TeX.Primitives',
+    'SuperScript': 'plasTeX.Base.TeX.Primitives',
+    'TeXBreak': 'plasTeX.Base.TeX.Text',
+    'TeXCount': 'plasTeX.Base.TeX.Registers',
+    'Token': 'plasTeX.Base.TeX.Primitives',
+    'abovedisplayshortskip': 'plasTeX.Base.TeX.Parameters',
+    'abovedisplayskip': 'plasTeX.Base.TeX.Parameters',
+    'active': 'plasTeX.Base.TeX.Primitives',
+    'adjdemerits': 'plasTeX.Base.TeX.Parameters',
+    'advance': 'plasTeX.Base.TeX.Primitives',
+    'allowbreak': 'plasTeX.Base.TeX.Text',
+    'baselineskip': 'plasTeX.Base.TeX.Parameters',
+    'begingroup': 'plasTeX.Base.TeX.Text',
+    'belowdisplayshortskip': 'plasTeX.Base.TeX.Parameters',
+    'belowdisplayskip': 'plasTeX.Base.TeX.Parameters',
+    'bf': 'plasTeX.Base.TeX.Fonts',
+    'bgroup': 'plasTeX.Base.TeX.Text',
+    'bigbreak': 'plasTeX.Base.TeX.Text',
+    'binoppenalty': 'plasTeX.Base.TeX.Parameters',
+    'box': 'plasTeX.Base.TeX.Registers',
+    'boxmaxdepth': 'plasTeX.Base.TeX.Parameters',
+    'brokenpenalty': 'plasTeX.Base.TeX.Parameters',
+    'cal': 'plasTeX.Base.TeX.Fonts',
+    'catcode': 'plasTeX.Base.TeX.Primitives',
+    'centerline': 'plasTeX.Base.TeX.Text',
+    'char': 'plasTeX.Base.TeX.Primitives',
+    'chardef': 'plasTeX.Base.TeX.Primitives',
+    'closeout': 'plasTeX.Base.TeX.Primitives',
+    'clubpenalty': 'plasTeX.Base.TeX.Parameters',
+    'csname': 'plasTeX.Base.TeX.Primitives',
+    'datetime': 'plasTeX.Base.TeX.Primitives',
+    'day': 'plasTeX.Base.TeX.Parameters',
+    'def_': 'plasTeX.Base.TeX.Primitives',
+    'defaulthyphenchar': 'plasTeX.Base.TeX.Parameters',
+    'defaultskewchar': 'plasTeX.Base.TeX.Parameters',
+    'deflog': 'plasTeX.Base.TeX.Primitives',
+    'delimiterfactor': 'plasTeX.Base.TeX.Parameters',
+    'delimitershortfall': 'plasTeX.Base.TeX.Parameters',
+    'dimen_': 'plasTeX.Base.TeX.Registers',
+    'displayindent': 'plasTeX.Base.TeX.Parameters',
+    'displaywidowpenalty': 'plasTeX.Base.TeX.Parameters',
+    'displaywidth': 'plasTeX.Base.TeX.Parameters',
+    'dots': 'plasTeX.Base.TeX.Text',
+    'doublehyphendemerits': 'plasTeX.Base.TeX.Parameters',
+    'edef': 'plasTeX.Base.TeX.Primitives',
+    'egroup': 'plasTeX.Base.TeX.Text',
+    'eject': 'plasTeX.Base.TeX.Text',
+    'else_': 'plasTeX.Base.TeX.Primitives',
+    'emergencystretch': 'plasTeX.Base.TeX.Parameters',
+    'empty': 'plasTeX.Base.TeX.Text',
+    'endcsname': 'plasTeX.Base.TeX.Primitives',
+    'endgroup': 'plasTeX.Base.TeX.Text',
+    'endinput': 'plasTeX.Base.TeX.Primitives',
+    'endlinechar': 'plasTeX.Base.TeX.Parameters',
+    'enskip': 'plasTeX.Base.TeX.Text',
+    'enspace': 'plasTeX.Base.TeX.Text',
+    'errorcontextlines': 'plasTeX.Base.TeX.Parameters',
+    'escapechar': 'plasTeX.Base.TeX.Parameters',
+    'everypar': 'plasTeX.Base.TeX.Primitives',
+    'exhyphenpenalty': 'plasTeX.Base.TeX.Parameters',
+    'expandafter': 'plasTeX.Base.TeX.Primitives',
+    'fam': 'plasTeX.Base.TeX.Parameters',
+    'fi': 'plasTeX.Base.TeX.Primitives',
+    'filbreak': 'plasTeX.Base.TeX.Text',
+    'finalhyphendemerits': 'plasTeX.Base.TeX.Parameters',
+    'floatingpenalty': 'plasTeX.Base.TeX.Parameters',
+    'frenchspacing': 'plasTeX.Base.TeX.Text',
+    'gdef': 'plasTeX.Base.TeX.Primitives',
+    'getLogger': 'plasTeX.Base.TeX.Primitives',
+    'global_': 'plasTeX.Base.TeX.Primitives',
+    'globaldefs': 'plasTeX.Base.TeX.Parameters',
+    'goodbreak': 'plasTeX.Base.TeX.Text',
+    'hang': 'plasTeX.Base.TeX.Text',
+    'hangafter': 'plasTeX.Base.TeX.Parameters',
+    'hangindent': 'plasTeX.Base.TeX.Parameters',
+    'hbadness': 'plasTeX.Base.TeX.Parameters',
+    'hbox': 'plasTeX.Base.TeX.Primitives',
+    'hfil': 'plasTeX.Base.TeX.Primitives',
+    'hfuzz': 'plasTeX.Base.TeX.Parameters',
+    'hglue': 'plasTeX.Base.TeX.Text',
+    'hideskip': 'plasTeX.Base.TeX.Registers',
+    'hoffset': 'plasTeX.Base.TeX.Parameters',
+    'holdinginserts': 'plasTeX.Base.TeX.Parameters',
+    'hrule': 'plasTeX.Base.TeX.Primitives',
+    'hsize': 'plasTeX.Base.TeX.Parameters',
+    'hskip': 'plasTeX.Base.TeX.Primitives',
+    'htmlfalse': 'plasTeX.Base.TeX.Primitives',
+    'htmltrue': 'plasTeX.Base.TeX.Primitives',
+    'hyphenpenalty': 'plasTeX.Base.TeX.Parameters',
+    'if_': 'plasTeX.Base.TeX.Primitives',
+    'ifcase': 'plasTeX.Base.TeX.Primitives',
+    'ifcat': 'plasTeX.Base.TeX.Primitives',
+    'ifcsname': 'plasTeX.Base.TeX.Primitives',
+    'ifdefined': 'plasTeX.Base.TeX.Primitives',
+    'ifdim': 'plasTeX.Base.TeX.Primitives',
+    'ifeof': 'plasTeX.Base.TeX.Primitives',
+    'iffalse': 'plasTeX.Base.TeX.Primitives',
+    'ifhbox': 'plasTeX.Base.TeX.Primitives',
+    'ifhmode': 'plasTeX.Base.TeX.Primitives',
+    'ifhtml': 'plasTeX.Base.TeX.Primitives',
+    'ifinner': 'plasTeX.Base.TeX.Primitives',
+    'ifmmode': 'plasTeX.Base.TeX.Primitives',
+    'ifnum': 'plasTeX.Base.TeX.Primitives',
+    'ifodd': 'plasTeX.Base.TeX.Primitives',
+    'ifpdf': 'plasTeX.Base.TeX.Primitives',
+    'ifplastex': 'plasTeX.Base.TeX.Primitives',
+    'iftrue': 'plasTeX.Base.TeX.Primitives',
+    'ifvbox': 'plasTeX.Base.TeX.Primitives',
+    'ifvmode': 'plasTeX.Base.TeX.Primitives',
+    'ifvoid': 'plasTeX.Base.TeX.Primitives',
+    'ifx': 'plasTeX.Base.TeX.Primitives',
+    'include': 'plasTeX.Base.TeX.Primitives',
+    'input': 'plasTeX.Base.TeX.Primitives',
+    'interlinepenalty': 'plasTeX.Base.TeX.Parameters',
+    'it': 'plasTeX.Base.TeX.Fonts',
+    'iterate': 'plasTeX.Base.TeX.Text',
+    'jobname': 'plasTeX.Base.TeX.Primitives',
+    'kern': 'plasTeX.Base.TeX.Primitives',
+    'language': 'plasTeX.Base.TeX.Parameters',
+    'lbrack': 'plasTeX.Base.TeX.Text',
+    'leavevmode': 'plasTeX.Base.TeX.Primitives',
+    'lefthyphenmin': 'plasTeX.Base.TeX.Parameters',
+    'leftline': 'plasTeX.Base.TeX.Text',
+    'leftskip': 'plasTeX.Base.TeX.Parameters',
+    'let': 'plasTeX.Base.TeX.Primitives',
+    'line': 'plasTeX.Base.TeX.Text',
+    'linepenalty': 'plasTeX.Base.TeX.Parameters',
+    'lineskip': 'plasTeX.Base.TeX.Parameters',
+    'lineskipamount': 'plasTeX.Base.TeX.Parameters',
+    'llap': 'plasTeX.Base.TeX.Text',
+    'log': 'plasTeX.Base.TeX.Primitives',
+    'long': 'plasTeX.Base.TeX.Primitives',
+    'loop': 'plasTeX.Base.TeX.Text',
+    'looseness': 'plasTeX.Base.TeX.Parameters',
+    'lq': 'plasTeX.Base.TeX.Text',
+    'mag': 'plasTeX.Base.TeX.Parameters',
+    'magstep': 'plasTeX.Base.TeX.Fonts',
+    'magstephalf': 'plasTeX.Base.TeX.Fonts',
+    'mathchardef': 'plasTeX.Base.TeX.Primitives',
+    'mathshiftlog': 'plasTeX.Base.TeX.Primitives',
+    'mathsurround': 'plasTeX.Base.TeX.Parameters',
+    'maxdeadcycles': 'plasTeX.Base.TeX.Parameters',
+    'maxdepth': 'plasTeX.Base.TeX.Parameters',
+    'maxdimen': 'plasTeX.Base.TeX.Registers',
+    'medbreak': 'plasTeX.Base.TeX.Text',
+    'medmuskip': 'plasTeX.Base.TeX.Parameters',
+    'month': 'plasTeX.Base.TeX.Parameters',
+    'narrower': 'plasTeX.Base.TeX.Text',
+    'negthinspace': 'plasTeX.Base.TeX.Text',
+    'newbox': 'plasTeX.Base.TeX.Registers',
+    'newcount': 'plasTeX.Base.TeX.Registers',
+    'newdimen': 'plasTeX.Base.TeX.Registers',
+    'newfam': 'plasTeX.Base.TeX.Registers',
+    'newhelp': 'plasTeX.Base.TeX.Registers',
+    'newif': 'plasTeX.Base.TeX.Registers',
+    'newlanguage': 'plasTeX.Base.TeX.Registers',
+    'newlinechar': 'plasTeX.Base.TeX.Parameters',
+    'newmuskip': 'plasTeX.Base.TeX.Registers',
+    'newread': 'plasTeX.Base.TeX.Registers',
+    'newskip': 'plasTeX.Base.TeX.Registers',
+    'newtoks': 'plasTeX.Base.TeX.Registers',
+    'newwrite': 'plasTeX.Base.TeX.Registers',
+    'nointerlineskip': 'plasTeX.Base.TeX.Text',
+    'noligs_': 'plasTeX.Base.TeX.Primitives',
+    'nonfrenchspacing': 'plasTeX.Base.TeX.Text',
+    'normalbaselines': 'plasTeX.Base.TeX.Text',
+    'null': 'plasTeX.Base.TeX.Text',
+    'nulldelimiterspace': 'plasTeX.Base.TeX.Parameters',
+    'numToRoman': 'plasTeX.Base.TeX.Numbers',
+    'number': 'plasTeX.Base.TeX.Numbers',
+    'obeyspaces': 'plasTeX.Base.TeX.Text',
+    'offinterlineskip': 'plasTeX.Base.TeX.Text',
+    'openout': 'plasTeX.Base.TeX.Primitives',
+    'outputpenalty': 'plasTeX.Base.TeX.Parameters',
+    'overfullrule': 'plasTeX.Base.TeX.Parameters',
+    'par': 'plasTeX.Base.TeX.Primitives',
+    'parfillskip': 'plasTeX.Base.TeX.Parameters',
+    'parindent': 'plasTeX.Base.TeX.Parameters',
+    'parskip': 'plasTeX.Base.TeX.Parameters',
+    'pausing': 'plasTeX.Base.TeX.Parameters',
+    'pdffalse': 'plasTeX.Base.TeX.Primitives',
+    'pdftrue': 'plasTeX.Base.TeX.Primitives',
+    'plastexfalse': 'plasTeX.Base.TeX.Primitives',
+    'plastextrue': 'plasTeX.Base.TeX.Primitives',
+    'postdisplaypenalty': 'plasTeX.Base.TeX.Parameters',
+    'predisplaypenalty': 'plasTeX.Base.TeX.Parameters',
+    'predisplaysize': 'plasTeX.Base.TeX.Parameters',
+    'pretolerance': 'plasTeX.Base.TeX.Parameters',
+    'protect': 'plasTeX.Base.TeX.Primitives',
+    'protected_write': 'plasTeX.Base.TeX.Primitives',
+    'qquad': 'plasTeX.Base.TeX.Text',
+    'quad': 'plasTeX.Base.TeX.Text',
+    'rbrack': 'plasTeX.Base.TeX.Text',
+    'relax': 'plasTeX.Base.TeX.Primitives',
+    'relpenalty': 'plasTeX.Base.TeX.Parameters',
+    'removelastskip': 'plasTeX.Base.TeX.Text',
+    'repeat': 'plasTeX.Base.TeX.Text',
+    'righthyphenmin': 'plasTeX.Base.TeX.Parameters',
+    'rightline': 'plasTeX.Base.TeX.Text',
+    'rightskip': 'plasTeX.Base.TeX.Parameters',
+    'rm': 'plasTeX.Base.TeX.Fonts',
+    'romannumeral': 'plasTeX.Base.TeX.Numbers',
+    'rq': 'plasTeX.Base.TeX.Text',
+    'sc': 'plasTeX.Base.TeX.Fonts',
+    'scriptspace': 'plasTeX.Base.TeX.Parameters',
+    'sf': 'plasTeX.Base.TeX.Fonts',
+    'showboxbreadth': 'plasTeX.Base.TeX.Parameters',
+    'showboxdepth': 'plasTeX.Base.TeX.Parameters',
+    'showthe': 'plasTeX.Base.TeX.Primitives',
+    'skip': 'plasTeX.Base.TeX.Registers',
+    'sl': 'plasTeX.Base.TeX.Fonts',
+    'slash': 'plasTeX.Base.TeX.Text',
+    'smallbreak': 'plasTeX.Base.TeX.Text',
+    'sourceChildren': 'plasTeX.Base.TeX.Text',
+    'space': 'plasTeX.Base.TeX.Text',
+    'spaceskip': 'plasTeX.Base.TeX.Parameters',
+    'splitmaxdepth': 'plasTeX.Base.TeX.Parameters',
+    'splittopskip': 'plasTeX.Base.TeX.Parameters',
+    'status': 'plasTeX.Base.TeX.Primitives',
+    'supereject': 'plasTeX.Base.TeX.Text',
+    'tabskip': 'plasTeX.Base.TeX.Parameters',
+    'textindent': 'plasTeX.Base.TeX.Text',
+    'the': 'plasTeX.Base.TeX.Primitives',
+    'thickmuskip': 'plasTeX.Base.TeX.Parameters',
+    'thinmuskip': 'plasTeX.Base.TeX.Parameters',
+    'thinspace': 'plasTeX.Base.TeX.Text',
+    'time': 'plasTeX.Base.TeX.Parameters',
+    'toks': 'plasTeX.Base.TeX.Registers',
+    'tolerance': 'plasTeX.Base.TeX.Parameters',
+    'topglue': 'plasTeX.Base.TeX.Text',
+    'topskip': 'plasTeX.Base.TeX.Parameters',
+    'tracingcommands': 'plasTeX.Base.TeX.Parameters',
+    'tracinglostchars': 'plasTeX.Base.TeX.Parameters',
+    'tracingmacros': 'plasTeX.Base.TeX.Parameters',
+    'tracingonline': 'plasTeX.Base.TeX.Parameters',
+    'tracingoutput': 'plasTeX.Base.TeX.Parameters',
+    'tracingpages': 'plasTeX.Base.TeX.Parameters',
+    'tracingparagraphs': 'plasTeX.Base.TeX.Parameters',
+    'tracingrestores': 'plasTeX.Base.TeX.Parameters',
+    'tracingstats': 'plasTeX.Base.TeX.Parameters',
+    'tt': 'plasTeX.Base.TeX.Fonts',
+    'uchyph': 'plasTeX.Base.TeX.Parameters',
+    'undefined': 'plasTeX.Base.TeX.Primitives',
+    'undefined_': 'plasTeX.Base.TeX.Primitives',
+    'underbar': 'plasTeX.Base.TeX.Text',
+    'uppercase': 'plasTeX.Base.TeX.Text',
+    'vbadness': 'plasTeX.Base.TeX.Parameters',
+    'vbox': 'plasTeX.Base.TeX.Primitives',
+    'vfuzz': 'plasTeX.Base.TeX.Parameters',
+    'vglue': 'plasTeX.Base.TeX.Text',
+    'vobeyspaces_': 'plasTeX.Base.TeX.Primitives',
+    'voffset': 'plasTeX.Base.TeX.Parameters',
+    'vsize': 'plasTeX.Base.TeX.Parameters',
+    'vskip': 'plasTeX.Base.TeX.Primitives',
+    'widowpenalty': 'plasTeX.Base.TeX.Parameters',
+    'write': 'plasTeX.Base.TeX.Primitives',
+    'xdef': 'plasTeX.Base.TeX.Primitives',
+    'xspaceskip': 'plasTeX.Base.TeX.Parameters',
+    'year': 'plasTeX.Base.TeX.Parameters',
+}
+
+# Module and attribute defining each macro
+MACROS = {
+    ' ': ('plasTeX.Base.LaTeX.Sentences', 'InterWordSpace'),
+    '!': ('plasTeX.Base.LaTeX.Math', 'NegativeThinSpace'),
+    '"': ('plasTeX.Base.LaTeX.Accents', 'Umlaut'),
+    '#': ('plasTeX.Base.LaTeX.Sentences', 'HashMark'),
+    '$': ('plasTeX.Base.LaTeX.Sentences', 'Dollar'),
+    '%': ('plasTeX.Base.LaTeX.Sentences', 'Percent'),
+    '&': ('plasTeX.Base.LaTeX.Sentences', 'Ampersand'),
+    "'": ('plasTeX.Base.LaTeX.Accents', 'Acute'),
+    '(': ('plasTeX.Base.LaTeX.Math', 'BeginMath'),
+    ')': ('plasTeX.Base.LaTeX.Math', 'EndMath'),
+    ',': ('plasTeX.Base.LaTeX.Sentences', 'SmallSpace'),
+    '-': ('plasTeX.Base.LaTeX.Breaking', 'AllowHyphen'),
+    '.': ('plasTeX.Base.LaTeX.Math', 'ThinSpace'),
+    '/': ('plasTeX.Base.LaTeX.Math', 'ThinSpace_'),
+    ':': ('plasTeX.Base.LaTeX.Math', 'MediumSpace'),
+    ';': ('plasTeX.Base.LaTeX.Math', 'ThickSpace'),
+    '=': ('plasTeX.Base.LaTeX.Accents', 'Macron'),
+    '@': ('plasTeX.Base.LaTeX.Sentences', 'EndOfSentence'),
+    '@ifundefined': ('plasTeX.Base.LaTeX', 'ifundefined_'),
+    '@namedef': ('plasTeX.Base.TeX.Primitives', 'NameDef'),
+    '@noligs': ('plasTeX.Base.TeX.Primitives', 'noligs_'),
+    '@undefined': ('plasTeX.Base.TeX.Primitives', 'undefined_'),
+    '@vobeyspaces': ('plasTeX.Base.TeX.Primitives', 'vobeyspaces_'),
+    '@vwritefile': ('plasTeX.Base.LaTeX', 'vwritefile_'),
+    'AE': ('plasTeX.Base.LaTeX.Characters', 'AE'),
+    'Accent': ('plasTeX.Base.LaTeX.Accents', 'Accent'),
+    'Alph': ('plasTeX.Base.LaTeX.Numbering', 'Alph'),
+    'AngleReplacingDelimiter': ('plasTeX.Base.LaTeX.Math', 'AngleReplacingDelimiter'),
+    'Array': ('plasTeX.Base.LaTeX.Math', 'Array'),
+    'Arrowvert': ('plasTeX.Base.LaTeX.Math', 'Arrowvert'),
+    'AtBeginDocument': ('plasTeX.Base.LaTeX.Document', 'AtBeginDocument'),
+    'AtEndDocument': ('plasTeX.Base.LaTeX.Document', 'AtEndDocument'),
+    'Big': ('plasTeX.Base.LaTeX.Math', 'Big'),
+    'Bigg': ('plasTeX.Base.LaTeX.Math', 'Bigg'),
+    'Biggl': ('plasTeX.Base.LaTeX.Math', 'Biggl'),
+    'Biggm': ('plasTeX.Base.LaTeX.Math', 'Biggm'),
+    'Biggr': ('plasTeX.Base.LaTeX.Math', 'Biggr'),
+    'Bigl': ('plasTeX.Base.LaTeX.Math', 'Bigl'),
+    'Bigm': ('plasTeX.Base.LaTeX.Math', 'Bigm'),
+    'Bigr': ('plasTeX.Base.LaTeX.Math', 'Bigr'),
+    'Box': ('plasTeX.Base.LaTeX.Math', 'Box'),
+    'BoxCommand': ('plasTeX.Base.TeX.Primitives', 'BoxCommand'),
+    'Caption': ('plasTeX.Base.LaTeX.Floats', 'Caption'),
+    'ColumnType': ('plasTeX.Base.LaTeX.Arrays', 'ColumnType'),
+    'Command': ('plasTeX.Base.TeX.Numbers', 'Command'),
+    'CountCommand': ('plasTeX.Base.TeX.Primitives', 'CountCommand'),
+    'DH': ('plasTeX.Base.LaTeX.Characters', 'DH'),
+    'DJ': ('plasTeX.Base.LaTeX.Characters', 'DJ'),
+    'DeclareOption': ('plasTeX.Base.LaTeX.Packages', 'DeclareOption'),
+    'DeclareRobustCommand': ('plasTeX.Base.LaTeX.Definitions', 'DeclareRobustCommand'),
+    'DeclareTextCommandDefault': ('plasTeX.Base.LaTeX.Definitions', 'DeclareTextCommandDefault'),
+    'DefCommand': ('plasTeX.Base.TeX.Primitives', 'DefCommand'),
+    'Delimiter': ('plasTeX.Base.LaTeX.Math', 'Delimiter'),
+    'Delta': ('plasTeX.Base.LaTeX.Math', 'Delta'),
+    'Diamond': ('plasTeX.Base.LaTeX.Math', 'Diamond'),
+    'DimenCommand': ('plasTeX.Base.TeX.Registers', 'DimenCommand'),
+    'Downarrow': ('plasTeX.Base.LaTeX.Math', 'Downarrow'),
+    'Environment': ('plasTeX.Base.TeX.Fonts', 'Environment'),
+    'Float': ('plasTeX.Base.LaTeX.Floats', 'Float'),
+    'Font': ('plasTeX.Base.TeX.Fonts', 'Font'),
+    'Gamma': ('plasTeX.Base.LaTeX.Math', 'Gamma'),
+    'GlueCommand': ('plasTeX.Base.TeX.Registers', 'GlueCommand'),
+    'H': ('plasTeX.Base.LaTeX.Accents', 'H'),
+    'Huge': ('plasTeX.Base.LaTeX.FontSelection', 'Huge'),
+    'IfCommand': ('plasTeX.Base.TeX.Primitives', 'IfCommand'),
+    'IfFileExists': ('plasTeX.Base.LaTeX.Packages', 'IfFileExists'),
+    'IgnoreCommand': ('plasTeX.Base.LaTeX.Index', 'IgnoreCommand'),
+    'Im': ('plasTeX.Base.LaTeX.Math', 'Im'),
+    'InputIfFileExists': ('plasTeX.Base.LaTeX.Packages', 'InputIfFileExists'),
+    'Join': ('plasTeX.Base.LaTeX.Math', 'Join'),
+    'L': ('plasTeX.Base.LaTeX.Characters', 'L'),
+    'LARGE': ('plasTeX.Base.LaTeX.FontSelection', 'LARGE'),
+    'LaTeX': ('plasTeX.Base.LaTeX.Sentences', 'LaTeX'),
+    'Lambda': ('plasTeX.Base.LaTeX.Math', 'Lambda'),
+    'Large': ('plasTeX.Base.LaTeX.FontSelection', 'Large'),
+    'Leftarrow': ('plasTeX.Base.LaTeX.Math', 'Leftarrow'),
+    'Leftrightarrow': ('plasTeX.Base.LaTeX.Math', 'Leftrightarrow'),
+    'List': ('plasTeX.Base.LaTeX.Lists', 'List'),
+    'LoadClass': ('plasTeX.Base.LaTeX.Packages', 'LoadClass'),
+    'Longleftarrow': ('plasTeX.Base.LaTeX.Math', 'Longleftarrow'),
+    'Longleftrightarrow': ('plasTeX.Base.LaTeX.Math', 'Longleftrightarrow'),
+    'Longrightarrow': ('plasTeX.Base.LaTeX.Math', 'Longrightarrow'),
+    'Macro': ('plasTeX.Base.TeX.Primitives', 'Macro'),
+    'MathAccent': ('plasTeX.Base.LaTeX.Math', 'MathAccent'),
+    'MathEnvironment': ('plasTeX.Base.LaTeX.Math', 'MathEnvironment'),
+    'MathEnvironmentPre': ('plasTeX.Base.LaTeX.Math', 'MathEnvironmentPre'),
+    'MathSymbol': ('plasTeX.Base.LaTeX.Math', 'MathSymbol'),
+    'MuGlueCommand': ('plasTeX.Base.TeX.Parameters', 'MuGlueCommand'),
+    'NG': ('plasTeX.Base.LaTeX.Characters', 'NG'),
+    'NeedsTeXFormat': ('plasTeX.Base.LaTeX.Packages', 'NeedsTeXFormat'),
+    'NoCharSubEnvironment': ('plasTeX.Base.LaTeX.Math', 'NoCharSubEnvironment'),
+    'O': ('plasTeX.Base.LaTeX.Characters', 'O'),
+    'OE': ('plasTeX.Base.LaTeX.Characters', 'OE'),
+    'Omega': ('plasTeX.Base.LaTeX.Math', 'Omega'),
+    'Other': ('plasTeX.Base.TeX.Primitives', 'Other'),
+    'P': ('plasTeX.Base.LaTeX.Accents', 'P'),
+    'PackageLoader': ('plasTeX.Base.LaTeX.Packages', 'PackageLoader'),
+    'PackageWarning': ('plasTeX.Base.LaTeX.Packages', 'PackageWarning'),
+    'ParameterCommand': ('plasTeX.Base.TeX.Parameters', 'ParameterCommand'),
+    'Phi': ('plasTeX.Base.LaTeX.Math', 'Phi'),
+    'Pi': ('plasTeX.Base.LaTeX.Math', 'Pi'),
+    'Pr': ('plasTeX.Base.LaTeX.Math', 'Pr'),
+    'ProcessOptions': ('plasTeX.Base.LaTeX.Packages', 'ProcessOptions'),
+    'ProvidesClass': ('plasTeX.Base.LaTeX.Packages', 'ProvidesClass'),
+    'ProvidesPackage': ('plasTeX.Base.LaTeX.Packages', 'ProvidesPackage'),
+    'Psi': ('plasTeX.Base.LaTeX.Math', 'Psi'),
+    'Re': ('plasTeX.Base.LaTeX.Math', 'Re'),
+    'RequirePackage': ('plasTeX.Base.LaTeX.Packages', 'RequirePackage'),
+    'Rightarrow': ('plasTeX.Base.LaTeX.Math', 'Rightarrow'),
+    'Roman': ('plasTeX.Base.LaTeX.Numbering', 'Roman'),
+    'S': ('plasTeX.Base.LaTeX.Accents', 'S'),
+    'SS': ('plasTeX.Base.LaTeX.Characters', 'SS'),
+    'Sigma': ('plasTeX.Base.LaTeX.Math', 'Sigma'),
+    'StartSection': ('plasTeX.Base.LaTeX.Sectioning', 'StartSection'),
+    'Symbol': ('plasTeX.Base.LaTeX.Accents', 'Symbol'),
+    'TH': ('plasTeX.Base.LaTeX.Characters', 'TH'),
+    'TeX': ('plasTeX.Base.LaTeX.Sentences', 'TeX'),
+    'TextBoxCommand': ('plasTeX.Base.LaTeX.Boxes', 'TextBoxCommand'),
+    'TextCommand': ('plasTeX.Base.LaTeX.FontSelection', 'TextCommand'),
+    'TextDeclaration': ('plasTeX.Base.LaTeX.FontSelection', 'TextDeclaration'),
+    'TextSizeDeclaration': ('plasTeX.Base.LaTeX.FontSelection', 'TextSizeDeclaration'),
+    'Theta': ('plasTeX.Base.LaTeX.Math', 'Theta'),
+    'Token': ('plasTeX.Base.TeX.Primitives', 'Token'),
+    'Uparrow': ('plasTeX.Base.LaTeX.Math', 'Uparrow'),
+    'Updownarrow': ('plasTeX.Base.LaTeX.Math', 'Updownarrow'),
+    'Upsilon': ('plasTeX.Base.LaTeX.Math', 'Upsilon'),
+    'VerbatimEnvironment': ('plasTeX.Base.LaTeX.Verbatim', 'VerbatimEnvironment'),
+    'Vert': ('plasTeX.Base.LaTeX.Math', 'Vert'),
+    'Xi': ('plasTeX.Base.LaTeX.Math', 'Xi'),
+    '[': ('plasTeX.Base.LaTeX.Math', 'BeginDisplayMath'),
+    '\\': ('plasTeX.Base.LaTeX.Breaking', 'NewLine'),
+    ']': ('plasTeX.Base.LaTeX.Math', 'EndDisplayMath'),
+    '^': ('plasTeX.Base.LaTeX.Accents', 'Circumflex'),
+    '_': ('plasTeX.Base.LaTeX.Sentences', 'Underscore'),
+    '`': ('plasTeX.Base.LaTeX.Accents', 'Grave'),
+    'abovedisplayshortskip': ('plasTeX.Base.TeX.Parameters', 'abovedisplayshortskip'),
+    'abovedisplayskip': ('plasTeX.Base.TeX.Parameters', 'abovedisplayskip'),
+    'abstract': ('plasTeX.Base.LaTeX.Packages', 'abstract'),
+    'active': ('plasTeX.Base.TeX.Primitives', 'active'),
+    'active::$': ('plasTeX.Base.TeX.Primitives', 'MathShift'),
+    'active::&': ('plasTeX.Base.TeX.Primitives', 'AlignmentChar'),
+    'active::^': ('plasTeX.Base.TeX.Primitives', 'SuperScript'),
+    'active::_': ('plasTeX.Base.TeX.Primitives', 'SubScript'),
+    'active::~': ('plasTeX.Base.TeX.Text', 'ControlSpace'),
+    'acute': ('plasTeX.Base.LaTeX.Math', 'acute'),
+    'addcontentsline': ('plasTeX.Base.LaTeX.Sectioning', 'addcontentsline'),
+    'addtocontents': ('plasTeX.Base.LaTeX.Sectioning', 'addtocontents'),
+    'addtocounter': ('plasTeX.Base.LaTeX.Numbering', 'addtocounter'),
+    'addtolength': ('plasTeX.Base.LaTeX.Lengths', 'addtolength'),
+    'addvspace': ('plasTeX.Base.LaTeX.Space', 'addvspace'),
+    'adjdemerits': ('plasTeX.Base.TeX.Parameters', 'adjdemerits'),
+    'advance': ('plasTeX.Base.TeX.Primitives', 'advance'),
+    'ae': ('plasTeX.Base.LaTeX.Characters', 'ae'),
+    'aleph': ('plasTeX.Base.LaTeX.Math', 'aleph'),
+    'allowbreak': ('plasTeX.Base.TeX.Text', 'allowbreak'),
+    'alph': ('plasTeX.Base.LaTeX.Numbering', 'alph'),
+    'alpha': ('plasTeX.Base.LaTeX.Math', 'alpha'),
+    'amalg': ('plasTeX.Base.LaTeX.Math', 'amalg'),
+    'appendix': ('plasTeX.Base.LaTeX.Sectioning', 'appendix'),
+    'approx': ('plasTeX.Base.LaTeX.Math', 'approx'),
+    'arabic': ('plasTeX.Base.LaTeX.Numbering', 'arabic'),
+    'arccos': ('plasTeX.Base.LaTeX.Math', 'arccos'),
+    'arcsin': ('plasTeX.Base.LaTeX.Math', 'arcsin'),
+    'arctan': ('plasTeX.Base.LaTeX.Math', 'arctan'),
+    'arg': ('plasTeX.Base.LaTeX.Math', 'arg'),
+    'array': ('plasTeX.Base.LaTeX.Arrays', 'array'),
+    'arraycolsep': ('plasTeX.Base.LaTeX.Arrays', 'arraycolsep'),
+    'arrayrulewidth': ('plasTeX.Base.LaTeX.Arrays', 'arrayrulewidth'),
+    'arraystretch': ('plasTeX.Base.LaTeX.Arrays', 'arraystretch'),
+    'arrowvert': ('plasTeX.Base.LaTeX.Math', 'arrowvert'),
+    'ast': ('plasTeX.Base.LaTeX.Math', 'ast'),
+    'asymp': ('plasTeX.Base.LaTeX.Math', 'asymp'),
+    'author': ('plasTeX.Base.LaTeX.Packages', 'author'),
+    'b': ('plasTeX.Base.LaTeX.Accents', 'b'),
+    'backslash': ('plasTeX.Base.LaTeX.Math', 'backslash'),
+    'bar': ('plasTeX.Base.LaTeX.Math', 'bar'),
+    'baselineskip': ('plasTeX.Base.TeX.Parameters', 'baselineskip'),
+    'baselinestretch': ('plasTeX.Base.LaTeX.Paragraphs', 'baselinestretch'),
+    'begin': ('plasTeX.Base.LaTeX.Environments', 'begin'),
+    'begingroup': ('plasTeX.Base.TeX.Text', 'begingroup'),
+    'belowdisplayshortskip': ('plasTeX.Base.TeX.Parameters', 'belowdisplayshortskip'),
+    'belowdisplayskip': ('plasTeX.Base.TeX.Parameters', 'belowdisplayskip'),
+    'beta': ('plasTeX.Base.LaTeX.Math', 'beta'),
+    'bf': ('plasTeX.Base.TeX.Fonts', 'bf'),
+    'bfseries': ('plasTeX.Base.LaTeX.FontSelection', 'bfseries'),
+    'bgroup': ('plasTeX.Base.TeX.Text', 'bgroup'),
+    'bibcite': ('plasTeX.Base.LaTeX.Bibliography', 'bibcite'),
+    'bibdata': ('plasTeX.Base.LaTeX.Bibliography', 'bibdata'),
+    'bibindent': ('plasTeX.Base.LaTeX.Packages', 'bibindent'),
+    'bibliography': ('plasTeX.Base.LaTeX.Bibliography', 'bibliography'),
+    'bibliographyref': ('plasTeX.Base.LaTeX.Bibliography', 'bibliographyref'),
+    'bibliographystyle': ('plasTeX.Base.LaTeX.Bibliography', 'bibliographystyle'),
+    'bibstyle': ('plasTeX.Base.LaTeX.Bibliography', 'bibstyle'),
+    'big': ('plasTeX.Base.LaTeX.Math', 'big'),
+    'bigbreak': ('plasTeX.Base.TeX.Text', 'bigbreak'),
+    'bigcap': ('plasTeX.Base.LaTeX.Math', 'bigcap'),
+    'bigcirc': ('plasTeX.Base.LaTeX.Math', 'bigcirc'),
+    'bigcup': ('plasTeX.Base.LaTeX.Math', 'bigcup'),
+    'bigg': ('plasTeX.Base.LaTeX.Math', 'bigg'),
+    'biggl': ('plasTeX.Base.LaTeX.Math', 'biggl'),
+    'biggm': ('plasTeX.Base.LaTeX.Math', 'biggm'),
+    'biggr': ('plasTeX.Base.LaTeX.Math', 'biggr'),
+    'bigl': ('plasTeX.Base.LaTeX.Math', 'bigl'),
+    'bigm': ('plasTeX.Base.LaTeX.Math', 'bigm'),
+    'bigodot': ('plasTeX.Base.LaTeX.Math', 'bigodot'),
+    'bigoplus': ('plasTeX.Base.LaTeX.Math', 'bigoplus'),
+    'bigotimes': ('plasTeX.Base.LaTeX.Math', 'bigotimes'),
+    'bigr': ('plasTeX.Base.LaTeX.Math', 'bigr'),
+    'bigskip': ('plasTeX.Base.LaTeX.Space', 'bigskip'),
+    'bigskipamount': ('plasTeX.Base.LaTeX.Space', 'bigskipamount'),
+    'bigsqcup': ('plasTeX.Base.LaTeX.Math', 'bigsqcup'),
+    'bigtriangledown': ('plasTeX.Base.LaTeX.Math', 'bigtriangledown'),
+    'bigtriangleup': ('plasTeX.Base.LaTeX.Math', 'bigtriangleup'),
+    'biguplus': ('plasTeX.Base.LaTeX.Math', 'biguplus'),
+    'bigvee': ('plasTeX.Base.LaTeX.Math', 'bigvee'),
+    'bigwedge': ('plasTeX.Base.LaTeX.Math', 'bigwedge'),
+    'binoppenalty': ('plasTeX.Base.TeX.Parameters', 'binoppenalty'),
+    'bmod': ('plasTeX.Base.LaTeX.Math', 'bmod'),
+    'boldmath': ('plasTeX.Base.LaTeX.Math', 'boldmath'),
+    'bot': ('plasTeX.Base.LaTeX.Math', 'bot'),
+    'bottomfraction': ('plasTeX.Base.LaTeX.Floats', 'bottomfraction'),
+    'bowtie': ('plasTeX.Base.LaTeX.Math', 'bowtie'),
+    'box': ('plasTeX.Base.TeX.Registers', 'box'),
+    'boxmaxdepth': ('plasTeX.Base.TeX.Parameters', 'boxmaxdepth'),
+    'brace': ('plasTeX.Base.LaTeX.Math', 'brace'),
+    'bracevert': ('plasTeX.Base.LaTeX.Math', 'bracevert'),
+    'brack': ('plasTeX.Base.LaTeX.Math', 'brack'),
+    'break': ('plasTeX.Base.TeX.Text', 'TeXBreak'),
+    'breve': ('plasTeX.Base.LaTeX.Math', 'breve'),
+    'brokenpenalty': ('plasTeX.Base.TeX.Parameters', 'brokenpenalty'),
+    'bullet': ('plasTeX.Base.LaTeX.Math', 'bullet'),
+    'c': ('plasTeX.Base.LaTeX.Accents', 'c'),
+    'cal': ('plasTeX.Base.TeX.Fonts', 'cal'),
+    'cap': ('plasTeX.Base.LaTeX.Math', 'cap'),
+    'catcode': ('plasTeX.Base.TeX.Primitives', 'catcode'),
+    'cdot': ('plasTeX.Base.LaTeX.Math', 'cdot'),
+    'cdots': ('plasTeX.Base.LaTeX.Math', 'cdots'),
+    'center': ('plasTeX.Base.LaTeX.Alignment', 'center'),
+    'centering': ('plasTeX.Base.LaTeX.Alignment', 'centering'),
+    'centerline': ('plasTeX.Base.TeX.Text', 'centerline'),
+    'chapter': ('plasTeX.Base.LaTeX.Sectioning', 'chapter'),
+    'char': ('plasTeX.Base.TeX.Primitives', 'char'),
+    'chardef': ('plasTeX.Base.TeX.Primitives', 'chardef'),
+    'check': ('plasTeX.Base.LaTeX.Math', 'check'),
+    'chi': ('plasTeX.Base.LaTeX.Math', 'chi'),
+    'choose': ('plasTeX.Base.LaTeX.Math', 'choose'),
+    'circ': ('plasTeX.Base.LaTeX.Math', 'circ'),
+    'citation': ('plasTeX.Base.LaTeX.Bibliography', 'citation'),
+    'cite': ('plasTeX.Base.LaTeX.Bibliography', 'cite'),
+    'cleardoublepage': ('plasTeX.Base.LaTeX.Breaking', 'cleardoublepage'),
+    'clearpage': ('plasTeX.Base.LaTeX.Breaking', 'clearpage'),
+    'closeout': ('plasTeX.Base.TeX.Primitives', 'closeout'),
+    'clubpenalty': ('plasTeX.Base.TeX.Parameters', 'clubpenalty'),
+    'clubsuit': ('plasTeX.Base.LaTeX.Math', 'clubsuit'),
+    'columnsep': ('plasTeX.Base.LaTeX.Packages', 'columnsep'),
+    'columnseprule': ('plasTeX.Base.LaTeX.Packages', 'columnseprule'),
+    'columnwidth': ('plasTeX.Base.LaTeX.Paragraphs', 'columnwidth'),
+    'cong': ('plasTeX.Base.LaTeX.Math', 'cong'),
+    'coprod': ('plasTeX.Base.LaTeX.Math', 'coprod'),
+    'copyright': ('plasTeX.Base.LaTeX.Accents', 'copyright'),
+    'cos': ('plasTeX.Base.LaTeX.Math', 'cos'),
+    'cosh': ('plasTeX.Base.LaTeX.Math', 'cosh'),
+    'cot': ('plasTeX.Base.LaTeX.Math', 'cot'),
+    'coth': ('plasTeX.Base.LaTeX.Math', 'coth'),
+    'count': ('plasTeX.Base.TeX.Registers', 'TeXCount'),
+    'csc': ('plasTeX.Base.LaTeX.Math', 'csc'),
+    'csname': ('plasTeX.Base.TeX.Primitives', 'csname'),
+    'cup': ('plasTeX.Base.LaTeX.Math', 'cup'),
+    'd': ('plasTeX.Base.LaTeX.Accents', 'd'),
+    'dag': ('plasTeX.Base.LaTeX.Accents', 'dag'),
+    'dagger': ('plasTeX.Base.LaTeX.Math', 'dagger'),
+    'dashv': ('plasTeX.Base.LaTeX.Math', 'dashv'),
+    'date': ('plasTeX.Base.LaTeX.Packages', 'date'),
+    'day': ('plasTeX.Base.TeX.Parameters', 'day'),
+    'dblfloatpagefraction': ('plasTeX.Base.LaTeX.Floats', 'dblfloatpagefraction'),
+    'dblfloatsep': ('plasTeX.Base.LaTeX.Floats', 'dblfloatsep'),
+    'dbltextfloatsep': ('plasTeX.Base.LaTeX.Floats', 'dbltextfloatsep'),
+    'dbltopfraction': ('plasTeX.Base.LaTeX.Floats', 'dbltopfraction'),
+    'ddag': ('plasTeX.Base.LaTeX.Accents', 'ddag'),
+    'ddagger': ('plasTeX.Base.LaTeX.Math', 'ddagger'),
+    'ddot': ('plasTeX.Base.LaTeX.Math', 'ddot'),
+    'ddots': ('plasTeX.Base.LaTeX.Math', 'ddots'),
+    'def': ('plasTeX.Base.TeX.Primitives', 'def_'),
+    'defaulthyphenchar': ('plasTeX.Base.TeX.Parameters', 'defaulthyphenchar'),
+    'defaultskewchar': ('plasTeX.Base.TeX.Parameters', 'defaultskewchar'),
+    'deg': ('plasTeX.Base.LaTeX.Math', 'deg'),
+    'delimiterfactor': ('plasTeX.Base.TeX.Parameters', 'delimiterfactor'),
+    'delimitershortfall': ('plasTeX.Base.TeX.Parameters', 'delimitershortfall'),
+    'delta': ('plasTeX.Base.LaTeX.Math', 'delta'),
+    'description': ('plasTeX.Base.LaTeX.Lists', 'description'),
+    'det': ('plasTeX.Base.LaTeX.Math', 'det'),
+    'dh': ('plasTeX.Base.LaTeX.Characters', 'dh'),
+    'diamond': ('plasTeX.Base.LaTeX.Math', 'diamond'),
+    'diamondsuit': ('plasTeX.Base.LaTeX.Math', 'diamondsuit'),
+    'dim': ('plasTeX.Base.LaTeX.Math', 'dim'),
+    'dimen': ('plasTeX.Base.TeX.Registers', 'dimen_'),
+    'ding': ('plasTeX.Base.LaTeX.Characters', 'ding'),
+    'displayindent': ('plasTeX.Base.TeX.Parameters', 'displayindent'),
+    'displaymath': ('plasTeX.Base.LaTeX.Math', 'displaymath'),
+    'displaystyle': ('plasTeX.Base.LaTeX.Math', 'displaystyle'),
+    'displaywidowpenalty': ('plasTeX.Base.TeX.Parameters', 'displaywidowpenalty'),
+    'displaywidth': ('plasTeX.Base.TeX.Parameters', 'displaywidth'),
+    'div': ('plasTeX.Base.LaTeX.Math', 'div'),
+    'dj': ('plasTeX.Base.LaTeX.Characters', 'dj'),
+    'document': ('plasTeX.Base.LaTeX.Document', 'document'),
+    'documentclass': ('plasTeX.Base.LaTeX.Packages', 'documentclass'),
+    'documentstyle': ('plasTeX.Base.LaTeX.Packages', 'documentstyle'),
+    'dot': ('plasTeX.Base.LaTeX.Math', 'dot'),
+    'doteq': ('plasTeX.Base.LaTeX.Math', 'doteq'),
+    'dots': ('plasTeX.Base.TeX.Text', 'dots'),
+    'doublehyphendemerits': ('plasTeX.Base.TeX.Parameters', 'doublehyphendemerits'),
+    'doublerulesep': ('plasTeX.Base.LaTeX.Arrays', 'doublerulesep'),
+    'downarrow': ('plasTeX.Base.LaTeX.Math', 'downarrow'),
+    'edef': ('plasTeX.Base.TeX.Primitives', 'edef'),
+    'egroup': ('plasTeX.Base.TeX.Text', 'egroup'),
+    'eject': ('plasTeX.Base.TeX.Text', 'eject'),
+    'ell': ('plasTeX.Base.LaTeX.Math', 'ell'),
+    'else': ('plasTeX.Base.TeX.Primitives', 'else_'),
+    'em': ('plasTeX.Base.LaTeX.Sentences', 'em'),
+    'emergencystretch': ('plasTeX.Base.TeX.Parameters', 'emergencystretch'),
+    'emph': ('plasTeX.Base.LaTeX.Sentences', 'emph'),
+    'empty': ('plasTeX.Base.TeX.Text', 'empty'),
+    'emptyset': ('plasTeX.Base.LaTeX.Math', 'emptyset'),
+    'end': ('plasTeX.Base.LaTeX.Environments', 'end'),
+    'endcsname': ('plasTeX.Base.TeX.Primitives', 'endcsname'),
+    'endgroup': ('plasTeX.Base.TeX.Text', 'endgroup'),
+    'endinput': ('plasTeX.Base.TeX.Primitives', 'endinput'),
+    'endlinechar': ('plasTeX.Base.TeX.Parameters', 'endlinechar'),
+    'endverbatim': ('plasTeX.Base.LaTeX.Verbatim', 'endverbatim'),
+    'endverbatim*': ('plasTeX.Base.LaTeX.Verbatim', 'EndVerbatimStar'),
+    'enlargethispage': ('plasTeX.Base.LaTeX.Breaking', 'enlargethispage'),
+    'enskip': ('plasTeX.Base.TeX.Text', 'enskip'),
+    'enspace': ('plasTeX.Base.TeX.Text', 'enspace'),
+    'ensuremath': ('plasTeX.Base.LaTeX.Math', 'ensuremath'),
+    'enumerate': ('plasTeX.Base.LaTeX.Lists', 'enumerate_'),
+    'enumiiiname': ('plasTeX.Base.LaTeX.Lists', 'enumiiiname'),
+    'enumiiname': ('plasTeX.Base.LaTeX.Lists', 'enumiiname'),
+    'enuminame': ('plasTeX.Base.LaTeX.Lists', 'enuminame'),
+    'enumivname': ('plasTeX.Base.LaTeX.Lists', 'enumivname'),
+    'epsilon': ('plasTeX.Base.LaTeX.Math', 'epsilon'),
+    'eqnarray': ('plasTeX.Base.LaTeX.Math', 'eqnarray'),
+    'eqnarray*': ('plasTeX.Base.LaTeX.Math', 'EqnarrayStar'),
+    'equation': ('plasTeX.Base.LaTeX.Math', 'equation'),
+    'equiv': ('plasTeX.Base.LaTeX.Math', 'equiv'),
+    'errorcontextlines': ('plasTeX.Base.TeX.Parameters', 'errorcontextlines'),
+    'escapechar': ('plasTeX.Base.TeX.Parameters', 'escapechar'),
+    'eta': ('plasTeX.Base.LaTeX.Math', 'eta'),
+    'evensidemargin': ('plasTeX.Base.LaTeX.Packages', 'evensidemargin'),
+    'everypar': ('plasTeX.Base.TeX.Primitives', 'everypar'),
+    'exhyphenpenalty': ('plasTeX.Base.TeX.Parameters', 'exhyphenpenalty'),
+    'exists': ('plasTeX.Base.LaTeX.Math', 'exists'),
+    'exp': ('plasTeX.Base.LaTeX.Math', 'exp'),
+    'expandafter': ('plasTeX.Base.TeX.Primitives', 'expandafter'),
+    'fam': ('plasTeX.Base.TeX.Parameters', 'fam'),
+    'fbox': ('plasTeX.Base.LaTeX.Boxes', 'fbox'),
+    'fboxrule': ('plasTeX.Base.LaTeX.Boxes', 'fboxrule'),
+    'fboxsep': ('plasTeX.Base.LaTeX.Boxes', 'fboxsep'),
+    'fi': ('plasTeX.Base.TeX.Primitives', 'fi'),
+    'figure': ('plasTeX.Base.LaTeX.Floats', 'figure'),
+    'figure*': ('plasTeX.Base.LaTeX.Floats', 'FigureStar'),
+    'filbreak': ('plasTeX.Base.TeX.Text', 'filbreak'),
+    'filecontents': ('plasTeX.Base.LaTeX.Files', 'filecontents'),
+    'filecontents*': ('plasTeX.Base.LaTeX.Files', 'FileContentsStar'),
+    'fill': ('plasTeX.Base.LaTeX.Lengths', 'fill'),
+    'finalhyphendemerits': ('plasTeX.Base.TeX.Parameters', 'finalhyphendemerits'),
+    'flat': ('plasTeX.Base.LaTeX.Math', 'flat'),
+    'floatingpenalty': ('plasTeX.Base.TeX.Parameters', 'floatingpenalty'),
+    'floatpagefraction': ('plasTeX.Base.LaTeX.Floats', 'floatpagefraction'),
+    'floatsep': ('plasTeX.Base.LaTeX.Floats', 'floatsep'),
+    'flushleft': ('plasTeX.Base.LaTeX.Alignment', 'flushleft'),
+    'flushright': ('plasTeX.Base.LaTeX.Alignment', 'flushright'),
+    'fnsymbol': ('plasTeX.Base.LaTeX.Numbering', 'fnsymbol'),
+    'footnote': ('plasTeX.Base.LaTeX.Footnotes', 'footnote'),
+    'footnotemark': ('plasTeX.Base.LaTeX.Footnotes', 'footnotemark'),
+    'footnoterule': ('plasTeX.Base.LaTeX.Footnotes', 'footnoterule'),
+    'footnotesep': ('plasTeX.Base.LaTeX.Footnotes', 'footnotesep'),
+    'footnotesize': ('plasTeX.Base.LaTeX.FontSelection', 'footnotesize'),
+    'footnotetext': ('plasTeX.Base.LaTeX.Footnotes', 'footnotetext'),
+    'footskip': ('plasTeX.Base.LaTeX.Packages', 'footskip'),
+    'forall': ('plasTeX.Base.LaTeX.Math', 'forall'),
+    'frac': ('plasTeX.Base.LaTeX.Math', 'frac'),
+    'framebox': ('plasTeX.Base.LaTeX.Boxes', 'framebox'),
+    'frenchspacing': ('plasTeX.Base.TeX.Text', 'frenchspacing'),
+    'frown': ('plasTeX.Base.LaTeX.Math', 'frown'),
+    'fussy': ('plasTeX.Base.LaTeX.Breaking', 'fussy'),
+    'gamma': ('plasTeX.Base.LaTeX.Math', 'gamma'),
+    'gcd': ('plasTeX.Base.LaTeX.Math', 'gcd'),
+    'gdef': ('plasTeX.Base.TeX.Primitives', 'gdef'),
+    'ge': ('plasTeX.Base.LaTeX.Math', 'ge'),
+    'geq': ('plasTeX.Base.LaTeX.Math', 'geq'),
+    'gg': ('plasTeX.Base.LaTeX.Math', 'gg'),
+    'global': ('plasTeX.Base.TeX.Primitives', 'global_'),
+    'globaldefs': ('plasTeX.Base.TeX.Parameters', 'globaldefs'),
+    'glossary': ('plasTeX.Base.LaTeX.Index', 'glossary'),
+    'goodbreak': ('plasTeX.Base.TeX.Text', 'goodbreak'),
+    'grave': ('plasTeX.Base.LaTeX.Math', 'grave'),
+    'guillemotright': ('plasTeX.Base.LaTeX.Characters', 'guillemotright'),
+    'guillmotleft': ('plasTeX.Base.LaTeX.Characters', 'guillmotleft'),
+    'guilsinglleft': ('plasTeX.Base.LaTeX.Characters', 'guilsinglleft'),
+    'guilsinglright': ('plasTeX.Base.LaTeX.Characters', 'guilsinglright'),
+    'hang': ('plasTeX.Base.TeX.Text', 'hang'),
+    'hangafter': ('plasTeX.Base.TeX.Parameters', 'hangafter'),
+    'hangindent': ('plasTeX.Base.TeX.Parameters', 'hangindent'),
+    'hat': ('plasTeX.Base.LaTeX.Math', 'hat'),
+    'hbadness': ('plasTeX.Base.TeX.Parameters', 'hbadness'),
+    'hbar': ('plasTeX.Base.LaTeX.Math', 'hbar'),
+    'hbox': ('plasTeX.Base.TeX.Primitives', 'hbox'),
+    'headheight': ('plasTeX.Base.LaTeX.Packages', 'headheight'),
+    'headsep': ('plasTeX.Base.LaTeX.Packages', 'headsep'),
+    'heartsuit': ('plasTeX.Base.LaTeX.Math', 'heartsuit'),
+    'hfil': ('plasTeX.Base.TeX.Primitives', 'hfil'),
+    'hfill': ('plasTeX.Base.LaTeX.Space', 'hfill'),
+    'hfuzz': ('plasTeX.Base.TeX.Parameters', 'hfuzz'),
+    'hglue': ('plasTeX.Base.TeX.Text', 'hglue'),
+    'hideskip': ('plasTeX.Base.TeX.Registers', 'hideskip'),
+    'hoffset': ('plasTeX.Base.TeX.Parameters', 'hoffset'),
+    'holdinginserts': ('plasTeX.Base.TeX.Parameters', 'holdinginserts'),
+    'hom': ('plasTeX.Base.LaTeX.Math', 'hom'),
+    'hookleftarrow': ('plasTeX.Base.LaTeX.Math', 'hookleftarrow'),
+    'hookrightarrow': ('plasTeX.Base.LaTeX.Math', 'hookrightarrow'),
+    'hrule': ('plasTeX.Base.TeX.Primitives', 'hrule'),
+    'hsize': ('plasTeX.Base.TeX.Parameters', 'hsize'),
+    'hskip': ('plasTeX.Base.TeX.Primitives', 'hskip'),
+    'hspace': ('plasTeX.Base.LaTeX.Space', 'hspace'),
+    'htmlfalse': ('plasTeX.Base.TeX.Primitives', 'htmlfalse'),
+    'htmltrue': ('plasTeX.Base.TeX.Primitives', 'htmltrue'),
+    'huge': ('plasTeX.Base.LaTeX.FontSelection', 'huge'),
+    'hyperindexformat': ('plasTeX.Base.LaTeX.Index', 'hyperindexformat'),
+    'hyperpage': ('plasTeX.Base.LaTeX.Index', 'hyperpage'),
+    'hyphenation': ('plasTeX.Base.LaTeX.Breaking', 'hyphenation'),
+    'hyphenpenalty': ('plasTeX.Base.TeX.Parameters', 'hyphenpenalty'),
+    'i': ('plasTeX.Base.LaTeX.Characters', 'i'),
+    'if': ('plasTeX.Base.TeX.Primitives', 'if_'),
+    'ifcase': ('plasTeX.Base.TeX.Primitives', 'ifcase'),
+    'ifcat': ('plasTeX.Base.TeX.Primitives', 'ifcat'),
+    'ifcsname': ('plasTeX.Base.TeX.Primitives', 'ifcsname'),
+    'ifdefined': ('plasTeX.Base.TeX.Primitives', 'ifdefined'),
+    'ifdim': ('plasTeX.Base.TeX.Primitives', 'ifdim'),
+    'ifeof': ('plasTeX.Base.TeX.Primitives', 'ifeof'),
+    'iffalse': ('plasTeX.Base.TeX.Primitives', 'iffalse'),
+    'ifhbox': ('plasTeX.Base.TeX.Primitives', 'ifhbox'),
+    'ifhmode': ('plasTeX.Base.TeX.Primitives', 'ifhmode'),
+    'ifhtml': ('plasTeX.Base.TeX.Primitives', 'ifhtml'),
+    'ifinner': ('plasTeX.Base.TeX.Primitives', 'ifinner'),
+    'ifmmode': ('plasTeX.Base.TeX.Primitives', 'ifmmode'),
+    'ifnum': ('plasTeX.Base.TeX.Primitives', 'ifnum'),
+    'ifodd': ('plasTeX.Base.TeX.Primitives', 'ifodd'),
+    'ifpdf': ('plasTeX.Base.TeX.Primitives', 'ifpdf'),
+    'ifplastex': ('plasTeX.Base.TeX.Primitives', 'ifplastex'),
+    'iftrue': ('plasTeX.Base.TeX.Primitives', 'iftrue'),
+    'ifvbox': ('plasTeX.Base.TeX.Primitives', 'ifvbox'),
+    'ifvmode': ('plasTeX.Base.TeX.Primitives', 'ifvmode'),
+    'ifvoid': ('plasTeX.Base.TeX.Primitives', 'ifvoid'),
+    'ifx': ('plasTeX.Base.TeX.Primitives', 'ifx'),
+    'imath': ('plasTeX.Base.LaTeX.Math', 'imath'),
+    'in': ('plasTeX.Base.LaTeX.Math', 'In'),
+    'include': ('plasTeX.Base.TeX.Primitives', 'include'),
+    'includeonly': ('plasTeX.Base.LaTeX.Files', 'includeonly'),
+    'indent': ('plasTeX.Base.LaTeX.Paragraphs', 'indent'),
+    'index': ('plasTeX.Base.LaTeX.Index', 'index'),
+    'index-page-number': ('plasTeX.Base.LaTeX.Index', 'IndexPageNumber'),
+    'inf': ('plasTeX.Base.LaTeX.Math', 'inf'),
+    'infty': ('plasTeX.Base.LaTeX.Math', 'infty'),
+    'input': ('plasTeX.Base.TeX.Primitives', 'input'),
+    'int': ('plasTeX.Base.LaTeX.Math', 'int'),
+    'interlinepenalty': ('plasTeX.Base.TeX.Parameters', 'interlinepenalty'),
+    'intextsep': ('plasTeX.Base.LaTeX.Floats', 'intextsep'),
+    'iota': ('plasTeX.Base.LaTeX.Math', 'iota'),
+    'it': ('plasTeX.Base.TeX.Fonts', 'it'),
+    'itemindent': ('plasTeX.Base.LaTeX.Lists', 'itemindent'),
+    'itemize': ('plasTeX.Base.LaTeX.Lists', 'itemize'),
+    'itemsep': ('plasTeX.Base.LaTeX.Lists', 'itemsep'),
+    'iterate': ('plasTeX.Base.TeX.Text', 'iterate'),
+    'itshape': ('plasTeX.Base.LaTeX.FontSelection', 'itshape'),
+    'j': ('plasTeX.Base.LaTeX.Characters', 'j'),
+    'jmath': ('plasTeX.Base.LaTeX.Math', 'jmath'),
+    'jobname': ('plasTeX.Base.TeX.Primitives', 'jobname'),
+    'jot': ('plasTeX.Base.LaTeX.Math', 'jot'),
+    'k': ('plasTeX.Base.LaTeX.Accents', 'k'),
+    'kappa': ('plasTeX.Base.LaTeX.Math', 'kappa'),
+    'ker': ('plasTeX.Base.LaTeX.Math', 'ker'),
+    'kern': ('plasTeX.Base.TeX.Primitives', 'kern'),
+    'l': ('plasTeX.Base.LaTeX.Characters', 'l'),
+    'label': ('plasTeX.Base.LaTeX.Crossref', 'label'),
+    'labelitemi': ('plasTeX.Base.LaTeX.Lists', 'labelitemi'),
+    'labelitemii': ('plasTeX.Base.LaTeX.Lists', 'labelitemii'),
+    'labelitemiii': ('plasTeX.Base.LaTeX.Lists', 'labelitemiii'),
+    'labelitemiv': ('plasTeX.Base.LaTeX.Lists', 'labelitemiv'),
+    'labelsep': ('plasTeX.Base.LaTeX.Lists', 'labelsep'),
+    'labelwidth': ('plasTeX.Base.LaTeX.Lists', 'labelwidth'),
+    'lambda': ('plasTeX.Base.LaTeX.Math', 'GreekLamda'),
+    'langle': ('plasTeX.Base.LaTeX.Math', 'langle'),
+    'language': ('plasTeX.Base.TeX.Parameters', 'language'),
+    'large': ('plasTeX.Base.LaTeX.FontSelection', 'large'),
+    'lbrace': ('plasTeX.Base.LaTeX.Math', 'lbrace'),
+    'lbrack': ('plasTeX.Base.TeX.Text', 'lbrack'),
+    'lceil': ('plasTeX.Base.LaTeX.Math', 'lceil'),
+    'ldots': ('plasTeX.Base.LaTeX.Math', 'ldots'),
+    'le': ('plasTeX.Base.LaTeX.Math', 'le'),
+    'leadsto': ('plasTeX.Base.LaTeX.Math', 'leadsto'),
+    'leavevmode': ('plasTeX.Base.TeX.Primitives', 'leavevmode'),
+    'left': ('plasTeX.Base.LaTeX.Math', 'left'),
+    'leftarrow': ('plasTeX.Base.LaTeX.Math', 'leftarrow'),
+    'lefteqn': ('plasTeX.Base.LaTeX.Math', 'lefteqn'),
+    'leftharpoondown': ('plasTeX.Base.LaTeX.Math', 'leftharpoondown'),
+    'leftharpoonup': ('plasTeX.Base.LaTeX.Math', 'leftharpoonup'),
+    'lefthyphenmin': ('plasTeX.Base.TeX.Parameters', 'lefthyphenmin'),
+    'leftline': ('plasTeX.Base.TeX.Text', 'leftline'),
+    'leftmargin': ('plasTeX.Base.LaTeX.Lists', 'leftmargin'),
+    'leftrightarrow': ('plasTeX.Base.LaTeX.Math', 'leftrightarrow'),
+    'leftskip': ('plasTeX.Base.TeX.Parameters', 'leftskip'),
+    'leq': ('plasTeX.Base.LaTeX.Math', 'leq'),
+    'let': ('plasTeX.Base.TeX.Primitives', 'let'),
+    'lfloor': ('plasTeX.Base.LaTeX.Math', 'lfloor'),
+    'lg': ('plasTeX.Base.LaTeX.Math', 'lg'),
+    'lgroup': ('plasTeX.Base.LaTeX.Math', 'lgroup'),
+    'lhd': ('plasTeX.Base.LaTeX.Math', 'lhd'),
+    'lim': ('plasTeX.Base.LaTeX.Math', 'lim'),
+    'liminf': ('plasTeX.Base.LaTeX.Math', 'liminf'),
+    'limsup': ('plasTeX.Base.LaTeX.Math', 'limsup'),
+    'line': ('plasTeX.Base.TeX.Text', 'line'),
+    'linebreak': ('plasTeX.Base.LaTeX.Breaking', 'linebreak'),
+    'linepenalty': ('plasTeX.Base.TeX.Parameters', 'linepenalty'),
+    'lineskip': ('plasTeX.Base.TeX.Parameters', 'lineskip'),
+    'lineskipamount': ('plasTeX.Base.TeX.Parameters', 'lineskipamount'),
+    'linewidth': ('plasTeX.Base.LaTeX.Paragraphs', 'linewidth'),
+    'list': ('plasTeX.Base.LaTeX.Lists', 'ConfigurableList'),
+    'listfiles': ('plasTeX.Base.LaTeX.Files', 'listfiles'),
+    'listoffigures': ('plasTeX.Base.LaTeX.Sectioning', 'listoffigures'),
+    'listoftables': ('plasTeX.Base.LaTeX.Sectioning', 'listoftables'),
+    'listparindent': ('plasTeX.Base.LaTeX.Lists', 'listparindent'),
+    'll': ('plasTeX.Base.LaTeX.Math', 'll'),
+    'llap': ('plasTeX.Base.TeX.Text', 'llap'),
+    'lmoustache': ('plasTeX.Base.LaTeX.Math', 'lmoustache'),
+    'ln': ('plasTeX.Base.LaTeX.Math', 'ln'),
+    'log': ('plasTeX.Base.LaTeX.Math', 'Logarithm'),
+    'long': ('plasTeX.Base.TeX.Primitives', 'long'),
+    'longleftarrow': ('plasTeX.Base.LaTeX.Math', 'longleftarrow'),
+    'longleftrightarrow': ('plasTeX.Base.LaTeX.Math', 'longleftrightarrow'),
+    'longmapsto': ('plasTeX.Base.LaTeX.Math', 'longmapsto'),
+    'longrightarrow': ('plasTeX.Base.LaTeX.Math', 'longrightarrow'),
+    'loop': ('plasTeX.Base.TeX.Text', 'loop'),
+    'looseness': ('plasTeX.Base.TeX.Parameters', 'looseness'),
+    'lq': ('plasTeX.Base.TeX.Text', 'lq'),
+    'lrbox': ('plasTeX.Base.LaTeX.Boxes', 'lrbox'),
+    'mag': ('plasTeX.Base.TeX.Parameters', 'mag'),
+    'magstep': ('plasTeX.Base.TeX.Fonts', 'magstep'),
+    'magstephalf': ('plasTeX.Base.TeX.Fonts', 'magstephalf'),
+    'makeatletter': ('plasTeX.Base.LaTeX', 'makeatletter'),
+    'makeatother': ('plasTeX.Base.LaTeX', 'makeatother'),
+    'makebox': ('plasTeX.Base.LaTeX.Boxes', 'makebox'),
+    'makeglossary': ('plasTeX.Base.LaTeX.Index', 'makeglossary'),
+    'makeindex': ('plasTeX.Base.LaTeX.Index', 'makeindex'),
+    'makelabel': ('plasTeX.Base.LaTeX.Lists', 'makelabel'),
+    'maketitle': ('plasTeX.Base.LaTeX.Packages', 'maketitle'),
+    'mapsto': ('plasTeX.Base.LaTeX.Math', 'mapsto'),
+    'marginpar': ('plasTeX.Base.LaTeX.Floats', 'marginpar'),
+    'marginparpush': ('plasTeX.Base.LaTeX.Floats', 'marginparpush'),
+    'marginparsep': ('plasTeX.Base.LaTeX.Packages', 'marginparsep'),
+    'marginparwidth': ('plasTeX.Base.LaTeX.Packages', 'marginparwidth'),
+    'markboth': ('plasTeX.Base.LaTeX.Packages', 'markboth'),
+    'markright': ('plasTeX.Base.LaTeX.Packages', 'markright'),
+    'math': ('plasTeX.Base.LaTeX.Math', 'math'),
+    'mathbf': ('plasTeX.Base.LaTeX.Math', 'mathbf'),
+    'mathcal': ('plasTeX.Base.LaTeX.Math', 'mathcal'),
+    'mathchardef': ('plasTeX.Base.TeX.Primitives', 'mathchardef'),
+    'mathindent': ('plasTeX.Base.LaTeX.Math', 'mathindent'),
+    'mathit': ('plasTeX.Base.LaTeX.Math', 'mathit'),
+    'mathop': ('plasTeX.Base.LaTeX.Math', 'mathop'),
+    'mathrm': ('plasTeX.Base.LaTeX.Math', 'mathrm'),
+    'mathsf': ('plasTeX.Base.LaTeX.Math', 'mathsf'),
+    'mathsurround': ('plasTeX.Base.TeX.Parameters', 'mathsurround'),
+    'mathtt': ('plasTeX.Base.LaTeX.Math', 'mathtt'),
+    'max': ('plasTeX.Base.LaTeX.Math', 'max'),
+    'maxdeadcycles': ('plasTeX.Base.TeX.Parameters', 'maxdeadcycles'),
+    'maxdepth': ('plasTeX.Base.TeX.Parameters', 'maxdepth'),
+    'maxdimen': ('plasTeX.Base.TeX.Registers', 'maxdimen'),
+    'mbox': ('plasTeX.Base.LaTeX.Boxes', 'mbox'),
+    'mdseries': ('plasTeX.Base.LaTeX.FontSelection', 'mdseries'),
+    'medbreak': ('plasTeX.Base.TeX.Text', 'medbreak'),
+    'medmuskip': ('plasTeX.Base.TeX.Parameters', 'medmuskip'),
+    'medskip': ('plasTeX.Base.LaTeX.Space', 'medskip'),
+    'medskipamount': ('plasTeX.Base.LaTeX.Space', 'medskipamount'),
+    'mho': ('plasTeX.Base.LaTeX.Math', 'mho'),
+    'mid': ('plasTeX.Base.LaTeX.Math', 'mid'),
+    'min': ('plasTeX.Base.LaTeX.Math', 'min'),
+    'minipage': ('plasTeX.Base.LaTeX.Boxes', 'minipage'),
+    'models': ('plasTeX.Base.LaTeX.Math', 'models'),
+    'month': ('plasTeX.Base.TeX.Parameters', 'month'),
+    'mp': ('plasTeX.Base.LaTeX.Math', 'mp'),
+    'mu': ('plasTeX.Base.LaTeX.Math', 'mu'),
+    'nabla': ('plasTeX.Base.LaTeX.Math', 'nabla'),
+    'narrower': ('plasTeX.Base.TeX.Text', 'narrower'),
+    'natural': ('plasTeX.Base.LaTeX.Math', 'natural'),
+    'ne': ('plasTeX.Base.LaTeX.Math', 'ne'),
+    'nearrow': ('plasTeX.Base.LaTeX.Math', 'nearrow'),
+    'neg': ('plasTeX.Base.LaTeX.Math', 'neg'),
+    'negthinspace': ('plasTeX.Base.TeX.Text', 'negthinspace'),
+    'neq': ('plasTeX.Base.LaTeX.Math', 'neq'),
+    'newblock': ('plasTeX.Base.LaTeX.Bibliography', 'newblock'),
+    'newbox': ('plasTeX.Base.TeX.Registers', 'newbox'),
+    'newcommand': ('plasTeX.Base.LaTeX.Definitions', 'newcommand'),
+    'newcount': ('plasTeX.Base.TeX.Registers', 'newcount'),
+    'newcounter': ('plasTeX.Base.LaTeX.Numbering', 'newcounter'),
+    'newdimen': ('plasTeX.Base.TeX.Registers', 'newdimen'),
+    'newenvironment': ('plasTeX.Base.LaTeX.Definitions', 'newenvironment'),
+    'newfam': ('plasTeX.Base.TeX.Registers', 'newfam'),
+    'newhelp': ('plasTeX.Base.TeX.Registers', 'newhelp'),
+    'newif': ('plasTeX.Base.TeX.Registers', 'newif'),
+    'newlanguage': ('plasTeX.Base.TeX.Registers', 'newlanguage'),
+    'newlength': ('plasTeX.Base.LaTeX.Lengths', 'newlength'),
+    'newline': ('plasTeX.Base.LaTeX.Breaking', 'newline'),
+    'newlinechar': ('plasTeX.Base.TeX.Parameters', 'newlinechar'),
+    'newmuskip': ('plasTeX.Base.TeX.Registers', 'newmuskip'),
+    'newpage': ('plasTeX.Base.LaTeX.Breaking', 'newpage'),
+    'newread': ('plasTeX.Base.TeX.Registers', 'newread'),
+    'newsavebox': ('plasTeX.Base.LaTeX.Boxes', 'newsavebox'),
+    'newskip': ('plasTeX.Base.TeX.Registers', 'newskip'),
+    'newtheorem': ('plasTeX.Base.LaTeX.Definitions', 'newtheorem'),
+    'newtoks': ('plasTeX.Base.TeX.Registers', 'newtoks'),
+    'newwrite': ('plasTeX.Base.TeX.Registers', 'newwrite'),
+    'ng': ('plasTeX.Base.LaTeX.Characters', 'ng'),
+    'ni': ('plasTeX.Base.LaTeX.Math', 'ni'),
+    'nocite': ('plasTeX.Base.LaTeX.Bibliography', 'nocite'),
+    'nofiles': ('plasTeX.Base.LaTeX.Files', 'nofiles'),
+    'noindent': ('plasTeX.Base.LaTeX.Paragraphs', 'noindent'),
+    'nointerlineskip': ('plasTeX.Base.TeX.Text', 'nointerlineskip'),
+    'nolinebreak': ('plasTeX.Base.LaTeX.Breaking', 'nolinebreak'),
+    'nonfrenchspacing': ('plasTeX.Base.TeX.Text', 'nonfrenchspacing'),
+    'nonumber': ('plasTeX.Base.LaTeX.Math', 'nonumber'),
+    'nopagebreak': ('plasTeX.Base.LaTeX.Breaking', 'nopagebreak'),
+    'normalbaselines': ('plasTeX.Base.TeX.Text', 'normalbaselines'),
+    'normalfont': ('plasTeX.Base.LaTeX.FontSelection', 'normalfont'),
+    'normalmarginpar': ('plasTeX.Base.LaTeX.Floats', 'normalmarginpar'),
+    'normalsize': ('plasTeX.Base.LaTeX.FontSelection', 'normalsize'),
+    'not': ('plasTeX.Base.LaTeX.Math', 'Not'),
+    'notag': ('plasTeX.Base.LaTeX.Math', 'notag'),
+    'notin': ('plasTeX.Base.LaTeX.Math', 'notin'),
+    'nu': ('plasTeX.Base.LaTeX.Math', 'nu'),
+    'null': ('plasTeX.Base.TeX.Text', 'null'),
+    'nulldelimiterspace': ('plasTeX.Base.TeX.Parameters', 'nulldelimiterspace'),
+    'number': ('plasTeX.Base.TeX.Numbers', 'number'),
+    'nwarrow': ('plasTeX.Base.LaTeX.Math', 'nwarrow'),
+    'o': ('plasTeX.Base.LaTeX.Characters', 'o'),
+    'obeyspaces': ('plasTeX.Base.TeX.Text', 'obeyspaces'),
+    'oddsidemargin': ('plasTeX.Base.LaTeX.Packages', 'oddsidemargin'),
+    'odot': ('plasTeX.Base.LaTeX.Math', 'odot'),
+    'oe': ('plasTeX.Base.LaTeX.Characters', 'oe'),
+    'offinterlineskip': ('plasTeX.Base.TeX.Text', 'offinterlineskip'),
+    'oint': ('plasTeX.Base.LaTeX.Math', 'oint'),
+    'omega': ('plasTeX.Base.LaTeX.Math', 'omega'),
+    'ominus': ('plasTeX.Base.LaTeX.Math', 'ominus'),
+    'onecolumn': ('plasTeX.Base.LaTeX.Packages', 'onecolumn'),
+    'openout': ('plasTeX.Base.TeX.Primitives', 'openout'),
+    'oplus': ('plasTeX.Base.LaTeX.Math', 'oplus'),
+    'oslash': ('plasTeX.Base.LaTeX.Math', 'oslash'),
+    'otimes': ('plasTeX.Base.LaTeX.Math', 'otimes'),
+    'outputpenalty': ('plasTeX.Base.TeX.Parameters', 'outputpenalty'),
+    'overbrace': ('plasTeX.Base.LaTeX.Math', 'overbrace'),
+    'overfullrule': ('plasTeX.Base.TeX.Parameters', 'overfullrule'),
+    'overline': ('plasTeX.Base.LaTeX.Math', 'overline'),
+    'pagebreak': ('plasTeX.Base.LaTeX.Breaking', 'pagebreak'),
+    'pagelabel': ('plasTeX.Base.LaTeX', 'pagelabel'),
+    'pagenumbering': ('plasTeX.Base.LaTeX.Packages', 'pagenumbering'),
+    'pageref': ('plasTeX.Base.LaTeX.Crossref', 'pageref'),
+    'pagestyle': ('plasTeX.Base.LaTeX.Packages', 'pagestyle'),
+    'paperheight': ('plasTeX.Base.LaTeX.Packages', 'paperheight'),
+    'paperwidth': ('plasTeX.Base.LaTeX.Packages', 'paperwidth'),
+    'par': ('plasTeX.Base.TeX.Primitives', 'par'),
+    'paragraph': ('plasTeX.Base.LaTeX.Sectioning', 'paragraph'),
+    'parallel': ('plasTeX.Base.LaTeX.Math', 'parallel'),
+    'parbox': ('plasTeX.Base.LaTeX.Boxes', 'parbox'),
+    'parfillskip': ('plasTeX.Base.TeX.Parameters', 'parfillskip'),
+    'parindent': ('plasTeX.Base.TeX.Parameters', 'parindent'),
+    'parsep': ('plasTeX.Base.LaTeX.Lists', 'parsep'),
+    'parskip': ('plasTeX.Base.TeX.Parameters', 'parskip'),
+    'part': ('plasTeX.Base.LaTeX.Sectioning', 'part'),
+    'partial': ('plasTeX.Base.LaTeX.Math', 'partial'),
+    'partopsep': ('plasTeX.Base.LaTeX.Lists', 'partopsep'),
+    'pausing': ('plasTeX.Base.TeX.Parameters', 'pausing'),
+    'pdffalse': ('plasTeX.Base.TeX.Primitives', 'pdffalse'),
+    'pdftrue': ('plasTeX.Base.TeX.Primitives', 'pdftrue'),
+    'perp': ('plasTeX.Base.LaTeX.Math', 'perp'),
+    'phantom': ('plasTeX.Base.LaTeX.Space', 'phantom'),
+    'phi': ('plasTeX.Base.LaTeX.Math', 'phi'),
+    'pi': ('plasTeX.Base.LaTeX.Math', 'pi'),
+    'picture': ('plasTeX.Base.LaTeX.Pictures', 'picture'),
+    'plastexfalse': ('plasTeX.Base.TeX.Primitives', 'plastexfalse'),
+    'plastextrue': ('plasTeX.Base.TeX.Primitives', 'plastextrue'),
+    'pm': ('plasTeX.Base.LaTeX.Math', 'pm'),
+    'pmod': ('plasTeX.Base.LaTeX.Math', 'pmod'),
+    'postdisplaypenalty': ('plasTeX.Base.TeX.Parameters', 'postdisplaypenalty'),
+    'pounds': ('plasTeX.Base.LaTeX.Accents', 'pounds'),
+    'prec': ('plasTeX.Base.LaTeX.Math', 'prec'),
+    'preceq': ('plasTeX.Base.LaTeX.Math', 'preceq'),
+    'predisplaypenalty': ('plasTeX.Base.TeX.Parameters', 'predisplaypenalty'),
+    'predisplaysize': ('plasTeX.Base.TeX.Parameters', 'predisplaysize'),
+    'pretolerance': ('plasTeX.Base.TeX.Parameters', 'pretolerance'),
+    'prime': ('plasTeX.Base.LaTeX.Math', 'prime'),
+    'printindex': ('plasTeX.Base.LaTeX.Index', 'printindex'),
+    'prod': ('plasTeX.Base.LaTeX.Math', 'prod'),
+    'propto': ('plasTeX.Base.LaTeX.Math', 'propto'),
+    'protect': ('plasTeX.Base.TeX.Primitives', 'protect'),
+    'protected_write': ('plasTeX.Base.TeX.Primitives', 'protected_write'),
+    'providecommand': ('plasTeX.Base.LaTeX.Definitions', 'providecommand'),
+    'psi': ('plasTeX.Base.LaTeX.Math', 'psi'),
+    'qbeziermax': ('plasTeX.Base.LaTeX.Pictures', 'qbeziermax'),
+    'qquad': ('plasTeX.Base.TeX.Text', 'qquad'),
+    'quad': ('plasTeX.Base.TeX.Text', 'quad'),
+    'quotation': ('plasTeX.Base.LaTeX.Quotations', 'quotation'),
+    'quote': ('plasTeX.Base.LaTeX.Quotations', 'quote'),
+    'quotedblbase': ('plasTeX.Base.LaTeX.Characters', 'quotedblbase'),
+    'quotesinglbase': ('plasTeX.Base.LaTeX.Characters', 'quotesinglbase'),
+    'r': ('plasTeX.Base.LaTeX.Accents', 'r'),
+    'raggedbottom': ('plasTeX.Base.LaTeX.Alignment', 'raggedbottom'),
+    'raggedleft': ('plasTeX.Base.LaTeX.Alignment', 'raggedleft'),
+    'raggedright': ('plasTeX.Base.LaTeX.Alignment', 'raggedright'),
+    'raisebox': ('plasTeX.Base.LaTeX.Boxes', 'raisebox'),
+    'rangle': ('plasTeX.Base.LaTeX.Math', 'rangle'),
+    'rbrace': ('plasTeX.Base.LaTeX.Math', 'rbrace'),
+    'rbrack': ('plasTeX.Base.TeX.Text', 'rbrack'),
+    'rceil': ('plasTeX.Base.LaTeX.Math', 'rceil'),
+    'ref': ('plasTeX.Base.LaTeX.Crossref', 'ref'),
+    'refstepcounter': ('plasTeX.Base.LaTeX.Numbering', 'refstepcounter'),
+    'relax': ('plasTeX.Base.TeX.Primitives', 'relax'),
+    'relpenalty': ('plasTeX.Base.TeX.Parameters', 'relpenalty'),
+    'removelastskip': ('plasTeX.Base.TeX.Text', 'removelastskip'),
+    'renewcommand': ('plasTeX.Base.LaTeX.Definitions', 'renewcommand'),
+    'renewenvironment': ('plasTeX.Base.LaTeX.Definitions', 'renewenvironment'),
+    'repeat': ('plasTeX.Base.TeX.Text', 'repeat'),
+    'reversemarginpar': ('plasTeX.Base.LaTeX.Floats', 'reversemarginpar'),
+    'rfloor': ('plasTeX.Base.LaTeX.Math', 'rfloor'),
+    'rgroup': ('plasTeX.Base.LaTeX.Math', 'rgroup'),
+    'rhd': ('plasTeX.Base.LaTeX.Math', 'rhd'),
+    'rho': ('plasTeX.Base.LaTeX.Math', 'rho'),
+    'right': ('plasTeX.Base.LaTeX.Math', 'right'),
+    'rightarrow': ('plasTeX.Base.LaTeX.Math', 'rightarrow'),
+    'rightharpoondown': ('plasTeX.Base.LaTeX.Math', 'rightharpoondown'),
+    'rightharpoonup': ('plasTeX.Base.LaTeX.Math', 'rightharpoonup'),
+    'righthyphenmin': ('plasTeX.Base.TeX.Parameters', 'righthyphenmin'),
+    'rightleftharpoons': ('plasTeX.Base.LaTeX.Math', 'rightleftharpoons'),
+    'rightline': ('plasTeX.Base.TeX.Text', 'rightline'),
+    'rightmargin': ('plasTeX.Base.LaTeX.Lists', 'rightmargin'),
+    'rightskip': ('plasTeX.Base.TeX.Parameters', 'rightskip'),
+    'rm': ('plasTeX.Base.TeX.Fonts', 'rm'),
+    'rmfamily': ('plasTeX.Base.LaTeX.FontSelection', 'rmfamily'),
+    'rmoustache': ('plasTeX.Base.LaTeX.Math', 'rmoustache'),
+    'roman': ('plasTeX.Base.LaTeX.Numbering', 'roman'),
+    'romannumeral': ('plasTeX.Base.TeX.Numbers', 'romannumeral'),
+    'rq': ('plasTeX.Base.TeX.Text', 'rq'),
+    'rule': ('plasTeX.Base.LaTeX.Boxes', 'rule'),
+    'savebox': ('plasTeX.Base.LaTeX.Boxes', 'savebox'),
+    'sbox': ('plasTeX.Base.LaTeX.Boxes', 'sbox'),
+    'sc': ('plasTeX.Base.TeX.Fonts', 'sc'),
+    'scriptscriptstyle': ('plasTeX.Base.LaTeX.Math', 'scriptscriptstyle'),
+    'scriptsize': ('plasTeX.Base.LaTeX.FontSelection', 'scriptsize'),
+    'scriptspace': ('plasTeX.Base.TeX.Parameters', 'scriptspace'),
+    'scriptstyle': ('plasTeX.Base.LaTeX.Math', 'scriptstyle'),
+    'scshape': ('plasTeX.Base.LaTeX.FontSelection', 'scshape'),
+    'searrow': ('plasTeX.Base.LaTeX.Math', 'searrow'),
+    'sec': ('plasTeX.Base.LaTeX.Math', 'sec'),
+    'section': ('plasTeX.Base.LaTeX.Sectioning', 'section'),
+    'setcounter': ('plasTeX.Base.LaTeX.Numbering', 'setcounter'),
+    'setlength': ('plasTeX.Base.LaTeX.Lengths', 'setlength'),
+    'setminus': ('plasTeX.Base.LaTeX.Math', 'setminus'),
+    'settodepth': ('plasTeX.Base.LaTeX.Lengths', 'settodepth'),
+    'settoheight': ('plasTeX.Base.LaTeX.Lengths', 'settoheight'),
+    'settowidth': ('plasTeX.Base.LaTeX.Lengths', 'settowidth'),
+    'sf': ('plasTeX.Base.TeX.Fonts', 'sf'),
+    'sffamily': ('plasTeX.Base.LaTeX.FontSelection', 'sffamily'),
+    'sharp': ('plasTeX.Base.LaTeX.Math', 'sharp'),
+    'showboxbreadth': ('plasTeX.Base.TeX.Parameters', 'showboxbreadth'),
+    'showboxdepth': ('plasTeX.Base.TeX.Parameters', 'showboxdepth'),
+    'showthe': ('plasTeX.Base.TeX.Primitives', 'showthe'),
+    'sigma': ('plasTeX.Base.LaTeX.Math', 'sigma'),
+    'sim': ('plasTeX.Base.LaTeX.Math', 'sim'),
+    'simeq': ('plasTeX.Base.LaTeX.Math', 'simeq'),
+    'sin': ('plasTeX.Base.LaTeX.Math', 'sin'),
+    'sinh': ('plasTeX.Base.LaTeX.Math', 'sinh'),
+    'skip': ('plasTeX.Base.TeX.Registers', 'skip'),
+    'sl': ('plasTeX.Base.TeX.Fonts', 'sl'),
+    'slash': ('plasTeX.Base.TeX.Text', 'slash'),
+    'sloppy': ('plasTeX.Base.LaTeX.Breaking', 'sloppy'),
+    'sloppypar': ('plasTeX.Base.LaTeX.Breaking', 'sloppypar'),
+    'slshape': ('plasTeX.Base.LaTeX.FontSelection', 'slshape'),
+    'small': ('plasTeX.Base.LaTeX.FontSelection', 'small'),
+    'smallbreak': ('plasTeX.Base.TeX.Text', 'smallbreak'),
+    'smallskip': ('plasTeX.Base.LaTeX.Space', 'smallskip'),
+    'smallskipamount': ('plasTeX.Base.LaTeX.Space', 'smallskipamount'),
+    'smile': ('plasTeX.Base.LaTeX.Math', 'smile'),
+    'space': ('plasTeX.Base.TeX.Text', 'space'),
+    'spaceskip': ('plasTeX.Base.TeX.Parameters', 'spaceskip'),
+    'spadesuit': ('plasTeX.Base.LaTeX.Math', 'spadesuit'),
+    'splitmaxdepth': ('plasTeX.Base.TeX.Parameters', 'splitmaxdepth'),
+    'splittopskip': ('plasTeX.Base.TeX.Parameters', 'splittopskip'),
+    'sqcap': ('plasTeX.Base.LaTeX.Math', 'sqcap'),
+    'sqcup': ('plasTeX.Base.LaTeX.Math', 'sqcup'),
+    'sqrt': ('plasTeX.Base.LaTeX.Math', 'sqrt'),
+    'sqsubseteq': ('plasTeX.Base.LaTeX.Math', 'sqsubseteq'),
+    'sqsupset': ('plasTeX.Base.LaTeX.Math', 'sqsupset'),
+    'sqsupseteq': ('plasTeX.Base.LaTeX.Math', 'sqsupseteq'),
+    'ss': ('plasTeX.Base.LaTeX.Characters', 'ss'),
+    'stackrel': ('plasTeX.Base.LaTeX.Math', 'stackrel'),
+    'star': ('plasTeX.Base.LaTeX.Math', 'star'),
+    'stepcounter': ('plasTeX.Base.LaTeX.Numbering', 'stepcounter'),
+    'stretch': ('plasTeX.Base.LaTeX.Lengths', 'stretch'),
+    'subparagraph': ('plasTeX.Base.LaTeX.Sectioning', 'subparagraph'),
+    'subsection': ('plasTeX.Base.LaTeX.Sectioning', 'subsection'),
+    'subset': ('plasTeX.Base.LaTeX.Math', 'subset'),
+    'subseteq': ('plasTeX.Base.LaTeX.Math', 'subseteq'),
+    'subsubparagraph': ('plasTeX.Base.LaTeX.Sectioning', 'subsubparagraph'),
+    'subsubsection': ('plasTeX.Base.LaTeX.Sectioning', 'subsubsection'),
+    'succ': ('plasTeX.Base.LaTeX.Math', 'succ'),
+    'succeq': ('plasTeX.Base.LaTeX.Math', 'succeq'),
+    'sum': ('plasTeX.Base.LaTeX.Math', 'sum'),
+    'sup': ('plasTeX.Base.LaTeX.Math', 'sup'),
+    'supereject': ('plasTeX.Base.TeX.Text', 'supereject'),
+    'suppressfloats': ('plasTeX.Base.LaTeX.Floats', 'suppressfloats'),
+    'supset': ('plasTeX.Base.LaTeX.Math', 'supset'),
+    'supseteq': ('plasTeX.Base.LaTeX.Math', 'supseteq'),
+    'surd': ('plasTeX.Base.LaTeX.Math', 'surd'),
+    'swarrow': ('plasTeX.Base.LaTeX.Math', 'swarrow'),
+    'symbol': ('plasTeX.Base.LaTeX.FontSelection', 'symbol'),
+    't': ('plasTeX.Base.LaTeX.Accents', 't'),
+    'tabbing': ('plasTeX.Base.LaTeX.Tabbing', 'tabbing'),
+    'tabbingsep': ('plasTeX.Base.LaTeX.Tabbing', 'tabbingsep'),
+    'tabcolsep': ('plasTeX.Base.LaTeX.Arrays', 'tabcolsep'),
+    'table': ('plasTeX.Base.LaTeX.Floats', 'table'),
+    'table*': ('plasTeX.Base.LaTeX.Floats', 'TableStar'),
+    'tableofcontents': ('plasTeX.Base.LaTeX.Sectioning', 'tableofcontents'),
+    'tabskip': ('plasTeX.Base.TeX.Parameters', 'tabskip'),
+    'tabular': ('plasTeX.Base.LaTeX.Arrays', 'tabular'),
+    'tabular*': ('plasTeX.Base.LaTeX.Arrays', 'TabularStar'),
+    'tabularx': ('plasTeX.Base.LaTeX.Arrays', 'tabularx'),
+    'tabulary': ('plasTeX.Base.LaTeX.Arrays', 'tabulary'),
+    'tan': ('plasTeX.Base.LaTeX.Math', 'tan'),
+    'tanh': ('plasTeX.Base.LaTeX.Math', 'tanh'),
+    'tau': ('plasTeX.Base.LaTeX.Math', 'tau'),
+    'text': ('plasTeX.Base.LaTeX.Math', 'text'),
+    'textasciicircum': ('plasTeX.Base.LaTeX.Characters', 'textasciicircum'),
+    'textasciitilde': ('plasTeX.Base.LaTeX.Characters', 'textasciitilde'),
+    'textbackslash': ('plasTeX.Base.LaTeX.Characters', 'textbackslash'),
+    'textbar': ('plasTeX.Base.LaTeX.Characters', 'textbar'),
+    'textbf': ('plasTeX.Base.LaTeX.FontSelection', 'textbf'),
+    'textbraceleft': ('plasTeX.Base.LaTeX.Characters', 'textbraceleft'),
+    'textbraceright': ('plasTeX.Base.LaTeX.Characters', 'textbraceright'),
+    'textcompwordmark': ('plasTeX.Base.LaTeX.Characters', 'textcompwordmark'),
+    'textcopyright': ('plasTeX.Base.LaTeX.Characters', 'textcopyright'),
+    'textdollar': ('plasTeX.Base.LaTeX.Characters', 'textdollar'),
+    'textemdash': ('plasTeX.Base.LaTeX.Characters', 'textemdash'),
+    'textendash': ('plasTeX.Base.LaTeX.Characters', 'textendash'),
+    'textexclamdown': ('plasTeX.Base.LaTeX.Characters', 'textexclamdown'),
+    'textfloatsep': ('plasTeX.Base.LaTeX.Floats', 'textfloatsep'),
+    'textfraction': ('plasTeX.Base.LaTeX.Floats', 'textfraction'),
+    'textgreater': ('plasTeX.Base.LaTeX.Characters', 'textgreater'),
+    'textheight': ('plasTeX.Base.LaTeX.Packages', 'textheight'),
+    'textindent': ('plasTeX.Base.TeX.Text', 'textindent'),
+    'textit': ('plasTeX.Base.LaTeX.FontSelection', 'textit'),
+    'textless': ('plasTeX.Base.LaTeX.Characters', 'textless'),
+    'textmd': ('plasTeX.Base.LaTeX.FontSelection', 'textmd'),
+    'textnormal': ('plasTeX.Base.LaTeX.FontSelection', 'textnormal'),
+    'textogonekcentered': ('plasTeX.Base.LaTeX.Characters', 'textogonekcentered'),
+    'textpertenthousand': ('plasTeX.Base.LaTeX.Characters', 'textpertenthousand'),
+    'textperthousand': ('plasTeX.Base.LaTeX.Characters', 'textperthousand'),
+    'textquestiondown': ('plasTeX.Base.LaTeX.Characters', 'textquestiondown'),
+    'textquotedbl': ('plasTeX.Base.LaTeX.Characters', 'textquotedbl'),
+    'textquotedblleft': ('plasTeX.Base.LaTeX.Characters', 'textquotedblleft'),
+    'textquotedblright': ('plasTeX.Base.LaTeX.Characters', 'textquotedblright'),
+    'textquoteleft': ('plasTeX.Base.LaTeX.Characters', 'textquoteleft'),
+    'textquoteright': ('plasTeX.Base.LaTeX.Characters', 'textquoteright'),
+    'textregistered': ('plasTeX.Base.LaTeX.Characters', 'textregistered'),
+    'textrm': ('plasTeX.Base.LaTeX.FontSelection', 'textrm'),
+    'textsc': ('plasTeX.Base.LaTeX.FontSelection', 'textsc'),
+    'textsection': ('plasTeX.Base.LaTeX.Characters', 'textsection'),
+    'textsf': ('plasTeX.Base.LaTeX.FontSelection', 'textsf'),
+    'textsl': ('plasTeX.Base.LaTeX.FontSelection', 'textsl'),
+    'textsterling': ('plasTeX.Base.LaTeX.Characters', 'textsterling'),
+    'textstyle': ('plasTeX.Base.LaTeX.Math', 'textstyle'),
+    'textsubscript': ('plasTeX.Base.LaTeX.Sentences', 'textsubscript'),
+    'textsuperscript': ('plasTeX.Base.LaTeX.Sentences', 'textsuperscript'),
+    'texttrademark': ('plasTeX.Base.LaTeX.Characters', 'texttrademark'),
+    'texttt': ('plasTeX.Base.LaTeX.FontSelection', 'texttt'),
+    'textunderscore': ('plasTeX.Base.LaTeX.Characters', 'textunderscore'),
+    'textup': ('plasTeX.Base.LaTeX.FontSelection', 'textup'),
+    'textvisiblespace': ('plasTeX.Base.LaTeX.Characters', 'textvisiblespace'),
+    'textwidth': ('plasTeX.Base.LaTeX.Packages', 'textwidth'),
+    'th': ('plasTeX.Base.LaTeX.Characters', 'th'),
+    'thanks': ('plasTeX.Base.LaTeX.Packages', 'thanks'),
+    'the': ('plasTeX.Base.TeX.Primitives', 'the'),
+    'thebibliography': ('plasTeX.Base.LaTeX.Bibliography', 'thebibliography'),
+    'theindex': ('plasTeX.Base.LaTeX.Index', 'theindex'),
+    'theta': ('plasTeX.Base.LaTeX.Math', 'theta'),
+    'thickmuskip': ('plasTeX.Base.TeX.Parameters', 'thickmuskip'),
+    'thinmuskip': ('plasTeX.Base.TeX.Parameters', 'thinmuskip'),
+    'thinspace': ('plasTeX.Base.TeX.Text', 'thinspace'),
+    'thispagestyle': ('plasTeX.Base.LaTeX.Packages', 'thispagestyle'),
+    'tilde': ('plasTeX.Base.LaTeX.Math', 'tilde'),
+    'time': ('plasTeX.Base.TeX.Parameters', 'time'),
+    'times': ('plasTeX.Base.LaTeX.Math', 'times'),
+    'tiny': ('plasTeX.Base.LaTeX.FontSelection', 'tiny'),
+    'title': ('plasTeX.Base.LaTeX.Packages', 'title'),
+    'titlepage': ('plasTeX.Base.LaTeX.Packages', 'titlepage'),
+    'toks': ('plasTeX.Base.TeX.Registers', 'toks'),
+    'tolerance': ('plasTeX.Base.TeX.Parameters', 'tolerance'),
+    'top': ('plasTeX.Base.LaTeX.Math', 'top'),
+    'topfraction': ('plasTeX.Base.LaTeX.Floats', 'topfraction'),
+    'topglue': ('plasTeX.Base.TeX.Text', 'topglue'),
+    'topmargin': ('plasTeX.Base.LaTeX.Packages', 'topmargin'),
+    'topsep': ('plasTeX.Base.LaTeX.Lists', 'topsep'),
+    'topskip': ('plasTeX.Base.TeX.Parameters', 'topskip'),
+    'tracingcommands': ('plasTeX.Base.TeX.Parameters', 'tracingcommands'),
+    'tracinglostchars': ('plasTeX.Base.TeX.Parameters', 'tracinglostchars'),
+    'tracingmacros': ('plasTeX.Base.TeX.Parameters', 'tracingmacros'),
+    'tracingonline': ('plasTeX.Base.TeX.Parameters', 'tracingonline'),
+    'tracingoutput': ('plasTeX.Base.TeX.Parameters', 'tracingoutput'),
+    'tracingpages': ('plasTeX.Base.TeX.Parameters', 'tracingpages'),
+    'tracingparagraphs': ('plasTeX.Base.TeX.Parameters', 'tracingparagraphs'),
+    'tracingrestores': ('plasTeX.Base.TeX.Parameters', 'tracingrestores'),
+    'tracingstats': ('plasTeX.Base.TeX.Parameters', 'tracingstats'),
+    'triangle': ('plasTeX.Base.LaTeX.Math', 'triangle'),
+    'triangleleft': ('plasTeX.Base.LaTeX.Math', 'triangleleft'),
+    'triangleright': ('plasTeX.Base.LaTeX.Math', 'triangleright'),
+    'trivlist': ('plasTeX.Base.LaTeX.Lists', 'trivlist'),
+    'tt': ('plasTeX.Base.TeX.Fonts', 'tt'),
+    'ttfamily': ('plasTeX.Base.LaTeX.FontSelection', 'ttfamily'),
+    'twocolumn': ('plasTeX.Base.LaTeX.Packages', 'twocolumn'),
+    'typein': ('plasTeX.Base.LaTeX.Files', 'typein'),
+    'typeout': ('plasTeX.Base.LaTeX.Files', 'typeout'),
+    'u': ('plasTeX.Base.LaTeX.Accents', 'u'),
+    'uchyph': ('plasTeX.Base.TeX.Parameters', 'uchyph'),
+    'unboldmath': ('plasTeX.Base.LaTeX.Math', 'unboldmath'),
+    'undefined': ('plasTeX.Base.TeX.Primitives', 'undefined'),
+    'underbar': ('plasTeX.Base.TeX.Text', 'underbar'),
+    'underbrace': ('plasTeX.Base.LaTeX.Math', 'underbrace'),
+    'underline': ('plasTeX.Base.LaTeX.Math', 'underline'),
+    'unitlength': ('plasTeX.Base.LaTeX.Pictures', 'unitlength'),
+    'unlhd': ('plasTeX.Base.LaTeX.Math', 'unlhd'),
+    'unrhd': ('plasTeX.Base.LaTeX.Math', 'unrhd'),
+    'uparrow': ('plasTeX.Base.LaTeX.Math', 'uparrow'),
+    'updownarrow': ('plasTeX.Base.LaTeX.Math', 'updownarrow'),
+    'uplus': ('plasTeX.Base.LaTeX.Math', 'uplus'),
+    'uppercase': ('plasTeX.Base.TeX.Text', 'uppercase'),
+    'upshape': ('plasTeX.Base.LaTeX.FontSelection', 'upshape'),
+    'upsilon': ('plasTeX.Base.LaTeX.Math', 'upsilon'),
+    'usebox': ('plasTeX.Base.LaTeX.Boxes', 'usebox'),
+    'usecounter': ('plasTeX.Base.LaTeX.Lists', 'usecounter'),
+    'usepackage': ('plasTeX.Base.LaTeX.Packages', 'usepackage'),
+    'v': ('plasTeX.Base.LaTeX.Accents', 'v'),
+    'value': ('plasTeX.Base.LaTeX.Numbering', 'value'),
+    'varepsilon': ('plasTeX.Base.LaTeX.Math', 'varepsilon'),
+    'varphi': ('plasTeX.Base.LaTeX.Math', 'varphi'),
+    'varpi': ('plasTeX.Base.LaTeX.Math', 'varpi'),
+    'varrho': ('plasTeX.Base.LaTeX.Math', 'varrho'),
+    'varsigma': ('plasTeX.Base.LaTeX.Math', 'varsigma'),
+    'vartheta': ('plasTeX.Base.LaTeX.Math', 'vartheta'),
+    'vbadness': ('plasTeX.Base.TeX.Parameters', 'vbadness'),
+    'vbox': ('plasTeX.Base.TeX.Primitives', 'vbox'),
+    'vdash': ('plasTeX.Base.LaTeX.Math', 'vdash'),
+    'vdots': ('plasTeX.Base.LaTeX.Math', 'vdots'),
+    'vec': ('plasTeX.Base.LaTeX.Math', 'vec'),
+    'vee': ('plasTeX.Base.LaTeX.Math', 'vee'),
+    'verb': ('plasTeX.Base.LaTeX.Verbatim', 'verb'),
+    'verbatim': ('plasTeX.Base.LaTeX.Verbatim', 'verbatim'),
+    'verbatim*': ('plasTeX.Base.LaTeX.Verbatim', 'VerbatimStar'),
+    'verbatiminput': ('plasTeX.Base.LaTeX', 'verbatiminput'),
+    'verse': ('plasTeX.Base.LaTeX.Quotations', 'verse'),
+    'vert': ('plasTeX.Base.LaTeX.Math', 'vert'),
+    'vfill': ('plasTeX.Base.LaTeX.Space', 'vfill'),
+    'vfuzz': ('plasTeX.Base.TeX.Parameters', 'vfuzz'),
+    'vglue': ('plasTeX.Base.TeX.Text', 'vglue'),
+    'voffset': ('plasTeX.Base.TeX.Parameters', 'voffset'),
+    'vsize': ('plasTeX.Base.TeX.Parameters', 'vsize'),
+    'vskip': ('plasTeX.Base.TeX.Primitives', 'vskip'),
+    'vspace': ('plasTeX.Base.LaTeX.Space', 'vspace'),
+    'wedge': ('plasTeX.Base.LaTeX.Math', 'wedge'),
+    'widehat': ('plasTeX.Base.LaTeX.Math', 'widehat'),
+    'widetilde': ('plasTeX.Base.LaTeX.Math', 'widetilde'),
+    'widowpenalty': ('plasTeX.Base.TeX.Parameters', 'widowpenalty'),
+    'wp': ('plasTeX.Base.LaTeX.Math', 'wp'),
+    'wr': ('plasTeX.Base.LaTeX.Math', 'wr'),
+    'write': ('plasTeX.Base.TeX.Primitives', 'write'),
+    'xdef': ('plasTeX.Base.TeX.Primitives', 'xdef'),
+    'xi': ('plasTeX.Base.LaTeX.Math', 'xi'),
+    'xspaceskip': ('plasTeX.Base.TeX.Parameters', 'xspaceskip'),
+    'year': ('plasTeX.Base.TeX.Parameters', 'year'),
+    'zeta': ('plasTeX.Base.LaTeX.Math', 'zeta'),
+    '{': ('plasTeX.Base.LaTeX.Sentences', 'LeftBrace'),
+    '|': ('plasTeX.Base.LaTeX.Math', 'VerticalBar'),
+    '}': ('plasTeX.Base.LaTeX.Sentences', 'RightBrace'),
+    '~': ('plasTeX.Base.LaTeX.Accents', 'Tilde'),
+}
@@ -1,14 +1,23 @@
-import os, sys, string, glob
+import os, sys, string, glob, time
 import importlib
 import importlib.util
+import logging, traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, redirect_stdout, redirect_stderr
+from io import StringIO
 from types import ModuleType
 from pathlib import Path
 import pdb
 import plasTeX
+from plasTeX import Logging
 from plasTeX.TeX import TeX
+from plasTeX.Config import defaultConfig
 from plasTeX.ConfigManager import *
 from plasTeX.Logging import getLogger, updateLogLevels
+from plasTeX.Profile import Profiler
 from plasTeX.Renderers import Renderer
+from plasTeX.Base.LaTeX.Sectioning import cachedproperty
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
 
 log = getLogger()
 
@@ -52,11 +61,43 @@ def load_renderer(rname: str, config: ConfigManager) -> Renderer:
         raise ImportError('Could not import renderer "%s".  Make sure that it is installed correctly, and can be imported by Python.' % rname)
 
 
+def renderer_names(config: ConfigManager) -> List[str]:
+    """Return the names of the renderers requested in config. Several
+    renderers can be given, separated by spaces."""
+    return config['general']['renderer'].split() or ['HTML5']
+
+def restore_paux(document: plasTeX.TeXDocument, rname: str):
+    """Load the cross-document references stored in the *.paux files of the
+    working directory and of the paux-dirs for the renderer rname."""
+    config = document.config
+    pauxname = '%s.paux' % document.userdata['jobname']
+    for dirname in [document.userdata['working-dir']] + config['general']['paux-dirs']:
+        for fname in glob.glob(os.path.join(dirname, '*.paux')):
+            if os.path.basename(fname) == pauxname:
+                continue
+            document.context.restore(fname, rname)
+
+def reset_render_state(document: plasTeX.TeXDocument):
+    """Forget the values cached on nodes during rendering, since they may
+    depend on the renderer (e.g. which sections generate files)."""
+    names = {} # type: Dict[type, List[str]]
+    for node in [document] + document.allChildNodes:
+        cls = type(node)
+        if cls not in names:
+            names[cls] = ['@' + name for c in cls.__mro__
+                          for name, value in vars(c).items()
+                          if isinstance(value, cachedproperty)]
+        for name in names[cls]:
+            if name in vars(node):
+                delattr(node, name)
+
 def parse(filename: str, config: ConfigManager) -> TeX:
     updateLogLevels(config['logging']['logging'])
 
     # Create document instance that output will be put into
     document = plasTeX.TeXDocument(config=config)
+    if config['general']['profile']:
+        document.profiler = Profiler()
 
     # Instantiate the TeX processor
     tex = TeX(document, file=filename)
@@ -73,20 +114,14 @@ def parse(filename: str, config: ConfigManager) -> TeX:
     cwd = document.userdata['working-dir'] = os.getcwd()
 
     # Load aux files for cross-document references
-    pauxname = '%s.paux' % jobname
-    rname = config['general']['renderer']
-    for dirname in [cwd] + config['general']['paux-dirs']:
-        for fname in glob.glob(os.path.join(dirname, '*.paux')):
-            if os.path.basename(fname) == pauxname:
-                continue
-            document.context.restore(fname, rname)
+    restore_paux(document, renderer_names(config)[0])
 
     # Parse the document
     tex.parse()
     return tex
 
 def run(filename: str, config: ConfigManager):
-    rname = config['general']['renderer']
+    rnames = renderer_names(config)
     tex = parse(filename, config)
     document = tex.ownerDocument
     cwd = document.userdata['working-dir'] = os.getcwd()
@@ -101,16 +136,17 @@ def run(filename: str, config: ConfigManager):
               "Also consider installing BeautifulSoup4 and using\n"
               "from bs4 import BeautifulSoup; print(BeautifulSoup(document.toXML(), 'xml').prettify())")
         pdb.set_trace()
-    renderer = load_renderer(rname, config)
+    renderers = [load_renderer(rname, config) for rname in rnames]
 
-    # Change to specified directory to output to
+    # Output files go to the specified directory.  Renderers are given
+    # this directory rather than changing the current directory.
     outdir = config['files']['directory']
     if outdir:
         outdir = string.Template(outdir).substitute({'jobname':jobname})
         if not os.path.isdir(outdir):
             os.makedirs(outdir)
         log.info('Directing output files to directory: %s.' % outdir)
-        os.chdir(outdir)
+    outdir = os.path.abspath(outdir or cwd)
 
     # Write expanded source file
     #sourcefile = '%s.source' % jobname
@@ -118,12 +154,212 @@ def run(filename: str, config: ConfigManager):
 
     # Write XML dump
     if config['general']['xml']:
-        outfile = '%s.xml' % jobname
+        outfile = os.path.join(outdir, '%s.xml' % jobname)
         with open(outfile,'w',encoding='utf-8') as f:
             f.write(document.toXML())
 
-    # Apply renderer
-    renderer.render(document)
+    # Apply renderers.  When there are several of them, each one renders
+    # the same parsed document into its own subdirectory.
+    for i, (rname, renderer) in enumerate(zip(rnames, renderers)):
+        directory = outdir
+        if len(renderers) > 1:
+            if i:
+                reset_render_state(document)
+                restore_paux(document, rname)
+            subdir = os.path.basename(os.path.normpath(rname))
+            directory = os.path.join(outdir, subdir)
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            log.info('Rendering with %s in directory: %s.' % (rname, subdir))
+
+        # Renderers look up their own name in the config
+        config['general']['renderer'] = rname
+        try:
+            renderer.render(document, directory=directory)
+        finally:
+            config['general']['renderer'] = ' '.join(rnames)
+
+    if document.profiler is not None:
+        basename = os.path.join(cwd, '%s.profile' % jobname)
+        document.profiler.write(basename)
+        log.info('Macro timings written to %s.txt and %s.json.' % (basename, basename))
 
-    os.chdir(cwd)
     print()
+
+def collect_renderer_config(config: ConfigManager):
+    """Add the options of the builtin renderers to config."""
+    plastex_dir = os.path.dirname(os.path.realpath(plasTeX.__file__))
+    renderers_dir = os.path.join(plastex_dir, 'Renderers')
+    renderers = next(os.walk(renderers_dir))[1]
+    for renderer in renderers:
+        try:
+            conf = importlib.import_module('plasTeX.Renderers.'+renderer+'.Config')
+        except ImportError as msg:
+            continue
+
+        conf.addConfig(config)
+
+@contextmanager
+def job_context(cwd, stdout, stderr):
+    """
+    Isolate a job from the process running it and from the other jobs
+
+    The job runs in its own working directory, its output and log
+    messages are written to the given streams, and the loggers are
+    restored afterwards since options like --log change them.
+
+    Required Arguments:
+    cwd -- working directory of the job
+    stdout -- stream receiving the output of the job
+    stderr -- stream receiving the error and log messages of the job
+
+    """
+    streams = {sys.stdout: stdout, sys.stderr: stderr}
+    loggers = {name: (logger.level, list(logger.handlers), list(logger.filters))
+               for name, logger in Logging._loggers.items()}
+    handlers = {handler: handler.stream
+                for _, current, _ in loggers.values() for handler in current
+                if isinstance(handler, logging.StreamHandler) and
+                   not isinstance(handler, logging.FileHandler)}
+    for handler in handlers:
+        handler.stream = stderr
+
+    oldcwd = os.getcwd()
+    try:
+        os.chdir(cwd)
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            yield
+    finally:
+        os.chdir(oldcwd)
+        for handler, stream in handlers.items():
+            handler.stream = stream
+        for name, logger in list(Logging._loggers.items()):
+            if name not in loggers:
+                # Loggers created by the job print to the process streams
+                for handler in logger.handlers:
+                    for server, job in streams.items():
+                        if getattr(handler, 'stream', None) is job:
+                            handler.stream = server
+                continue
+            level, current, filters = loggers[name]
+            for handler in logger.handlers:
+                if handler not in current:
+                    handler.close()
+            logger.handlers[:] = current
+            logger.filters[:] = filters
+            logger.setLevel(level)
+
+class BatchResult(NamedTuple):
+    """Outcome of the conversion of one document by run_many."""
+    filename: str
+    # 0 when the document was converted
+    status: int
+    seconds: float
+    # Output and log messages of the conversion
+    output: str
+    # Traceback of the error that stopped the conversion
+    error: Optional[str]
+
+def config_values(config: ConfigManager) -> Dict[str, Dict[str, Any]]:
+    """Get the raw values of all options of config, section by section.
+    Unlike config itself, these values can be sent to other processes."""
+    return {name: {key: option.value for key, option in section.data.items()}
+            for name, section in config.items()}
+
+def batch_config(values: Dict[str, Dict[str, Any]]) -> ConfigManager:
+    """Rebuild the configuration whose values were given by config_values.
+    Options of sections which are not defined by plasTeX and its renderers
+    are ignored."""
+    config = defaultConfig()
+    collect_renderer_config(config)
+    for name, options in values.items():
+        if name not in config:
+            continue
+        data = config[name].data
+        for key, value in options.items():
+            if key in data:
+                data[key].value = value
+    return config
+
+def run_batch_job(filename: str, values: Dict[str, Dict[str, Any]],
+                  cwd: str) -> BatchResult:
+    """Convert one document of run_many, in a worker process."""
+    output = StringIO()
+    error = None
+    status = 0
+    start = time.perf_counter()
+    try:
+        with job_context(cwd, output, output):
+            run(filename, batch_config(values))
+    except (Exception, SystemExit):
+        error = traceback.format_exc()
+        status = 1
+    return BatchResult(filename, status, time.perf_counter() - start,
+                       output.getvalue(), error)
+
+def batch_directories(files: List[str], config: ConfigManager) -> Dict[str, List[str]]:
+    """Group files by the output directory run would use for them."""
+    directories = {} # type: Dict[str, List[str]]
+    for filename in files:
+        jobname = os.path.basename(os.path.splitext(filename)[0])
+        outdir = config['files']['directory']
+        if outdir:
+            outdir = string.Template(outdir).substitute({'jobname': jobname})
+        outdir = os.path.normpath(os.path.abspath(outdir or '.'))
+        directories.setdefault(outdir, []).append(filename)
+    return directories
+
+def run_many(files: List[str], config: ConfigManager,
+             workers: Optional[int] = None,
+             callback: Optional[Callable[[BatchResult], None]] = None) -> List[BatchResult]:
+    """Convert independent documents in parallel worker processes.
+
+    Each document is converted like run would do from the current
+    directory, but in a worker process, so that the directory changes
+    and the global state of one conversion don't affect the others.
+    Since conversions write auxiliary files in their output directory,
+    each document must have its own output directory.
+
+    Required Arguments:
+    files -- names of the files to convert
+    config -- configuration used for all documents
+
+    Keyword Arguments:
+    workers -- maximal number of worker processes (defaults to the
+        number of processors)
+    callback -- function called in this process with the BatchResult of
+        each document, as soon as its conversion ends
+
+    Returns:
+    the BatchResult of each document, in the order of files
+    """
+    for outdir, names in batch_directories(files, config).items():
+        if len(names) > 1:
+            raise ValueError('The documents %s would be written to the same '
+                             'directory %s' % (', '.join(names), outdir))
+
+    values = config_values(config)
+    cwd = os.getcwd()
+    results = [] # type: List[BatchResult]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_batch_job, filename, values, cwd)
+                   for filename in files]
+        if callback is not None:
+            for future in as_completed(futures):
+                callback(future.result())
+        results = [future.result() for future in futures]
+    return results
+
+def format_summary(results: List[BatchResult]) -> str:
+    """Format the timings and failures of the documents converted by
+    run_many as a table."""
+    width = max([len(x.filename) for x in results] + [len('Document')])
+    lines = ['%-*s  %-6s  %8s' % (width, 'Document', 'Status', 'Time (s)')]
+    for result in results:
+        lines.append('%-*s  %-6s  %8.2f' % (width, result.filename,
+                     'failed' if result.status else 'ok', result.seconds))
+    failed = len([x for x in results if x.status])
+    lines.append('%d documents converted, %d failed, %.2f s in total'
+                 % (len(results) - failed, failed,
+                    sum(x.seconds for x in results)))
+    return '\n'.join(lines)
@@ -16,7 +16,8 @@ def defaultConfig(loadConfigFiles: bool=False):
         Renderer to use for conversion
 
         This is either one of the built in renderers, or a path to the
-        directory of a renderer
+        directory of a renderer.  Several renderers can be given, separated
+        by spaces, to render the same parsed document with each of them.
         """,
         options = '--renderer',
         default = 'HTML5',
@@ -40,12 +41,30 @@ def defaultConfig(loadConfigFiles: bool=False):
         default = True,
     )
 
+    general['memoize-templates'] = BooleanOption(
+        """
+        Reuse the output of templates declared as pure when rendering
+        nodes with identical source
+        """,
+        options = '--memoize-templates !--no-memoize-templates',
+        default = False,
+    )
+
     general['kpsewhich'] = StringOption(
         """ Program which locates LaTeX files and packages """,
         options = '--kpsewhich',
         default = 'kpsewhich',
     )
 
+    general['kpsewhich-index'] = BooleanOption(
+        """
+        Locate files using the ls-R databases of the TeX trees, and only
+        run kpsewhich when the result is ambiguous
+        """,
+        options = '--kpsewhich-index !--no-kpsewhich-index',
+        default = True,
+    )
+
     general['xml'] = BooleanOption(
         """ Dump XML representation of the document (for debugging) """,
         options = '--xml',
@@ -58,6 +77,16 @@ def defaultConfig(loadConfigFiles: bool=False):
         default = False,
     )
 
+    general['profile'] = BooleanOption(
+        """
+        Time the expansion, parsing, digestion and rendering of each macro,
+        and write the timings to jobname.profile.json and
+        jobname.profile.txt
+        """,
+        options = '--profile',
+        default = False,
+    )
+
     general['paux-dirs'] = MultiStringOption(
         """Directories where *.paux files should be loaded from.""",
         options = '--paux-dirs',
@@ -205,6 +234,18 @@ def defaultConfig(loadConfigFiles: bool=False):
         default = '-',
     )
 
+    files['incremental'] = BooleanOption(
+        """
+        Only render files whose content changed since the last run
+
+        A manifest of the generated files is kept next to the .paux file.
+        Files whose source, cross-references, templates and configuration
+        are unchanged are not written again.
+        """,
+        options = '--incremental !--no-incremental',
+        default = False,
+    )
+
     files['directory'] = StringOption(
         """ Directory to put output files into """,
         options = '--dir -d',
@@ -291,6 +332,52 @@ def defaultConfig(loadConfigFiles: bool=False):
         default = False,
     )
 
+    images['precompile-preamble'] = BooleanOption(
+        """
+        Dump the document preamble to a format file which is reused by
+        later runs (latex and pdflatex only)
+        """,
+        options = '--precompile-preamble !--no-precompile-preamble',
+        default = False,
+    )
+
+    images['simple-math'] = BooleanOption(
+        """
+        Render simple formulas as MathML instead of images.  Formulas
+        using anything other than symbols, sub and superscripts, fractions
+        and square roots are still rendered as images.
+        """,
+        options = '--simple-math !--no-simple-math',
+        default = False,
+    )
+
+    images['cache-dir'] = StringOption(
+        """
+        Directory of an image store shared between documents and runs.
+        Images are stored under a hash of their source and settings.
+        """,
+        options = '--image-cache-dir',
+        default = '',
+    )
+
+    images['cache-size'] = IntegerOption(
+        """
+        Maximum size of the shared image store in megabytes (0 for no limit).
+        Least recently used images are removed first.
+        """,
+        options = '--image-cache-size',
+        default = 0,
+    )
+
+    images['shards'] = IntegerOption(
+        """
+        Number of shards to split the images in.  Shards are compiled
+        and converted concurrently, in separate processes.
+        """,
+        options = '--image-shards',
+        default = 1,
+    )
+
     images['save-file'] = BooleanOption(
         """ Should the temporary images.tex file be saved for debugging? """,
         options = '--save-image-file !--delete-image-file',
@@ -5,13 +5,15 @@ import contextlib
 import re
 import time
 from pathlib import Path
-from typing import Optional, Dict, List
+from types import ModuleType
+from typing import Optional, Dict, FrozenSet, List, Tuple
 from importlib import import_module
 from importlib.util import find_spec
 
 from plasTeX import ismacro, macroName
 from plasTeX.TeX import TeX
 from plasTeX.Logging import getLogger
+from plasTeX.Paux import PauxFile, write as writePaux
 from plasTeX.Base.TeX.Primitives import relax
 from plasTeX.Tokenizer import Tokenizer, Token, DEFAULT_CATEGORIES, VERBATIM_CATEGORIES
 import plasTeX
@@ -26,6 +28,100 @@ status = getLogger('status')
 stacklog = getLogger('context.stack')
 macrolog = getLogger('context.macros')
 
+# Python versions of the packages, or None for packages without one, for
+# each package name, packages-dirs and plugins.  Entries are stamped with
+# the modification times of the packages-dirs.
+_packageModules = {} # type: Dict[tuple, Tuple[tuple, Optional[ModuleType]]]
+
+# Names of the modules of the Packages directories of plasTeX and plugins
+_packageNames = {} # type: Dict[str, FrozenSet[str]]
+
+def packageNames(directory: str) -> FrozenSet[str]:
+    """ Get the names of the Python modules and packages in a directory """
+    if directory not in _packageNames:
+        names = set()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            entries = []
+        for entry in entries:
+            name, ext = os.path.splitext(entry.name)
+            if ext == '.py' and name != '__init__' and entry.is_file():
+                names.add(name)
+            elif entry.is_dir() and \
+                 os.path.isfile(os.path.join(entry.path, '__init__.py')):
+                names.add(entry.name)
+        _packageNames[directory] = frozenset(names)
+    return _packageNames[directory]
+
+def directoryStamp(directory: str) -> Optional[int]:
+    """ Get the modification time of a directory, or None if it is missing """
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+# Macro definitions read from each INI file, with the modification time
+# of the file
+_iniDefinitions = {} # type: Dict[str, Tuple[float, List[Tuple[str, List[Tuple[str, str, str]]]]]]
+
+# Classes created from INI definitions, for each base class, macro name
+# and attribute.  They are shared by all contexts.  Only the classes whose
+# base class is defined at the top level of a module are kept, since the
+# classes defined by a document would otherwise never be freed.
+_iniClasses = {} # type: Dict[tuple, type]
+
+INI_STRING = re.compile(r'^str\(\s*(?:(\'|\")(?P<string>.+)(?:\1)|(?P<number>\d+))\s*\)$')
+
+def readINIFile(filename: str) -> List[Tuple[str, List[Tuple[str, str, str]]]]:
+    """
+    Read the macro definitions of an INI file, reusing earlier results
+
+    The file is read again when it changes.
+
+    Required Arguments:
+    filename -- the INI file
+
+    Returns:
+    list of the sections of the file, with the name of the base class
+    and the definitions of the section.  Each definition is the name of
+    a macro, the attribute to set ('args' or 'str') and its value.
+
+    """
+    filename = os.path.abspath(filename)
+    try:
+        mtime = os.path.getmtime(filename)
+    except OSError:
+        return []
+    if filename in _iniDefinitions and _iniDefinitions[filename][0] == mtime:
+        return _iniDefinitions[filename][1]
+
+    ini = configparser.RawConfigParser()
+    ini.read(filename)
+    sections = []
+    for section in ini.sections():
+        definitions = []
+        for name in ini.options(section):
+            value = ini.get(section, name)
+            m = INI_STRING.match(value)
+            if m:
+                data = m.groupdict()
+                if data['number'] is not None:
+                    value = chr(int(data['number']))
+                else:
+                    value = data['string']
+                definitions.append((name, 'str', value))
+                continue
+            definitions.append((name, 'args', value))
+        sections.append((section, definitions))
+    _iniDefinitions[filename] = (mtime, sections)
+    return sections
+
+# Terms parsed from each list of language files.  These are the same for
+# every document, so they are only computed once per process and shared
+# by all contexts.
+_languageTables = {} # type: Dict[tuple, Dict[str, Dict[str, str]]]
+
 
 class ContextItem(dict):
     """
@@ -41,6 +137,10 @@ class ContextItem(dict):
         self.parent = None
         self.owner = None
 
+        # Macros that are imported the first time they are looked up,
+        # mapped to the module and attribute defining them
+        self.registry = None # type: Optional[Dict[str, Tuple[str, str]]]
+
     @property
     def name(self):
         if self.obj is not None:
@@ -55,6 +155,14 @@ class ContextItem(dict):
                 return self.parent[key]
             raise
 
+    def __missing__(self, key):
+        if self.registry is None or key not in self.registry:
+            raise KeyError(key)
+        module, name = self.registry[key]
+        value = getattr(import_module(module), name)
+        dict.__setitem__(self, key, value)
+        return value
+
     def get(self, key, default=None):
         try: return self[key]
         except KeyError: return default
@@ -62,6 +170,8 @@ class ContextItem(dict):
     def has_key(self, key):
         if dict.__contains__(self, key):
             return True
+        if self.registry is not None and key in self.registry:
+            return True
         if self.parent is not None:
             return key in list(self.parent.keys())
 
@@ -71,6 +181,9 @@ class ContextItem(dict):
         keys = {}
         for key in list(dict.keys(self)):
             keys[key] = 0
+        if self.registry is not None:
+            for key in self.registry:
+                keys[key] = 0
         if self.parent is not None:
             for key in list(self.parent.keys()):
                 keys[key] = 0
@@ -92,6 +205,64 @@ class Counters(dict):
         return c
 
 
+class Labels(dict):
+    """
+    Labeled nodes
+
+    The labels of other documents are restored lazily: restoring a .paux
+    file only reads the names of its labels, and their node is created
+    the first time they are looked up.
+
+    """
+    def __init__(self, context):
+        """
+        Required Arguments:
+        context -- the context creating the nodes of the restored labels
+
+        """
+        dict.__init__(self)
+        self.context = context
+
+        # Restored .paux files, in order
+        self.sources = [] # type: List[PauxFile]
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or \
+               any(key in x.labels for x in self.sources)
+
+    def __missing__(self, key):
+        return self.load(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def load(self, key):
+        """ Create the node of a label of other documents """
+        context = self.context
+        node = None
+        wou = context.warnOnUnrecognized
+        context.warnOnUnrecognized = False
+        try:
+            for paux in self.sources:
+                value = paux.get(key)
+                if value is None:
+                    continue
+                if node is None:
+                    node = context[value.get('macroName', 'Macro')]()
+                node.restore(value)
+        except Exception as msg:
+            log.warning('Could not load auxiliary information. (%s)' % msg)
+        finally:
+            context.warnOnUnrecognized = wou
+        if node is None:
+            raise KeyError(key)
+        self[key] = node
+        return node
+
+
 class LanguageParser(object):
     """ Parser for language commands """
 
@@ -151,6 +322,27 @@ class LanguageParser(object):
             self.language[self.term] += data
 
 
+def loadLanguageFiles(files: List[str]) -> Dict[str, Dict[str, str]]:
+    """
+    Parse language files, reusing the terms parsed earlier in the process
+
+    The terms are parsed again when one of the files changes.  The
+    returned terms are shared, and shouldn't be modified.
+
+    Required Arguments:
+    files -- the language files, in order of increasing precedence
+
+    Returns:
+    dictionary mapping language names to their terms
+
+    """
+    key = tuple((f, os.path.getmtime(f) if os.path.isfile(f) else None)
+                for f in files)
+    if key not in _languageTables:
+        _languageTables[key] = LanguageParser().parse(files)
+    return _languageTables[key]
+
+
 class Context(object):
     """
     Object to handle macro contexts within a TeX document
@@ -174,7 +366,7 @@ class Context(object):
         self.currentlabel = None
 
         # Labeled objects
-        self.labels = {}
+        self.labels = Labels(self)
         self.persistentLabels = {}
 
         # Unresolved refs
@@ -230,6 +422,8 @@ class Context(object):
         """
         Persist cross-document information for labeled nodes
 
+        Only the labels of the given renderer are replaced in the file.
+
         Required Arguments:
         filename -- the name of the file with the shelved data
 
@@ -239,24 +433,11 @@ class Context(object):
             renderer may be different.
 
         """
-        import pickle
-        if os.path.exists(filename):
-            try:
-                with open(filename, 'rb') as fh:
-                    d = pickle.load(fh)
-                    if rtype not in list(d.keys()):
-                        d[rtype] = {}
-            except:
-                os.remove(filename)
-                d = {rtype:{}}
-        else:
-            d = {rtype:{}}
-        data = d[rtype]
+        data = {}
         for key, value in list(self.persistentLabels.items()):
             data[key] = value.persist()
         try:
-            with open(filename, 'wb') as fh:
-                pickle.dump(d, fh)
+            writePaux(filename, rtype, data)
         except Exception as msg:
             log.warning('Could not save auxiliary information. (%s)' % msg)
 
@@ -264,6 +445,9 @@ class Context(object):
         """
         Restore cross-document information for labeled nodes
 
+        Only the names of the labels are read.  Their nodes are created
+        when they are looked up.
+
         Required Arguments:
         filename -- the name of the file with the shelved data
 
@@ -273,20 +457,20 @@ class Context(object):
             renderer may be different.
 
         """
-        import pickle
         if not os.path.exists(filename):
             return
         try:
-            d = pickle.load(open(filename, 'rb'))
-            try: data = d[rtype]
-            except KeyError: return
-            wou = self.warnOnUnrecognized
-            self.warnOnUnrecognized = False
-            for key, value in list(data.items()):
-                n = self[value.get('macroName', 'Macro')]()
-                n.restore(value)
-                self.labels[key] = n
-            self.warnOnUnrecognized = wou
+            paux = PauxFile(filename, rtype)
+            # Nodes that were already restored (e.g. for another
+            # renderer) are updated in place, since references to
+            # them may already have been resolved.  Labels of the
+            # current document take precedence.
+            for key, node in list(self.labels.items()):
+                if key in paux.labels and key not in self.persistentLabels:
+                    value = paux.get(key)
+                    if value is not None:
+                        node.restore(value)
+            self.labels.sources.append(paux)
         except Exception as msg:
             log.warning('Could not load auxiliary information. (%s)' % msg)
 
@@ -300,9 +484,15 @@ class Context(object):
         return False
 
     def loadBaseMacros(self):
-        """ Import all builtin macros """
-        from plasTeX import Base
-        self.importMacros(vars(Base))
+        """
+        Make all builtin macros available
+
+        The modules defining the macros are imported the first time one
+        of their macros is looked up.
+
+        """
+        from plasTeX.Base.registry import MACROS
+        self.contexts[0].registry = MACROS
 
     def loadLanguage(self, lang, document):
         """
@@ -317,12 +507,12 @@ class Context(object):
             files = document.config['document']['lang-terms']
             files.append(os.path.join(os.path.dirname(__file__), 'i18n.xml'))
 
-            LanguageParser(self.languages).parse(reversed(files))
+            self.languages.update(loadLanguageFiles(list(reversed(files))))
 
         if lang in list(self.languages.keys()):
             self.currentLanguage = lang
             self.newcommand('languagename', definition=lang)
-            self.terms = self.languages[lang]
+            self.terms = dict(self.languages[lang])
             for key, value in list(self.languages[lang].items()):
                 if key == 'today':
                     self.newcommand(key, definition=self._strftime(value))
@@ -353,31 +543,25 @@ class Context(object):
         inifile -- filename of INI formatted file
 
         """
-        ini = configparser.RawConfigParser()
         if not isinstance(inifile, (list, tuple)):
             inifile = [inifile]
         for f in inifile:
-            ini.read(f)
             macros = {}
-            for section in ini.sections():
+            for section, definitions in readINIFile(f):
                 try: baseclass = self[section]
                 except KeyError:
                     log.warning('Could not find macro %s' % section)
                     continue
-                for name in ini.options(section):
-                    value = ini.get(section, name)
-                    m = re.match(r'^str\(\s*(?:(\'|\")(?P<string>.+)(?:\1)|(?P<number>\d+))\s*\)$', value)
-                    if m:
-                        data = m.groupdict()
-                        if data['number'] is not None:
-                            value = chr(int(data['number']))
-                        else:
-                            value = data['string']
-                        macros[name] = type(name, (baseclass,),
-                                                    {'str': value})
+                module = sys.modules.get(baseclass.__module__)
+                shared = getattr(module, baseclass.__name__, None) is baseclass
+                for name, attr, value in definitions:
+                    if not shared:
+                        macros[name] = type(name, (baseclass,), {attr: value})
                         continue
-                    macros[name] = type(name, (baseclass,),
-                                                {'args': value})
+                    key = (baseclass, name, attr, value)
+                    if key not in _iniClasses:
+                        _iniClasses[key] = type(name, (baseclass,), {attr: value})
+                    macros[name] = _iniClasses[key]
             self.importMacros(macros)
 
     def loadPythonPackage(self, document: plasTeX.TeXDocument, file_name: str, options: Optional[Dict] = None) -> bool:
@@ -411,6 +595,53 @@ class Context(object):
         packagesini = os.path.join(os.path.dirname(plasTeX.Packages.__file__),
                                    os.path.basename(module) + '.ini')
 
+        imported = self.findPythonPackage(config, working_dir, module)
+
+        if imported:
+            status.info(' (loading package %s ' % imported.__file__)
+            if hasattr(imported, 'ProcessOptions'):
+                imported.ProcessOptions(options, document) # type: ignore
+            assert imported.__file__
+            self.importMacros(vars(imported))
+            moduleini = os.path.splitext(imported.__file__)[0] + '.ini'
+            self.loadINIPackage([packagesini, moduleini])
+            self.packages[module] = options
+            status.info(' ) ')
+            return True
+        else:
+            return False
+
+    def findPythonPackage(self, config, working_dir: str, module: str) -> Optional[ModuleType]:
+        """
+        Find and import the Python version of a package
+
+        The result of the search is kept for the whole process, including
+        when no Python version is found.  It is searched for again when
+        one of the directories of config['general']['packages-dirs']
+        changes.
+
+        Required Arguments:
+        config -- the document config
+        working_dir -- the directory relative packages-dirs are based on
+        module -- the name of the package
+
+        Returns:
+        the imported module, or None if there is no Python version
+
+        """
+        dirs = []
+        for pkg_dir in config['general']['packages-dirs']:
+            if Path(pkg_dir).is_absolute():
+                dirs.append(Path(pkg_dir))
+            else:
+                dirs.append((Path(working_dir)/pkg_dir).absolute())
+        plugins = tuple(config['general']['plugins'])
+
+        key = (module, tuple(dirs), plugins)
+        stamp = tuple(directoryStamp(str(x)) for x in dirs)
+        if key in _packageModules and _packageModules[key][0] == stamp:
+            return _packageModules[key][1]
+
         imported = None
         # temporarily adjust the path for importing plugins
         orig_sys_path = sys.path
@@ -419,12 +650,7 @@ class Context(object):
             def _reset_sys_path():
                 sys.path = orig_sys_path
 
-            for pkg_dir in config['general']['packages-dirs']:
-                if Path(pkg_dir).is_absolute():
-                    path = Path(pkg_dir)
-                else:
-                    path = (Path(working_dir)/pkg_dir).absolute()
-
+            for path, pkg_dir in zip(dirs, config['general']['packages-dirs']):
                 pypath = (path/module).with_suffix('.py')
                 if not pypath.exists():
                     continue
@@ -445,56 +671,29 @@ class Context(object):
                 break
 
             if imported is None:
-                for plugin in reversed(config['general']['plugins']):
+                for plugin in reversed(plugins):
                     sys.path = orig_sys_path
                     plugin_module = import_module(plugin)
                     assert plugin_module.__file__
-                    if not (Path(plugin_module.__file__).parent/'Packages').exists():
+                    packages = Path(plugin_module.__file__).parent/'Packages'
+                    if module not in packageNames(str(packages)):
                         continue
                     p_ = str(Path(plugin_module.__file__).parent.parent)
                     if p_ not in sys.path:
                         sys.path.insert(0, p_)
-                    try:
-                        imported = import_module(plugin + '.Packages.' + module)
-                        break
-                    except (ImportError, ModuleNotFoundError) as msg:
-                        # No Python module
-                        if 'No module' in str(msg) and module in str(msg):
-                            pass
-                            # Failed to load Python package
-                        # Error while importing
-                        else:
-                            raise
+                    imported = import_module(plugin + '.Packages.' + module)
+                    break
 
-            if imported is None:
+            if imported is None and \
+               module in packageNames(os.path.dirname(plasTeX.Packages.__file__)):
                 # Now try builtin plasTeX packages
                 p_ = str(Path(__file__).parent.parent)
                 if p_ not in sys.path:
                     sys.path.insert(0, p_)
-                try:
-                    imported = import_module('plasTeX.Packages.' + module)
-                except (ImportError, ModuleNotFoundError) as msg:
-                    # No Python module
-                    if 'No module' in str(msg) and module in str(msg):
-                        pass
-                        # Failed to load Python package
-                    # Error while importing
-                    else:
-                        raise
+                imported = import_module('plasTeX.Packages.' + module)
 
-        if imported:
-            status.info(' (loading package %s ' % imported.__file__)
-            if hasattr(imported, 'ProcessOptions'):
-                imported.ProcessOptions(options, document) # type: ignore
-            assert imported.__file__
-            self.importMacros(vars(imported))
-            moduleini = os.path.splitext(imported.__file__)[0] + '.ini'
-            self.loadINIPackage([packagesini, moduleini])
-            self.packages[module] = options
-            status.info(' ) ')
-            return True
-        else:
-            return False
+        _packageModules[key] = (stamp, imported)
+        return imported
 
     def loadPackage(self, tex: TeX, file_name: str, options: Optional[Dict] = None) -> bool:
         """
@@ -581,7 +780,7 @@ class Context(object):
         # print label, ''.join(self.currentlabel.ref[:])
 
         # Resolve any outstanding references to this object
-        if label in list(self.refs.keys()) and label in (self.labels.keys()):
+        if label in self.refs and label in self.labels:
             for obj in self.refs[label]:
                 for key, value in list(obj.idref.items()):
                     if value.id != label:
@@ -607,8 +806,9 @@ class Context(object):
             return
 
         # Resolve ref if label already exists
-        if label in list(self.labels.keys()):
-            obj.idref[name] = self.labels[label]
+        node = self.labels.get(label)
+        if node is not None:
+            obj.idref[name] = node
             return
 
         # If the label doesn't exist, store away the object for later
@@ -1021,7 +1221,7 @@ class Context(object):
         """
 
         # \if already exists
-        if name in list(self.keys()):
+        if name in self:
             macrolog.debug('if %s already defined', name)
             return
 
@@ -1057,7 +1257,7 @@ class Context(object):
 
         """
         # Macro already exists
-        if name in list(self.keys()):
+        if name in self:
             if not issubclass(self[name], (plasTeX.NewCommand, plasTeX.UnrecognizedMacro, plasTeX.Definition, relax)):
                 if not issubclass(self[name], plasTeX.TheCounter):
                     return
@@ -1098,7 +1298,7 @@ class Context(object):
 
         """
         # Macro already exists
-        if name in list(self.keys()):
+        if name in self:
             if not issubclass(self[name], (plasTeX.NewCommand,
                                            plasTeX.Definition)):
                 return
@@ -1,10 +1,11 @@
 from pathlib import Path
-import os, tempfile, shutil, re, string, pickle
-from hashlib import md5
-from io import StringIO
+import os, tempfile, shutil, re, string, pickle, copy, json, threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from hashlib import md5, sha256
+from io import StringIO, BytesIO
 import subprocess
 import shlex
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Set
 
 from plasTeX import Macro
 from plasTeX.Filenames import Filenames
@@ -15,12 +16,133 @@ depthlog = getLogger('render.images.depth')
 status = getLogger('status')
 imagelog = getLogger('imager')
 
+# Held while an imager changes the working directory of the process
+workingDirectoryLock = threading.RLock()
+
 try:
     from PIL import Image as PILImage
     from PIL import ImageChops as PILImageChops
 except ImportError:
     PILImage = PILImageChops = None  # type: ignore
 
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore
+
+def getBBox(mask) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Get the bounding box of the true values of a 2D array
+
+    This is the array counterpart of PIL's getbbox.
+
+    Required Argument:
+    mask -- 2D boolean array
+
+    Returns: (left, top, right, bottom) tuple, or None if there are
+        no true values
+
+    """
+    rows = numpy.flatnonzero(mask.any(axis=1))
+    if not rows.size:
+        return None
+    cols = numpy.flatnonzero(mask.any(axis=0))
+    return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+
+def nonzeroMask(a):
+    """ Mask of the pixels of an RGB array which aren't black """
+    return (a[..., 0] != 0) | (a[..., 1] != 0) | (a[..., 2] != 0)
+
+def colorMask(a, color):
+    """ Mask of the pixels of an RGB array which aren't the given color """
+    color = numpy.broadcast_to(numpy.asarray(color, dtype=a.dtype), (3,))
+    return (a[..., 0] != color[0]) | (a[..., 1] != color[1]) | (a[..., 2] != color[2])
+
+def cropArray(a, bbox):
+    """
+    Crop an image array to the given box
+
+    Like PIL's crop, parts of the box outside of the image are black.
+
+    """
+    left, top, right, bottom = bbox
+    part = a[top:bottom, left:right]
+    if part.shape[:2] == (bottom - top, right - left):
+        return part
+    out = numpy.zeros((bottom - top, right - left) + a.shape[2:], dtype=a.dtype)
+    out[:part.shape[0], :part.shape[1]] = part
+    return out
+
+def blankArray(color):
+    """ Image array containing one pixel of the given color """
+    out = numpy.empty((1, 1, 3), dtype=numpy.uint8)
+    out[...] = color
+    return out
+
+def findContent(a, bgcolor=None, nonzero=None, content=None):
+    """
+    Find the non-background portion of an image array
+
+    Required Argument:
+    a -- height x width x 3 array containing the RGB values of the image
+
+    Optional Argument:
+    bgcolor -- value or tuple containing the background color.  By
+        default, the most frequent color of the corners is used.
+    nonzero -- mask of the non-black pixels of the image, if known
+    content -- mask of the non-background pixels of the image, if known
+
+    Returns: bounding box of the non-black pixels (or of the whole
+        image), bounding box of the non-background pixels (or None),
+        background color and mask of the non-background pixels
+
+    """
+    height, width = a.shape[:2]
+    if nonzero is None:
+        nonzero = nonzeroMask(a)
+    origbbox = getBBox(nonzero) or (0, 0, width, height)
+
+    # Use the most frequent color of the corners as background color
+    if bgcolor is None:
+        left, top, right, bottom = origbbox
+        corners = [tuple(int(x) for x in a[y, x])
+                   for x, y in [(left, top), (right-1, top),
+                                (left, bottom-1), (right-1, bottom-1)]]
+        matches = [corners.count(x) for x in corners]
+        bgcolor = corners[matches.index(max(matches))]
+
+    if content is None:
+        content = colorMask(a, bgcolor)
+    return origbbox, getBBox(content), bgcolor, content
+
+def autoCropArray(a, bgcolor=None, margin=0):
+    """
+    Automatically crop an image array down to non-background portion
+
+    This is the vectorized version of autoCrop.
+
+    Required Argument:
+    a -- height x width x 3 array containing the RGB values of the image
+
+    Optional Argument:
+    bgcolor -- value or tuple containing the color to use for the
+        background color when cropping
+    margin -- leave this many pixels around the content.  If there
+        aren't that many pixels to leave, leave as many as possible.
+
+    Returns: cropped array, tuple containing the number of pixels
+        removed from each side (left, top, right, bottom), and the
+        background color
+
+    """
+    origbbox, bbox, bgcolor, _ = findContent(a, bgcolor)
+    if bbox:
+        if margin:
+            bbox = (max(0, bbox[0] - margin), max(0, bbox[1] - margin),
+                    bbox[2] + margin, bbox[3] + margin)
+        return cropArray(a, bbox), tuple([abs(x-y) for x,y in zip(origbbox,bbox)]), bgcolor
+    return blankArray(bgcolor), (0,0,0,0), bgcolor
+
 def autoCrop(im, bgcolor=None, margin=0):
     """
     Automatically crop image down to non-background portion
@@ -41,6 +163,10 @@ def autoCrop(im, bgcolor=None, margin=0):
     if im.mode != "RGB":
         im = im.convert("RGB")
 
+    if numpy is not None:
+        a, box, bgcolor = autoCropArray(numpy.asarray(im), bgcolor, margin)
+        return PILImage.fromarray(numpy.ascontiguousarray(a)), box, bgcolor
+
     origbbox = im.getbbox()
     if origbbox is None:
         origbbox = (0,0,im.size[0],im.size[1])
@@ -162,13 +288,30 @@ class DimensionPlaceholder(str):
             return
         return str.__setattribute__(self, name, value)
 
+def fileFingerprint(path: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Get the size, modification time and inode of a file
+
+    These change whenever the file is rewritten, so they are used to
+    avoid hashing image files which haven't changed.
+
+    Returns: (size, mtime_ns, inode) tuple, or None if the file
+        doesn't exist
+
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
 class Image(object):
     """ Generic image object """
 
     def __init__(self, filename, config: Dict[str, Any], width=None, height=None, alt=None,
-                       depth=None, longdesc=None):
+                       depth=None, longdesc=None, directory: Optional[str] = None):
         self.filename = filename
-        self.path = os.path.join(os.getcwd(), self.filename)
+        self.path = os.path.join(directory or os.getcwd(), self.filename)
         self.width = width
         self.height = height
         self.alt = alt
@@ -179,6 +322,7 @@ class Image(object):
         self._cropped = False
         self.bitmap = self
         self.checksum = None
+        self.fingerprint = None # type: Optional[Tuple[int, int, int]]
 
     @property
     def height(self):
@@ -235,8 +379,11 @@ class Image(object):
 
         # Crop an SVG image
         if os.path.splitext(self.path)[-1] in ['.svg']:
-            with open(self.path,'r') as fh:
-                svg = fh.read()
+            with open(self.path,'rb') as fh:
+                data = fh.read()
+            self.checksum = md5(data).digest()
+            self.fingerprint = fileFingerprint(self.path)
+            svg = data.decode('utf-8', 'replace')
 
             self.width = 0
             width = re.search(r'width=(?:\'|")([^\d\.]+)\w*(?:\'|")', svg)
@@ -275,14 +422,25 @@ class Image(object):
         if padbaseline and self.depth > padbaseline:
             log.warning('depth of image %s (%d) is greater than the baseline padding (%s).  This may cause the image to be misaligned with surrounding text.', self.filename, self.depth, padbaseline)
 
+        # The image is encoded in memory so that its checksum can be
+        # computed without reading the file again
+        buf = BytesIO()
+        imageFormat = PILImage.registered_extensions().get(
+                          os.path.splitext(self.path)[-1].lower())
         if self.config['transparent']:
             im = im.convert("P")
             lut = im.resize((256,1))
             lut.putdata(list(range(256)))
             index = list(lut.convert("RGB").getdata()).index((255,255,255))
-            im.save(self.path, transparency=index)
+            im.save(buf, imageFormat, transparency=index)
         else:
-            im.save(self.path)
+            im.save(buf, imageFormat)
+
+        data = buf.getvalue()
+        with open(self.path, 'wb') as fh:
+            fh.write(data)
+        self.checksum = md5(data).digest()
+        self.fingerprint = fileFingerprint(self.path)
 
         self._cropped = True
 
@@ -323,6 +481,10 @@ class Image(object):
         if im.mode != "RGB":
             im = im.convert("RGB")
 
+        if numpy is not None:
+            a, depth = self._stripBaselineArray(numpy.asarray(im), padbaseline)
+            return PILImage.fromarray(numpy.ascontiguousarray(a)), depth
+
         depth = 0
 
         # Crop the image so that the regitration mark is on the left edge
@@ -413,13 +575,253 @@ class Image(object):
 
         return im, depth
 
-def run_command(cmd: str, env: Optional[Dict] = None):
+    def _stripBaselineArray(self, a, padbaseline=0):
+        """
+        Find the baseline register mark and crop it out
+
+        This is the vectorized version of _stripBaseline.  Instead of
+        walking over pixels, it looks for the registration mark using
+        reductions over boolean masks of the image array.
+
+        Required Arguments:
+        a -- height x width x 3 array containing the RGB values of the image
+
+        Keyword Arguments:
+        padbaseline -- amount to pad the bottom of all cropped images
+
+        Returns:
+        (cropped array, distance from baseline to bottom of image)
+
+        """
+        depth = 0
+
+        # Crop the image so that the regitration mark is on the left edge.
+        # The masks are computed once, and cropped along with the image.
+        nonzero = nonzeroMask(a)
+        _, bbox, background, content = findContent(a, nonzero=nonzero)
+        if bbox is None:
+            return blankArray(background), 0
+        a, nonzero, content = [cropArray(x, bbox) for x in [a, nonzero, content]]
+
+        height, width = a.shape[:2]
+        column = content[:, 0]
+
+        def firstGap(line):
+            """ Index of the first background pixel of `line` """
+            gaps = numpy.flatnonzero(~line)
+            return int(gaps[0]) if gaps.size else len(line)
+
+        def baseline():
+            """ Lowest row of the registration mark, ignoring the first row """
+            rows = numpy.flatnonzero(column[1:])
+            return int(rows[-1]) + 1 if rows.size else 0
+
+        # Determine if registration mark is at top or left.  If there is
+        # non-background content after the mark on the second row, the
+        # mark is on the left.
+        top = False
+        if content[0, 0]:
+            top = True
+            row = content[1, 1:] if width > 1 else content[0, 1:]
+            gap = firstGap(row)
+            if gap < len(row) and row[gap:].any():
+                top = False
+
+        # Registration mark at the top
+        blank = False
+        bbox = fullbbox = getBBox(nonzero)
+        if top:
+            depth = baseline() - height + 1
+
+            # Get the height of the registration mark so it can be cropped out
+            rheight = firstGap(column)
+
+            # If the depth is the entire height, just make depth = 0
+            if -depth == (height-rheight):
+                depth = 0
+
+            # Handle empty images
+            if bbox is None or rheight == (height-1):
+                blank = True
+            else:
+                bbox = (bbox[0], rheight, bbox[2], bbox[3])
+
+        # Registration mark on left side
+        if blank or not(top) or fullbbox[1] == 0:
+            pos = baseline()
+            depth = pos - height + 1
+
+            # Get the width of the registration mark so it can be cropped out
+            rwidth = firstGap(content[pos])
+
+            # Handle empty images
+            bbox = fullbbox
+            if bbox is None or rwidth == (width-1):
+                return blankArray(background), 0
+
+            bbox = (rwidth, bbox[1], bbox[2], bbox[3])
+
+        # Crop out register mark, and autoCrop result
+        a, nonzero, content = [cropArray(x, bbox) for x in [a, nonzero, content]]
+        origbbox, bbox, _, _ = findContent(a, background, nonzero, content)
+        if bbox is None:
+            a = blankArray(background)
+            nonzero = nonzeroMask(a)
+            cropped = (0,0,0,0)
+        else:
+            a, nonzero = [cropArray(x, bbox) for x in [a, nonzero]]
+            cropped = tuple([abs(x-y) for x,y in zip(origbbox,bbox)])
+
+        # If the content was entirely above the baseline,
+        # we need to keep that whitespace
+        depth += cropped[3]
+        depthlog.debug('Depth of image %s is %s', self.filename, depth)
+
+        # Pad all images with the given amount.  This allows you to
+        # set one margin-bottom for all images.  Like PIL's paste, the
+        # image is clipped to the new size and must not have black edges.
+        if padbaseline:
+            height, width = a.shape[:2]
+            newheight = height+(padbaseline+depth)
+            if newheight < 0:
+                raise ValueError('height must be >= 0')
+            if getBBox(nonzero) not in [None, (0, 0, width, height)]:
+                raise ValueError('images do not match')
+            newim = numpy.empty((newheight, width, 3), dtype=numpy.uint8)
+            newim[...] = background
+            newim[:height] = a[:newheight]
+            a = newim
+
+        return a, depth
+
+class ImageStore(object):
+    """
+    Content-addressed image cache shared between documents and runs
+
+    Images are stored in a directory under a key which is the hash of
+    everything used to generate them: the preamble, the context, the
+    LaTeX source, the scale and the imager settings.  The dimensions
+    of each image are stored next to it in a JSON file.  When an image
+    is found in the store, it is copied into the output directory
+    instead of being generated.
+
+    The modification time of an entry is updated each time it is used,
+    and the least recently used entries are removed when the store
+    grows larger than its maximum size.
+
+    """
+
+    def __init__(self, directory: str, maxsize: int = 0):
+        """
+        Required Arguments:
+        directory -- the directory containing the store
+
+        Keyword Arguments:
+        maxsize -- maximum size of the store in megabytes, or 0 for
+            no limit
+
+        """
+        self.directory = Path(directory)
+        self.maxsize = maxsize * 1024 * 1024
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """ Return the key of an image generated from the given parts """
+        h = sha256()
+        for part in parts:
+            h.update(repr(part).encode('utf-8'))
+            h.update(b'\0')
+        return h.hexdigest()
+
+    def path(self, key: str, ext: str) -> Path:
+        return self.directory / key[:2] / (key + ext)
+
+    def get(self, key: str, ext: str, dest: str) -> Optional[Dict[str, Any]]:
+        """
+        Copy the stored image to `dest`, if there is one
+
+        Returns:
+        dictionary of dimensions of the image, or None if the image
+        isn't in the store
+
+        """
+        path = self.path(key, ext)
+        try:
+            with open(str(path.with_suffix('.json'))) as fh:
+                data = json.load(fh)
+            directory = os.path.dirname(dest)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            # Images are copied rather than linked, since the output
+            # images can be rewritten in place later, e.g. when cropped
+            if os.path.lexists(dest):
+                os.remove(dest)
+            shutil.copyfile(str(path), dest)
+            os.utime(str(path))
+        except (OSError, ValueError):
+            return None
+        return data
+
+    def put(self, key: str, src: str, data: Dict[str, Any]):
+        """
+        Add the image file `src` to the store
+
+        Required Arguments:
+        key -- the key of the image
+        src -- the image file
+        data -- dictionary of dimensions of the image
+
+        """
+        path = self.path(key, os.path.splitext(src)[-1])
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to temporary files first so that concurrent runs
+            # never see partial entries
+            fd, tmp = tempfile.mkstemp(dir=str(path.parent))
+            os.close(fd)
+            shutil.copyfile(src, tmp)
+            os.replace(tmp, str(path))
+            fd, tmp = tempfile.mkstemp(dir=str(path.parent))
+            with os.fdopen(fd, 'w') as fh:
+                json.dump(data, fh)
+            os.replace(tmp, str(path.with_suffix('.json')))
+        except OSError as msg:
+            log.warning('Could not add %s to the image store (%s)', src, msg)
+
+    def evict(self):
+        """ Remove least recently used entries until the store is small enough """
+        if not self.maxsize or not self.directory.is_dir():
+            return
+        entries = []
+        total = 0
+        for path in self.directory.glob('*/*'):
+            if path.suffix == '.json':
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.maxsize:
+                break
+            for item in [path, path.with_suffix('.json')]:
+                try:
+                    item.unlink()
+                except OSError:
+                    pass
+            total -= size
+
+def run_command(cmd: str, env: Optional[Dict] = None, cwd: Optional[str] = None):
     p = subprocess.Popen(shlex.split(cmd),
                  stdin=subprocess.DEVNULL,
                  stdout=subprocess.PIPE,
                  stderr=subprocess.STDOUT,
                  universal_newlines=True,
-                 env=env or os.environ)
+                 env=env or os.environ,
+                 cwd=cwd)
     try:
         if p.stdout is not None:
             for line in p.stdout:
@@ -433,6 +835,45 @@ def run_command(cmd: str, env: Optional[Dict] = None):
     if p.returncode:
         raise subprocess.CalledProcessError(p.returncode, cmd)
 
+def formatInputsUnchanged(path: Path) -> bool:
+    """
+    Check that the files loaded by a format haven't changed
+
+    Required Arguments:
+    path -- JSON file containing a list of (filename, mtime, size)
+
+    """
+    try:
+        with open(str(path)) as fh:
+            inputs = json.load(fh)
+        for filename, mtime, size in inputs:
+            st = os.stat(filename)
+            if st.st_mtime_ns != mtime or st.st_size != size:
+                return False
+    except (OSError, ValueError, TypeError):
+        return False
+    return True
+
+def compileShard(imager, directory: Path, texinputs: str) -> List[Tuple[str, str]]:
+    """
+    Compile and convert one shard of images
+
+    This runs in a worker process, so it is safe to change the
+    current directory here.
+
+    Required Arguments:
+    imager -- copy of the imager whose tmpFile is the shard source
+    directory -- the directory containing the shard source
+    texinputs -- value of the TEXINPUTS environment variable
+
+    Returns:
+    list of (src, dest) pairs where src is an absolute path
+
+    """
+    os.chdir(str(directory))
+    imager.compileLatex(texinputs=texinputs)
+    return [(str(directory / src), dest) for src, dest in imager.convertImages()]
+
 class Imager(object):
     """ Generic Imager """
 
@@ -446,6 +887,9 @@ class Imager(object):
     # The filename for temporary LaTeX source
     tmpFile = Path('images.tex')
 
+    # Format file containing the document preamble, see buildFormat
+    formatFile = None # type: Optional[Path]
+
     # Verification command to determine if the imager is available
     verifications = []
 
@@ -454,32 +898,29 @@ class Imager(object):
     imageAttrs = ''
     imageUnits = ''
 
-    def __init__(self, document, imageTypes=None):
+    def __init__(self, document, imageTypes=None, directory=None):
         self.config = document.config
         self.ownerDocument = document
 
+        # Output directory, which image filenames are relative to
+        self.directory = os.path.abspath(directory or os.getcwd())
+
         if imageTypes is None:
             self.imageTypes = [self.fileExtension]
         else:
             self.imageTypes = imageTypes[:]
 
         # Dictionary that makes sure each image is only generated once.
-        # The key is the LaTeX source and the value is the image instance.
-        self._cache = {}
+        # The key is the LaTeX source, the context and the scale of the
+        # image, and the value is the image instance.
+        self._cache = {} # type: Dict[Tuple[str, str, float], Image]
         usednames = {}
-        self._filecache = os.path.abspath(os.path.join('.cache',
-                                          self.__class__.__name__+'.images'))
+        self._filecache = os.path.join(self.directory, '.cache',
+                                       self.__class__.__name__+'.images')
         if self.config['images']['cache'] and os.path.isfile(self._filecache):
-            try:
-                with open(self._filecache, 'rb') as fh:
-                    self._cache = pickle.load(fh)
-                for key, value in list(self._cache.items()):
-                    if not os.path.isfile(value.filename):
-                        del self._cache[key]
-                        continue
-                    usednames[value.filename] = None
-            except ImportError:
-                os.remove(self._filecache)
+            self._cache = self.loadCache(self._filecache)
+            for value in self._cache.values():
+                usednames[value.filename] = None
 
         # List of images
         self.images = {}
@@ -487,6 +928,15 @@ class Imager(object):
         # Images that are simply copied from the source directory
         self.staticimages = {}
 
+        # Images of a vector imager that are compiled along with the images
+        # of this imager, see getImagePair
+        self.vectorImager = None # type: Optional[Imager]
+        self.hostedImages = {} # type: Dict[str, Image]
+
+        # Names of the images of this imager that are compiled by another
+        # imager
+        self._hosted = set() # type: Set[str]
+
         # Filename generator
         self.newFilename = Filenames(self.config['images'].get('filenames'),
                            variables={'jobname':document.userdata.get('jobname','')},
@@ -498,9 +948,81 @@ class Imager(object):
         self.writePreamble(document)
         self.source.write('\\begin{document}\n')
 
+        # Position of the end of the preamble, and of the source of each
+        # image in self.source.  Used to split the images in shards.
+        self._preambleEnd = self.source.tell()
+        self._imageSpans = [] # type: List[Tuple[int, int]]
+
+        # Shared store of images, and the store keys of the images
+        # generated by this imager
+        self.store = None # type: Optional[ImageStore]
+        self._storeKeys = {} # type: Dict[str, str]
+        self._storePreamble = ''
+        cachedir = self.config['images']['cache-dir']
+        if cachedir:
+            cachedir = os.path.join(document.userdata.get('working-dir', '.'),
+                                    os.path.expanduser(cachedir))
+            self.store = ImageStore(cachedir, self.config['images']['cache-size'])
+            self._storePreamble = sha256(self.source.getvalue().encode('utf-8')).hexdigest()
+
         # Set up additional options
         self._configOptions = self.formatConfigOptions(self.config['images'])
 
+    def loadCache(self, filename: str) -> Dict[Tuple[str, str, float], Image]:
+        """
+        Load the images generated by previous runs
+
+        Each image is checked on its own.  Images whose file is missing,
+        or which could not be cropped, are dropped so that only these
+        are generated again.  An unreadable cache file is ignored.
+
+        Required Arguments:
+        filename -- the cache file
+
+        Returns:
+        dictionary of valid cached images
+
+        """
+        try:
+            with open(filename, 'rb') as fh:
+                cache = pickle.load(fh)
+        except Exception as msg:
+            log.warning('Could not read the image cache %s (%s)', filename, msg)
+            return {}
+
+        if not isinstance(cache, dict):
+            return {}
+
+        valid = {}
+        for key, value in cache.items():
+            if not isinstance(key, tuple) or not isinstance(value, Image):
+                continue
+            value.path = os.path.join(self.directory, value.filename)
+            if not value._cropped or not os.path.isfile(value.path):
+                continue
+            if any(isinstance(getattr(value, '_' + name, None), DimensionPlaceholder)
+                   for name in ['width', 'height', 'depth']):
+                continue
+            valid[key] = value
+        return valid
+
+    def __getstate__(self):
+        """
+        State sent to worker processes compiling shards of images
+
+        The document can't be pickled, and isn't needed to compile
+        images, so only a copy of the configuration values is kept.
+
+        """
+        state = self.__dict__.copy()
+        state['config'] = {name: {key: section[key] for key in section.keys()}
+                           for name, section in self.config.items()}
+        for name in ['ownerDocument', 'source', '_cache', 'images',
+                     'staticimages', 'newFilename', 'store', '_storeKeys']:
+            state.pop(name, None)
+        state['hostedImages'] = dict.fromkeys(self.hostedImages)
+        return state
+
     def formatConfigOptions(self, config):
         """
         Format configuration options as command line options
@@ -521,7 +1043,9 @@ class Imager(object):
 
     def writePreamble(self, document):
         """ Write any necessary code to the preamble of the document """
+        start = self.source.tell()
         self.source.write(document.preamble.source)
+        self._documentPreamble = (start, self.source.tell())
         self.source.write('\\makeatletter\\oddsidemargin -0.25in\\evensidemargin -0.25in\n')
 
 #       self.source.write('\\tracingoutput=1\n')
@@ -586,7 +1110,10 @@ width 2pt\hskip2pt}}{}
     def close(self):
         """ Invoke the rendering code """
         # Bail out if there are no images
-        if not self.images:
+        if not self.images and not self.hostedImages:
+            # Images compiled by another imager still have to be cached
+            if self._hosted:
+                self.saveCache()
             return
 
         if not self.enabled:
@@ -597,14 +1124,22 @@ width 2pt\hskip2pt}}{}
 
         self.source.write('\n\\end{document}\\endinput')
 
+        # Check that cached images haven't changed on the disk.  Files are
+        # only hashed when their size, modification time or inode changed.
         for value in list(self._cache.values()):
-            if value.checksum and os.path.isfile(value.path):
-                with open(value.path,'r') as fh:
-                    d = md5().digest(fh.read())
-                if value.checksum != d:
-                    log.warning('The image data for "%s" on the disk has changed.  You may want to clear the image cache.' % value.filename)
+            if not value.checksum:
+                continue
+            fingerprint = fileFingerprint(value.path)
+            if fingerprint is None or fingerprint == getattr(value, 'fingerprint', None):
+                continue
+            with open(value.path,'rb') as fh:
+                d = md5(fh.read()).digest()
+            if value.checksum != d:
+                log.warning('The image data for "%s" on the disk has changed.  You may want to clear the image cache.' % value.filename)
+            else:
+                value.fingerprint = fingerprint
 
-        cwd = Path.cwd()
+        outdir = Path(self.directory)
 
         folders = []
         root = Path(self.ownerDocument.userdata.get('working-dir', '.')).absolute()
@@ -617,92 +1152,238 @@ width 2pt\hskip2pt}}{}
         # `with TemporaryDirectory() as tempdir` because we want to retain the
         # possibility of keeping the temporary directory.
         tempdir = Path(tempfile.mkdtemp())
-        os.chdir(str(tempdir))
-
-        # Compile LaTeX source, then convert the output
-        self.source.seek(0)
-        (_, fname) = tempfile.mkstemp('.tex', 'images-', '.', True)
-        self.tmpFile = Path(fname)
-        self.tmpFile.write_text(self.source.read(), encoding=self.config['files']['input-encoding'])
-
-        def on_error(e):
-            log.info("Source files for the failing images are saved in folder {}".format(tempdir))
-            os.chdir(str(cwd))
-
-        try:
-            self.compileLatex(texinputs=new_texinputs)
-        except Exception as e:
-            log.error("Failed to compile image: {}".format(e))
-            log.info("The above command was ran with the environment variable:")
-            log.info("TEXINPUTS={}".format(new_texinputs))
-            on_error(e)
-            return
-
-        # Execute converter
-        try:
-            images = self.executeConverter()
-        except Exception as e:
-            log.error("Failed to convert image: {}".format(e))
-            on_error(e)
-            return
 
-        os.chdir(str(cwd))
+        shards = self.shardSources()
+        if self.config['images']['precompile-preamble']:
+            self.formatFile = self.buildFormat(tempdir, new_texinputs)
+            if self.formatFile is not None:
+                start, end = self._documentPreamble
+                shards = [shard[:start] + shard[end:] for shard in shards]
 
-        if len(images) != len(self.images):
+        if len(shards) > 1:
+            images, failed = self.compileShards(tempdir, shards, new_texinputs)
+            if failed:
+                save_file = True
+                log.info("Source files for the failing images are saved in folder {}".format(tempdir))
+            if not images:
+                return
+            requested = len(self.images) + len(self.hostedImages) - failed
+        else:
+            # Compile LaTeX source, then convert the output
+            (_, fname) = tempfile.mkstemp('.tex', 'images-', str(tempdir), True)
+            self.tmpFile = Path(os.path.basename(fname))
+            Path(fname).write_text(shards[0], encoding=self.config['files']['input-encoding'])
+
+            # Compilers and converters run in the temporary directory.
+            # The working directory is shared by all threads, so imagers
+            # of concurrent renderings take turns.
+            with workingDirectoryLock:
+                cwd = os.getcwd()
+                os.chdir(str(tempdir))
+                try:
+                    try:
+                        self.compileLatex(texinputs=new_texinputs)
+                    except Exception as e:
+                        log.error("Failed to compile image: {}".format(e))
+                        log.info("The above command was ran with the environment variable:")
+                        log.info("TEXINPUTS={}".format(new_texinputs))
+                        log.info("Source files for the failing images are saved in folder {}".format(tempdir))
+                        return
+
+                    # Execute converter
+                    try:
+                        images = self.convertImages()
+                    except Exception as e:
+                        log.error("Failed to convert image: {}".format(e))
+                        log.info("Source files for the failing images are saved in folder {}".format(tempdir))
+                        return
+                finally:
+                    os.chdir(cwd)
+
+            requested = len(self.images) + len(self.hostedImages)
+
+        if len(images) != requested:
             save_file = True
-            log.error('The number of images generated (%d) and the number of images requested (%d) is not the same.' % (len(images), len(self.images)))
+            log.error('The number of images generated (%d) and the number of images requested (%d) is not the same.' % (len(images), requested))
 
         if PILImage is None and type(self) is not VectorImager:
             log.warning('PIL (Python Imaging Library) is not installed.  ' +
                         'Images will not be cropped.')
 
 
-        # Move images to their final location
+        # Move images to their final location.  Hosted vector images are
+        # handled after the bitmaps since their depth is computed from
+        # the depth of their bitmap.
+        jobs = []
+        hosted = []
         for src, dest in images:
-            try:
-                dest_img = self.images[dest]
-            except KeyError:
+            if dest in self.images:
+                jobs.append((tempdir / src, outdir / dest, self.images[dest], self))
+            elif dest in self.hostedImages:
+                hosted.append((tempdir / src, outdir / dest, self.hostedImages[dest],
+                               self.vectorImager))
+            else:
                 save_file = True
                 log.warning("Generated extra image: {} => {}".format(src, dest))
-                continue
 
-            if not (cwd / dest).parent.is_dir():
-                (cwd / dest).parent.mkdir(parents=True)
+        # Copy, crop and checksum the images in a pool of threads.  The
+        # results are reported in the order of the images.
+        for batch in [jobs, hosted]:
+            with ThreadPoolExecutor() as executor:
+                results = executor.map(lambda job: self.processImage(*job[:3]), batch)
+                for (_, dest, dest_img, owner), error in zip(batch, results):
+                    if error is not None:
+                        import traceback
+                        traceback.print_exception(type(error), error, error.__traceback__)
+                        log.warning('failed to crop %s (%s)', dest.relative_to(outdir), error)
+                        continue
+                    status.dot()
 
-            # Move the image
-            try:
-                shutil.copy2(str(tempdir / src), str(cwd / dest))
-            except OSError:
-                shutil.copy(str(tempdir / src), str(cwd / dest))
+                    if owner.store is not None and dest_img.filename in owner._storeKeys:
+                        data = {name: getattr(dest_img, '_' + name, None)
+                                for name in ['width', 'height', 'depth']}
+                        if all(x is None or isinstance(x, float) for x in data.values()):
+                            owner.store.put(owner._storeKeys[dest_img.filename], str(dest), data)
 
-            # Crop the image
-            try:
-                dest_img.crop()
-                status.dot()
-            except Exception as msg:
-                import traceback
-                traceback.print_exc()
-                log.warning('failed to crop %s (%s)', dest, msg)
+        if self.store is not None:
+            self.store.evict()
+
+        self.saveCache()
 
+        if save_file:
+            log.warning("Imager temp files saved at {}".format(tempdir))
+        else:
+            shutil.rmtree(str(tempdir), True)
+
+    def saveCache(self):
+        """ Checksum the generated images and write the cache file """
         for value in list(self._cache.values()):
             if value.checksum is None and os.path.isfile(value.path):
                 with open(value.path,'rb') as fh:
                     value.checksum = md5(fh.read()).digest()
+                value.fingerprint = fileFingerprint(value.path)
 
         if not os.path.isdir(os.path.dirname(self._filecache)):
             os.makedirs(os.path.dirname(self._filecache))
 
+        # Only keep the images that were generated successfully, so that
+        # the others are generated again by the next run
         with open(self._filecache,'wb') as fh:
-            pickle.dump(self._cache, fh)
+            pickle.dump({key: value for key, value in self._cache.items()
+                         if value._cropped}, fh)
 
-        if save_file:
-            log.warning("Imager temp files saved at {}".format(tempdir))
-        else:
-            shutil.rmtree(str(tempdir), True)
+    def processImage(self, src: Path, dest: Path, img: Image) -> Optional[Exception]:
+        """
+        Copy a generated image to its final location and crop it
+
+        This is run by the threads of the pool in `close`.
+
+        Required Arguments:
+        src -- the generated image
+        dest -- the final location of the image
+        img -- the image object
+
+        Returns:
+        the exception raised while cropping the image, or None
+
+        """
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+        # Move the image
+        try:
+            shutil.copy2(str(src), str(dest))
+        except OSError:
+            shutil.copy(str(src), str(dest))
+
+        # Crop the image
+        try:
+            img.crop()
+        except Exception as e:
+            return e
+        return None
+
+    def shardSources(self) -> List[str]:
+        """
+        Split the LaTeX source of the images in shards
+
+        The number of shards is given by the images:shards config
+        option.  Each shard contains the preamble and a contiguous
+        run of images.
+
+        Returns:
+        list of complete LaTeX documents, one per shard
+
+        """
+        source = self.source.getvalue()
+        nshards = min(self.config['images']['shards'], len(self._imageSpans))
+        if nshards <= 1:
+            return [source]
+
+        preamble = source[:self._preambleEnd]
+        end = source[self._imageSpans[-1][1]:]
+        size, extra = divmod(len(self._imageSpans), nshards)
+        shards = []
+        start = 0
+        for i in range(nshards):
+            stop = start + size + (i < extra)
+            spans = self._imageSpans[start:stop]
+            shards.append(preamble + source[spans[0][0]:spans[-1][1]] + end)
+            start = stop
+        return shards
+
+    def compileShards(self, tempdir: Path, shards: List[str], texinputs: str) -> Tuple[List[Tuple[str, str]], int]:
+        """
+        Compile and convert shards of images concurrently
+
+        Each shard is compiled in its own subdirectory of `tempdir`
+        by a pool of worker processes.  A failure in one shard only
+        loses the images of that shard.
+
+        Required Arguments:
+        tempdir -- the directory to create the shard directories in
+        shards -- the LaTeX source of each shard
+        texinputs -- value of the TEXINPUTS environment variable
+
+        Returns:
+        tuple containing the list of (src, dest) pairs of the
+        successful shards, and the number of images in failed shards
+
+        """
+        jobs = []
+        for i, shard in enumerate(shards):
+            directory = tempdir / ('shard%d' % i)
+            directory.mkdir()
+            imager = copy.copy(self)
+            imager.tmpFile = directory / 'images.tex'
+            imager.tmpFile.write_text(shard, encoding=self.config['files']['input-encoding'])
+            imager.tmpFile = Path(imager.tmpFile.name)
+            jobs.append((imager, directory, shard.count('\\begin{plasTeXimage}')))
+
+        images = [] # type: List[Tuple[str, str]]
+        failed = 0
+        workers = min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(compileShard, imager, directory, texinputs)
+                       for imager, directory, _ in jobs]
+            for future, (_, directory, count) in zip(futures, jobs):
+                try:
+                    images.extend(future.result())
+                except Exception as e:
+                    log.error("Failed to compile or convert images in {}: {}".format(directory, e))
+                    failed += count
+        return images, failed
 
     def getCompiler(self):
         return self.config['images']['compiler'] or self.compiler
 
+    def storeSettings(self) -> Tuple:
+        """ Settings of this imager that affect the images it generates """
+        images = self.config['images']
+        return (type(self).__module__, type(self).__name__, self.getCompiler(),
+                self.command, self.fileExtension, self._configOptions,
+                images['resolution'], images['baseline-padding'],
+                images['transparent'])
+
     def compileLatex(self, texinputs=''):
         """
         Compile the LaTeX source, located at self.tmpFile
@@ -711,7 +1392,110 @@ width 2pt\hskip2pt}}{}
         """
         env = os.environ.copy()
         env['TEXINPUTS'] = texinputs
-        run_command(r'%s %s' % (self.getCompiler(), self.tmpFile.name), env=env)
+        compiler = self.getCompiler()
+        if self.formatFile is not None:
+            shutil.copyfile(str(self.formatFile), self.formatFile.name)
+            compiler += ' -fmt=%s' % self.formatFile.stem
+        run_command(r'%s %s' % (compiler, self.tmpFile.name), env=env)
+
+    def buildFormat(self, tempdir: Path, texinputs: str) -> Optional[Path]:
+        """
+        Get a format file containing the document preamble
+
+        The preamble is dumped to a format with `-ini` the first time it
+        is seen.  The format is stored in the cache directory under a hash
+        of the preamble and the compiler, so later runs and all shards
+        start without loading the document class and packages again.
+        When image caching is disabled, it is only kept in `tempdir`.
+        Only latex and pdflatex are supported.
+
+        Required Arguments:
+        tempdir -- the directory to build the format in
+        texinputs -- value of the TEXINPUTS environment variable
+
+        Returns:
+        path of the format file, or None if the preamble can't be
+        precompiled
+
+        """
+        program = shlex.split(self.getCompiler())
+        engine = os.path.basename(program[0]) if program else ''
+        if engine not in ['latex', 'pdflatex']:
+            return None
+
+        start, end = self._documentPreamble
+        preamble = self.source.getvalue()[start:end]
+        try:
+            version = subprocess.run(program[:1] + ['--version'],
+                                     stdout=subprocess.PIPE,
+                                     stderr=subprocess.DEVNULL,
+                                     universal_newlines=True).stdout
+        except OSError:
+            return None
+
+        name = '%s-%s' % (engine, sha256('\0'.join(program + [version, preamble])
+                                         .encode('utf-8')).hexdigest()[:16])
+        if self.store is not None:
+            directory = self.store.directory / 'formats'
+        elif self.config['images']['cache']:
+            directory = Path(os.path.dirname(self._filecache))
+        else:
+            # Without a cache, the format is only used by this run
+            directory = tempdir / 'formats'
+        fmt = directory / (name + '.fmt')
+        if fmt.is_file() and formatInputsUnchanged(fmt.with_suffix('.json')):
+            return fmt
+
+        workdir = tempdir / 'format'
+        workdir.mkdir(exist_ok=True)
+        (workdir / (name + '.tex')).write_text(preamble + '\n\\dump\n',
+                encoding=self.config['files']['input-encoding'])
+        env = os.environ.copy()
+        env['TEXINPUTS'] = texinputs
+        command = program + ['-ini', '-interaction=nonstopmode', '-recorder',
+                             '-jobname=' + name, '&' + engine, name + '.tex']
+        try:
+            run_command(' '.join(shlex.quote(x) for x in command), env=env,
+                        cwd=str(workdir))
+        except (OSError, subprocess.CalledProcessError) as e:
+            log.warning('Could not precompile the image preamble (%s)', e)
+            return None
+
+        built = workdir / (name + '.fmt')
+        if not built.is_file():
+            return None
+
+        # Record the files loaded by the preamble so that the format is
+        # rebuilt when one of them changes
+        inputs = []
+        try:
+            with open(str(workdir / (name + '.fls')), encoding='utf-8',
+                      errors='replace') as fh:
+                for line in fh:
+                    if not line.startswith('INPUT '):
+                        continue
+                    path = (workdir / line[6:].strip()).resolve()
+                    if workdir.resolve() in path.parents:
+                        continue
+                    st = path.stat()
+                    inputs.append([str(path), st.st_mtime_ns, st.st_size])
+        except OSError:
+            pass
+
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=str(directory))
+            os.close(fd)
+            shutil.copyfile(str(built), tmp)
+            os.replace(tmp, str(fmt))
+            fd, tmp = tempfile.mkstemp(dir=str(directory))
+            with os.fdopen(fd, 'w') as fh:
+                json.dump(sorted({tuple(x) for x in inputs}), fh)
+            os.replace(tmp, str(fmt.with_suffix('.json')))
+        except OSError as e:
+            log.warning('Could not store the precompiled image preamble (%s)', e)
+            return built
+        return fmt
 
     def executeConverter(self, outfile: Optional[str] = None) -> List[Tuple[str, str]]:
         """
@@ -760,6 +1544,40 @@ width 2pt\hskip2pt}}{}
 
         return images
 
+    def convertImages(self) -> List[Tuple[str, str]]:
+        """
+        Convert the LaTeX output to images, including hosted images
+
+        The pages of the hosted images are converted by the vector
+        imager from the same LaTeX output, each converter only being
+        given its own rows of `images.csv`.
+
+        Returns:
+        A list of pairs (src, dest), as returned by `executeConverter`
+
+        """
+        if not self.hostedImages:
+            return self.executeConverter()
+
+        with open('images.csv') as fh:
+            lines = fh.readlines()
+        rows = {self: [], self.vectorImager: []} # type: Dict[Imager, List[str]]
+        for line in lines:
+            if line.split(',')[1] in self.hostedImages:
+                rows[self.vectorImager].append(line)
+            else:
+                rows[self].append(line)
+
+        images = [] # type: List[Tuple[str, str]]
+        for imager, selected in rows.items():
+            if not selected:
+                continue
+            with open('images.csv', 'w') as fh:
+                fh.writelines(selected)
+            imager.tmpFile = self.tmpFile
+            images.extend(imager.executeConverter())
+        return images
+
     def writeImage(self, filename: str, code: str, context: str='', scale: float=1.0) -> None:
         """
         Write LaTeX source for the image
@@ -776,7 +1594,28 @@ width 2pt\hskip2pt}}{}
         return self.config["images"]["scales"].get(nodeName,
             self.config["images"]["scale-factor"])
 
-    def newImage(self, node: Macro, context: str='', filename: Optional[str]=None) -> Image:
+    def writeHostedImage(self, imager, filename: str, code: str, context: str='', scale: float=1.0) -> None:
+        """
+        Write LaTeX source for an image of another imager
+
+        The image is typeset without the registration mark used to find
+        the baseline of bitmaps, as vector imagers do.
+
+        Arguments:
+        imager -- the vector imager that the image belongs to
+        filename -- the name of the file that will be generated
+        code -- the LaTeX code of the image
+        context -- the LaTeX code of the context of the image
+
+        """
+        self.vectorImager = imager
+        start = self.source.tell()
+        self.source.write('\\begingroup\\def\\plasTeXregister{}\n')
+        self.writeImage(filename, code, context, scale)
+        self.source.write('\\endgroup\n')
+        self._imageSpans.append((start, self.source.tell()))
+
+    def newImage(self, node: Macro, context: str='', filename: Optional[str]=None, host: Optional['Imager']=None) -> Image:
         """
         Invoke a new image
 
@@ -790,6 +1629,8 @@ width 2pt\hskip2pt}}{}
             generates the image.
         filename -- filename to force the image to.  This filename
             should not include the file extension.
+        host -- imager that compiles the image along with its own
+            images, see getImagePair
 
         """
         text = node.source
@@ -797,20 +1638,40 @@ width 2pt\hskip2pt}}{}
         for dest, src in self.ownerDocument.charsubs:
             text = text.replace(src, dest)
 
+        scale = self.get_scale(node.nodeName) # type: ignore
+
         # See if this image has been cached
-        if text in self._cache:
-            return self._cache[text]
+        key = (text, context, scale)
+        if key in self._cache:
+            return self._cache[key]
 
         # Generate a filename if none has been provided
         filename = filename or self.newFilename()
 
-        scale = self.get_scale(node.nodeName) # type: ignore
+        # Reuse the image from the shared store if possible
+        if self.store is not None:
+            storekey = self.store.key(self._storePreamble, context, text, scale,
+                                      self.storeSettings())
+            data = self.store.get(storekey, os.path.splitext(filename)[-1],
+                                  os.path.join(self.directory, filename))
+            if data is not None:
+                img = Image(filename, dict(self.config['images']),
+                            directory=self.directory, **data)
+                img._cropped = True
+                self._cache[key] = img
+                return img
+            self._storeKeys[filename] = storekey
 
         # Add the image to the current document and cache
         #log.debug('Creating %s from %s', filename, text)
-        self.writeImage(filename, text, context, scale)
+        if host is not None:
+            host.writeHostedImage(self, filename, text, context, scale)
+        else:
+            start = self.source.tell()
+            self.writeImage(filename, text, context, scale)
+            self._imageSpans.append((start, self.source.tell()))
 
-        img = Image(filename, dict(self.config['images']))
+        img = Image(filename, dict(self.config['images']), directory=self.directory)
 
         # Populate image attrs that will be bound later
         if self.imageAttrs:
@@ -823,9 +1684,55 @@ width 2pt\hskip2pt}}{}
                     value.imageUnits = self.imageUnits
                     setattr(img, name, value)
 
-        self.images[filename] = self._cache[text] = img
+        if host is not None:
+            host.hostedImages[filename] = img
+            self._hosted.add(filename)
+        else:
+            self.images[filename] = img
+        self._cache[key] = img
         return img
 
+    def canHost(self, imager) -> bool:
+        """
+        Can the images of `imager` be compiled along with the images of
+        this imager?
+
+        This is the case when both imagers are enabled and use the same
+        LaTeX compiler, so that both converters can read its output.
+
+        """
+        return (imager is not None and imager is not self and
+                self.enabled and imager.enabled and
+                self.getCompiler() == imager.getCompiler())
+
+    def getImagePair(self, node, vectorImager):
+        """
+        Get a vector image of the node, along with its bitmap
+
+        When possible, the vector image is compiled by this imager in
+        the same LaTeX run as the bitmap, instead of compiling the same
+        source twice.
+
+        Arguments:
+        node -- the node to create the images from
+        vectorImager -- the imager of the vector image
+
+        Returns:
+        vector Image instance, whose `bitmap` attribute is the bitmap
+        Image instance
+
+        """
+        if getattr(node, 'imageoverride', None) is not None or \
+           not self.canHost(vectorImager):
+            image = vectorImager.getImage(node)
+            image.bitmap = self.getImage(node)
+            return image
+
+        bitmap = self.newImage(node)
+        image = vectorImager.newImage(node, host=self)
+        image.bitmap = bitmap
+        return image
+
     def getImage(self, node):
         """
         Get an image from the given node whatever way possible
@@ -855,23 +1762,24 @@ width 2pt\hskip2pt}}{}
         newext = os.path.splitext(path)[-1].lower()
         oldext = os.path.splitext(name)[-1].lower()
         try:
-            directory = os.path.dirname(path)
-            if directory and not os.path.isdir(directory):
+            directory = os.path.dirname(os.path.join(self.directory, path))
+            if not os.path.isdir(directory):
                 os.makedirs(directory)
 
             # If PIL isn't available or no conversion is necessary,
             # just copy the image to the new location
             if newext == oldext or oldext in self.imageTypes:
                 path = os.path.splitext(path)[0] + os.path.splitext(name)[-1]
+                dest = os.path.join(self.directory, path)
                 if PILImage is None:
-                    shutil.copyfile(name, path)
+                    shutil.copyfile(name, dest)
                     tmpl = string.Template(self.imageAttrs)
                     width = DimensionPlaceholder(tmpl.substitute({'filename':path, 'attr':'width'}))
                     height = DimensionPlaceholder(tmpl.substitute({'filename':path, 'attr':'height'}))
                     height.imageUnits = width.imageUnits = self.imageUnits
                 else:
                     if os.path.splitext(name)[1].lower() == '.svg':
-                        shutil.copyfile(name, path)
+                        shutil.copyfile(name, dest)
                         width = height = None
                     else:
                         img = PILImage.open(name)
@@ -881,9 +1789,9 @@ width 2pt\hskip2pt}}{}
                             width = int(width * scale)
                             height = int(height * scale)
                             img.resize((width,height))
-                            img.save(path)
+                            img.save(dest)
                         else:
-                            shutil.copyfile(name, path)
+                            shutil.copyfile(name, dest)
 
             # If PIL is available, convert the image to the appropriate type
             else:
@@ -894,8 +1802,9 @@ width 2pt\hskip2pt}}{}
                     width = int(width * scale)
                     height = int(height * scale)
                     img.resize((width,height))
-                img.save(path)
-            img = Image(path, self.ownerDocument.config['images'], width=width, height=height)
+                img.save(os.path.join(self.directory, path))
+            img = Image(path, self.ownerDocument.config['images'], width=width,
+                        height=height, directory=self.directory)
             self.staticimages[name] = img
             return img
 
@@ -0,0 +1,241 @@
+"""
+Kpathsea
+
+In-process version of the lookups done by kpsewhich for files in the
+TEXINPUTS search path.  The default search path is asked to kpsewhich
+once per process, and the `ls-R' databases of the TeX trees are read
+once, so that looking up a file doesn't spawn a process.
+
+Lookups that can't be resolved exactly like kpsewhich would (several
+candidates in the same directory tree, path elements using variables,
+files with the suffix of another kpathsea format, ...) raise
+`Unresolved', and the caller falls back to running kpsewhich.
+
+"""
+
+import os, subprocess, sys
+from typing import Dict, List, Optional, Tuple
+
+# Suffixes of files that kpsewhich doesn't look up in TEXINPUTS
+OTHER_SUFFIXES = {'.afm', '.base', '.bib', '.bst', '.cnf', '.enc', '.eps',
+                  '.epsi', '.fmt', '.gf', '.ist', '.lua', '.luc', '.map',
+                  '.mem', '.mf', '.mft', '.mp', '.ofm', '.opl', '.otf',
+                  '.ovf', '.ovp', '.pfa', '.pfb', '.pk', '.sfd', '.tfm',
+                  '.ttc', '.ttf', '.vf'}
+
+class Unresolved(Exception):
+    """ Raised when a file has to be looked up by kpsewhich itself """
+
+# Default TEXINPUTS search path of each kpsewhich program
+_defaultPaths = {} # type: Dict[str, Optional[List[str]]]
+
+# Parsed ls-R databases, along with their modification time
+_databases = {} # type: Dict[str, Tuple[float, Dict[str, List[str]]]]
+
+def defaultPath(program: str) -> Optional[List[str]]:
+    """
+    Get the expanded default search path of TeX files
+
+    Required Arguments:
+    program -- the kpsewhich program
+
+    Returns:
+    list of path elements, or None if kpsewhich couldn't be run
+
+    """
+    if program not in _defaultPaths:
+        env = os.environ.copy()
+        env.pop('TEXINPUTS', None)
+        kwargs = {'stdout': subprocess.PIPE, 'stderr': subprocess.DEVNULL}
+        if sys.platform.lower().startswith('win'):
+            kwargs['shell'] = True
+        try:
+            output = subprocess.Popen([program, '-show-path=tex'], env=env,
+                                      **kwargs).communicate()[0]
+            output = output.decode('utf-8').strip()
+        except Exception:
+            output = ''
+        _defaultPaths[program] = output.split(os.pathsep) if output else None
+    return _defaultPaths[program]
+
+def findDatabase(directory: str) -> Optional[str]:
+    """ Get the ls-R database of the tree containing `directory' """
+    directory = os.path.abspath(directory)
+    while True:
+        database = os.path.join(directory, 'ls-R')
+        if os.path.isfile(database):
+            return database
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+def readDatabase(filename: str) -> Dict[str, List[str]]:
+    """
+    Read an ls-R database
+
+    Required Arguments:
+    filename -- the ls-R file
+
+    Returns:
+    dictionary mapping file names to the directories containing them
+
+    """
+    mtime = os.stat(filename).st_mtime
+    if filename in _databases and _databases[filename][0] == mtime:
+        return _databases[filename][1]
+
+    root = os.path.dirname(os.path.abspath(filename))
+    index = {} # type: Dict[str, List[str]]
+    directory = root
+    with open(filename, encoding='utf-8', errors='surrogateescape') as fh:
+        for line in fh:
+            line = line.rstrip('\n')
+            if not line or line.startswith('%'):
+                continue
+            if line.endswith(':') and ('/' in line or line == '.:'):
+                directory = os.path.normpath(os.path.join(root, line[:-1]))
+                continue
+            index.setdefault(line, []).append(directory)
+
+    _databases[filename] = (mtime, index)
+    return index
+
+def inTree(directory: str, top: str, recursive: bool) -> bool:
+    """ Is `directory' the directory `top', or below it when `recursive' """
+    if directory == top:
+        return True
+    return recursive and directory.startswith(top.rstrip(os.sep) + os.sep)
+
+class FileResolver(object):
+    """
+    Find files in the TEXINPUTS search path like kpsewhich
+
+    Results are kept for the lifetime of the resolver, which is usually
+    one run of plasTeX.
+
+    """
+
+    def __init__(self):
+        # Results of the lookups for each name and search path
+        self.cache = {} # type: Dict[Tuple[str, str], Optional[str]]
+
+        # Files found below the recursive directories of the search path
+        self.trees = {} # type: Dict[str, Dict[str, List[str]]]
+
+    def find(self, name: str, texinputs: str, program: str = 'kpsewhich') -> Optional[str]:
+        """
+        Locate a file
+
+        Required Arguments:
+        name -- name of the file to find
+        texinputs -- the value of TEXINPUTS kpsewhich would be run with
+
+        Keyword Arguments:
+        program -- the kpsewhich program, which gives the default path
+
+        Returns:
+        path of the file, or None if it isn't in the indexed search path
+
+        This raises Unresolved if kpsewhich has to be used.
+
+        """
+        key = (name, texinputs)
+        if key not in self.cache:
+            self.cache[key] = self.search(name, texinputs, program)
+        return self.cache[key]
+
+    def search(self, name: str, texinputs: str, program: str) -> Optional[str]:
+        """ Search the path elements of TEXINPUTS in order """
+        if os.path.splitext(name)[-1].lower() in OTHER_SUFFIXES:
+            raise Unresolved(name)
+
+        # Like kpsewhich, try the name with the .tex suffix first when it
+        # has no extension
+        names = [name]
+        if not os.path.splitext(name)[1]:
+            names.insert(0, name + '.tex')
+
+        for element in self.expand(texinputs, program):
+            path = self.searchElement(element, names)
+            if path is not None:
+                return path
+        return None
+
+    def expand(self, texinputs: str, program: str) -> List[str]:
+        """ Get the path elements, with empty elements expanded """
+        elements = []
+        for element in (texinputs or '').split(os.pathsep):
+            if element:
+                elements.append(element)
+                continue
+            default = defaultPath(program)
+            if default is None:
+                raise Unresolved('unknown default path')
+            elements.extend(default)
+        return elements
+
+    def searchElement(self, element: str, names: List[str]) -> Optional[str]:
+        """
+        Look for the first of `names' in one element of the search path
+
+        Required Arguments:
+        element -- the path element, using the kpathsea syntax
+        names -- the names to look for, in order
+
+        Returns:
+        path of the file, or None if it isn't there
+
+        """
+        if '$' in element or '{' in element or '~' in element:
+            raise Unresolved(element)
+
+        dbonly = element.startswith('!!')
+        if dbonly:
+            element = element[2:]
+        recursive = element.endswith('//')
+        directory = element.rstrip('/') or '/'
+        if '//' in directory:
+            raise Unresolved(element)
+
+        if dbonly:
+            database = findDatabase(directory)
+            if database is None:
+                return None
+            index = readDatabase(database)
+            top = os.path.normpath(os.path.abspath(directory))
+        elif recursive:
+            if not os.path.isdir(directory):
+                return None
+            index = self.tree(directory)
+            top = os.path.normpath(os.path.abspath(directory))
+        else:
+            for name in names:
+                path = os.path.join(element, name)
+                if os.path.isfile(path):
+                    return path
+            return None
+
+        for name in names:
+            found = [x for x in index.get(name, []) if inTree(x, top, recursive)]
+            if not found:
+                continue
+            # A file at the top of the tree comes first.  Otherwise, the
+            # order kpathsea uses for subdirectories isn't known.
+            if top in found:
+                return os.path.join(top, name)
+            if len(found) > 1:
+                raise Unresolved(name)
+            return os.path.join(found[0], name)
+        return None
+
+    def tree(self, directory: str) -> Dict[str, List[str]]:
+        """ Index the files below `directory' """
+        directory = os.path.normpath(os.path.abspath(directory))
+        if directory not in self.trees:
+            index = {} # type: Dict[str, List[str]]
+            for root, _, files in os.walk(directory):
+                for name in files:
+                    index.setdefault(name, []).append(os.path.normpath(root))
+            self.trees[directory] = index
+        return self.trees[directory]
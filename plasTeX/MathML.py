@@ -0,0 +1,176 @@
+"""
+MathML for simple formulas
+
+Formulas that only contain characters, math symbols, sub and superscripts,
+groups, fractions and square roots are converted to MathML directly,
+without going through LaTeX and an imager.  Any other formula is left to
+the imager.
+
+"""
+
+import unicodedata
+from typing import List, Optional
+from xml.sax.saxutils import escape
+
+from plasTeX.DOM import Node
+
+MATHML_NS = 'http://www.w3.org/1998/Math/MathML'
+
+# Widths of the math spacing commands
+SPACES = {
+    ',': '0.1667em',
+    '.': '0.1667em',
+    '/': '0.1667em',
+    '!': '-0.1667em',
+    ':': '0.2222em',
+    ';': '0.2778em',
+}
+
+# Modules whose commands with a character are converted as symbols.
+# Commands with a character from other modules, like text symbols or
+# spaces, are left to the imager.
+SYMBOL_MODULES = ['plasTeX.Base.LaTeX.Math']
+
+# Source characters rendered as other operators
+PRIMES = {"'": '′'}
+
+class Unsupported(Exception):
+    """ Raised when a formula uses something outside of the supported subset """
+
+class Item(object):
+    """ Element of a formula, along with its sub and superscripts """
+
+    def __init__(self, base: str):
+        self.base = base
+        self.sub = None # type: Optional[str]
+        self.sup = None # type: Optional[str]
+
+    def __str__(self):
+        if self.sub is not None and self.sup is not None:
+            return '<msubsup>%s%s%s</msubsup>' % (self.base, self.sub, self.sup)
+        if self.sub is not None:
+            return '<msub>%s%s</msub>' % (self.base, self.sub)
+        if self.sup is not None:
+            return '<msup>%s%s</msup>' % (self.base, self.sup)
+        return self.base
+
+def mrow(nodes) -> str:
+    """ Convert a list of nodes to a single MathML element """
+    items = convert(nodes)
+    if len(items) == 1:
+        return str(items[0])
+    return '<mrow>%s</mrow>' % ''.join(str(x) for x in items)
+
+def convertText(text: str) -> List[Item]:
+    """ Convert the characters of a text node """
+    items = [] # type: List[Item]
+    number = ''
+    for char in text + ' ':
+        if char.isdigit() or (char == '.' and number):
+            number += char
+            continue
+        if number:
+            items.append(Item('<mn>%s</mn>' % escape(number)))
+            number = ''
+        if char.isspace():
+            continue
+        if char in PRIMES:
+            items.append(Item('<mo>%s</mo>' % PRIMES[char]))
+        elif unicodedata.category(char).startswith('L'):
+            items.append(Item('<mi>%s</mi>' % escape(char)))
+        else:
+            items.append(Item('<mo>%s</mo>' % escape(char)))
+    return items
+
+def convert(nodes) -> List[Item]:
+    """
+    Convert a list of nodes to MathML items
+
+    Required Arguments:
+    nodes -- the nodes to convert
+
+    Returns:
+    list of items
+
+    """
+    items = [] # type: List[Item]
+    text = ''
+    for node in nodes:
+        name = node.nodeName
+
+        # Each character is usually a separate node, so text is
+        # collected until the next command
+        if node.nodeType == Node.TEXT_NODE:
+            text += str(node)
+            continue
+        if text:
+            items.extend(convertText(text))
+            text = ''
+
+        if name in ['active::^', 'active::_']:
+            script = mrow(node.attributes['self'].childNodes)
+            if not items:
+                items.append(Item('<mrow></mrow>'))
+            attr = 'sup' if name == 'active::^' else 'sub'
+            if getattr(items[-1], attr) is not None:
+                raise Unsupported('double %sscript' % attr)
+            setattr(items[-1], attr, script)
+
+        elif name in ['bgroup', '#document-fragment']:
+            items.append(Item(mrow(node.childNodes)))
+
+        elif name == 'frac':
+            items.append(Item('<mfrac>%s%s</mfrac>' %
+                              (mrow(node.attributes['numer'].childNodes),
+                               mrow(node.attributes['denom'].childNodes))))
+
+        elif name == 'sqrt':
+            base = mrow(node.attributes['self'].childNodes)
+            n = node.attributes.get('n')
+            if n is not None:
+                items.append(Item('<mroot>%s%s</mroot>' % (base, mrow(n.childNodes))))
+            else:
+                items.append(Item('<msqrt>%s</msqrt>' % base))
+
+        elif name in SPACES:
+            items.append(Item('<mspace width="%s"/>' % SPACES[name]))
+
+        # Symbols: commands of the math module without arguments which
+        # have a character
+        elif (type(node).__module__ in SYMBOL_MODULES and
+              not node.attributes and getattr(node, 'str', None)):
+            char = node.str
+            if len(char) == 1 and unicodedata.category(char).startswith('L'):
+                items.append(Item('<mi>%s</mi>' % escape(char)))
+            else:
+                items.append(Item('<mo>%s</mo>' % escape(char)))
+
+        else:
+            raise Unsupported(name)
+
+    if text:
+        items.extend(convertText(text))
+    return items
+
+def toMathML(node, display: bool = False) -> Optional[str]:
+    """
+    Convert the content of a math node to MathML
+
+    Required Arguments:
+    node -- the math node
+
+    Keyword Arguments:
+    display -- whether the formula is a display formula
+
+    Returns:
+    MathML source, or None if the formula uses something that isn't
+    supported
+
+    """
+    try:
+        body = mrow(node.childNodes)
+    except Unsupported:
+        return None
+    if display:
+        return '<math xmlns="%s" display="block">%s</math>' % (MATHML_NS, body)
+    return '<math xmlns="%s">%s</math>' % (MATHML_NS, body)
@@ -25,6 +25,7 @@ from pathlib import Path
 from plasTeX import Environment, Command, dimen, TeXFragment
 from plasTeX.Base.LaTeX.FontSelection import itshape, bfseries
 from plasTeX.PackageResource import PackagePreCleanupCB, PackageCss
+from plasTeX.Renderers import currentRenderContext
 
 def fontweight(tag):
     if tag.getElementsByTagName('bfseries'):
@@ -41,7 +42,7 @@ def fontstyle(tag):
 def make_amsthm_css(document):
     styles = document.userdata.getPath("packages/amsthm/styles")
     path = Path('styles')/'amsthm.css'
-    with path.open('w') as cssfile:
+    with Path(currentRenderContext().path(str(path))).open('w') as cssfile:
         swap = document.userdata.getPath("packages/amsthm/swapnumbers")
         if swap:
             cssfile.write(r"""
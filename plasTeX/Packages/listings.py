@@ -5,6 +5,7 @@ from typing import Optional
 from plasTeX import VerbatimEnvironment, Environment, Command
 from plasTeX.Base.TeX.Text import bgroup
 from plasTeX.PackageResource import PackagePreCleanupCB, PackageCss
+from plasTeX.Renderers import currentRenderContext
 
 try:
     import pygments
@@ -30,7 +31,7 @@ def ProcessOptions(options, document):
 
 def make_pygments_css(document):
     path = Path('styles')/'pygments.css'
-    path.write_text(HtmlFormatter().get_style_defs())
+    Path(currentRenderContext().path(str(path))).write_text(HtmlFormatter().get_style_defs())
     return [str(path)]
 
 class lstset(Command):
@@ -1,8 +1,8 @@
-import pickle
 import os
 from typing import Dict
 from plasTeX import Command
 from plasTeX.Logging import getLogger
+from plasTeX.Paux import read
 
 log = getLogger()
 
@@ -11,7 +11,7 @@ def load_paux(name: str) -> Dict:
         log.warning('Could not find {}'.format(name))
         return dict()
     try:
-        data = pickle.load(open(name, 'rb'))
+        data = read(name)
     except:
         log.warning('Failed to load {}'.format(name))
         return dict()
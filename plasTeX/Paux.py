@@ -0,0 +1,173 @@
+"""
+Paux
+
+Reading and writing of the `.paux' files holding the labels of a
+document, which other documents use for cross-document references.
+
+A .paux file is a SQLite database with one row per renderer and label,
+holding the pickled attributes of the labeled node.  Opening a file
+only reads the names of its labels, so that the labels of other
+documents can be restored lazily, when they are referenced.
+Writing a file only replaces the rows of one renderer, in a single
+transaction, so that documents converted at the same time can read
+each other's files.
+
+Files written by older versions of plasTeX, which pickled a dictionary
+of all the renderers and labels, can still be read.  They are converted
+to the new format when they are written.
+
+"""
+
+import os, pickle, sqlite3
+from contextlib import closing
+from typing import Collection, Dict, Optional
+from urllib.request import pathname2url
+
+from plasTeX.Logging import getLogger
+
+log = getLogger()
+
+# Header of SQLite database files
+MAGIC = b'SQLite format 3\x00'
+
+SCHEMA = '''CREATE TABLE IF NOT EXISTS labels (
+    renderer TEXT NOT NULL,
+    label TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (renderer, label))'''
+
+def isDatabase(filename: str) -> bool:
+    """ Is `filename' a .paux file using the SQLite format """
+    with open(filename, 'rb') as fh:
+        return fh.read(len(MAGIC)) == MAGIC
+
+def connect(filename: str, readonly: bool = False) -> sqlite3.Connection:
+    """
+    Open a .paux file, waiting for the writers of the file if needed
+
+    Read-only connections can be used by any thread, since the labels of
+    a document may be looked up by the threads rendering it.
+
+    """
+    if readonly:
+        uri = 'file:%s?mode=ro' % pathname2url(os.path.abspath(filename))
+        return sqlite3.connect(uri, uri=True, timeout=30,
+                               check_same_thread=False)
+    return sqlite3.connect(filename, timeout=30)
+
+class PauxFile(object):
+    """
+    Labels of one renderer stored in a .paux file
+
+    Only the names of the labels are read when the file is opened.  The
+    attributes of each label are read by `get', using a read-only
+    connection kept as long as the object.
+
+    """
+
+    def __init__(self, filename: str, rtype: str):
+        """
+        Required Arguments:
+        filename -- the .paux file
+        rtype -- name of the renderer
+
+        """
+        self.filename = filename
+        self.rtype = rtype
+
+        # Content of a file in the pickle format
+        self.legacy = None # type: Optional[Dict[str, Dict]]
+
+        # Connection to a file in the SQLite format
+        self.connection = None # type: Optional[sqlite3.Connection]
+
+        # Names of the labels, or attributes of each label for files in
+        # the pickle format
+        self.labels = set() # type: Collection[str]
+
+        if isDatabase(filename):
+            self.connection = connect(filename, readonly=True)
+            self.labels = {label for label, in self.connection.execute(
+                'SELECT label FROM labels WHERE renderer = ?', (rtype,))}
+        else:
+            self.legacy = self.labels = readLegacy(filename).get(rtype, {})
+
+    def get(self, label: str) -> Optional[Dict]:
+        """
+        Get the attributes of a labeled node
+
+        Required Arguments:
+        label -- the label
+
+        Returns:
+        dictionary of attributes, or None if the label isn't in the file
+
+        """
+        if label not in self.labels:
+            return None
+        if self.legacy is not None:
+            return self.legacy[label]
+        try:
+            row = self.connection.execute(
+                'SELECT data FROM labels WHERE renderer = ? AND label = ?',
+                (self.rtype, label)).fetchone()
+        except sqlite3.Error as msg:
+            log.warning('Could not load auxiliary information. (%s)' % msg)
+            return None
+        if row is None:
+            return None
+        return pickle.loads(row[0])
+
+def readLegacy(filename: str) -> Dict[str, Dict[str, Dict]]:
+    """ Read the content of a .paux file in the pickle format """
+    with open(filename, 'rb') as fh:
+        return pickle.load(fh)
+
+def read(filename: str) -> Dict[str, Dict[str, Dict]]:
+    """
+    Read all the labels of a .paux file
+
+    Required Arguments:
+    filename -- the .paux file
+
+    Returns:
+    dictionary mapping renderer names to dictionaries of the attributes
+    of each label
+
+    """
+    if not isDatabase(filename):
+        return readLegacy(filename)
+    data = {} # type: Dict[str, Dict[str, Dict]]
+    with closing(connect(filename, readonly=True)) as conn:
+        for rtype, label, value in conn.execute(
+                'SELECT renderer, label, data FROM labels'):
+            data.setdefault(rtype, {})[label] = pickle.loads(value)
+    return data
+
+def write(filename: str, rtype: str, data: Dict[str, Dict]):
+    """
+    Replace the labels of a renderer in a .paux file
+
+    Required Arguments:
+    filename -- the .paux file, which is created if needed
+    rtype -- name of the renderer
+    data -- dictionary mapping labels to the attributes of their node
+
+    """
+    others = {} # type: Dict[str, Dict[str, Dict]]
+    if os.path.exists(filename) and not isDatabase(filename):
+        try:
+            others = readLegacy(filename)
+        except Exception:
+            pass
+        os.remove(filename)
+    others.pop(rtype, None)
+
+    rows = [(name, key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+            for name, labels in list(others.items()) + [(rtype, data)]
+            for key, value in labels.items()]
+    with closing(connect(filename)) as conn:
+        with conn:
+            conn.execute(SCHEMA)
+            conn.execute('DELETE FROM labels WHERE renderer = ?', (rtype,))
+            conn.executemany('INSERT INTO labels VALUES (?, ?, ?)', rows)
@@ -0,0 +1,136 @@
+"""
+Profile
+
+Timings of the macros of a document, gathered when the `profile' option
+is set.  For each kind of operation and each macro, the profiler counts
+the calls and measures their total time, which includes the nested
+operations, and their own time, which doesn't.
+
+The operations are:
+
+invoke -- Macro.invoke, called when the macro is expanded
+parse -- the parsing of the arguments of the macro by Macro.parse
+digest -- Macro.digest, which gathers the content of environments.  The
+    ends of environments, whose digest does nothing, aren't counted.
+expand -- TeX.expandTokens, attributed to the macro calling it
+render -- the rendering of the node by the template of the renderer
+
+"""
+
+import json, time
+from typing import Dict, List, Optional, Tuple
+
+class Profiler(object):
+    """ Counts and cumulative times of the operations on each macro """
+
+    def __init__(self, clock=time.perf_counter):
+        """
+        Keyword Arguments:
+        clock -- function returning the current time, in seconds
+
+        """
+        self.clock = clock
+
+        # Count, total time and own time of each kind of operation and macro
+        self.timings = {} # type: Dict[Tuple[str, str], List]
+
+        # Operations in progress: kind, macro name, start time and time
+        # spent in nested operations
+        self.stack = [] # type: List[List]
+
+        # Number of operations in progress for each kind and macro, so
+        # that the total time of recursive calls is only counted once
+        self.active = {} # type: Dict[Tuple[str, str], int]
+
+    def start(self, kind: str, name: str):
+        """
+        Start timing an operation
+
+        Required Arguments:
+        kind -- the kind of operation, like 'invoke' or 'render'
+        name -- the name of the macro
+
+        """
+        key = (kind, name)
+        self.active[key] = self.active.get(key, 0) + 1
+        self.stack.append([key, self.clock(), 0.0])
+
+    def stop(self):
+        """ Stop timing the innermost operation in progress """
+        key, start, nested = self.stack.pop()
+        elapsed = self.clock() - start
+        record = self.timings.get(key)
+        if record is None:
+            record = self.timings[key] = [0, 0.0, 0.0]
+        record[0] += 1
+        record[2] += elapsed - nested
+        self.active[key] -= 1
+        if not self.active[key]:
+            record[1] += elapsed
+        if self.stack:
+            self.stack[-1][2] += elapsed
+
+    @property
+    def current(self) -> Optional[str]:
+        """ Name of the macro of the innermost operation in progress """
+        if self.stack:
+            return self.stack[-1][0][1]
+        return None
+
+    def results(self) -> List[Dict]:
+        """
+        Get the timings, sorted by decreasing own time
+
+        Returns:
+        list of dictionaries with the kind of operation, the name of the
+        macro, the number of calls and the total and own times in seconds
+
+        """
+        results = [{'kind': kind, 'name': name, 'count': count,
+                    'total': total, 'own': own}
+                   for (kind, name), (count, total, own) in self.timings.items()]
+        results.sort(key=lambda x: (-x['own'], x['kind'], x['name']))
+        return results
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """
+        Format the timings as a text table
+
+        Keyword Arguments:
+        limit -- maximum number of rows of the table
+
+        Returns:
+        the table, with one row per kind of operation and macro, sorted
+        by decreasing own time
+
+        """
+        results = self.results()
+        totals = {} # type: Dict[str, float]
+        for result in results:
+            totals[result['kind']] = totals.get(result['kind'], 0.0) + result['own']
+
+        lines = ['Time spent in each kind of operation (own time):']
+        for kind, total in sorted(totals.items(), key=lambda x: -x[1]):
+            lines.append('  %-8s %10.3fs' % (kind, total))
+        lines.append('')
+        lines.append('%-8s %-30s %9s %11s %11s' %
+                     ('kind', 'macro', 'count', 'total (s)', 'own (s)'))
+        for result in results[:limit]:
+            lines.append('%-8s %-30s %9d %11.4f %11.4f' %
+                         (result['kind'], result['name'], result['count'],
+                          result['total'], result['own']))
+        return '\n'.join(lines) + '\n'
+
+    def write(self, basename: str):
+        """
+        Write the timings as JSON and as a text report
+
+        Required Arguments:
+        basename -- name of the files without their extension.  The
+            timings are written to `basename'.json and `basename'.txt.
+
+        """
+        with open(basename + '.json', 'w', encoding='utf-8') as fh:
+            json.dump(self.results(), fh, indent=1)
+        with open(basename + '.txt', 'w', encoding='utf-8') as fh:
+            fh.write(self.report())
@@ -196,7 +196,7 @@ class Epub_Package(object):
                       'titlepage.html',
                       'index.html',
                       ]:
-            if os.path.exists(fname):
+            if os.path.exists(os.path.join(self.root_dir, fname)):
                 os.unlink(os.path.join(self.root_dir, fname))
 
 class EpubRenderer(XHTMLRenderer):
@@ -219,7 +219,7 @@ class EpubRenderer(XHTMLRenderer):
 
         properties = dict()
         properties['data'] = tocdata[0]
-        properties['root_dir'] = os.getcwd()
+        properties['root_dir'] = self.renderContext.directory
         properties['encoding'] = 'utf-8'
         properties['name'] = document.userdata.get('jobname','index')
 
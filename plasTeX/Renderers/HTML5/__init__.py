@@ -27,13 +27,13 @@ class HTML5(_Renderer):
             addConfig(config)
 
         srcDir = document.userdata.get('working-dir', '.') # type: str
-        buildDir = os.getcwd()
+        buildDir = self.renderContext.directory
 
         # Theme css has already been copied by PageTemplate.loadTemplates,
         # provided config['general']['copy-theme-extras'] is true
         # Still try to create styles directory is case it's false
         try:
-            os.mkdir('styles')
+            os.mkdir(os.path.join(buildDir, 'styles'))
         except OSError:
             # This should mean the directory already exists
             pass
@@ -48,7 +48,7 @@ class HTML5(_Renderer):
         # provided config['general']['copy-theme-extras'] is true
         # Still try to create js directory is case it's false
         try:
-            os.mkdir('js')
+            os.mkdir(os.path.join(buildDir, 'js'))
         except OSError:
             pass
 
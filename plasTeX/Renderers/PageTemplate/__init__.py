@@ -10,6 +10,7 @@ support for your own templating engines.
 import sys, os, re, plasTeX, shutil, string
 from io import StringIO
 import pdb
+from collections import OrderedDict
 from plasTeX.Renderers import Renderer as BaseRenderer
 from plasTeX.Renderers.PageTemplate.simpletal import simpleTAL, simpleTALES
 from plasTeX.Renderers.PageTemplate.simpletal.simpleTALES import Context as TALContext
@@ -44,26 +45,37 @@ else:
     def jinja2template(s, encoding='utf8'):
         env = Environment(trim_blocks=True, lstrip_blocks=True)
         env.globals['debug'] = debug
+        tpl = env.from_string(s)
 
-        def renderjinja2(obj, s=s):
-            tvars = {'here':obj,
-                     'obj':obj,
-                     'doc':obj.ownerDocument,
-                     'container':obj.parentNode,
-                     'config':obj.ownerDocument.config,
-                     'context':obj.ownerDocument.context,
-                     'templates':obj.renderer,
-                     'tpl_src': s}
+        def variables(obj):
+            return {'here':obj,
+                    'obj':obj,
+                    'doc':obj.ownerDocument,
+                    'container':obj.parentNode,
+                    'config':obj.ownerDocument.config,
+                    'context':obj.ownerDocument.context,
+                    'templates':obj.renderer,
+                    'tpl_src': s}
 
-            tpl = env.from_string(s)
+        def renderjinja2(obj):
             try:
-                return tpl.render(tvars)
+                return tpl.render(variables(obj))
             except jinja2.exceptions.TemplateError as e:
                 log.warning('Jinja2 template error: {} while rendering node {}'
                             ' with source\n {}\n'.format(
                             e, obj.nodeName, obj.source))
                 return ''
 
+        def generatejinja2(obj):
+            try:
+                yield from tpl.generate(variables(obj))
+            except jinja2.exceptions.TemplateError as e:
+                log.warning('Jinja2 template error: {} while rendering node {}'
+                            ' with source\n {}\n'.format(
+                            e, obj.nodeName, obj.source))
+
+        # Used by the renderer to stream output to files
+        renderjinja2.generate = generatejinja2  # type: ignore
 
         return renderjinja2
 
@@ -233,14 +245,18 @@ except ImportError:
 def copytree(src, dest, symlink=None):
     """
     This is the same as shutil.copytree, but doesn't error out if the
-    directories already exist.
+    directories already exist.  The directory `src' itself is copied
+    into `dest'.
 
     """
+    base = os.path.dirname(os.path.normpath(src)) or os.curdir
     for root, dirs, files in os.walk(src, True):
+        root = os.path.relpath(root, base)
+        srcroot = os.path.join(base, root)
         for d in dirs:
             if d.startswith('.'):
                 continue
-            srcpath = os.path.join(root, d)
+            srcpath = os.path.join(srcroot, d)
             destpath = os.path.join(dest, root, d)
             if symlink and os.path.islink(srcpath):
                 if os.path.exists(destpath):
@@ -257,7 +273,7 @@ def copytree(src, dest, symlink=None):
         for f in files:
             if f.startswith('.'):
                 continue
-            srcpath = os.path.join(root, f)
+            srcpath = os.path.join(srcroot, f)
             destpath = os.path.join(dest, root, f)
             if symlink and os.path.islink(srcpath):
                 if os.path.exists(destpath):
@@ -266,6 +282,13 @@ def copytree(src, dest, symlink=None):
             else:
                 shutil.copy2(srcpath, destpath)
 
+# Templates of all renderers, indexed by their engine, source and purity.
+# The least recently used templates are dropped beyond SHARED_TEMPLATES
+# entries, so that a long-running process using many themes doesn't keep
+# all of them.
+SHARED_TEMPLATES = 2048
+sharedTemplates = OrderedDict() # type: OrderedDict
+
 class TemplateEngine(object):
     def __init__(self, ext, function):
         if not isinstance(ext, (list,tuple)):
@@ -275,6 +298,71 @@ class TemplateEngine(object):
     def compile(self, *args, **kwargs):
         return self.function(*args, **kwargs)
 
+class LazyTemplate(object):
+    """
+    Template whose compilation is deferred until it is first used
+
+    Theme directories contain hundreds of templates, but a typical
+    document only uses a few dozen of them.  Templates are therefore
+    indexed by name when they are loaded, and only compiled when the
+    renderer actually looks them up.
+
+    """
+    def __init__(self, engine, source, name, pure=None):
+        self.engine = engine
+        self.source = source
+        self.name = name
+        self.pure = pure
+        self.function = None
+
+    def compile(self):
+        """ Compile the template (once) and return the rendering callable """
+        if self.function is None:
+            try:
+                self.function = self.engine.compile(self.source)
+            except Exception as msg:
+                raise ValueError('Could not compile template "%s"' % self.name)
+            self.source = None
+        return self.function
+
+    def __call__(self, obj):
+        return self.compile()(obj)
+
+    def generate(self, obj):
+        func = self.compile()
+        generate = getattr(func, 'generate', None)
+        if generate is not None:
+            return generate(obj)
+        return [func(obj)]
+
+class MemoizedTemplate(object):
+    """
+    Wrapper around a pure template that reuses its previous results
+
+    A template is pure when its output only depends on the source of
+    the node it renders, plus the given list of attributes.  Results
+    are cached in the `memo` dictionary of the renderer, which is only
+    set when the memoize-templates option is enabled.
+
+    """
+    def __init__(self, function, attributes, renderer):
+        self.function = function
+        self.attributes = attributes
+        self.renderer = renderer
+
+    def __call__(self, obj):
+        memo = self.renderer.memo
+        if memo is None:
+            return self.function(obj)
+        key = (self, obj.nodeName, obj.source) + \
+              tuple(str(getattr(obj, x, None)) for x in self.attributes)
+        try:
+            return memo[key]
+        except KeyError:
+            pass
+        value = memo[key] = self.function(obj)
+        return value
+
 class PageTemplate(BaseRenderer):
     """ Renderer for page template based documents """
 
@@ -285,6 +373,8 @@ class PageTemplate(BaseRenderer):
         BaseRenderer.__init__(self, *args, **kwargs)
         self.loadedTheme = None
         self.engines = {}
+        self.templateFiles = []
+        self.memo = None
         htmlexts = ['.html','.htm','.xhtml','.xhtm','.zpt','.pt']
         self.registerEngine('pt', None, htmlexts, htmltemplate)
         self.registerEngine('zpt', None, htmlexts, htmltemplate)
@@ -319,6 +409,17 @@ class PageTemplate(BaseRenderer):
         key = (name, type)
         self.engines[key] = TemplateEngine(ext, function)
 
+    def templateSignature(self):
+        """ Include the names and modification times of all template files """
+        files = []
+        for filename in self.templateFiles:
+            try:
+                st = os.stat(filename)
+                files.append('%s:%s:%s' % (filename, st.st_mtime_ns, st.st_size))
+            except OSError:
+                files.append(filename)
+        return '\n'.join([BaseRenderer.templateSignature(self)] + files)
+
     def textDefault(self, node):
         """
         Default renderer for text nodes
@@ -384,24 +485,27 @@ class PageTemplate(BaseRenderer):
                     extensions += e.ext + [x+'s' for x in e.ext]
 
                 if document.config['general']['copy-theme-extras']:
-                    # Copy all theme extras
-                    cwd = os.getcwd()
-                    os.chdir(full_path)
-                    for item in os.listdir('.'):
-                        if os.path.isdir(item):
-                            if not os.path.isdir(os.path.join(cwd,item)):
-                                os.makedirs(os.path.join(cwd,item))
-                            copytree(item, cwd, True)
+                    # Copy all theme extras to the output directory
+                    outdir = self.renderContext.directory
+                    for item in os.listdir(full_path):
+                        src = os.path.join(full_path, item)
+                        if os.path.isdir(src):
+                            if not os.path.isdir(os.path.join(outdir,item)):
+                                os.makedirs(os.path.join(outdir,item))
+                            copytree(src, outdir, True)
                         elif os.path.splitext(item)[-1].lower() not in extensions:
-                            shutil.copy(item, os.path.join(cwd,item))
-                    os.chdir(cwd)
+                            shutil.copy(src, os.path.join(outdir,item))
 
                 break
 
-    def render(self, document):
+    def render(self, document, postProcess=None, directory=None):
         """ Load templates and render the document """
-        self.loadTemplates(document)
-        BaseRenderer.render(self, document)
+        if document.config['general']['memoize-templates']:
+            self.memo = {}
+        try:
+            BaseRenderer.render(self, document, postProcess, directory)
+        finally:
+            self.memo = None
 
     def importDirectory(self, templatedir):
         """
@@ -521,15 +625,69 @@ class PageTemplate(BaseRenderer):
 
         templateeng = self.engines.get((engine, ttype),
                             self.engines.get((engine, None)))
-
-        try:
-            template = templateeng.compile(template)
-        except Exception as msg:
+        if templateeng is None:
             raise ValueError('Could not compile template "%s"' % names[0])
 
+        # Pure templates can have their results reused
+        pure = options.get('pure', 'no').split()
+        if not pure or pure[0].lower() in ['no', 'false', '0']:
+            pure = None
+        elif pure[0].lower() in ['yes', 'true', '1']:
+            pure = []
+
+        # Compilation is deferred until the template is first looked up.
+        # Templates with the same source share their compiled version, so
+        # that a long-running process compiles each of them only once.
+        key = (templateeng.function, template,
+               None if pure is None else tuple(pure))
+        if key in sharedTemplates:
+            sharedTemplates.move_to_end(key)
+        else:
+            sharedTemplates[key] = LazyTemplate(templateeng, template, names[0], pure)
+            while len(sharedTemplates) > SHARED_TEMPLATES:
+                sharedTemplates.popitem(last=False)
+        template = sharedTemplates[key]
+
         for name in names:
             self[name] = template
 
+    def find(self, keys, default=None):
+        """
+        Locate a renderer given a list of possibilities
+
+        This compiles the matching template if it hasn't been compiled
+        yet.  Templates that fail to compile are removed, and the
+        search continues with the remaining keys.  Pure templates
+        are wrapped so that their results can be memoized.
+
+        Required Arguments:
+        keys -- a list of strings containing the requested name of
+            a renderer.  This list is traversed in order.
+
+        Keyword Arguments:
+        default -- the renderer to return if none of the keys exists
+
+        Returns:
+        the requested renderer
+
+        """
+        for key in keys:
+            if key not in self:
+                continue
+            template = self[key]
+            if isinstance(template, LazyTemplate):
+                try:
+                    function = template.compile()
+                except ValueError as msg:
+                    log.error(msg)
+                    del self[key]
+                    continue
+                if template.pure is not None:
+                    function = MemoizedTemplate(function, template.pure, self)
+                template = self[key] = function
+            return template
+        return BaseRenderer.find(self, keys, default)
+
     def parseTemplates(self, filename, options={}):
         """
         Parse templates from the file and set them in the renderer
@@ -542,6 +700,7 @@ class PageTemplate(BaseRenderer):
             in the file
 
         """
+        self.templateFiles.append(os.path.abspath(filename))
         num_templates = 0
         template = []
         options = options.copy()
@@ -638,7 +797,7 @@ class PageTemplate(BaseRenderer):
         filename, parameter, units = m.group(1), m.group(2), m.group(3)
 
         try:
-            img = self.imager.images.get(filename, self.vectorImager.images.get(filename, self.imager.staticimages.get(filename)))
+            img = self.getGeneratedImage(filename)
             if img is not None and getattr(img, parameter) is not None:
                 if units:
                     return getattr(getattr(img, parameter), units)
@@ -1,4 +1,5 @@
-import os, shutil, string, importlib
+import os, shutil, string, importlib, pickle, tempfile, threading
+from hashlib import sha1
 from plasTeX.Filenames import Filenames
 from plasTeX.DOM import Node
 from plasTeX.Logging import getLogger
@@ -14,6 +15,27 @@ logging.getLogger('simpleTALES').setLevel(logging.WARNING)
 
 __all__ = ['Renderer','Renderable']
 
+# Results of Imager.verify, which runs external programs, for each imager
+# class, command line and compiler.  These don't change during a process.
+verifiedImagers = {}
+
+def verifyImager(imager):
+    """
+    Verify that an imager works on this machine, reusing earlier results
+
+    Required Arguments:
+    imager -- the imager instance to verify
+
+    Returns:
+    boolean indicating whether the imager works
+
+    """
+    key = (type(imager), imager.command, tuple(imager.verifications or ()),
+           imager.getCompiler())
+    if key not in verifiedImagers:
+        verifiedImagers[key] = bool(imager.verify())
+    return verifiedImagers[key]
+
 def baseclasses(cls):
     output = [cls]
     for item in cls.__bases__:
@@ -69,6 +91,100 @@ def unmix(base, mix=None):
         if not base._mixed_:
             del base._mixed_
 
+# Renderable classes mixed into Node, with the number of renderings using them
+_mixedRenderables = {}
+_mixinCondition = threading.Condition()
+
+# Stack of the renderings in progress in each thread
+_renderContexts = threading.local()
+
+def currentRenderContext():
+    """ Get the context of the innermost rendering of this thread, or None """
+    stack = getattr(_renderContexts, 'stack', None)
+    if stack:
+        return stack[-1]
+    return None
+
+class RenderContext(object):
+    """
+    State of a rendering in progress
+
+    Renderings don't change the working directory of the process, and
+    don't store the renderer on the Node class.  The output directory
+    and the active renderer are kept in a render context instead, which
+    is entered by Renderer.render.  Contexts are kept per thread, so
+    that several documents can be rendered at the same time by a pool
+    of threads.
+
+    The methods of the renderable class of the renderer are mixed into
+    Node while at least one rendering uses them.  Renderings using
+    another renderable class wait for these renderings to end, unless
+    one of them is in progress in the same thread, which would never end.
+    Such nested renderings raise RuntimeError.
+
+    """
+
+    def __init__(self, renderer, document, directory):
+        """
+        Required Arguments:
+        renderer -- the active renderer
+        document -- the document being rendered
+        directory -- the output directory
+
+        """
+        self.renderer = renderer
+        self.document = document
+        self.directory = os.path.abspath(directory)
+
+    def path(self, *names):
+        """ Get the absolute path of a file of the output directory """
+        return os.path.join(self.directory, *names)
+
+    def __enter__(self):
+        cls = type(self.renderer).renderableClass
+        for context in getattr(_renderContexts, 'stack', None) or []:
+            if type(context.renderer).renderableClass is not cls:
+                raise RuntimeError('Cannot render with %s within a rendering '
+                                   'with %s' % (type(self.renderer).__name__,
+                                   type(context.renderer).__name__))
+        with _mixinCondition:
+            while any(x is not cls for x in _mixedRenderables):
+                _mixinCondition.wait()
+            if cls not in _mixedRenderables:
+                mixin(Node, cls)
+                _mixedRenderables[cls] = 0
+            _mixedRenderables[cls] += 1
+        if getattr(_renderContexts, 'stack', None) is None:
+            _renderContexts.stack = []
+        _renderContexts.stack.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        _renderContexts.stack.remove(self)
+        cls = type(self.renderer).renderableClass
+        with _mixinCondition:
+            _mixedRenderables[cls] -= 1
+            if not _mixedRenderables[cls]:
+                # Rendering with another renderer afterwards starts afresh
+                del _mixedRenderables[cls]
+                unmix(Node, cls)
+                _mixinCondition.notify_all()
+
+class ActiveRenderer(object):
+    """
+    Descriptor giving the renderer of the current thread as Node.renderer
+
+    Outside of a rendering, accessing the attribute raises AttributeError.
+
+    """
+    def __get__(self, obj, cls=None):
+        context = currentRenderContext()
+        if context is None:
+            raise AttributeError('renderer')
+        return context.renderer
+
+Node.renderer = ActiveRenderer()
+
 
 class Renderable(object):
     """
@@ -100,6 +216,18 @@ class Renderable(object):
 #       if self.filename:
 #           status.info(' [ %s ', self.filename)
 
+        return r.outputType(''.join(self.renderChildNodes()))
+
+    def renderChildNodes(self):
+        """
+        Render the child nodes, yielding the output of each one
+
+        Child nodes that generate a file are written to their file, and
+        yield nothing.
+
+        """
+        r = Node.renderer
+
         # At the very top level, only render the DOCUMENT_LEVEL node
         if self.nodeType == Node.DOCUMENT_NODE:
             childNodes = [x for x in self.childNodes
@@ -108,18 +236,18 @@ class Renderable(object):
             childNodes = self.childNodes
 
         # Render all child nodes
-        s = []
+        profiler = getattr(r.renderContext.document, 'profiler', None)
         for child in childNodes:
 
             # Short circuit text nodes
             if child.nodeType == Node.TEXT_NODE:
-                s.append(r.textDefault(child))
+                yield r.textDefault(child)
                 continue
 
             # Short circuit macros that have unicode equivalents
             uni = child.str
             if uni is not None:
-                s.append(r.textDefault(uni))
+                yield r.textDefault(uni)
                 continue
 
             layouts, names = [], []
@@ -133,6 +261,13 @@ class Renderable(object):
                 modifier = child.attributes.get('*modifier*')
 
             if child.filename:
+                # Skip files whose inputs haven't changed since the last run
+                if r.manifest is not None and r.manifest.isUnchanged(child):
+                    status.info(' [ %s (unchanged) ] ', child.filename)
+                    continue
+
+                imageRequests = r.imageRequests
+
                 # Force footnotes to be cached
                 if hasattr(child, 'footnotes'):
                     _ = child.footnotes
@@ -164,56 +299,50 @@ class Renderable(object):
             names.append(nodeName)
             layouts.append('default-layout')
 
-            # Locate the rendering callable, and call it with the
-            # current object (i.e. `child`) as its argument.
+            # Locate the rendering callable
             func = r.find(names, r.default)
-            val = func(child)
-
-            # If a plain string is returned, we have no idea what
-            # the encoding is, but we'll make a guess.
-            if type(val) is not str:
-                log.warning('The renderer for %s returned a non-unicode string.  Using the default input encoding.' % type(child).__name__)
-                val = str(val)
 
             # If the content should go to a file, write it and go
             # to the next child.
             if child.filename:
-                filename = child.filename
-
-                # Create any directories as needed
-                directory = os.path.dirname(filename)
-                if directory and not os.path.isdir(directory):
-                    os.makedirs(directory)
-
-                # Add the layout wrapper if there is one
-                func = r.find(layouts)
-                if func is not None:
-                    val = func(StaticNode(child, val))
-
-                    # If a plain string is returned, we have no idea what
-                    # the encoding is, but we'll make a guess.
-                    if type(val) is not str:
-                        log.warning('The renderer for %s returned a non-unicode string.  Using the default input encoding.' % type(child).__name__)
-                        val = str(val)
-
-                # Write the file content
+                if profiler is None:
+                    r.writeFile(child, func, r.find(layouts))
+                else:
+                    profiler.start('render', nodeName)
+                    try:
+                        r.writeFile(child, func, r.find(layouts))
+                    finally:
+                        profiler.stop()
 
-                enc = child.config['files']['output-encoding']
-                with open(filename, 'w', encoding=enc) as f:
-                    f.write(val)
+                if r.manifest is not None:
+                    r.manifest.record(child, r.imageRequests != imageRequests)
 
                 status.info(' ] ')
 
                 continue
 
-            # Append the resultant object to the output
-            s.append(val)
+            # Call the rendering callable with the current object
+            # (i.e. `child`) as its argument.
+            if profiler is None:
+                val = func(child)
+            else:
+                profiler.start('render', nodeName)
+                try:
+                    val = func(child)
+                finally:
+                    profiler.stop()
+
+            # If a plain string is returned, we have no idea what
+            # the encoding is, but we'll make a guess.
+            if type(val) is not str:
+                log.warning('The renderer for %s returned a non-unicode string.  Using the default input encoding.' % type(child).__name__)
+                val = str(val)
+
+            yield val
 
 #       if self.filename:
 #           status.info(' ] ')
 
-        return r.outputType(''.join(s))
-
     # def __str__(self):
     #     return ''
 
@@ -221,15 +350,16 @@ class Renderable(object):
     @property
     def image(self):
         """ Generate an image and return the image filename """
+        Node.renderer.imageRequests += 1
         return Node.renderer.imager.getImage(self)
 
     @property
     def vectorImage(self):
         """ Generate a vector image and return the image filename """
-        image = Node.renderer.vectorImager.getImage(self)
+        Node.renderer.imageRequests += 1
         if Node.renderer.vectorBitmap:
-            image.bitmap = Node.renderer.imager.getImage(self)
-        return image
+            return Node.renderer.imager.getImagePair(self, Node.renderer.vectorImager)
+        return Node.renderer.vectorImager.getImage(self)
 
     @property
     def url(self):
@@ -365,69 +495,58 @@ class Renderer(dict):
         # Names of generated files
         self.files = {}
 
-        # Instantiated at render time
-        self.imager = None
-        self.vectorImager = None
+        # Instantiated on first use at render time
+        self._document = None
+        self._imager = None
+        self._vectorImager = None
 
         # Filename generator
         self.newFilename = None
 
-    def cacheFilenames(self, node):
-        """
-        Generate filenames in order
+        # Number of image requests made by the nodes rendered so far
+        self.imageRequests = 0
 
-        Since filenames are generated on demand, in order to make the
-        nodes have a filename that corresponds to its position in the document,
-        the filenames must be generated before rendering the document.
+        # Manifest of generated files, used for incremental rendering
+        self.manifest = None
 
-        Required Arguments:
-        node -- the top-level node in the document
+        # Context of the rendering in progress
+        self.renderContext = None
 
-        """
-        # Using the side-effect of the filename property
-        _ = node.filename
-        for child in node.childNodes:
-            self.cacheFilenames(child)
-
-    def render(self, document, postProcess=None):
-        """
-        Invoke the rendering process
-
-        This method invokes the rendering process as well as handling
-        the setup and shutdown of image processing.
-
-        Required Arguments:
-        document -- the document object to render
-        postProcess -- a function that will be called with the content of
-
-        """
-        config = document.config
+    @property
+    def imager(self):
+        """ Bitmap imager, created the first time it is used """
+        if self._imager is None and self._document is not None:
+            self._imager = self.createImager(self._document)
+        return self._imager
 
-        self.level = config["files"]["split-level"]
-        filenameTemplate = config["files"]["filename"].strip()
-        if ' ' not in filenameTemplate and '[' not in filenameTemplate:
-            self.level = -10
+    @imager.setter
+    def imager(self, value):
+        self._imager = value
 
-        # If there are no keys, print a warning.
-        # This is most likely a problem.
-        if not list(self.keys()):
-            log.warning('There are no keys in the renderer.  ' +
-                        'All objects will use the default rendering method.')
+    @property
+    def vectorImager(self):
+        """ Vector imager, created the first time it is used """
+        if self._vectorImager is None and self._document is not None:
+            self._vectorImager = self.createVectorImager(self._document)
+        return self._vectorImager
 
-        # Mix in required methods and members
-        mixin(Node, type(self).renderableClass)
-        Node.renderer = self
+    @vectorImager.setter
+    def vectorImager(self, value):
+        self._vectorImager = value
 
-        # Create a filename generator
-        self.newFilename = Filenames(config['files'].get('filename'),
-                                     (config['files']['bad-chars'],
-                                      config['files']['bad-chars-sub']),
-                                     {'jobname':document.userdata.get('jobname', '')}, self.fileExtension)
+    @property
+    def outputDirectory(self):
+        """ Directory of the output files of the rendering in progress """
+        if self.renderContext is not None:
+            return self.renderContext.directory
+        return os.getcwd()
 
-        self.cacheFilenames(document)
+    def createImager(self, document):
+        """ Instantiate the first working bitmap imager of the configuration """
+        imager = None
 
         # Instantiate appropriate imager
-        names = [x for x in config['images']['imager'].split() if x]
+        names = [x for x in document.config['images']['imager'].split() if x]
         for name in names:
             if name == 'none':
                 break
@@ -447,31 +566,37 @@ class Renderer(dict):
                 log.warning("Invalid imager '%s'" % name)
                 continue
 
-            self.imager = Imager(document, self.imageTypes)
+            imager = Imager(document, self.imageTypes, self.outputDirectory)
 
             # Make sure that this imager works on this machine
-            if self.imager.verify():
+            if verifyImager(imager):
                 log.info('Using the imager "%s".' % name)
                 break
             else:
-                self.imager = None
+                imager = None
 
         # Still no imager? Just use the default.
-        if self.imager is None:
+        if imager is None:
             if 'none' not in names:
                 log.warning('Could not find a valid imager in the list: %s.  The default imager will be used.' % ', '.join(names))
             from plasTeX.Imagers import Imager
-            self.imager = Imager(document, self.imageTypes)
+            imager = Imager(document, self.imageTypes, self.outputDirectory)
+
+        if self.imageTypes and imager.fileExtension not in self.imageTypes:
+            imager.fileExtension = self.imageTypes[0]
+        if self.imageAttrs and not imager.imageAttrs:
+            imager.imageAttrs = self.imageAttrs
+        if self.imageUnits and not imager.imageUnits:
+            imager.imageUnits = self.imageUnits
 
-        if self.imageTypes and self.imager.fileExtension not in self.imageTypes:
-            self.imager.fileExtension = self.imageTypes[0]
-        if self.imageAttrs and not self.imager.imageAttrs:
-            self.imager.imageAttrs = self.imageAttrs
-        if self.imageUnits and not self.imager.imageUnits:
-            self.imager.imageUnits = self.imageUnits
+        return imager
+
+    def createVectorImager(self, document):
+        """ Instantiate the first working vector imager of the configuration """
+        imager = None
 
         # Instantiate appropriate vector imager
-        names = [x for x in config['images']['vector-imager'].split() if x]
+        names = [x for x in document.config['images']['vector-imager'].split() if x]
         for name in names:
             if name == 'none':
                 break
@@ -483,48 +608,210 @@ class Renderer(dict):
                 log.warning("Invalid imager '%s'" % name)
                 continue
 
-            self.vectorImager = VectorImager(document, self.vectorImageTypes)
+            imager = VectorImager(document, self.vectorImageTypes, self.outputDirectory)
 
             # Make sure that this imager works on this machine
-            if self.vectorImager.verify():
+            if verifyImager(imager):
                 log.info('Using the vector imager "%s".' % name)
                 break
 
-            self.vectorImager = None
+            imager = None
 
         # Still no vector imager? Just use the default.
-        if self.vectorImager is None:
+        if imager is None:
             if 'none' not in names:
                 log.warning('Could not find a valid vector imager in the list: %s.  The default vector imager will be used.' % ', '.join(names))
             from plasTeX.Imagers import VectorImager
-            self.vectorImager = VectorImager(document, self.vectorImageTypes)
+            imager = VectorImager(document, self.vectorImageTypes, self.outputDirectory)
 
         if self.vectorImageTypes and \
-           self.vectorImager.fileExtension not in self.vectorImageTypes:
-            self.vectorImager.fileExtension = self.vectorImageTypes[0]
-        if self.imageAttrs and not self.vectorImager.imageAttrs:
-            self.vectorImager.imageAttrs = self.imageAttrs
-        if self.imageUnits and not self.vectorImager.imageUnits:
-            self.vectorImager.imageUnits = self.imageUnits
+           imager.fileExtension not in self.vectorImageTypes:
+            imager.fileExtension = self.vectorImageTypes[0]
+        if self.imageAttrs and not imager.imageAttrs:
+            imager.imageAttrs = self.imageAttrs
+        if self.imageUnits and not imager.imageUnits:
+            imager.imageUnits = self.imageUnits
 
-        # Invoke the rendering process
-        str(document)
+        return imager
 
-        self.imager.close()
-        self.vectorImager.close()
+    def getGeneratedImage(self, filename):
+        """
+        Get the image generated for `filename` by the imagers, if any
 
-        # Run any cleanup activities
-        self.cleanup(document, list(self.files.values()), postProcess=postProcess)
+        This doesn't create the imagers if they haven't been used.
 
-        # Write out auxilliary information
-        pauxname = os.path.join(document.userdata.get('working-dir','.'),
-                                '%s.paux' % document.userdata.get('jobname',''))
-        rname = config['general']['renderer']
-        document.context.persist(pauxname, rname)
+        """
+        for images in [getattr(self._imager, 'images', {}),
+                       getattr(self._vectorImager, 'images', {}),
+                       getattr(self._imager, 'hostedImages', {}),
+                       getattr(self._imager, 'staticimages', {})]:
+            if filename in images:
+                return images[filename]
+        return None
+
+    def templateSignature(self):
+        """
+        Return a string that changes whenever the templates change
 
-        # Remove mixins
-        del Node.renderer
-        unmix(Node, type(self).renderableClass)
+        This is used to invalidate the manifest of generated files
+        when incremental rendering is enabled.
+
+        """
+        return '%s.%s' % (type(self).__module__, type(self).__name__)
+
+    def renderSignature(self, document):
+        """
+        Return a hash of everything that every generated file depends on
+
+        This includes the configuration, the templates, the output
+        directory, and the document structure (filenames, titles and
+        numbers of all nodes that generate files).  If any of these
+        change, all files are rendered again.
+
+        Required Arguments:
+        document -- the document being rendered
+
+        """
+        h = sha1()
+        h.update(self.templateSignature().encode('utf-8'))
+        h.update(self.renderContext.directory.encode('utf-8'))
+        config = document.config
+        for section in sorted(config.keys()):
+            for key, option in sorted(config[section].data.items()):
+                h.update(repr((section, key, option.value)).encode('utf-8'))
+
+        # Generate IDs in document order so that they are stable
+        # from one run to the next, regardless of which files are rendered
+        for node in document.allChildNodes:
+            if node.nodeType == Node.ELEMENT_NODE:
+                _ = node.id
+
+        for node, filename in list(self.files.items()):
+            h.update(str(filename).encode('utf-8'))
+            for name in ['title', 'ref']:
+                value = getattr(node, name, None)
+                value = getattr(value, 'textContent', value)
+                if isinstance(value, str):
+                    h.update(value.encode('utf-8'))
+
+        # The index is gathered from the whole document
+        for entry in document.userdata.get('index', []):
+            h.update(entry.node.source.encode('utf-8'))
+
+        return h.hexdigest()
+
+    def cacheFilenames(self, node):
+        """
+        Generate filenames in order
+
+        Since filenames are generated on demand, in order to make the
+        nodes have a filename that corresponds to its position in the document,
+        the filenames must be generated before rendering the document.
+
+        Required Arguments:
+        node -- the top-level node in the document
+
+        """
+        # Using the side-effect of the filename property
+        _ = node.filename
+        for child in node.childNodes:
+            self.cacheFilenames(child)
+
+    def render(self, document, postProcess=None, directory=None):
+        """
+        Invoke the rendering process
+
+        This method invokes the rendering process as well as handling
+        the setup and shutdown of image processing.
+
+        Required Arguments:
+        document -- the document object to render
+
+        Keyword Arguments:
+        postProcess -- a function that will be called with the content of
+            each file, see cleanup
+        directory -- the directory to write the output files to.  The
+            default is the current directory.
+
+        """
+        config = document.config
+
+        self.level = config["files"]["split-level"]
+        filenameTemplate = config["files"]["filename"].strip()
+        if ' ' not in filenameTemplate and '[' not in filenameTemplate:
+            self.level = -10
+
+        # Mix in required methods and members, and make this renderer
+        # the active one in this thread.  This is undone even if rendering
+        # fails.
+        self.renderContext = RenderContext(self, document, directory or os.getcwd())
+        try:
+            with self.renderContext:
+                self.loadTemplates(document)
+
+                # If there are no keys, print a warning.
+                # This is most likely a problem.
+                if not list(self.keys()):
+                    log.warning('There are no keys in the renderer.  ' +
+                                'All objects will use the default rendering method.')
+
+                # Create a filename generator
+                self.newFilename = Filenames(config['files'].get('filename'),
+                                             (config['files']['bad-chars'],
+                                              config['files']['bad-chars-sub']),
+                                             {'jobname':document.userdata.get('jobname', '')}, self.fileExtension)
+
+                self.cacheFilenames(document)
+
+                # Load the manifest of files generated by the previous run.
+                # Each renderer of a run has its own manifest.
+                pauxdir = document.userdata.get('working-dir', '.')
+                rname = config['general']['renderer']
+                if config['files']['incremental']:
+                    manifestname = os.path.join(pauxdir, '%s.%s.pmanifest' %
+                            (document.userdata.get('jobname', ''),
+                             os.path.basename(os.path.normpath(rname))))
+                    self.manifest = RenderManifest(manifestname,
+                                                   self.renderSignature(document),
+                                                   self.renderContext.directory)
+
+                # Imagers are created the first time they are used
+                self._document = document
+
+                # Invoke the rendering process
+                str(document)
+
+                for imager in [self._imager, self._vectorImager]:
+                    if imager is not None:
+                        imager.close()
+
+                # Run any cleanup activities
+                files = list(self.files.values())
+                if self.manifest is not None:
+                    files = [x for x in files if x not in self.manifest.skipped]
+                self.cleanup(document, files, postProcess=postProcess)
+
+                if self.manifest is not None:
+                    self.manifest.save()
+
+                # Write out auxilliary information
+                pauxname = os.path.join(pauxdir,
+                                        '%s.paux' % document.userdata.get('jobname',''))
+                document.context.persist(pauxname, rname)
+
+        finally:
+            self.renderContext = None
+            self._document = self._imager = self._vectorImager = None
+
+    def loadTemplates(self, document):
+        """
+        Load the templates of the renderer
+
+        This is called at the start of render, once the render context
+        is set.  The default implementation does nothing.
+
+        """
+        pass
 
     def processFileContent(self, document, s):
         return s
@@ -556,6 +843,7 @@ class Renderer(dict):
         encoding = document.config['files']['output-encoding']
         errs = self.encodingErrors
         for f in files:
+            f = self.renderContext.path(f)
             try:
                 with open(f, 'r', encoding=encoding, errors=errs) as fd:
                     s = fd.read()
@@ -571,6 +859,129 @@ class Renderer(dict):
             with open(f, 'w', encoding=encoding) as fd:
                 fd.write(''.join(s))
 
+    def generate(self, func, obj):
+        """
+        Render `obj` with `func`, yielding the output piece by piece
+
+        If the rendering callable has a `generate` attribute, it is
+        called with `obj` and must return an iterable of strings.
+        Otherwise, the whole output of `func` is yielded at once.
+
+        Required Arguments:
+        func -- the rendering callable
+        obj -- the node to render
+
+        """
+        generate = getattr(func, 'generate', None)
+        chunks = generate(obj) if generate is not None else [func(obj)]
+        for chunk in chunks:
+            # If a plain string is returned, we have no idea what
+            # the encoding is, but we'll make a guess.  Templates yield
+            # subclasses of str, like the Text nodes of the document.
+            if not isinstance(chunk, str):
+                log.warning('The renderer for %s returned a non-unicode string.  Using the default input encoding.' % type(obj).__name__)
+                chunk = str(chunk)
+            yield chunk
+
+    def writeFile(self, node, func, layout=None):
+        """
+        Render a node into its own file
+
+        The output is written as it is produced, so that the content
+        of a large page isn't built in memory first.  When there is a
+        layout, the content is spooled to a temporary file, and the
+        layout is then rendered around it.  The output goes to a
+        temporary file, which only replaces the file of the node once
+        the rendering succeeds.
+
+        Required Arguments:
+        node -- the node to render, which has a filename
+        func -- the rendering callable of the node
+
+        Keyword Arguments:
+        layout -- the rendering callable of the layout wrapped around
+            the content of the node
+
+        """
+        filename = self.renderContext.path(node.filename)
+
+        # Create any directories as needed
+        directory = os.path.dirname(filename)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        tmpname = '%s.%s.tmp' % (filename, os.getpid())
+        enc = node.config['files']['output-encoding']
+        try:
+            with open(tmpname, 'w', encoding=enc) as f:
+                if layout is None:
+                    for chunk in self.generateContent(func, node):
+                        f.write(chunk)
+                else:
+                    with tempfile.SpooledTemporaryFile(SPOOL_SIZE, 'w+',
+                                                       encoding='utf-8') as content:
+                        for chunk in self.generateContent(func, node):
+                            content.write(chunk)
+                        parts = self.splitOutput(layout, node)
+                        content.seek(0)
+                        if parts is None:
+                            for chunk in self.generate(layout,
+                                                       StaticNode(node, content.read())):
+                                f.write(chunk)
+                        else:
+                            f.write(parts[0])
+                            shutil.copyfileobj(content, f)
+                            f.write(parts[1])
+            os.replace(tmpname, filename)
+        except BaseException:
+            if os.path.exists(tmpname):
+                os.remove(tmpname)
+            raise
+
+    def generateContent(self, func, node):
+        """
+        Render a node, yielding the output of its child nodes one by one
+
+        This only applies to templates that include the content of the
+        node exactly once, as in `<h1>...</h1>{{ obj }}'.  The output
+        of other rendering callables is yielded as a whole.
+
+        Required Arguments:
+        func -- the rendering callable of the node
+        node -- the node to render
+
+        """
+        parts = None
+        if node.str is None and node.hasChildNodes():
+            parts = self.splitOutput(func, node)
+        if parts is None:
+            yield from self.generate(func, node)
+            return
+        yield parts[0]
+        yield from node.renderChildNodes()
+        yield parts[1]
+
+    def splitOutput(self, func, obj):
+        """
+        Render `obj` with a placeholder in place of its content
+
+        Required Arguments:
+        func -- the rendering callable
+        obj -- the node to render
+
+        Returns:
+        the output before and after the content of `obj`, or None if
+        `func` can't stream its output or doesn't include the content
+        exactly once
+
+        """
+        if getattr(func, 'generate', None) is None:
+            return None
+        output = ''.join(self.generate(func, StaticNode(obj, CONTENT_PLACEHOLDER)))
+        if output.count(CONTENT_PLACEHOLDER) != 1:
+            return None
+        return output.split(CONTENT_PLACEHOLDER)
+
     def find(self, keys, default=None):
         """
         Locate a renderer given a list of possibilities
@@ -599,6 +1010,140 @@ class Renderer(dict):
 
 
 
+class RenderManifest(object):
+    """
+    Record of the inputs used to generate each output file
+
+    The manifest is stored next to the .paux file.  For each generated
+    file, it holds a hash of the source of the node that generated it,
+    including the numbers and IDs of the nodes in that subtree and the
+    cross-reference targets they point to.  The whole manifest is
+    discarded when the render signature (templates, configuration,
+    document structure) changes.
+
+    Files whose hash hasn't changed since the last run are neither
+    rendered nor written, so their modification times stay the same.
+    Files that requested images are always rendered since image
+    filenames are handed out in rendering order.
+
+    """
+
+    def __init__(self, filename, signature, directory='.'):
+        """
+        Load the manifest written by the previous run, if any
+
+        Required Arguments:
+        filename -- the name of the manifest file
+        signature -- the render signature of the current run
+
+        Keyword Arguments:
+        directory -- the output directory
+
+        """
+        self.filename = filename
+        self.signature = signature
+        self.directory = directory
+        self.previous = {}
+        self.entries = {}
+        self.keys = {}
+        self.skipped = set()
+        if os.path.exists(filename):
+            try:
+                with open(filename, 'rb') as fh:
+                    d = pickle.load(fh)
+                if d['signature'] == signature:
+                    self.previous = d['files']
+            except Exception as msg:
+                log.warning('Could not load render manifest. (%s)' % msg)
+
+    def key(self, node):
+        """ Return the hash of all of the inputs of the file of `node` """
+        try:
+            return self.keys[node.filename]
+        except KeyError:
+            pass
+        h = sha1()
+        h.update(node.filename.encode('utf-8'))
+        h.update(node.source.encode('utf-8'))
+        for child in [node] + node.allChildNodes:
+            if child.nodeType != Node.ELEMENT_NODE:
+                continue
+            h.update(str(child.id).encode('utf-8'))
+            ref = getattr(child, 'ref', None)
+            ref = getattr(ref, 'textContent', ref)
+            if isinstance(ref, str):
+                h.update(ref.encode('utf-8'))
+            for target in list((getattr(child, '@idref', None) or {}).values()):
+                h.update(str(getattr(target, 'url', '')).encode('utf-8'))
+                ref = getattr(target, 'ref', None)
+                ref = getattr(ref, 'textContent', ref)
+                if isinstance(ref, str):
+                    h.update(ref.encode('utf-8'))
+        key = self.keys[node.filename] = h.hexdigest()
+        return key
+
+    def _isValid(self, filename, key=None):
+        entry = self.previous.get(filename)
+        if entry is None or entry['images'] or \
+           not os.path.isfile(os.path.join(self.directory, filename)):
+            return False
+        return key is None or entry['key'] == key
+
+    def isUnchanged(self, node):
+        """
+        Can the file of `node` be kept from the previous run?
+
+        If so, the file, along with the files of all of the nodes below
+        `node`, is marked as skipped.
+
+        """
+        if not self._isValid(node.filename, self.key(node)):
+            return False
+
+        # Files generated by nodes below this one are kept as well,
+        # their sources are part of the source of this node.
+        filenames = [node.filename]
+        for child in node.allChildNodes:
+            if child.nodeType == Node.ELEMENT_NODE and child.filename:
+                if not self._isValid(child.filename):
+                    return False
+                filenames.append(child.filename)
+
+        for filename in filenames:
+            self.entries[filename] = self.previous[filename]
+            self.skipped.add(filename)
+        return True
+
+    def record(self, node, images=False):
+        """
+        Record the inputs of a file that was just written
+
+        Required Arguments:
+        node -- the node that generated the file
+
+        Keyword Arguments:
+        images -- whether or not images were requested while rendering
+
+        """
+        self.entries[node.filename] = {'key': self.key(node), 'images': images}
+
+    def save(self):
+        """ Write the manifest to disk """
+        try:
+            with open(self.filename, 'wb') as fh:
+                pickle.dump({'signature': self.signature,
+                             'files': self.entries}, fh)
+        except Exception as msg:
+            log.warning('Could not save render manifest. (%s)' % msg)
+
+
+# Size of the page content kept in memory before it is spooled to disk
+SPOOL_SIZE = 1024 * 1024
+
+# Stands for the content of a node while its template or layout is
+# rendered, so that the content can be streamed in its place
+CONTENT_PLACEHOLDER = '\x00plasTeX-content\x00'
+
 class StaticNode(object):
     """
     Object to assist in rendering files
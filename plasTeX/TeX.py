@@ -15,8 +15,9 @@ Example:
 """
 from io import IOBase
 from typing import Optional, List
-import contextlib, string, os, sys, plasTeX, subprocess
+import string, os, sys, plasTeX, subprocess
 from plasTeX.Tokenizer import Tokenizer, Token, EscapeSequence, Other
+from plasTeX.Kpathsea import FileResolver, Unresolved
 from plasTeX import TeXDocument
 from plasTeX.Base.TeX.Primitives import MathShift
 from plasTeX import ParameterCommand, Macro
@@ -74,6 +75,9 @@ class TeX(object):
         # Auxiliary files loaded
         self.auxFiles = []
 
+        # Files located by kpsewhich
+        self.fileResolver = FileResolver()
+
         # TeX arguments types and their casting functions
         self.argtypes = {
             'url': (self.castNone, {'#':12,'~':12,'%':12,'&':12}),
@@ -292,6 +296,7 @@ class TeX(object):
         pushTokens = self.pushTokens
         createElement = self.ownerDocument.createElement
         ELEMENT_NODE = Macro.ELEMENT_NODE
+        profiler = getattr(self.ownerDocument, 'profiler', None)
 
         while 1:
             # Get the next token
@@ -319,7 +324,14 @@ class TeX(object):
                     obj = createElement(token.macroName)
                     obj.contextDepth = token.contextDepth
                     obj.parentNode = token.parentNode
-                    tokens = obj.invoke(self)
+                    if profiler is None:
+                        tokens = obj.invoke(self)
+                    else:
+                        profiler.start('invoke', obj.nodeName)
+                        try:
+                            tokens = obj.invoke(self)
+                        finally:
+                            profiler.stop()
                     if tokens is None:
 #                       log.info('expanding %s %s', token.macroName, obj)
                         pushToken(obj)
@@ -382,7 +394,15 @@ class TeX(object):
         tex.pushTokens(tokens)
         frag = tex.ownerDocument.createDocumentFragment()
         frag.parentNode = parentNode
-        out = tex.parse(frag)
+        profiler = getattr(self.ownerDocument, 'profiler', None)
+        if profiler is None:
+            out = tex.parse(frag)
+        else:
+            profiler.start('expand', profiler.current or '(document)')
+            try:
+                out = tex.parse(frag)
+            finally:
+                profiler.stop()
 
         # Pop all of our nested contexts off
         tex.endSubProcess()
@@ -409,11 +429,20 @@ class TeX(object):
         if output is None:
             output = self.ownerDocument
 
+        profiler = getattr(self.ownerDocument, 'profiler', None)
+
         try:
             for item in tokens:
                 if item.nodeType == Macro.ELEMENT_NODE:
                     item.parentNode = output
-                    item.digest(tokens)
+                    if profiler is None or item.macroMode == Macro.MODE_END:
+                        item.digest(tokens)
+                    else:
+                        profiler.start('digest', item.nodeName)
+                        try:
+                            item.digest(tokens)
+                        finally:
+                            profiler.stop()
                 output.append(item)
         except Exception as message:
             msg = str(message)
@@ -1333,46 +1362,54 @@ class TeX(object):
         if os.path.isabs(name):
             return name
 
-        with contextlib.ExitStack() as stack:
-            # When, for example, ``\Input{name}`` is encountered, we should look in
-            # the directory containing the file being processed. So the following
-            # code adds the directory to the start of $TEXINPUTS.
-            TEXINPUTS = os.environ.get("TEXINPUTS",'')
-            try:
-                srcDir = os.path.dirname(self.filename)
-            except AttributeError:
-                # I think this happens only for the command line file.
-                pass
+        # When, for example, ``\Input{name}`` is encountered, we should look in
+        # the directory containing the file being processed. So the following
+        # code adds the directory to the start of $TEXINPUTS.
+        TEXINPUTS = os.environ.get("TEXINPUTS",'')
+        try:
+            srcDir = os.path.dirname(self.filename)
+        except AttributeError:
+            # I think this happens only for the command line file.
+            pass
+        else:
+            if TEXINPUTS:
+                TEXINPUTS = "%s%s%s%s" % (srcDir, os.path.pathsep, TEXINPUTS, os.path.pathsep)
             else:
-                if TEXINPUTS:
-                    os.environ["TEXINPUTS"] = "%s%s%s%s" % (srcDir, os.path.pathsep, TEXINPUTS, os.path.pathsep)
-                    @stack.callback
-                    def restore_texinputs():
-                        os.environ["TEXINPUTS"] = TEXINPUTS
-                else:
-                    os.environ["TEXINPUTS"] = "%s%s" % (srcDir, os.path.pathsep)
-                    @stack.callback
-                    def restore_texinputs():
-                        os.environ.pop("TEXINPUTS", None)
-
-            try:
-                program = self.ownerDocument.config['general']['kpsewhich']
+                TEXINPUTS = "%s%s" % (srcDir, os.path.pathsep)
 
-                kwargs = {'stdout':subprocess.PIPE}
-                if sys.platform.lower().startswith('win'):
-                    kwargs['shell'] = True
+        config = self.ownerDocument.config['general']
+        program = config['kpsewhich']
 
-                output = subprocess.Popen([program, name], **kwargs).communicate()[0].strip()
-                output = output.decode('utf-8')
+        # Look for the file without running kpsewhich if possible
+        if config['kpsewhich-index']:
+            try:
+                output = self.fileResolver.find(name, TEXINPUTS, program)
+            except Unresolved:
+                pass
+            else:
+                # The ls-R databases may be out of date, so let kpsewhich
+                # look for the files missing from them
                 if output:
                     return output
 
-            except Exception:
-                paths = os.environ.get("TEXINPUTS", '.').split(os.path.pathsep)
-                for path in paths:
-                    path = os.path.join(path, name)
-                    if os.path.exists(path):
-                        return path
+        try:
+            kwargs = {'stdout':subprocess.PIPE}
+            if sys.platform.lower().startswith('win'):
+                kwargs['shell'] = True
+
+            env = os.environ.copy()
+            env['TEXINPUTS'] = TEXINPUTS
+            output = subprocess.Popen([program, name], env=env, **kwargs).communicate()[0].strip()
+            output = output.decode('utf-8')
+            if output:
+                return output
+
+        except Exception:
+            paths = (TEXINPUTS or '.').split(os.path.pathsep)
+            for path in paths:
+                path = os.path.join(path, name)
+                if os.path.exists(path):
+                    return path
 
         raise FileNotFoundError('Could not find any file named: %s' % name)
 
@@ -475,6 +475,9 @@ class Macro(Element):
 
         self.argSource = ''
         arg = None
+        profiler = getattr(self.ownerDocument, 'profiler', None)
+        if profiler is not None:
+            profiler.start('parse', self.nodeName)
         try:
             for arg in self.arguments:
                 self.preArgument(arg, tex)
@@ -488,6 +491,9 @@ class Macro(Element):
             log.error('Error while parsing argument "%s" of "%s"' %
                        (arg.name, self.nodeName))
             raise
+        finally:
+            if profiler is not None:
+                profiler.stop()
 
         self.postParse(tex)
 
@@ -694,13 +700,21 @@ class Macro(Element):
         token -- the token of the requested type if it was found
 
         """
+        profiler = getattr(self.ownerDocument, 'profiler', None)
         for tok in tokens:
             if tok.nodeType == Node.ELEMENT_NODE:
                 if isinstance(tok, endclass):
                     tokens.push(tok)
                     return tok
                 tok.parentNode = self
-                tok.digest(tokens)
+                if profiler is None or tok.macroMode == Macro.MODE_END:
+                    tok.digest(tokens)
+                else:
+                    profiler.start('digest', tok.nodeName)
+                    try:
+                        tok.digest(tokens)
+                    finally:
+                        profiler.stop()
             # Stay within our context
             if tok.contextDepth < self.contextDepth:
                 tokens.push(tok)
@@ -833,6 +847,9 @@ class TeXDocument(Document):
         self.packageResources = []
         self.rendererdata = dict()
 
+        # Profiler timing the macros, see plasTeX.Profile
+        self.profiler = None
+
         self.charsubs = [x for x in TeXDocument.defaultCharsubs if x[0] not in self.config["document"]["disable-charsub"]]
 
     def addPackageResource(self, resource):
@@ -909,6 +926,7 @@ class Environment(Macro):
             return
         # Absorb the tokens that belong to us
         dopars = self.forcePars
+        profiler = getattr(self.ownerDocument, 'profiler', None)
 #       print 'DIGEST', type(self), self.contextDepth
         for item in tokens:
 #           print type(item), (item.level, self.level), (item.contextDepth, self.contextDepth)
@@ -926,7 +944,14 @@ class Environment(Macro):
                 if item.macroMode == Macro.MODE_END and type(item) is type(self):
                     break
                 item.parentNode = self
-                item.digest(tokens)
+                if profiler is None or item.macroMode == Macro.MODE_END:
+                    item.digest(tokens)
+                else:
+                    profiler.start('digest', item.nodeName)
+                    try:
+                        item.digest(tokens)
+                    finally:
+                        profiler.stop()
             # Stay within our context depth
             if self.level > Node.DOCUMENT_LEVEL and \
                item.contextDepth < self.contextDepth:
@@ -2,30 +2,35 @@
 
 import os, sys
 import importlib
+import json, socket, socketserver
 import traceback, pdb
+from contextlib import redirect_stdout
+from io import StringIO
 import plasTeX
 from plasTeX import __version__
 from argparse import ArgumentParser
 from plasTeX.Logging import getLogger
-from plasTeX.Compile import run
+from plasTeX.Compile import run, run_many, format_summary, load_renderer, \
+    renderer_names, collect_renderer_config, job_context
 from plasTeX.Config import defaultConfig
 
 log = getLogger()
 
-def collect_renderer_config(config):
-    plastex_dir = os.path.dirname(os.path.realpath(plasTeX.__file__))
-    renderers_dir = os.path.join(plastex_dir, 'Renderers')
-    renderers = next(os.walk(renderers_dir))[1]
-    for renderer in renderers:
-        try:
-            conf = importlib.import_module('plasTeX.Renderers.'+renderer+'.Config')
-        except ImportError as msg:
-            continue
-
-        conf.addConfig(config)
-
 def main(argv):
     """ Main program routine """
+    if argv and argv[0] == 'serve':
+        return serve_main(argv[1:])
+    if argv and (argv[0] == '--client' or argv[0].startswith('--client=')):
+        if '=' in argv[0]:
+            address, argv = argv[0].split('=', 1)[1], argv[1:]
+        elif len(argv) > 1:
+            address, argv = argv[1], argv[2:]
+        else:
+            print('plasTeX: --client requires the socket of a plastex server',
+                  file=sys.stderr)
+            return 2
+        return submit(address, argv)
+
     print('plasTeX version %s' % __version__)
 
     config = defaultConfig()
@@ -38,7 +43,10 @@ def main(argv):
 
     config.registerArgparse(parser)
 
-    parser.add_argument("file", help="File to process")
+    group = parser.add_argument_group("Batch Conversion")
+    group.add_argument("--workers", "-j", dest="workers", type=int, help="Number of worker processes converting the files when several files are given [number of processors]")
+
+    parser.add_argument("file", nargs="+", help="Files to process")
 
     data = parser.parse_args(argv)
     data = vars(data)
@@ -47,9 +55,197 @@ def main(argv):
 
     config.updateFromDict(data)
 
-    filename = data["file"]
+    files = data["file"]
+
+    if len(files) == 1:
+        run(files[0], config)
+        return
+
+    def report(result):
+        print('\n==> %s <==' % result.filename)
+        sys.stdout.write(result.output)
+        if result.error:
+            sys.stdout.write(result.error)
+
+    try:
+        results = run_many(files, config, workers=data["workers"], callback=report)
+    except ValueError as msg:
+        print('plasTeX: %s' % msg, file=sys.stderr)
+        return 2
+    print()
+    print(format_summary(results))
+    if any(result.status for result in results):
+        return 1
+
+def serve_main(argv):
+    """ Run plastex as a server processing the jobs of clients """
+    parser = ArgumentParser("plasTeX serve",
+        description="Keep a warm plasTeX process and run the jobs sent "
+                    "as JSON lines on the socket, or on stdin when no socket "
+                    "is given")
+    parser.add_argument("--socket", "-s", dest="socket",
+                        help="UNIX socket to listen on")
+    parser.add_argument("--no-warm-up", dest="warmup", action="store_false",
+                        help="Don't import packages and compile templates "
+                             "before accepting jobs")
+    data = parser.parse_args(argv)
+    if data.warmup:
+        warm_up()
+    if data.socket:
+        serve_socket(data.socket)
+    else:
+        serve_stream(sys.stdin, sys.stdout)
+    return 0
+
+def warm_up():
+    """
+    Do the work shared by all jobs before the first one arrives
+
+    This imports the modules of plasTeX.Base and of the renderers, and
+    compiles the templates of the default renderers.  Jobs using other
+    renderers or themes still benefit from the templates they share.
+
+    """
+    from plasTeX.Base import registry
+    for module in sorted(set(registry.BASE.values())):
+        importlib.import_module(module)
 
-    run(filename, config)
+    from plasTeX.Renderers.PageTemplate import PageTemplate
+    config = defaultConfig()
+    collect_renderer_config(config)
+    config['general']['copy-theme-extras'] = False
+    document = plasTeX.TeXDocument(config=config)
+    for rname in renderer_names(config):
+        try:
+            renderer = load_renderer(rname, config)
+        except ImportError:
+            continue
+        if not isinstance(renderer, PageTemplate):
+            continue
+        # Only the templates of the theme are loaded, the renderer
+        # subclasses also write files to the output directory.
+        with redirect_stdout(sys.stderr):
+            PageTemplate.loadTemplates(renderer, document)
+        for template in set(renderer.values()):
+            try:
+                template.compile()
+            except (AttributeError, ValueError):
+                pass
+
+def run_job(job):
+    """
+    Run one job and describe its outcome
+
+    Each job is processed like a call to plastex, with a fresh
+    configuration and document.
+
+    Required Arguments:
+    job -- dictionary containing the command line arguments of plastex
+        in `argv', and its working directory in `cwd'
+
+    Returns:
+    dictionary containing the exit `status' of the job, and what it
+    printed to `stdout' and `stderr'
+
+    """
+    stdout, stderr = StringIO(), StringIO()
+    try:
+        # A job starting a server or submitting itself to one would block
+        # the worker running it
+        argv = list(job['argv'])
+        if argv and (argv[0] == 'serve' or argv[0].split('=', 1)[0] == '--client'):
+            raise ValueError('jobs cannot run %s' % argv[0].split('=', 1)[0])
+        with job_context(job.get('cwd') or os.getcwd(), stdout, stderr):
+            try:
+                status = main(argv) or 0
+            except SystemExit as exc:
+                if exc.code is None:
+                    status = 0
+                else:
+                    status = exc.code if isinstance(exc.code, int) else 1
+                if not isinstance(exc.code, (int, type(None))):
+                    print(exc.code, file=sys.stderr)
+            except Exception:
+                traceback.print_exc()
+                status = 1
+    except Exception as exc:
+        # The job was invalid or its working directory doesn't exist
+        print('plasTeX: %s' % exc, file=stderr)
+        status = 2
+    return {'status': status, 'stdout': stdout.getvalue(),
+            'stderr': stderr.getvalue()}
+
+def serve_stream(infile, outfile):
+    """ Run the jobs read as JSON lines from infile, replying to outfile """
+    for line in infile:
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+        except ValueError as exc:
+            reply = {'status': 2, 'stdout': '',
+                     'stderr': 'plasTeX: invalid job: %s\n' % exc}
+        else:
+            reply = run_job(job)
+        outfile.write(json.dumps(reply) + '\n')
+        outfile.flush()
+
+class JobHandler(socketserver.StreamRequestHandler):
+    """ Run the jobs sent on one connection to the server """
+    def handle(self):
+        infile = (line.decode('utf-8') for line in self.rfile)
+        outfile = self.wfile
+        class Writer(object):
+            def write(self, s):
+                outfile.write(s.encode('utf-8'))
+            def flush(self):
+                outfile.flush()
+        serve_stream(infile, Writer())
+
+def serve_socket(address):
+    """
+    Run the jobs of the clients connecting to a UNIX socket
+
+    Jobs are run one at a time, since they change the working directory
+    of the process.
+
+    """
+    if os.path.exists(address):
+        os.remove(address)
+    server = socketserver.UnixStreamServer(address, JobHandler)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        os.remove(address)
+
+def submit(address, argv):
+    """
+    Send a job to a plastex server and print its output
+
+    Required Arguments:
+    address -- the UNIX socket of the server
+    argv -- command line arguments of the job
+
+    Returns:
+    exit status of the job
+
+    """
+    job = {'argv': argv, 'cwd': os.getcwd()}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(address)
+            sock.sendall((json.dumps(job) + '\n').encode('utf-8'))
+            sock.shutdown(socket.SHUT_WR)
+            with sock.makefile('rb') as fh:
+                reply = json.loads(fh.readline().decode('utf-8'))
+    except (OSError, ValueError) as exc:
+        print('plasTeX: could not run the job on %s: %s' % (address, exc),
+              file=sys.stderr)
+        return 2
+    sys.stdout.write(reply.get('stdout', ''))
+    sys.stderr.write(reply.get('stderr', ''))
+    return reply.get('status', 1)
 
 def info(type, value, tb):
    if hasattr(sys, 'ps1') or not sys.stderr.isatty():
@@ -69,6 +265,8 @@ def info(type, value, tb):
 
 def plastex():
     try:
-        main(sys.argv[1:])
+        status = main(sys.argv[1:])
     except KeyboardInterrupt:
-        pass
+        status = None
+    if status:
+        sys.exit(status)
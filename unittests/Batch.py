@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from plasTeX.Compile import (batch_config, collect_renderer_config,
+                             config_values, format_summary, run_many)
+from plasTeX.Config import defaultConfig
+
+def make_config():
+    config = defaultConfig()
+    collect_renderer_config(config)
+    config['general']['renderer'] = 'Text'
+    return config
+
+def test_run_many(tmpdir):
+    for name in 'abc':
+        tmpdir.join('%s.tex' % name).write(r'''
+        \documentclass{article}
+        \begin{document}
+        Document %s
+        \end{document}
+        ''' % name)
+    files = ['a.tex', 'missing.tex', 'b.tex', 'c.tex']
+    seen = []
+    cwd = os.getcwd()
+    with tmpdir.as_cwd():
+        results = run_many(files, make_config(), workers=2,
+                           callback=seen.append)
+        assert os.getcwd() == str(tmpdir)
+    assert os.getcwd() == cwd
+
+    assert [x.filename for x in results] == files
+    assert sorted(x.filename for x in seen) == sorted(files)
+    assert [x.status for x in results] == [0, 1, 0, 0]
+    assert 'missing.tex' in results[1].error
+    for name in 'abc':
+        assert 'Document %s' % name in tmpdir.join(name, 'index.txt').read()
+    assert 'index.txt' in results[0].output
+
+    summary = format_summary(results)
+    assert '3 documents converted, 1 failed' in summary
+
+def test_same_directory(tmpdir):
+    config = make_config()
+    config['files']['directory'] = 'out'
+    with tmpdir.as_cwd(), pytest.raises(ValueError):
+        run_many(['a.tex', 'b.tex'], config)
+
+def test_config_values():
+    config = make_config()
+    config['general']['theme'] = 'minimal'
+    config['html5']['filters'] = ['cat']
+    copy = batch_config(config_values(config))
+    assert copy['general']['renderer'] == 'Text'
+    assert copy['general']['theme'] == 'minimal'
+    assert copy['html5']['filters'] == ['cat']
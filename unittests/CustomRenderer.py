@@ -73,3 +73,121 @@ class Renderer(BaseRenderer):
 
     result = (tmpdir/'test'/'index').read_text()
     assert result == "Test Renderer"
+
+def test_streamed_layout(tmpdir):
+    from plasTeX.TeX import TeX
+    from plasTeX.Renderers import Renderer as BaseRenderer
+
+    def layout(obj):
+        raise AssertionError('The layout should be streamed')
+    layout.generate = lambda obj: ['<html>', str(obj), '</html>']
+
+    renderer = BaseRenderer()
+    renderer['default-layout'] = layout
+    renderer['document'] = lambda obj: 'Body'
+
+    tex = TeX()
+    tex.input(r"""
+\documentclass{article}
+\begin{document}
+\end{document}
+""")
+    doc = tex.parse()
+    with tmpdir.as_cwd():
+        renderer.render(doc)
+        assert Path('index').read_text() == '<html>Body</html>'
+
+def test_several_renderers(tmpdir):
+    tmpdir = Path(str(tmpdir))
+    (tmpdir / "test.tex").write_text(r"""
+\documentclass{article}
+\begin{document}
+\section{Foo}\label{foo}
+See section~\ref{foo}.
+\end{document}
+""")
+    ret = subprocess.run(["plastex", "--renderer=HTML5 Text", "test.tex"],
+                         cwd=str(tmpdir), check=False)
+    assert ret.returncode == 0
+
+    assert "See section" in (tmpdir / "test" / "HTML5" / "foo.html").read_text()
+    assert "See section" in (tmpdir / "test" / "Text" / "foo.txt").read_text()
+
+def test_streamed_content(tmpdir):
+    from plasTeX.TeX import TeX
+    from plasTeX.Renderers import Renderer as BaseRenderer
+
+    def document(obj):
+        raise AssertionError('The content should be streamed')
+    def generate(obj):
+        assert 'One' not in str(obj), 'The content should be streamed'
+        return ['<body>', str(obj), '</body>']
+    document.generate = generate
+
+    renderer = BaseRenderer()
+    renderer['default-layout'] = lambda obj: '<html>%s</html>' % obj
+    renderer['document'] = document
+    renderer['par'] = lambda obj: '<p>%s</p>' % str(obj).strip()
+
+    tex = TeX()
+    tex.input(r"""
+\documentclass{article}
+\begin{document}
+One
+
+Two
+\end{document}
+""")
+    doc = tex.parse()
+    with tmpdir.as_cwd():
+        renderer.render(doc)
+        assert Path('index').read_text() == '<html><body><p>One</p><p>Two</p></body></html>'
+
+def test_streamed_layout_without_warnings(tmpdir, monkeypatch):
+    import plasTeX.Renderers
+    from plasTeX.TeX import TeX
+    from plasTeX.Renderers.HTML5 import Renderer
+
+    warnings = []
+    monkeypatch.setattr(plasTeX.Renderers.log, 'warning', warnings.append)
+    tex = TeX()
+    tex.input(r"""
+\documentclass{article}
+\title{The title}
+\begin{document}
+\maketitle
+\section{One}
+Some text
+\end{document}
+""")
+    doc = tex.parse()
+    doc.userdata['working-dir'] = str(tmpdir)
+    with tmpdir.as_cwd():
+        Renderer().render(doc)
+        assert 'Some text' in Path('sect0001.html').read_text()
+    assert warnings == []
+
+def test_failed_rendering_keeps_file(tmpdir):
+    import pytest
+    from plasTeX.TeX import TeX
+    from plasTeX.Renderers import Renderer as BaseRenderer
+
+    def document(obj):
+        raise RuntimeError('Rendering failed')
+
+    renderer = BaseRenderer()
+    renderer['document'] = document
+
+    tex = TeX()
+    tex.input(r"""
+\documentclass{article}
+\begin{document}
+\end{document}
+""")
+    doc = tex.parse()
+    with tmpdir.as_cwd():
+        Path('index').write_text('Previous output')
+        with pytest.raises(RuntimeError):
+            renderer.render(doc)
+        assert not [x for x in os.listdir('.') if x.endswith('.tmp')]
+        assert Path('index').read_text() == 'Previous output'
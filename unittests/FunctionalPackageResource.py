@@ -1,4 +1,3 @@
-import os
 from pathlib import Path
 
 from plasTeX.TeX import TeX
@@ -22,7 +21,7 @@ def test_package_resource(tmpdir):
             \end{document}""")
 
     doc = tex.parse()
-    doc.userdata['working-dir'] = os.path.dirname(__file__)
+    doc.userdata['working-dir'] = str(tmpdir)
 
     with tmpdir.as_cwd():
             Renderer().render(doc)
@@ -0,0 +1,60 @@
+import os
+import subprocess
+from pathlib import Path
+
+SOURCE = r"""
+\documentclass{article}
+\begin{document}
+\section{First}\label{first}
+First section, see section~\ref{second}.
+\section{Second}\label{second}
+%s
+\end{document}
+"""
+
+def render(tmpdir, body, renderer='HTML5'):
+    """
+    Render in a separate process, as generated IDs are only stable
+    from one process to the next.
+    """
+    (tmpdir/'test.tex').write_text(SOURCE % body, encoding='utf-8')
+    with tmpdir.as_cwd():
+        subprocess.run(['plastex', '--incremental', '--split-level', '1',
+                        '--no-theme-extras', '--renderer', renderer,
+                        'test.tex'], check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def test_unchanged_files_are_not_rewritten(tmpdir):
+    render(tmpdir, 'Second section.')
+    out = Path(str(tmpdir))/'test'
+    assert (Path(str(tmpdir))/'test.HTML5.pmanifest').exists()
+    first, second = out/'first.html', out/'second.html'
+    os.utime(str(first), ns=(0, 0))
+    os.utime(str(second), ns=(0, 0))
+
+    render(tmpdir, 'Second section, edited.')
+    assert first.stat().st_mtime_ns == 0
+    assert second.stat().st_mtime_ns != 0
+    assert 'edited' in second.read_text()
+    assert 'second.html' in first.read_text()
+
+def test_structure_change_rewrites_everything(tmpdir):
+    render(tmpdir, 'Second section.')
+    first = Path(str(tmpdir))/'test'/'first.html'
+    os.utime(str(first), ns=(0, 0))
+
+    render(tmpdir, 'Second section.\n\\section{Third}')
+    assert first.stat().st_mtime_ns != 0
+
+def test_several_renderers(tmpdir):
+    render(tmpdir, 'Second section.', 'HTML5 XHTML')
+    assert (Path(str(tmpdir))/'test.HTML5.pmanifest').exists()
+    assert (Path(str(tmpdir))/'test.XHTML.pmanifest').exists()
+    out = Path(str(tmpdir))/'test'
+    files = [out/'HTML5'/'first.html', out/'XHTML'/'first.html']
+    for path in files:
+        os.utime(str(path), ns=(0, 0))
+
+    render(tmpdir, 'Second section, edited.', 'HTML5 XHTML')
+    assert all(path.stat().st_mtime_ns == 0 for path in files)
+    assert 'edited' in (out/'XHTML'/'second.html').read_text()
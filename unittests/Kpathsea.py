@@ -0,0 +1,122 @@
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import plasTeX.Kpathsea
+from plasTeX.Kpathsea import FileResolver, Unresolved
+from plasTeX.TeX import TeX
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """ TeX tree with an ls-R database """
+    root = tmp_path / 'texmf'
+    for path in ['tex/latex/foo/foo.sty', 'tex/latex/bar/bar.sty',
+                 'tex/generic/bar/bar.sty', 'doc/latex/foo/foo.sty']:
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text('% ' + path)
+    (root / 'ls-R').write_text('''% ls-R -- filename database for kpathsea; do not change this line.
+./:
+doc
+tex
+
+./tex/latex/foo:
+foo.sty
+
+./tex/latex/bar:
+bar.sty
+
+./tex/generic/bar:
+bar.sty
+
+./doc/latex/foo:
+foo.sty
+''')
+    return root
+
+def test_database(tree):
+    resolver = FileResolver()
+    texinputs = '!!%s/tex//' % tree
+    assert resolver.find('foo.sty', texinputs) == str(tree / 'tex/latex/foo/foo.sty')
+    assert resolver.find('missing.sty', texinputs) is None
+    with pytest.raises(Unresolved):
+        resolver.find('bar.sty', texinputs)
+    assert resolver.find('bar.sty', '!!%s/tex/generic//' % tree) == \
+           str(tree / 'tex/generic/bar/bar.sty')
+
+def test_local_first(tree, tmp_path):
+    local = tmp_path / 'local'
+    local.mkdir()
+    (local / 'foo.sty').write_text('')
+    (local / 'chapter.tex').write_text('')
+    (local / 'chapter').write_text('')
+    resolver = FileResolver()
+    texinputs = os.pathsep.join([str(local), '!!%s/tex//' % tree])
+    assert resolver.find('foo.sty', texinputs) == str(local / 'foo.sty')
+    assert resolver.find('chapter', texinputs) == str(local / 'chapter.tex')
+
+def test_recursive_directory(tmp_path):
+    (tmp_path / 'a' / 'b').mkdir(parents=True)
+    (tmp_path / 'a' / 'b' / 'deep.tex').write_text('')
+    resolver = FileResolver()
+    assert resolver.find('deep.tex', '%s//' % (tmp_path / 'a')) == \
+           str(tmp_path / 'a' / 'b' / 'deep.tex')
+
+def test_unsupported(tmp_path):
+    resolver = FileResolver()
+    with pytest.raises(Unresolved):
+        resolver.find('refs.bib', str(tmp_path))
+    with pytest.raises(Unresolved):
+        resolver.find('foo.sty', '$TEXMF/tex//')
+
+def test_memoized(tmp_path):
+    (tmp_path / 'once.tex').write_text('')
+    resolver = FileResolver()
+    assert resolver.find('once.tex', str(tmp_path)) == str(tmp_path / 'once.tex')
+    (tmp_path / 'once.tex').unlink()
+    assert resolver.find('once.tex', str(tmp_path)) == str(tmp_path / 'once.tex')
+
+def test_default_path(tree, monkeypatch):
+    monkeypatch.setattr(plasTeX.Kpathsea, '_defaultPaths',
+                        {'kpsewhich': ['.', '!!%s/tex/latex//' % tree]})
+    assert FileResolver().find('foo.sty', '') == str(tree / 'tex/latex/foo/foo.sty')
+
+def test_input_without_subprocess(tmpdir, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('kpsewhich was run')
+    monkeypatch.setattr(subprocess, 'Popen', fail)
+    with tmpdir.as_cwd():
+        Path('input.tex').write_text(r'''
+\documentclass{article}
+\begin{document}
+\input{chapter1}
+\input{chapter1}
+\end{document}
+''')
+        Path('chapter1.tex').write_text('Chapter')
+        tex = TeX(file='input.tex')
+        assert tex.parse().textContent.split() == ['Chapter', 'Chapter']
+
+def test_suffix_only_without_extension(tmp_path):
+    (tmp_path / 'notes.txt').write_text('')
+    (tmp_path / 'notes.txt.tex').write_text('')
+    resolver = FileResolver()
+    assert resolver.find('notes.txt', str(tmp_path)) == str(tmp_path / 'notes.txt')
+
+def test_missing_file_asks_kpsewhich(tmpdir, monkeypatch):
+    calls = []
+    class Kpsewhich(object):
+        def __init__(self, args, **kwargs):
+            calls.append(args)
+        def communicate(self):
+            return (b'', None)
+    monkeypatch.setattr(subprocess, 'Popen', Kpsewhich)
+    monkeypatch.setattr(plasTeX.Kpathsea, '_defaultPaths',
+                        {'kpsewhich': [str(tmpdir)]})
+    with tmpdir.as_cwd():
+        tex = TeX()
+        with pytest.raises(OSError):
+            tex.kpsewhich('missing.sty')
+    assert calls == [['kpsewhich', 'missing.sty']]
@@ -99,3 +99,76 @@ def test_crazy_package_name():
     ctx = Context()
     tex = TeX()
     assert not ctx.loadPackage(tex, 'rlcompleter')
+
+def test_package_resolution_cached(tmpdir, monkeypatch):
+    import plasTeX.Context
+    calls = []
+    real_import = plasTeX.Context.import_module
+    def counting_import(name):
+        calls.append(name)
+        return real_import(name)
+    monkeypatch.setattr(plasTeX.Context, 'import_module', counting_import)
+
+    tmpdir = Path(str(tmpdir))
+    for i in range(2):
+        doc = TeXDocument()
+        doc.config['general'].data['packages-dirs'].value = [str(tmpdir)]
+        tex = TeX(doc)
+        assert not doc.context.loadPackage(tex, 'nosuchpackage')
+        assert doc.context.loadPackage(tex, 'float')
+    assert calls.count('plasTeX.Packages.float') == 1
+    assert not [x for x in calls if 'nosuchpackage' in x]
+
+    # Adding a package to the packages-dirs invalidates the results
+    (tmpdir / "nosuchpackage.py").write_text(
+    r"""
+from plasTeX import Command
+
+class nosuchcmd(Command):
+    pass
+""")
+    doc = TeXDocument()
+    doc.config['general'].data['packages-dirs'].value = [str(tmpdir)]
+    assert doc.context.loadPackage(TeX(doc), 'nosuchpackage')
+    assert 'nosuchcmd' in doc.context
+
+def test_ini_definitions_cached(tmpdir):
+    import os
+    tmpdir = Path(str(tmpdir))
+    (tmpdir / "inipkg.py").write_text("")
+    ini = tmpdir / "inipkg.ini"
+    ini.write_text("[Command]\ninicmd=self\ninistr=str(65)\n")
+
+    def load():
+        doc = TeXDocument()
+        doc.config['general'].data['packages-dirs'].value = [str(tmpdir)]
+        assert doc.context.loadPackage(TeX(doc), 'inipkg')
+        return doc.context
+
+    first, second = load(), load()
+    assert first['inicmd'] is second['inicmd']
+    assert first['inicmd'].args == 'self'
+    assert first['inistr'].str == 'A'
+
+    ini.write_text("[Environment]\ninicmd=[ opt ] self\n")
+    os.utime(str(ini), (0, 0))
+    third = load()
+    assert third['inicmd'] is not first['inicmd']
+    assert third['inicmd'].args == '[ opt ] self'
+
+def test_ini_classes_of_document_macros_not_kept(tmpdir, monkeypatch):
+    import plasTeX.Context
+    from plasTeX import Command
+    monkeypatch.setattr(plasTeX.Context, '_iniClasses', {})
+    tmpdir = Path(str(tmpdir))
+    (tmpdir / "localpkg.py").write_text("")
+    (tmpdir / "localpkg.ini").write_text("[localbase]\ninicmd=self\n"
+                                       "[Command]\nglobalcmd=self\n")
+
+    doc = TeXDocument()
+    doc.config['general'].data['packages-dirs'].value = [str(tmpdir)]
+    doc.context.importMacros({'localbase': type('localbase', (Command,), {})})
+    assert doc.context.loadPackage(TeX(doc), 'localpkg')
+    assert issubclass(doc.context['inicmd'], doc.context['localbase'])
+    assert doc.context['inicmd'].args == 'self'
+    assert [key[1] for key in plasTeX.Context._iniClasses] == ['globalcmd']
@@ -4,7 +4,8 @@ from pathlib import Path
 from pathlib import Path
 from plasTeX.TeX import TeX, TeXDocument
 from plasTeX.Context import Context
-from plasTeX.Renderers.PageTemplate import Renderer
+import plasTeX.Renderers.PageTemplate as PageTemplate
+from plasTeX.Renderers.PageTemplate import Renderer, LazyTemplate, jinja2template
 
 def test_templates_dir(tmpdir):
     doc = TeXDocument()
@@ -53,3 +54,82 @@ def test_theme_dir(tmpdir):
     text = (tmpdir/'index.xml').read_text()
     os.chdir(cwd)
     assert text == 'Yo.'
+
+def test_templates_compiled_lazily(tmpdir):
+    doc = TeXDocument()
+    tmpdir = Path(tmpdir)
+    extras = tmpdir/'templates'
+    extras.mkdir()
+    (extras/'lazy.jinja2s').write_text("""
+name: quote
+<div class="quote">{{ obj }}</div>
+
+name: unusedmacro
+{% if %}broken
+""")
+    doc.config['general'].data['extra-templates'].value = [str(extras)]
+    tex = TeX(doc)
+    tex.input(r"""
+        \documentclass{article}
+        \begin{document}
+          \begin{quote}Cogito ergo sum.\end{quote}
+        \end{document}
+        """)
+    renderer = Renderer()
+    cwd = os.getcwd()
+    os.chdir(str(tmpdir))
+    renderer.render(tex.parse())
+    text = (tmpdir/'index.xml').read_text()
+    os.chdir(cwd)
+    assert '<div class="quote">' in text
+    # The broken template was never looked up, so it was never compiled
+    assert isinstance(renderer['unusedmacro'], LazyTemplate)
+    assert renderer['unusedmacro'].function is None
+    assert not isinstance(renderer['quote'], LazyTemplate)
+
+def test_pure_templates_memoized(tmpdir):
+    doc = TeXDocument()
+    tmpdir = Path(tmpdir)
+    extras = tmpdir/'templates'
+    extras.mkdir()
+    (extras/'pure.jinja2s').write_text("""
+name: textbf
+pure: yes
+<b>{{ obj }}</b>
+""")
+    doc.config['general'].data['extra-templates'].value = [str(extras)]
+    doc.config['general']['memoize-templates'] = True
+    tex = TeX(doc)
+    tex.input(r"""
+        \documentclass{article}
+        \begin{document}
+          \textbf{a} \textbf{a} \textbf{b}
+        \end{document}
+        """)
+    renderer = Renderer()
+    calls = []
+    def counting_template(s):
+        template = jinja2template(s)
+        def render(obj):
+            calls.append(obj.nodeName)
+            return template(obj)
+        return render
+    renderer.registerEngine('jinja2', None, '.jinja2', counting_template)
+    cwd = os.getcwd()
+    os.chdir(str(tmpdir))
+    renderer.render(tex.parse())
+    text = (tmpdir/'index.xml').read_text()
+    os.chdir(cwd)
+    assert text.count('<b>a</b>') == 2
+    assert '<b>b</b>' in text
+    assert calls.count('textbf') == 2
+
+def test_shared_templates_bounded(monkeypatch):
+    monkeypatch.setattr(PageTemplate, 'sharedTemplates', PageTemplate.OrderedDict())
+    monkeypatch.setattr(PageTemplate, 'SHARED_TEMPLATES', 2)
+    renderer = Renderer()
+    renderer.aliases = {}
+    for name in ['one', 'two', 'one', 'three']:
+        renderer.setTemplate(name, {'name': name})
+    sources = [key[1] for key in PageTemplate.sharedTemplates]
+    assert sources == ['one', 'three']
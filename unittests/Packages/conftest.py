@@ -43,7 +43,9 @@ def renderXHTML():
     def runRenderer(tmpdir, doc):
         # Create document file
 
-        # Run plastex on the document
+        # Run plastex on the document.  The .paux file goes to the working
+        # directory.
+        doc.userdata['working-dir'] = str(tmpdir)
         with tmpdir.as_cwd():
             Renderer().render(doc)
 
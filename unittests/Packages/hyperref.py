@@ -53,7 +53,7 @@ This section is not numbered.
 \end{document}
     """)
     doc = tex.parse()
-    doc.userdata['working-dir'] = Path(__file__).parent
+    doc.userdata['working-dir'] = str(tmpdir)
 
     with tmpdir.as_cwd():
             Renderer().render(doc)
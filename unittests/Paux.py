@@ -0,0 +1,91 @@
+import pickle
+
+import plasTeX.Paux
+
+from plasTeX.TeX import TeX
+from plasTeX.Paux import isDatabase, read, write
+
+def make_paux(filename, rtype='HTML5'):
+    tex = TeX()
+    tex.input(r'''
+    \documentclass{article}
+    \begin{document}
+    \section{One}\label{one}
+    \section{Two}\label{two}
+    \end{document}
+    ''')
+    doc = tex.parse()
+    for node in doc.getElementsByTagName('section'):
+        node.url = 'index.html#%s' % node.id
+    doc.context.persist(filename, rtype)
+
+def test_lazy_restore(tmpdir):
+    filename = str(tmpdir.join('other.paux'))
+    make_paux(filename)
+    assert isDatabase(filename)
+
+    tex = TeX()
+    context = tex.ownerDocument.context
+    context.restore(filename, 'HTML5')
+    assert not dict(context.labels)
+
+    tex.input(r'''
+    \documentclass{article}
+    \begin{document}
+    See \ref{two}.
+    \end{document}
+    ''')
+    doc = tex.parse()
+    ref = doc.getElementsByTagName('ref')[0]
+    assert ref.idref['label'].id == 'two'
+    assert ref.idref['label'].urloverride == 'index.html#two'
+    assert list(dict(context.labels)) == ['two']
+    assert 'one' in context.labels
+    assert 'three' not in context.labels
+
+def test_labels_read_from_one_connection(tmpdir, monkeypatch):
+    filename = str(tmpdir.join('other.paux'))
+    make_paux(filename)
+    connections = []
+    connect = plasTeX.Paux.connect
+    def counting_connect(*args, **kwargs):
+        connections.append(kwargs.get('readonly', False))
+        return connect(*args, **kwargs)
+    monkeypatch.setattr(plasTeX.Paux, 'connect', counting_connect)
+
+    tex = TeX()
+    context = tex.ownerDocument.context
+    context.restore(filename, 'HTML5')
+    # Rewriting the file, like another document converted at the same
+    # time, changes its rows
+    make_paux(filename, 'Text')
+    make_paux(filename, 'HTML5')
+    assert context.labels['one'].urloverride == 'index.html#one'
+    assert context.labels['two'].urloverride == 'index.html#two'
+    assert connections.count(True) == 1
+
+def test_replace_renderer_labels(tmpdir):
+    filename = str(tmpdir.join('doc.paux'))
+    make_paux(filename, 'HTML5')
+    make_paux(filename, 'Text')
+    write(filename, 'Text', {'three': {'ref': '3'}})
+    data = read(filename)
+    assert sorted(data['HTML5']) == ['one', 'two']
+    assert data['Text'] == {'three': {'ref': '3'}}
+
+def test_legacy_format(tmpdir):
+    filename = str(tmpdir.join('old.paux'))
+    with open(filename, 'wb') as fh:
+        pickle.dump({'HTML5': {'old': {'macroName': 'section', 'ref': '7'}},
+                     'Text': {'old': {'ref': '8'}}}, fh)
+
+    tex = TeX()
+    context = tex.ownerDocument.context
+    context.restore(filename, 'HTML5')
+    assert context.labels['old'].ref == '7'
+
+    write(filename, 'HTML5', {'new': {'ref': '1'}})
+    assert isDatabase(filename)
+    data = read(filename)
+    assert data == {'HTML5': {'new': {'ref': '1'}},
+                    'Text': {'old': {'ref': '8'}}}
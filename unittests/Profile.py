@@ -0,0 +1,65 @@
+import json
+
+from plasTeX.TeX import TeX
+from plasTeX.Profile import Profiler
+from plasTeX.Renderers.Text import Renderer
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def test_nested_timings():
+    clock = FakeClock()
+    profiler = Profiler(clock)
+    profiler.start('invoke', 'outer')
+    clock.now += 1
+    profiler.start('invoke', 'inner')
+    clock.now += 2
+    profiler.start('invoke', 'inner')
+    clock.now += 3
+    profiler.stop()
+    profiler.stop()
+    assert profiler.current == 'outer'
+    profiler.stop()
+    assert profiler.current is None
+
+    results = {x['name']: x for x in profiler.results()}
+    assert results['outer']['total'] == 6
+    assert results['outer']['own'] == 1
+    # Recursive calls are only counted once in the total time
+    assert results['inner']['count'] == 2
+    assert results['inner']['total'] == 5
+    assert results['inner']['own'] == 5
+    assert [x['name'] for x in profiler.results()] == ['inner', 'outer']
+
+def test_document_profile(tmpdir):
+    tex = TeX()
+    doc = tex.ownerDocument
+    doc.profiler = Profiler()
+    doc.userdata['working-dir'] = str(tmpdir)
+    tex.input(r'''
+    \documentclass{article}
+    \begin{document}
+    \section{First}
+    \begin{itemize}\item one\end{itemize}
+    \end{document}
+    ''')
+    tex.parse()
+    Renderer().render(doc, directory=str(tmpdir))
+
+    kinds = {(x['kind'], x['name']): x['count']
+             for x in doc.profiler.results()}
+    assert kinds[('invoke', 'section')] == 1
+    assert kinds[('parse', 'section')] == 1
+    # \end{itemize} isn't counted, since its digest does nothing
+    assert kinds[('digest', 'itemize')] == 1
+    assert kinds[('digest', 'item')] == 1
+    assert kinds[('render', 'section')] == 1
+    assert not doc.profiler.stack
+
+    doc.profiler.write(str(tmpdir.join('doc.profile')))
+    data = json.loads(tmpdir.join('doc.profile.json').read())
+    assert {'kind', 'name', 'count', 'total', 'own'} == set(data[0])
+    assert 'invoke   section' in tmpdir.join('doc.profile.txt').read()
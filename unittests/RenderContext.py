@@ -0,0 +1,64 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from plasTeX.DOM import Node
+from plasTeX.TeX import TeX
+from plasTeX.Renderers import RenderContext, Renderable, currentRenderContext
+from plasTeX.Renderers.Text import Renderer
+
+def parse(text, directory):
+    tex = TeX()
+    # The .paux file goes to the working directory
+    tex.ownerDocument.userdata['working-dir'] = str(directory)
+    tex.input(r'''
+    \documentclass{article}
+    \begin{document}
+    %s
+    \section{First}
+    \end{document}
+    ''' % text)
+    return tex.parse()
+
+def test_render_to_directory(tmpdir):
+    cwd = os.getcwd()
+    Renderer().render(parse('Some text', tmpdir), directory=str(tmpdir))
+    assert os.getcwd() == cwd
+    assert 'Some text' in tmpdir.join('index.txt').read()
+    assert currentRenderContext() is None
+    with pytest.raises(AttributeError):
+        Node().renderer
+
+def test_concurrent_renderings(tmpdir):
+    cwd = os.getcwd()
+    names = ['doc%d' % i for i in range(6)]
+    documents = [parse('Text of %s' % name, tmpdir.mkdir(name))
+                 for name in names]
+
+    def render(name, document):
+        Renderer().render(document, directory=str(tmpdir.join(name)))
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        for future in [pool.submit(render, name, document)
+                       for name, document in zip(names, documents)]:
+            future.result()
+
+    assert os.getcwd() == cwd
+    for name in names:
+        output = tmpdir.join(name, 'index.txt').read()
+        assert 'Text of %s' % name in output
+        assert tmpdir.join(name, 'sect0001.txt').exists()
+
+class OtherRenderer(Renderer):
+    renderableClass = type('OtherRenderable', (Renderable,), {})
+
+def test_nested_rendering_with_other_renderer(tmpdir):
+    document = parse('Some text', tmpdir)
+    with RenderContext(Renderer(), document, str(tmpdir)):
+        with pytest.raises(RuntimeError):
+            OtherRenderer().render(document, directory=str(tmpdir.join('other')))
+        assert currentRenderContext().directory == str(tmpdir)
+    assert currentRenderContext() is None
+    Renderer().render(document, directory=str(tmpdir))
+    assert 'Some text' in tmpdir.join('index.txt').read()
@@ -0,0 +1,91 @@
+import json
+import os
+import socketserver
+import threading
+
+import plasTeX.client
+from plasTeX import Logging
+from plasTeX.client import JobHandler, run_job, serve_stream, submit
+
+SOURCE = r'''
+\documentclass{article}
+\begin{document}
+Hello world
+\end{document}
+'''
+
+def test_run_job(tmpdir):
+    tmpdir.join('doc.tex').write(SOURCE)
+    cwd = os.getcwd()
+    reply = run_job({'argv': ['--renderer', 'Text', 'doc.tex'],
+                     'cwd': str(tmpdir)})
+    assert reply['status'] == 0, reply['stderr']
+    assert 'plasTeX version' in reply['stdout']
+    assert 'Hello world' in tmpdir.join('doc', 'index.txt').read()
+    assert os.getcwd() == cwd
+
+def test_jobs_isolated(tmpdir):
+    tmpdir.join('doc.tex').write(SOURCE)
+    handlers = {name: list(logger.handlers)
+                for name, logger in Logging._loggers.items()}
+
+    # --log replaces the handlers of all loggers
+    reply = run_job({'argv': ['--renderer', 'Text', '--log', 'doc.tex'],
+                     'cwd': str(tmpdir)})
+    assert reply['status'] == 0, reply['stderr']
+    assert tmpdir.join('doc.log').exists()
+    for name, logger in Logging._loggers.items():
+        if name in handlers:
+            assert logger.handlers == handlers[name]
+
+    reply = run_job({'argv': ['--no-such-option', 'doc.tex'],
+                     'cwd': str(tmpdir)})
+    assert reply['status'] == 2
+    assert '--no-such-option' in reply['stderr']
+
+def test_exit_status(tmpdir, monkeypatch):
+    def exit(code):
+        def main(argv):
+            raise SystemExit(code)
+        return main
+    statuses = []
+    for code in [None, 0, 3, 'failed']:
+        monkeypatch.setattr(plasTeX.client, 'main', exit(code))
+        statuses.append(run_job({'argv': [], 'cwd': str(tmpdir)})['status'])
+    assert statuses == [0, 0, 3, 1]
+
+def test_nested_server_rejected(tmpdir):
+    for argv in [['serve'], ['--client', 'socket', 'doc.tex'],
+                 ['--client=socket', 'doc.tex']]:
+        reply = run_job({'argv': argv, 'cwd': str(tmpdir)})
+        assert reply['status'] == 2
+        assert 'jobs cannot run' in reply['stderr']
+
+def test_serve_stream(tmpdir):
+    tmpdir.join('doc.tex').write(SOURCE)
+    jobs = [json.dumps({'argv': ['--renderer', 'Text', 'doc.tex'],
+                        'cwd': str(tmpdir)}),
+            'not json',
+            json.dumps({'argv': ['missing.tex'], 'cwd': str(tmpdir/'missing')})]
+    output = tmpdir.join('replies')
+    with open(str(output), 'w') as fh:
+        serve_stream(iter(jobs), fh)
+    replies = [json.loads(x) for x in output.read().splitlines()]
+    assert [x['status'] for x in replies] == [0, 2, 2]
+
+def test_client(tmpdir, capsys):
+    tmpdir.join('doc.tex').write(SOURCE)
+    address = str(tmpdir/'socket')
+    server = socketserver.UnixStreamServer(address, JobHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        with tmpdir.as_cwd():
+            status = submit(address, ['--renderer', 'Text', 'doc.tex'])
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+    assert status == 0
+    assert 'plasTeX version' in capsys.readouterr().out
+    assert 'Hello world' in tmpdir.join('doc', 'index.txt').read()
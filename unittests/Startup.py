@@ -0,0 +1,64 @@
+import plasTeX.Context
+from plasTeX.Context import LanguageParser
+from plasTeX.TeX import TeX
+
+def parse(source):
+    tex = TeX()
+    tex.input(source)
+    return tex.parse()
+
+def test_documents_have_separate_contexts():
+    doc = parse(r'\newcommand{\foo}{bar}\foo')
+    assert doc.textContent == 'bar'
+    assert 'foo' in doc.context
+    assert 'foo' not in TeX().ownerDocument.context
+    assert 'section' in TeX().ownerDocument.context
+
+def test_base_macros_shared():
+    first = TeX().ownerDocument.context
+    second = TeX().ownerDocument.context
+    assert first.contexts[0] is not second.contexts[0]
+    assert first['section'] is second['section']
+
+def test_language_files_parsed_once(monkeypatch):
+    calls = []
+    parse_files = LanguageParser.parse
+    def counting_parse(self, files, encoding='UTF-8'):
+        calls.append(files)
+        return parse_files(self, files, encoding)
+    monkeypatch.setattr(LanguageParser, 'parse', counting_parse)
+    monkeypatch.setattr(plasTeX.Context, '_languageTables', {})
+
+    source = r'\documentclass{article}\begin{document}\chaptername\end{document}'
+    assert parse(source).textContent.strip() == 'Chapter'
+    assert parse(source).textContent.strip() == 'Chapter'
+    assert len(calls) == 1
+
+def test_terms_not_shared():
+    source = r'\documentclass{article}\begin{document}\chaptername\end{document}'
+    first = parse(source)
+    first.context.terms['proof'] = 'Demonstration'
+    second = parse(source)
+    assert second.context.terms['proof'] == 'Proof'
+    assert second.textContent.strip() == 'Chapter'
+
+def test_registry_up_to_date():
+    from plasTeX.Base import registry
+    from plasTeX.Base.makeregistry import registry as compute
+    data = compute()
+    for name in ['BASE', 'LATEX', 'TEX', 'MACROS']:
+        assert getattr(registry, name) == data[name], \
+            'Run python -m plasTeX.Base.makeregistry'
+
+def test_macro_modules_imported_on_first_use():
+    import subprocess, sys
+    code = '''
+import sys
+from plasTeX.TeX import TeX
+tex = TeX()
+assert "plasTeX.Base.LaTeX.Tabbing" not in sys.modules
+assert "tabbing" in tex.ownerDocument.context
+tex.ownerDocument.context["tabbing"]
+assert "plasTeX.Base.LaTeX.Tabbing" in sys.modules
+'''
+    subprocess.run([sys.executable, '-c', code], check=True)
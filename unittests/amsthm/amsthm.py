@@ -15,7 +15,7 @@ def test_amsthm(tmpdir):
     tex = TeX(TeXDocument(config=config))
     tex.input((root/'source.tex').read_text())
     doc = tex.parse()
-    doc.userdata['working-dir'] = Path(__file__).parent
+    doc.userdata['working-dir'] = str(tmpdir)
 
     with tmpdir.as_cwd():
             Renderer().render(doc)
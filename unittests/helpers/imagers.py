@@ -0,0 +1,134 @@
+"""
+Imagers for tests, which draw a square for each image instead of running
+LaTeX and a converter
+"""
+import os
+import re
+import stat
+import sys
+
+from PIL import Image as PILImage
+
+from plasTeX.TeX import TeX
+from plasTeX.Imagers import Imager
+
+# Script standing for latex.  It logs its arguments to $FAKE_LATEX_LOG and
+# lists the images of the document in images.csv.  With -ini, it writes a
+# format whose recorded inputs are the source and $FAKE_LATEX_STY.
+FAKE_LATEX = '''#!%s
+import os, re, sys
+args = sys.argv[1:]
+if '--version' in args:
+    print('fake latex')
+    sys.exit(0)
+with open(os.environ['FAKE_LATEX_LOG'], 'a') as fh:
+    fh.write(' '.join(args) + '\\n')
+source = open(args[-1]).read()
+if '-ini' in args:
+    job = [x for x in args if x.startswith('-jobname=')][0][len('-jobname='):]
+    open(job + '.fmt', 'w').write(source)
+    open(job + '.fls', 'w').write('INPUT %%s\\nINPUT %%s\\n' %%
+        (os.path.abspath(args[-1]), os.environ['FAKE_LATEX_STY']))
+    sys.exit(0)
+if any(x.startswith('-fmt=') for x in args) and '\\\\documentclass' in source:
+    sys.exit('preamble not expected')
+with open('images.csv', 'w') as fh:
+    for page, (dest, scale) in enumerate(re.findall(
+            r'\\\\begin\\{plasTeXimage\\}\\{(.*?)\\}\\{(.*?)\\}', source), 1):
+        fh.write('%%d,%%s,%%s\\n' %% (page, dest, scale))
+''' % sys.executable
+
+def install_fake_latex(tmpdir, monkeypatch):
+    """Put FAKE_LATEX first in the PATH, and return the file logging its
+    calls."""
+    bindir = tmpdir.mkdir('bin')
+    latex = bindir/'latex'
+    latex.write(FAKE_LATEX)
+    latex.chmod(latex.stat().mode | stat.S_IEXEC)
+    log = tmpdir/'log'
+    monkeypatch.setenv('PATH', str(bindir) + os.pathsep + os.environ['PATH'])
+    monkeypatch.setenv('FAKE_LATEX_LOG', str(log))
+    return log
+
+def draw_images(color=(0, 0, 0)):
+    """Draw a registration mark and a square of the given color for each
+    page listed in images.csv, and return the (src, dest) pairs like
+    Imager.executeConverter."""
+    images = []
+    with open('images.csv') as fh:
+        for line in fh:
+            page, dest, _ = line.split(',')
+            im = PILImage.new('RGB', (60, 40), 'white')
+            # Registration mark on the left, then the content
+            im.paste((0, 0, 0), (5, 10, 8, 25))
+            im.paste(color, (12, 12, 40, 30))
+            im.save('img%s.png' % page)
+            images.append(('img%s.png' % page, dest))
+    return images
+
+class SquareImager(Imager):
+    """ Imager running latex, then drawing a square for each image """
+    fileExtension = '.png'
+
+    def executeConverter(self, outfile=None):
+        return draw_images()
+
+class FakeImager(Imager):
+    """ Imager drawing a square for each image, without running LaTeX
+
+    The destinations of the images of each LaTeX run are appended to
+    `batches', and `generated' counts the images drawn.  Sources
+    containing FAIL fail to compile.  The squares are drawn in `color'.
+
+    """
+    fileExtension = '.png'
+    batches = []
+    generated = 0
+    color = (0, 0, 0)
+
+    def compileLatex(self, texinputs=''):
+        source = self.tmpFile.read_text()
+        if 'FAIL' in source:
+            raise RuntimeError('Compilation failed')
+        images = re.findall(r'\\begin\{plasTeXimage\}\{(.*?)\}\{(.*?)\}', source)
+        FakeImager.batches.append([dest for dest, _ in images])
+        with open('images.csv', 'w') as fh:
+            for page, (dest, scale) in enumerate(images, 1):
+                fh.write('%d,%s,%s\n' % (page, dest, scale))
+
+    def executeConverter(self, outfile=None):
+        images = draw_images(self.color)
+        FakeImager.generated += len(images)
+        return images
+
+def make_images(directory, source, config=None, imager=FakeImager):
+    """Generate the images of the math nodes of source in directory.
+
+    Required Arguments:
+    directory -- the output directory, created if needed
+    source -- the body of the document
+
+    Keyword Arguments:
+    config -- values of the options of the images section
+    imager -- the class of the imager
+
+    Returns:
+    the images
+
+    """
+    tex = TeX()
+    for key, value in (config or {}).items():
+        tex.ownerDocument.config['images'][key] = value
+    tex.input(r'''
+    \documentclass{article}
+    \begin{document}
+    %s
+    \end{document}
+    ''' % source)
+    doc = tex.parse()
+    directory.ensure(dir=True)
+    with directory.as_cwd():
+        imager = imager(doc)
+        images = [imager.newImage(node) for node in doc.getElementsByTagName('math')]
+        imager.close()
+    return images
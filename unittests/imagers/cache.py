@@ -0,0 +1,62 @@
+import sys
+from hashlib import md5
+from pathlib import Path
+
+import plasTeX.Imagers
+
+# Add the unittests directory to the sys path so that the helpers module
+# can be imported when this test is run on its own.
+sys.path.append(str(Path(__file__).parent.parent))
+
+from helpers.imagers import FakeImager, make_images
+
+CACHE = {'cache': True}
+
+def test_only_new_images_compiled(tmpdir):
+    FakeImager.batches = []
+    first = make_images(tmpdir, '$a$ $b$', CACHE)
+    second = make_images(tmpdir, '$a$ $c$ $b$', CACHE)
+    assert FakeImager.batches == [['images/img-0001.png', 'images/img-0002.png'],
+                                  ['images/img-0003.png']]
+    assert [img.filename for img in second] == \
+           ['images/img-0001.png', 'images/img-0003.png', 'images/img-0002.png']
+    assert all(Path(str(tmpdir/img.filename)).exists() for img in second)
+
+def test_missing_image_compiled_again(tmpdir):
+    FakeImager.batches = []
+    make_images(tmpdir, '$a$ $b$', CACHE)
+    (tmpdir/'images'/'img-0002.png').remove()
+    make_images(tmpdir, '$a$ $b$', CACHE)
+    assert FakeImager.batches[1] == ['images/img-0002.png']
+
+def test_unreadable_cache(tmpdir):
+    FakeImager.batches = []
+    make_images(tmpdir, '$a$', CACHE)
+    (tmpdir/'.cache'/'FakeImager.images').write_binary(b'garbage')
+    make_images(tmpdir, '$a$', CACHE)
+    assert FakeImager.batches == [['images/img-0001.png'], ['images/img-0001.png']]
+
+def test_checksums(tmpdir):
+    images = make_images(tmpdir, '$a$ $b$ $c$', CACHE)
+    for img in images:
+        assert img._cropped
+        assert img.checksum == md5((tmpdir/img.filename).read_binary()).digest()
+
+def test_unchanged_images_not_hashed(tmpdir, monkeypatch):
+    make_images(tmpdir, '$a$ $b$', CACHE)
+    hashed = []
+    def counting_md5(data=b''):
+        hashed.append(data)
+        return md5(data)
+    monkeypatch.setattr(plasTeX.Imagers, 'md5', counting_md5)
+    make_images(tmpdir, '$a$ $b$ $c$', CACHE)
+    assert len(hashed) == 1
+
+def test_changed_image_detected(tmpdir, monkeypatch):
+    make_images(tmpdir, '$a$', CACHE)
+    (tmpdir/'images'/'img-0001.png').write_binary(b'changed')
+    warnings = []
+    monkeypatch.setattr(plasTeX.Imagers.log, 'warning',
+                        lambda msg, *args: warnings.append(msg % args))
+    make_images(tmpdir, '$a$ $b$', CACHE)
+    assert any('has changed' in msg for msg in warnings)
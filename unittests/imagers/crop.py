@@ -0,0 +1,58 @@
+import pytest
+from PIL import Image as PILImage
+
+import plasTeX.Imagers
+from plasTeX.Imagers import Image, autoCrop
+
+numpy = pytest.importorskip('numpy')
+
+def make_image(mark, content, background=(255, 255, 255)):
+    im = PILImage.new('RGB', (60, 40), background)
+    im.paste((0, 0, 0), mark)
+    for box in content:
+        im.paste((0, 0, 0), box)
+    return im
+
+IMAGES = [
+    # Registration mark on the left, content below the baseline
+    make_image((5, 10, 8, 25), [(12, 12, 40, 30)]),
+    # Content entirely above the baseline
+    make_image((5, 10, 8, 30), [(12, 5, 40, 20)]),
+    # Registration mark at the top
+    make_image((5, 5, 50, 7), [(12, 12, 40, 30)]),
+    # Empty image
+    make_image((5, 10, 8, 25), []),
+    # Coloured background
+    make_image((5, 10, 8, 25), [(12, 12, 40, 30)], (200, 10, 10)),
+]
+
+@pytest.mark.parametrize('im', IMAGES)
+@pytest.mark.parametrize('padbaseline', [0, 10])
+def test_strip_baseline_numpy(im, padbaseline, monkeypatch):
+    image = Image('img.png', {})
+    result, depth = image._stripBaseline(im, padbaseline)
+    monkeypatch.setattr(plasTeX.Imagers, 'numpy', None)
+    expected, expected_depth = image._stripBaseline(im, padbaseline)
+    assert depth == expected_depth
+    assert result.size == expected.size
+    assert result.tobytes() == expected.tobytes()
+
+@pytest.mark.parametrize('im', IMAGES)
+def test_autocrop_numpy(im, monkeypatch):
+    result, box, bgcolor = autoCrop(im, margin=3)
+    monkeypatch.setattr(plasTeX.Imagers, 'numpy', None)
+    expected, expected_box, expected_bgcolor = autoCrop(im, margin=3)
+    assert (box, bgcolor) == (expected_box, expected_bgcolor)
+    assert result.tobytes() == expected.tobytes()
+
+def test_crop_images(tmpdir):
+    images = []
+    for i, im in enumerate(IMAGES):
+        path = str(tmpdir/('img%d.png' % i))
+        im.save(path)
+        image = Image(path, {'baseline-padding': 0, 'transparent': False})
+        images.append(image)
+    images.append(Image(str(tmpdir/'missing.png'), {'baseline-padding': 0, 'transparent': False}))
+    for image in images:
+        image.crop()
+    assert [img.depth for img in images[:2]] == [-5, 10]
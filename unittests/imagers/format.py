@@ -0,0 +1,49 @@
+import re
+import sys
+from pathlib import Path
+
+# Add the unittests directory to the sys path so that the helpers module
+# can be imported when this test is run on its own.
+sys.path.append(str(Path(__file__).parent.parent))
+
+from helpers.imagers import SquareImager, install_fake_latex, make_images
+
+def setup_latex(tmpdir, monkeypatch):
+    log = install_fake_latex(tmpdir, monkeypatch)
+    sty = tmpdir/'mystyle.sty'
+    sty.write('% style')
+    monkeypatch.setenv('FAKE_LATEX_STY', str(sty))
+    return log, sty
+
+def test_precompiled_preamble(tmpdir, monkeypatch):
+    log, sty = setup_latex(tmpdir, monkeypatch)
+    config = {'precompile-preamble': True, 'cache': True}
+
+    out = tmpdir/'out'
+    images = make_images(out, '$a$ $b$', config, SquareImager)
+    assert all((out/img.filename).exists() for img in images)
+    calls = log.read().splitlines()
+    assert len(calls) == 2
+    assert '-ini' in calls[0]
+    fmt = re.search(r'-jobname=(\S+)', calls[0]).group(1)
+    assert '-fmt=%s' % fmt in calls[1]
+    assert (out/'.cache'/(fmt + '.fmt')).exists()
+
+    # The format is reused by the next run
+    make_images(out, '$a$ $b$ $c$', config, SquareImager)
+    assert len(log.read().splitlines()) == 3
+
+    # and built again when a file it loaded changes
+    sty.write('% changed style')
+    make_images(out, '$a$ $b$ $c$ $d$', config, SquareImager)
+    assert '-ini' in log.read().splitlines()[3]
+
+def test_no_format_kept_without_cache(tmpdir, monkeypatch):
+    log, sty = setup_latex(tmpdir, monkeypatch)
+    config = {'precompile-preamble': True}
+
+    out = tmpdir/'out'
+    images = make_images(out, '$a$ $b$', config, SquareImager)
+    assert all((out/img.filename).exists() for img in images)
+    assert '-ini' in log.read().splitlines()[0]
+    assert not list(out.visit('*.fmt'))
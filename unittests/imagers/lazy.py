@@ -0,0 +1,87 @@
+import pytest
+
+import plasTeX.Renderers
+from plasTeX.Renderers import Renderer
+from plasTeX.TeX import TeX
+from plasTeX.Imagers import Imager
+
+def render(source, renderer):
+    tex = TeX()
+    tex.ownerDocument.config['images']['imager'] = 'none'
+    tex.ownerDocument.config['images']['vector-imager'] = 'none'
+    tex.input(source)
+    doc = tex.parse()
+    renderer.render(doc)
+    return doc
+
+def test_no_imager_without_images(tmpdir, monkeypatch):
+    def fail(self, document):
+        raise AssertionError('imager created')
+    monkeypatch.setattr(Renderer, 'createImager', fail)
+    monkeypatch.setattr(Renderer, 'createVectorImager', fail)
+
+    with tmpdir.as_cwd():
+        renderer = Renderer()
+        renderer['document'] = lambda node: str(node)
+        render(r'''
+        \documentclass{article}
+        \begin{document}
+        Only text.
+        \end{document}
+        ''', renderer)
+    assert not tmpdir.join('.cache').exists()
+
+def test_imager_created_on_first_use(tmpdir):
+    created = []
+
+    class CountingRenderer(Renderer):
+        def createImager(self, document):
+            imager = Renderer.createImager(self, document)
+            created.append(imager)
+            return imager
+
+    with tmpdir.as_cwd():
+        renderer = CountingRenderer()
+        renderer['math'] = lambda node: node.image.url or ''
+        render(r'''
+        \documentclass{article}
+        \begin{document}
+        $a$ and $b$
+        \end{document}
+        ''', renderer)
+
+    assert len(created) == 1
+    assert renderer.imager is None
+
+def test_verify_cached(monkeypatch):
+    calls = []
+
+    class CountingImager(Imager):
+        command = 'counting'
+        def verify(self):
+            calls.append(self)
+            return True
+
+    monkeypatch.setattr(plasTeX.Renderers, 'verifiedImagers', {})
+    doc = TeX().ownerDocument
+    assert plasTeX.Renderers.verifyImager(CountingImager(doc))
+    assert plasTeX.Renderers.verifyImager(CountingImager(doc))
+    assert len(calls) == 1
+
+def test_verify_cached_per_compiler(monkeypatch):
+    compilers = []
+
+    class CompilerImager(Imager):
+        command = 'counting'
+        def verify(self):
+            compilers.append(self.getCompiler())
+            return self.getCompiler() == 'latex'
+
+    monkeypatch.setattr(plasTeX.Renderers, 'verifiedImagers', {})
+    doc = TeX().ownerDocument
+    assert plasTeX.Renderers.verifyImager(CompilerImager(doc))
+    other = TeX().ownerDocument
+    other.config['images']['compiler'] = 'missinglatex'
+    assert not plasTeX.Renderers.verifyImager(CompilerImager(other))
+    assert plasTeX.Renderers.verifyImager(CompilerImager(doc))
+    assert compilers == ['latex', 'missinglatex']
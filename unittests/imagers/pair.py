@@ -0,0 +1,62 @@
+import pickle
+import sys
+from pathlib import Path
+
+from plasTeX.TeX import TeX
+from plasTeX.Imagers import VectorImager
+
+# Add the unittests directory to the sys path so that the helpers module
+# can be imported when this test is run on its own.
+sys.path.append(str(Path(__file__).parent.parent))
+
+from helpers.imagers import SquareImager, install_fake_latex
+
+class FakeVectorImager(VectorImager):
+    """ Vector imager writing empty SVG files """
+    fileExtension = '.svg'
+
+    def executeConverter(self, outfile=None):
+        images = []
+        with open('images.csv') as fh:
+            for line in fh:
+                page, dest, _ = line.split(',')
+                with open('img%s.svg' % page, 'w') as out:
+                    out.write('<svg xmlns="http://www.w3.org/2000/svg"/>')
+                images.append(('img%s.svg' % page, dest.strip()))
+        return images
+
+def test_single_compile(tmpdir, monkeypatch):
+    log = install_fake_latex(tmpdir, monkeypatch)
+
+    tex = TeX()
+    tex.input(r'''
+    \documentclass{article}
+    \begin{document}
+    $a$ $b$
+    \end{document}
+    ''')
+    doc = tex.parse()
+    with tmpdir.as_cwd():
+        imager = SquareImager(doc)
+        vectorImager = FakeVectorImager(doc)
+        images = [imager.getImagePair(node, vectorImager)
+                  for node in doc.getElementsByTagName('math')]
+        source = imager.source.getvalue()
+        imager.close()
+        vectorImager.close()
+
+    assert len(log.read().splitlines()) == 1
+    assert source.count('\\def\\plasTeXregister{}') == 2
+    assert not vectorImager.images
+    for image in images:
+        assert image.filename.endswith('.svg')
+        assert image.bitmap.filename.endswith('.png')
+        assert (tmpdir/image.filename).exists()
+        assert (tmpdir/image.bitmap.filename).exists()
+        assert image._cropped and image.bitmap._cropped
+
+    # The vector images are cached by the vector imager
+    with open(str(tmpdir/'.cache'/'FakeVectorImager.images'), 'rb') as fh:
+        cache = pickle.load(fh)
+    assert sorted(x.filename for x in cache.values()) == \
+           sorted(x.filename for x in images)
@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+import pytest
+
+# Add the unittests directory to the sys path so that the helpers module
+# can be imported when this test is run on its own.
+sys.path.append(str(Path(__file__).parent.parent))
+
+from helpers.imagers import make_images
+
+@pytest.mark.parametrize('shards', [1, 3])
+def test_shards(shards, tmpdir):
+    images = make_images(tmpdir, '$a$ $b$ $c$ $d$ $e$', {'shards': shards})
+    assert len(images) == 5
+    assert all(Path(str(tmpdir/img.filename)).exists() for img in images)
+
+def test_failing_shard(tmpdir):
+    images = make_images(tmpdir, '$a$ $b$ $FAIL$ $d$', {'shards': 2})
+    assert [Path(str(tmpdir/img.filename)).exists() for img in images] == \
+           [True, True, False, False]
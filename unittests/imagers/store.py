@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+
+from plasTeX.Imagers import ImageStore
+
+# Add the unittests directory to the sys path so that the helpers module
+# can be imported when this test is run on its own.
+sys.path.append(str(Path(__file__).parent.parent))
+
+from helpers.imagers import FakeImager, make_images
+
+def test_store_shared_between_documents(tmpdir):
+    config = {'cache-dir': str(tmpdir/'cache')}
+    FakeImager.generated = 0
+    first = make_images(tmpdir/'one', '$a$ $b$', config)
+    assert FakeImager.generated == 2
+    second = make_images(tmpdir/'two', '$b$ $a$ $c$', config)
+    assert FakeImager.generated == 3
+    assert all((tmpdir/'two'/img.filename).exists() for img in second)
+    assert (second[0].width, second[0].height, second[0].depth) == \
+           (first[1].width, first[1].height, first[1].depth)
+
+def test_store_entries_not_modified(tmpdir, monkeypatch):
+    config = {'cache-dir': str(tmpdir/'cache')}
+    make_images(tmpdir/'one', '$a$', config)
+    entries = {path: path.read_binary()
+               for path in (tmpdir/'cache').visit('*.png')}
+    assert len(entries) == 1
+
+    # Serve the image from the store, then generate a different image
+    # under the same name without the store
+    image, = make_images(tmpdir/'two', '$a$', config)
+    monkeypatch.setattr(FakeImager, 'color', (255, 0, 0))
+    regenerated, = make_images(tmpdir/'two', '$a$')
+    assert regenerated.filename == image.filename
+    assert all(path.read_binary() == data for path, data in entries.items())
+
+def test_store_eviction(tmpdir):
+    store = ImageStore(str(tmpdir), 1)
+    data = b'x' * 400 * 1024
+    src = tmpdir/'src.png'
+    src.write_binary(data)
+    for i, key in enumerate(['aa1', 'bb2', 'cc3']):
+        store.put(key, str(src), {})
+        (tmpdir/key[:2]/(key + '.png')).setmtime(1000 + i)
+    assert store.get('aa1', '.png', str(tmpdir/'out.png')) is not None
+    store.evict()
+    assert [store.path(key, '.png').exists() for key in ['aa1', 'bb2', 'cc3']] == [True, False, True]
@@ -0,0 +1,48 @@
+from plasTeX.TeX import TeX
+from plasTeX.MathML import toMathML
+
+def mathml(source):
+    tex = TeX()
+    tex.input(r'\documentclass{article}\begin{document}%s\end{document}' % source)
+    doc = tex.parse()
+    return toMathML(doc.getElementsByTagName('math')[0])
+
+def test_scripts():
+    assert mathml(r'$x_i^{2}$') == \
+        '<math xmlns="http://www.w3.org/1998/Math/MathML">' \
+        '<msubsup><mi>x</mi><mi>i</mi><mn>2</mn></msubsup></math>'
+
+def test_frac_sqrt_symbols():
+    assert mathml(r'$\frac{a}{b} \leq \sqrt[3]{\alpha} + 3.5$') == \
+        '<math xmlns="http://www.w3.org/1998/Math/MathML"><mrow>' \
+        '<mfrac><mi>a</mi><mi>b</mi></mfrac><mo>≤</mo>' \
+        '<mroot><mi>α</mi><mn>3</mn></mroot><mo>+</mo><mn>3.5</mn></mrow></math>'
+
+def test_escape():
+    assert mathml(r'$a<b$') == \
+        '<math xmlns="http://www.w3.org/1998/Math/MathML">' \
+        '<mrow><mi>a</mi><mo>&lt;</mo><mi>b</mi></mrow></math>'
+
+def test_unsupported():
+    assert mathml(r'$\mathrm{d}x$') is None
+    assert mathml(r'$\begin{array}{c} a \end{array}$') is None
+
+def test_disabled_by_default():
+    tex = TeX()
+    tex.input(r'\documentclass{article}\begin{document}$x$\end{document}')
+    doc = tex.parse()
+    assert doc.getElementsByTagName('math')[0].mathml is None
+    doc.config['images']['simple-math'] = True
+    assert doc.getElementsByTagName('math')[0].mathml == \
+        '<math xmlns="http://www.w3.org/1998/Math/MathML"><mi>x</mi></math>'
+
+def test_spaces():
+    assert mathml(r'$a\,b\!c$') == \
+        '<math xmlns="http://www.w3.org/1998/Math/MathML"><mrow>' \
+        '<mi>a</mi><mspace width="0.1667em"/><mi>b</mi>' \
+        '<mspace width="-0.1667em"/><mi>c</mi></mrow></math>'
+    assert mathml(r'$a\ b$') is None
+
+def test_symbols_outside_math_module():
+    assert mathml(r'$\dag$') is None
+    assert mathml(r'$\S$') is None